@@ -12,6 +12,9 @@ Usage:
     python -m canslim_monitor regime seed --start 2024-01-01  # Seed historical data
     python -m canslim_monitor test_position          # Test position monitor
     python -m canslim_monitor test_position --live   # Live validation
+    python -m canslim_monitor backup list            # List database snapshots
+    python -m canslim_monitor backup verify <file>   # Check a backup or snapshot
+    python -m canslim_monitor backup restore <manifest> <dest>  # Rebuild a snapshot
 """
 
 import sys
@@ -458,6 +461,59 @@ def cmd_regime(args):
         return 1
 
 
+def cmd_backup(args):
+    """List, verify or restore database backups."""
+    from canslim_monitor.data.backup import BackupError, SnapshotStore, MANIFEST_SUFFIX, integrity_check
+    from canslim_monitor.utils.config import load_config
+
+    config = load_config(args.config)
+    db_path = Path(args.database or config.get('database', {}).get('path') or DEFAULT_DB_PATH)
+    backup_dir = config.get('maintenance', {}).get('backup_dir')
+    backup_dir = Path(backup_dir) if backup_dir else db_path.parent / 'backups'
+
+    if args.action == 'list':
+        store = SnapshotStore(backup_dir / 'snapshots')
+        snapshots = store.snapshots()
+        files = sorted(backup_dir.glob(f"{db_path.stem}_*{db_path.suffix}"), reverse=True)
+        if not snapshots and not files:
+            print(f"No backups in {backup_dir}")
+        for path in snapshots:
+            print(f"snapshot  {path}")
+        for path in files:
+            print(f"file      {path}  ({path.stat().st_size / 1024 / 1024:.1f} MB)")
+        return 0
+
+    if not args.path:
+        print(f"Error: backup {args.action} needs a backup file or snapshot manifest")
+        return 1
+    path = Path(args.path)
+
+    try:
+        if args.action == 'verify':
+            if path.name.endswith(MANIFEST_SUFFIX):
+                result = SnapshotStore(path.parent).verify(path)
+                ok = result['ok']
+                print(f"{path.name}: {result.get('error', 'ok')} ({result['chunks']} chunks, {result['size']:,} bytes)")
+            else:
+                check = integrity_check(path)
+                ok = check == 'ok'
+                print(f"{path.name}: {check}")
+            return 0 if ok else 1
+
+        if args.action == 'restore':
+            if not args.dest:
+                print("Error: restore needs a destination path")
+                return 1
+            restored = SnapshotStore(path.parent).restore(path, args.dest, overwrite=args.force)
+            print(f"Restored {path.name} -> {restored}")
+            return 0
+    except BackupError as e:
+        print(f"Error: {e}")
+        return 1
+
+    return 1
+
+
 def cmd_test_position(args):
     """Run position monitor tests."""
     from canslim_monitor.tests.test_position_monitor_cli import (
@@ -681,6 +737,21 @@ Config search order:
         help='Actually send alerts to Discord (use with --live)'
     )
     
+    # Backup command
+    backup_parser = subparsers.add_parser('backup', help='List, verify or restore database backups')
+    backup_parser.add_argument(
+        'action',
+        choices=['list', 'verify', 'restore'],
+        help='Action: list backups, verify a backup/snapshot, restore a snapshot'
+    )
+    backup_parser.add_argument('path', nargs='?', help='Backup file or snapshot manifest')
+    backup_parser.add_argument('dest', nargs='?', help='Restore destination (restore only)')
+    backup_parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Overwrite an existing restore destination'
+    )
+    
     args = parser.parse_args()
     
     setup_logging(args.verbose)
@@ -699,6 +770,8 @@ Config search order:
         sys.exit(cmd_regime(args))
     elif args.command == 'test_position':
         sys.exit(cmd_test_position(args))
+    elif args.command == 'backup':
+        sys.exit(cmd_backup(args))
     else:
         parser.print_help()
 
@@ -0,0 +1,141 @@
+"""
+CANSLIM Monitor - Bar Cache Benchmark
+======================================
+Time to get a chart-ready OHLCV DataFrame for one symbol:
+
+  - ORM path: query HistoricalBar rows, build a list of dicts, then
+    pd.DataFrame (what get_dataframe / the chart dialogs did on every open)
+  - cold cache: BarCache.sync from an empty cache (full fetch + write)
+  - warm cache: BarCache.sync with one new bar (mmap + tail append), then
+    to_dataframe() over the mapped columns
+
+for 5 years of daily bars (~1,260) and 5 years of hourly bars (~20k).
+
+Run: python -m canslim_monitor.benchmarks.bench_bar_cache
+"""
+
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import pandas as pd
+
+from canslim_monitor.data.bar_cache import BarCache
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.data.models import HistoricalBar
+from canslim_monitor.data.repositories.bar_repo import BarRepository
+from canslim_monitor.integrations.polygon_client import Bar
+
+
+YEARS = 5
+DAILY_BARS = YEARS * 252
+HOURLY_BARS = DAILY_BARS * 16
+REPEAT = 20
+START_DATE = date(2020, 1, 2)
+START_MS = 1_577_923_200_000   # 2020-01-02 00:00 UTC
+
+
+def synthetic_bars(symbol: str, count: int, step_ms: int = None, seed: int = 7):
+    """*count* bars; daily by date, or intraday with ``_timestamp_ms`` every *step_ms*."""
+    rng = random.Random(seed)
+    price = rng.uniform(10, 500)
+    bars = []
+    for i in range(count):
+        price *= 1 + rng.gauss(0, 0.01)
+        bar = Bar(
+            symbol=symbol, bar_date=START_DATE + timedelta(days=i if step_ms is None else 0),
+            open=price, high=price * 1.01, low=price * 0.99, close=price,
+            volume=rng.randint(100_000, 5_000_000),
+        )
+        if step_ms is not None:
+            bar._timestamp_ms = START_MS + i * step_ms
+        bars.append(bar)
+    return bars
+
+
+def orm_dataframe(session, symbol: str) -> pd.DataFrame:
+    """The old path: ORM rows -> list of dicts -> DataFrame."""
+    bars = session.query(HistoricalBar).filter(
+        HistoricalBar.symbol == symbol
+    ).order_by(HistoricalBar.bar_date.asc()).all()
+    return pd.DataFrame([{
+        'date': bar.bar_date, 'open': bar.open, 'high': bar.high,
+        'low': bar.low, 'close': bar.close, 'volume': bar.volume,
+    } for bar in bars])
+
+
+def per_call_ms(fn, repeat: int = REPEAT) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat * 1000
+
+
+def report(label: str, rows: int, ms: float):
+    print(f"{label:>38} {rows:>8,} {ms:>10.2f}")
+
+
+def bench_series(cache: BarCache, timeframe: str, bars: list):
+    """Cold sync, then warm opens that each append one new bar."""
+    symbol = f'BENCH_{timeframe.upper()}'
+    feed = {'bars': bars[:-REPEAT]}
+
+    def fetch(since_ms):
+        if since_ms is None:
+            return feed['bars']
+        return [b for b in feed['bars'][-50:] if getattr(b, '_timestamp_ms', None) is None
+                or b._timestamp_ms >= since_ms]
+
+    t0 = time.perf_counter()
+    cache.sync(symbol, timeframe, fetch)
+    report(f'cold sync ({timeframe})', len(feed['bars']), (time.perf_counter() - t0) * 1000)
+
+    extra = iter(bars[-REPEAT:])
+
+    def warm_open():
+        feed['bars'] = feed['bars'] + [next(extra)]
+        return cache.sync(symbol, timeframe, fetch).to_dataframe()
+
+    ms = per_call_ms(warm_open)
+    report(f'warm open + append ({timeframe})', len(bars), ms)
+    return ms
+
+
+def main():
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'path':>38} {'rows':>8} {'ms/open':>10}")
+
+        db = DatabaseManager(db_path=os.path.join(tmp, 'bench.db'))
+        db.initialize(seed_config=False)
+        session = db.get_new_session()
+        daily = synthetic_bars('DAILY', DAILY_BARS)
+        BarRepository(session).bulk_upsert(daily)
+        orm = per_call_ms(lambda: orm_dataframe(session, 'DAILY'))
+        report('ORM -> dicts -> DataFrame (day)', DAILY_BARS, orm)
+        session.close()
+        db.close()
+
+        cache = BarCache(os.path.join(tmp, 'bar_cache'))
+        warm = bench_series(cache, 'day', daily)
+        print(f"{'speed-up (day)':>38} {orm / warm:>8.1f}x")
+
+        hourly = synthetic_bars('HOURLY', HOURLY_BARS, step_ms=3_600_000)
+        dicts = per_call_ms(lambda: pd.DataFrame([{
+            'timestamp': b._timestamp_ms, 'open': b.open, 'high': b.high,
+            'low': b.low, 'close': b.close, 'volume': b.volume,
+        } for b in hourly]), repeat=5)
+        report('Bar list -> dicts -> DataFrame (hour)', HOURLY_BARS, dicts)
+        warm = bench_series(cache, 'hour', hourly)
+        print(f"{'speed-up (hour)':>38} {dicts / warm:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+CANSLIM Monitor - Historical Bar Ingestion Benchmark
+=====================================================
+Writes synthetic daily bars into a file-backed (WAL) historical_bars
+table:
+
+  - per-bar ORM path (the old VolumeService._store_bars: one SELECT per
+    bar, then add/update) on the 300 symbols x 200 bars seeding case
+  - BarRepository.bulk_upsert on the same 60k bars
+  - bulk_upsert of a 1M-bar dataset (5,000 symbols x 200 bars), first as
+    inserts, then again so every row takes the ON CONFLICT update branch
+
+Bars are generated lazily, so the 1M runs also show that bulk_upsert
+streams rather than materializing its input.
+
+Run: python -m canslim_monitor.benchmarks.bench_bar_ingest
+"""
+
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.data.models import HistoricalBar
+from canslim_monitor.data.repositories.bar_repo import BarRepository
+from canslim_monitor.integrations.polygon_client import Bar
+
+
+BARS_PER_SYMBOL = 200
+SEED_SYMBOLS = 300          # 60k bars: the watchlist seeding case
+LARGE_SYMBOLS = 5000        # 1M bars
+START_DATE = date(2024, 1, 2)
+
+
+def synthetic_bars(symbols: int, seed: int = 7):
+    """Yield BARS_PER_SYMBOL daily bars for *symbols* synthetic tickers."""
+    rng = random.Random(seed)
+    dates = [START_DATE + timedelta(days=i) for i in range(BARS_PER_SYMBOL)]
+    for n in range(symbols):
+        symbol = f'S{n:04d}'
+        price = rng.uniform(10, 500)
+        for bar_date in dates:
+            price *= 1 + rng.gauss(0, 0.02)
+            yield Bar(
+                symbol=symbol, bar_date=bar_date,
+                open=price, high=price * 1.01, low=price * 0.99, close=price,
+                volume=rng.randint(100_000, 5_000_000),
+                vwap=price, transactions=rng.randint(1000, 50000),
+            )
+
+
+def legacy_store(session, bars) -> int:
+    """The old per-bar path: SELECT, then update or add an ORM object."""
+    stored = 0
+    for bar in bars:
+        existing = session.query(HistoricalBar).filter(
+            HistoricalBar.symbol == bar.symbol,
+            HistoricalBar.bar_date == bar.bar_date
+        ).first()
+        if existing:
+            existing.open = bar.open
+            existing.high = bar.high
+            existing.low = bar.low
+            existing.close = bar.close
+            existing.volume = bar.volume
+            existing.vwap = bar.vwap
+            existing.transactions = bar.transactions
+        else:
+            session.add(HistoricalBar(
+                symbol=bar.symbol, bar_date=bar.bar_date, open=bar.open, high=bar.high,
+                low=bar.low, close=bar.close, volume=bar.volume, vwap=bar.vwap,
+                transactions=bar.transactions,
+            ))
+        stored += 1
+    session.commit()
+    return stored
+
+
+def timed(label: str, fn, *args) -> float:
+    t0 = time.perf_counter()
+    rows = fn(*args)
+    elapsed = time.perf_counter() - t0
+    print(f"{label:>28} {rows:>10,} {elapsed:>9.2f} {rows / elapsed:>12,.0f}")
+    return elapsed
+
+
+def main():
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"file-backed SQLite (WAL), {BARS_PER_SYMBOL} bars/symbol")
+        print(f"{'path':>28} {'rows':>10} {'seconds':>9} {'rows/s':>12}")
+
+        db = DatabaseManager(db_path=os.path.join(tmp, 'legacy.db'))
+        db.initialize(seed_config=False)
+        session = db.get_new_session()
+        legacy = timed('per-bar ORM (60k)', legacy_store, session, synthetic_bars(SEED_SYMBOLS))
+        session.close()
+        db.close()
+
+        db = DatabaseManager(db_path=os.path.join(tmp, 'bulk.db'))
+        db.initialize(seed_config=False)
+        session = db.get_new_session()
+        repo = BarRepository(session)
+        bulk = timed('bulk_upsert (60k)', repo.bulk_upsert, synthetic_bars(SEED_SYMBOLS))
+        print(f"{'speed-up':>28} {legacy / bulk:>10.1f}x")
+
+        db2 = DatabaseManager(db_path=os.path.join(tmp, 'large.db'))
+        db2.initialize(seed_config=False)
+        large = BarRepository(db2.get_new_session())
+        timed('bulk_upsert 1M insert', large.bulk_upsert, synthetic_bars(LARGE_SYMBOLS))
+        timed('bulk_upsert 1M update', large.bulk_upsert, synthetic_bars(LARGE_SYMBOLS, seed=8))
+        print(f"{'rows stored':>28} {large.session.query(HistoricalBar).count():>10,}")
+        large.session.close()
+        db2.close()
+
+        session.close()
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
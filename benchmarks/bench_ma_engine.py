@@ -0,0 +1,93 @@
+"""
+CANSLIM Monitor - Moving-Average Engine Benchmark
+==================================================
+Per-cycle cost of TechnicalDataService's indicator math for 50, 500 and
+5,000 symbols: the per-symbol Python loops vs. the vectorized bulk engine.
+
+Bars are synthetic (250 daily bars per symbol, already in memory), so the
+numbers isolate computation from API / database I/O.
+
+Run: python -m canslim_monitor.benchmarks.bench_ma_engine
+"""
+
+import random
+import sys
+import os
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.integrations.polygon_client import Bar
+from canslim_monitor.services.technical_data_service import TechnicalDataService
+from canslim_monitor.utils.ma_engine import BarMatrix, compute_indicators
+
+
+SIZES = [50, 500, 5000]
+BARS = 250
+
+
+def make_bars(symbol: str, rng: random.Random):
+    """A random walk of BARS weekday bars ending yesterday."""
+    days = []
+    d = date.today() - timedelta(days=1)
+    while len(days) < BARS:
+        if d.weekday() < 5:
+            days.append(d)
+        d -= timedelta(days=1)
+    days.reverse()
+
+    price = rng.uniform(20, 500)
+    bars = []
+    for d in days:
+        price *= 1 + rng.gauss(0, 0.02)
+        bars.append(Bar(symbol, d, price, price * 1.01, price * 0.99, price,
+                        rng.randint(100_000, 5_000_000)))
+    return bars
+
+
+def per_symbol(service, bars_by_symbol):
+    """The pre-existing path: one _calculate_* loop set per symbol."""
+    for bars in bars_by_symbol.values():
+        closes = [b.close for b in bars]
+        volumes = [b.volume for b in bars]
+        service._calculate_sma(closes, 21)
+        service._calculate_sma(closes, 50)
+        service._calculate_sma(closes, 200)
+        service._calculate_ema(closes, 21)
+        service._calculate_weekly_ma(bars, 10)
+        service._calculate_avg_volume(volumes, 50)
+
+
+def best_of(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    rng = random.Random(42)
+    service = TechnicalDataService()
+    pool = [make_bars(f'S{i:04d}', rng) for i in range(max(SIZES))]
+
+    # bulk = compute_bulk() end to end; pack = Bar objects -> arrays;
+    # math = compute_indicators() on the packed matrix
+    print(f"{'symbols':>8} {'per-symbol':>12} {'bulk':>10} {'pack':>10} {'math':>10} {'speedup':>8}")
+    for n in SIZES:
+        bars_by_symbol = {f'S{i:04d}': pool[i] for i in range(n)}
+        matrix = BarMatrix.from_bars(bars_by_symbol)
+        loop_s = best_of(lambda: per_symbol(service, bars_by_symbol))
+        bulk_s = best_of(lambda: service.compute_bulk(bars_by_symbol))
+        pack_s = best_of(lambda: BarMatrix.from_bars(bars_by_symbol))
+        math_s = best_of(lambda: compute_indicators(matrix))
+        print(
+            f"{n:>8} {loop_s * 1000:>10.1f}ms {bulk_s * 1000:>8.1f}ms "
+            f"{pack_s * 1000:>8.1f}ms {math_s * 1000:>8.1f}ms {loop_s / bulk_s:>7.1f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+CANSLIM Monitor - Monitor State Store Benchmark
+================================================
+Per-cycle cost MonitorStateStore adds to PositionThread for 200 positions
+on a file-backed (WAL) database: recording the cycle's high-water mark and
+cooldown changes plus the single end-of-cycle flush (one packed row per
+changed map). Also times the start-up load.
+
+Target: < 1 ms per cycle.
+
+Run: python -m canslim_monitor.benchmarks.bench_monitor_state
+"""
+
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.core.position_monitor import MonitorStateStore
+
+
+POSITIONS = 200
+CYCLES = 200
+# (label, share of positions making a new high per cycle, cooldowns set per cycle)
+SCENARIOS = [
+    ('steady', 0.05, 1),
+    ('trending', 0.5, 5),
+    ('all change', 1.0, 20),
+]
+
+
+def run_cycles(store: MonitorStateStore, new_high_share: float, cooldowns_per_cycle: int) -> float:
+    """Mean ms per cycle spent in state bookkeeping + flush."""
+    rng = random.Random(3)
+    symbols = [f'S{i:03d}' for i in range(POSITIONS)]
+    prices = store.map('max_price')
+    gains = store.map('max_gain')
+    cooldowns = store.map('cooldown.stop', datetime_values=True)
+
+    for symbol in symbols:
+        prices[symbol] = 100.0
+        gains[symbol] = 0.0
+    store.flush()
+
+    elapsed = 0.0
+    for cycle in range(CYCLES):
+        movers = rng.sample(symbols, int(POSITIONS * new_high_share))
+        t0 = time.perf_counter()
+        for symbol in movers:
+            prices[symbol] = prices[symbol] + 0.25
+            gains[symbol] = gains[symbol] + 0.25
+        for symbol in rng.sample(symbols, cooldowns_per_cycle):
+            cooldowns[f'{symbol}_HARD_STOP'] = datetime.now()
+        store.flush()
+        elapsed += time.perf_counter() - t0
+    return elapsed / CYCLES * 1000
+
+
+def main():
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{POSITIONS} positions, {CYCLES} cycles, file-backed SQLite (WAL)")
+        print(f"{'scenario':>12} {'changes/cycle':>14} {'ms/cycle':>9}")
+        for label, share, cooldowns in SCENARIOS:
+            db = DatabaseManager(db_path=os.path.join(tmp, f'{label.replace(" ", "_")}.db'))
+            db.initialize(seed_config=False)
+            store = MonitorStateStore(db.get_new_session)
+            ms = run_cycles(store, share, cooldowns)
+            rows = int(POSITIONS * share) * 2 + cooldowns
+            print(f"{label:>12} {rows:>14} {ms:>9.3f}")
+
+            t0 = time.perf_counter()
+            restarted = MonitorStateStore(db.get_new_session)
+            loaded = restarted.load()
+            for scope in ('max_price', 'max_gain'):
+                restarted.map(scope)
+            restarted.map('cooldown.stop', datetime_values=True)
+            load_ms = (time.perf_counter() - t0) * 1000
+            db.close()
+        print(f"load at start: {loaded} values in {load_ms:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+CANSLIM Monitor - Regime Seeder Benchmark
+==========================================
+Wall-clock time of HistoricalSeeder.seed_range() for a 1-year and a
+10-year range, against a file-backed SQLite database (so commit cost is
+real) and synthetic SPY/QQQ bars (so no API calls are made).
+
+Run: python -m canslim_monitor.benchmarks.bench_regime_seed
+"""
+
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from canslim_monitor.regime.historical_data import DailyBar
+from canslim_monitor.regime.historical_seeder import HistoricalSeeder
+from canslim_monitor.regime.models_regime import Base
+from canslim_monitor.regime.ftd_tracker import Base as FTDBase
+
+
+END = date(2025, 12, 31)
+YEARS = [1, 10]
+
+
+def synthetic_bars(start: date, end: date, seed: int):
+    """Random-walk weekday bars with volume swings that produce D-days and FTDs."""
+    rng = random.Random(seed)
+    bars = []
+    price, volume = 400.0, 80_000_000
+    d = start
+    while d <= end:
+        if d.weekday() < 5:
+            change = rng.gauss(0.0004, 0.011)
+            open_ = price
+            price *= 1 + change
+            volume = max(10_000_000, int(volume * (1 + rng.gauss(0, 0.15))))
+            bars.append(DailyBar(d, open_, max(open_, price) * 1.003,
+                                 min(open_, price) * 0.997, price, volume))
+        d += timedelta(days=1)
+    return bars
+
+
+def run(years: int, workdir: str) -> float:
+    start = END - timedelta(days=365 * years)
+    data = {
+        'SPY': synthetic_bars(start - timedelta(days=60), END, 1),
+        'QQQ': synthetic_bars(start - timedelta(days=60), END, 2),
+    }
+
+    engine = create_engine(f"sqlite:///{os.path.join(workdir, f'seed_{years}y.db')}")
+    Base.metadata.create_all(engine)
+    FTDBase.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    seeder = HistoricalSeeder(db_session=session, config={})
+    seeder._fetch_historical_data = lambda s, e: data
+
+    t0 = time.perf_counter()
+    result = seeder.seed_range(start, END, verbose=False)
+    elapsed = time.perf_counter() - t0
+
+    session.close()
+    engine.dispose()
+    print(
+        f"{years:>3}y  {result.days_processed:>5} days  {elapsed:>8.2f}s  "
+        f"{elapsed / max(result.days_processed, 1) * 1000:>7.2f} ms/day  "
+        f"d-days={result.d_days_created} phases={result.phase_changes_recorded}"
+    )
+    return elapsed
+
+
+def main():
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as workdir:
+        for years in YEARS:
+            run(years, workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+CANSLIM Monitor - Weight Optimizer Benchmark
+=============================================
+Wall-clock time of WeightOptimizer.optimize() on synthetic outcomes:
+the per-outcome Python scorer vs. the NumPy population scorer at the
+default 100 iterations x 20 population, then a much larger NumPy-only run.
+
+Run: python -m canslim_monitor.benchmarks.bench_weight_optimizer
+"""
+
+import logging
+import random
+import sys
+import os
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.core.learning import weight_optimizer
+from canslim_monitor.core.learning.weight_optimizer import WeightOptimizer
+from canslim_monitor.data.repositories.learning_repo import OutcomeData
+
+
+SIZES = [1000, 5000]
+LARGE = (5000, 1000, 200)      # outcomes, iterations, population
+
+
+def make_outcomes(count: int, seed: int = 1):
+    """Outcomes with every scored factor populated the way imports produce them."""
+    rng = random.Random(seed)
+    outcomes = []
+    for i in range(count):
+        rs = rng.randint(40, 99)
+        outcomes.append(OutcomeData(
+            position_id=i, symbol=f'S{i}', entry_date=date(2020, 1, 1) + timedelta(days=i % 1500),
+            exit_date=date(2025, 1, 1), holding_days=30, gross_pct=0.0,
+            outcome='SUCCESS' if rng.random() < rs / 180 else 'STOPPED',
+            rs_rating=rs, eps_rating=rng.randint(20, 99), comp_rating=rng.randint(20, 99),
+            ad_rating=rng.choice(['A+', 'A', 'B+', 'B', 'C', 'D']),
+            industry_rank=rng.randint(1, 197), fund_count=rng.randint(50, 4000),
+            funds_qtr_chg=rng.randint(-200, 200), base_stage=rng.choice(['1', '2', '2b', '3', '4']),
+            base_depth=rng.uniform(8, 45), market_regime=rng.choice(['BULLISH', 'NEUTRAL', 'BEARISH']),
+        ))
+    return outcomes
+
+
+def run(outcomes, iterations: int, population: int, use_numpy: bool) -> float:
+    optimizer = WeightOptimizer(None)
+    optimizer._outcomes = outcomes
+    split = int(len(outcomes) * 0.8)
+    optimizer._train_set = outcomes[:split]
+    optimizer._test_set = outcomes[split:]
+
+    random.seed(7)
+    with patch.object(weight_optimizer, 'NUMPY_AVAILABLE', use_numpy):
+        t0 = time.perf_counter()
+        optimizer.optimize(iterations=iterations, population_size=population)
+        return time.perf_counter() - t0
+
+
+def main():
+    logging.disable(logging.INFO)
+
+    print(f"{'outcomes':>9} {'iter x pop':>11} {'python':>10} {'numpy':>10} {'speedup':>8}")
+    for n in SIZES:
+        outcomes = make_outcomes(n)
+        slow = run(outcomes, 100, 20, use_numpy=False)
+        fast = run(outcomes, 100, 20, use_numpy=True)
+        print(f"{n:>9} {'100 x 20':>11} {slow:>9.2f}s {fast:>9.3f}s {slow / fast:>7.0f}x")
+
+    n, iterations, population = LARGE
+    fast = run(make_outcomes(n), iterations, population, use_numpy=True)
+    print(f"{n:>9} {f'{iterations} x {population}':>11} {'-':>10} {fast:>9.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,11 +6,18 @@ Uses gradient-free optimization to find weights that maximize predictive power.
 """
 
 import logging
+import math
 import random
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import date
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from canslim_monitor.data.repositories.learning_repo import (
     LearningRepository, OutcomeData
 )
@@ -58,6 +65,25 @@ DEFAULT_WEIGHTS = {
     'market_regime': 10,
 }
 
+# Factors that contribute to _calculate_score, in scoring order
+SCORED_FACTORS = (
+    'rs_rating',
+    'eps_rating',
+    'comp_rating',
+    'industry_rank',
+    'fund_count',
+    'funds_qtr_chg',
+    'base_stage',
+    'base_depth',
+    'ad_rating',
+    'market_regime',
+)
+
+SCORE_THRESHOLD = 70  # Score at or above this predicts a win
+
+AD_ORDER = ['E', 'D-', 'D', 'D+', 'C-', 'C', 'C+', 'B-', 'B', 'B+', 'A-', 'A', 'A+']
+REGIME_MAP = {'BEARISH': 0, 'NEUTRAL': 0.5, 'BULLISH': 1}
+
 
 class WeightOptimizer:
     """
@@ -149,8 +175,12 @@ class WeightOptimizer:
         if initial_weights is None:
             initial_weights = DEFAULT_WEIGHTS.copy()
 
+        # Encode the training set once; each iteration then scores the
+        # whole population in one matrix product
+        train_encoded = self._encode_outcomes(self._train_set) if NUMPY_AVAILABLE else None
+
         # Calculate baseline accuracy
-        baseline_accuracy = self._evaluate_weights(initial_weights, self._train_set)['accuracy']
+        baseline_accuracy = self._evaluate_all([initial_weights], train_encoded)[0]['accuracy']
         logger.info(f"Baseline accuracy: {baseline_accuracy:.1%}")
 
         # Initialize population
@@ -183,12 +213,12 @@ class WeightOptimizer:
 
         for iteration in range(iterations):
             # Evaluate fitness
-            fitness_scores = []
-            for weights in population:
-                metrics = self._evaluate_weights(weights, self._train_set)
-                # Use F1 score as fitness (balances precision and recall)
-                fitness = metrics['f1_score']
-                fitness_scores.append((fitness, weights))
+            population_metrics = self._evaluate_all(population, train_encoded)
+            # Use F1 score as fitness (balances precision and recall)
+            fitness_scores = [
+                (metrics['f1_score'], weights)
+                for metrics, weights in zip(population_metrics, population)
+            ]
 
             # Sort by fitness
             fitness_scores.sort(key=lambda x: x[0], reverse=True)
@@ -297,12 +327,10 @@ class WeightOptimizer:
         Returns accuracy, precision, recall, F1 score.
         """
         if not outcomes:
-            return {
-                'accuracy': 0,
-                'precision': 0,
-                'recall': 0,
-                'f1_score': 0
-            }
+            return self._empty_metrics()
+
+        if NUMPY_AVAILABLE:
+            return self._evaluate_population([weights], self._encode_outcomes(outcomes))[0]
 
         # Score each outcome and predict win/loss
         true_positives = 0
@@ -312,7 +340,7 @@ class WeightOptimizer:
 
         for outcome in outcomes:
             score = self._calculate_score(outcome, weights)
-            predicted_win = score >= 70  # Threshold for "good" score
+            predicted_win = score >= SCORE_THRESHOLD
 
             actual_win = outcome.outcome == 'SUCCESS'
 
@@ -350,6 +378,100 @@ class WeightOptimizer:
             'f1_score': f1
         }
 
+    def _evaluate_all(
+        self,
+        population: List[Dict[str, float]],
+        train_encoded: Optional[Tuple['np.ndarray', 'np.ndarray']]
+    ) -> List[Dict[str, float]]:
+        """Metrics on the training set for each weight set in population."""
+        if train_encoded is not None:
+            return self._evaluate_population(population, train_encoded)
+        return [self._evaluate_weights(weights, self._train_set) for weights in population]
+
+    @staticmethod
+    def _empty_metrics() -> Dict[str, float]:
+        return {
+            'accuracy': 0,
+            'precision': 0,
+            'recall': 0,
+            'f1_score': 0
+        }
+
+    def _encode_outcomes(self, outcomes: List[OutcomeData]) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Pre-encode outcomes for vectorized scoring.
+
+        Returns:
+            (features, actual_wins): float array (outcomes x SCORED_FACTORS)
+            of each factor's (normalized - 0.5) contribution per unit weight,
+            0 where the factor is missing; bool array of SUCCESS outcomes.
+        """
+        features = np.zeros((len(outcomes), len(SCORED_FACTORS)))
+        for row, outcome in enumerate(outcomes):
+            for col, value in enumerate(self._factor_contributions(outcome)):
+                if value is not None:
+                    features[row, col] = value
+        actual_wins = np.fromiter(
+            (o.outcome == 'SUCCESS' for o in outcomes), dtype=bool, count=len(outcomes)
+        )
+        return features, actual_wins
+
+    def _evaluate_population(
+        self,
+        population: List[Dict[str, float]],
+        encoded: Tuple['np.ndarray', 'np.ndarray']
+    ) -> List[Dict[str, float]]:
+        """
+        Evaluate every weight set in population against pre-encoded outcomes.
+
+        Scores are one matrix product (population x factors . factors x
+        outcomes); the confusion matrix and metrics are array reductions.
+        Results match _evaluate_weights() per weight set.
+        """
+        features, actual_wins = encoded
+        if not len(actual_wins):
+            return [self._empty_metrics() for _ in population]
+
+        weight_matrix = np.array(
+            [[weights.get(factor, 0) for factor in SCORED_FACTORS] for weights in population],
+            dtype=float
+        ).reshape(len(population), len(SCORED_FACTORS))
+        # Non-positive weights are skipped by _calculate_score
+        weight_matrix = np.where(weight_matrix > 0, weight_matrix, 0.0)
+
+        # Clamping to 0-100 cannot move a score across the threshold
+        predicted_wins = 50 + weight_matrix @ features.T >= SCORE_THRESHOLD
+
+        true_positives = np.count_nonzero(predicted_wins & actual_wins, axis=1)
+        false_positives = np.count_nonzero(predicted_wins, axis=1) - true_positives
+        false_negatives = np.count_nonzero(actual_wins) - true_positives
+        true_negatives = len(actual_wins) - true_positives - false_positives - false_negatives
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            accuracy = (true_positives + true_negatives) / len(actual_wins)
+            precision = np.where(
+                true_positives + false_positives > 0,
+                true_positives / (true_positives + false_positives), 0.0
+            )
+            recall = np.where(
+                true_positives + false_negatives > 0,
+                true_positives / (true_positives + false_negatives), 0.0
+            )
+            f1 = np.where(
+                precision + recall > 0,
+                2 * precision * recall / (precision + recall), 0.0
+            )
+
+        return [
+            {
+                'accuracy': float(accuracy[i]),
+                'precision': float(precision[i]),
+                'recall': float(recall[i]),
+                'f1_score': float(f1[i])
+            }
+            for i in range(len(population))
+        ]
+
     def _calculate_score(
         self,
         outcome: OutcomeData,
@@ -362,64 +484,59 @@ class WeightOptimizer:
         """
         score = 50  # Start at midpoint
 
-        # RS Rating (0-99 -> 0-1)
-        if outcome.rs_rating and weights.get('rs_rating', 0) > 0:
-            normalized = outcome.rs_rating / 99
-            score += (normalized - 0.5) * weights['rs_rating']
+        for factor, value in zip(SCORED_FACTORS, self._factor_contributions(outcome)):
+            if value is not None and weights.get(factor, 0) > 0:
+                score += value * weights[factor]
+
+        return max(0, min(100, score))
 
-        # EPS Rating (0-99 -> 0-1)
-        if outcome.eps_rating and weights.get('eps_rating', 0) > 0:
-            normalized = outcome.eps_rating / 99
-            score += (normalized - 0.5) * weights['eps_rating']
+    def _factor_contributions(self, outcome: OutcomeData) -> List[Optional[float]]:
+        """
+        Each SCORED_FACTORS value normalized to 0-1 and centered
+        (normalized - 0.5), or None where the outcome lacks the factor.
+        """
+        values: List[Optional[float]] = [None] * len(SCORED_FACTORS)
 
-        # Composite Rating (0-99 -> 0-1)
-        if outcome.comp_rating and weights.get('comp_rating', 0) > 0:
-            normalized = outcome.comp_rating / 99
-            score += (normalized - 0.5) * weights['comp_rating']
+        # RS / EPS / Composite Rating (0-99 -> 0-1)
+        if outcome.rs_rating:
+            values[0] = outcome.rs_rating / 99 - 0.5
+        if outcome.eps_rating:
+            values[1] = outcome.eps_rating / 99 - 0.5
+        if outcome.comp_rating:
+            values[2] = outcome.comp_rating / 99 - 0.5
 
         # Industry Rank (1-197 -> 0-1, inverted - lower is better)
-        if outcome.industry_rank and weights.get('industry_rank', 0) > 0:
-            normalized = 1 - (outcome.industry_rank / 197)
-            score += (normalized - 0.5) * weights['industry_rank']
+        if outcome.industry_rank:
+            values[3] = (1 - (outcome.industry_rank / 197)) - 0.5
 
         # Fund Count (0-5000 -> 0-1, log scale)
-        if outcome.fund_count and weights.get('fund_count', 0) > 0:
-            import math
-            normalized = min(1, math.log10(max(1, outcome.fund_count)) / 3.7)
-            score += (normalized - 0.5) * weights['fund_count']
+        if outcome.fund_count:
+            values[4] = min(1, math.log10(max(1, outcome.fund_count)) / 3.7) - 0.5
 
         # Funds Qtr Change (-500 to +500 -> 0-1)
-        if outcome.funds_qtr_chg and weights.get('funds_qtr_chg', 0) > 0:
+        if outcome.funds_qtr_chg:
             normalized = (outcome.funds_qtr_chg + 500) / 1000
-            normalized = max(0, min(1, normalized))
-            score += (normalized - 0.5) * weights['funds_qtr_chg']
+            values[5] = max(0, min(1, normalized)) - 0.5
 
         # Base Stage (1-5 -> 0-1, inverted - lower is better)
-        if outcome.base_stage and weights.get('base_stage', 0) > 0:
+        if outcome.base_stage:
             stage_num = self._parse_stage(outcome.base_stage)
             if stage_num:
-                normalized = 1 - (stage_num / 5)
-                score += (normalized - 0.5) * weights['base_stage']
+                values[6] = (1 - (stage_num / 5)) - 0.5
 
         # Base Depth (0-50% -> 0-1, inverted - lower is better)
-        if outcome.base_depth and weights.get('base_depth', 0) > 0:
-            normalized = 1 - min(1, outcome.base_depth / 50)
-            score += (normalized - 0.5) * weights['base_depth']
+        if outcome.base_depth:
+            values[7] = (1 - min(1, outcome.base_depth / 50)) - 0.5
 
         # A/D Rating (E to A+ -> 0-1)
-        if outcome.ad_rating and weights.get('ad_rating', 0) > 0:
-            ad_order = ['E', 'D-', 'D', 'D+', 'C-', 'C', 'C+', 'B-', 'B', 'B+', 'A-', 'A', 'A+']
-            if outcome.ad_rating in ad_order:
-                normalized = ad_order.index(outcome.ad_rating) / (len(ad_order) - 1)
-                score += (normalized - 0.5) * weights['ad_rating']
+        if outcome.ad_rating and outcome.ad_rating in AD_ORDER:
+            values[8] = AD_ORDER.index(outcome.ad_rating) / (len(AD_ORDER) - 1) - 0.5
 
         # Market Regime
-        if outcome.market_regime and weights.get('market_regime', 0) > 0:
-            regime_map = {'BEARISH': 0, 'NEUTRAL': 0.5, 'BULLISH': 1}
-            normalized = regime_map.get(outcome.market_regime, 0.5)
-            score += (normalized - 0.5) * weights['market_regime']
+        if outcome.market_regime:
+            values[9] = REGIME_MAP.get(outcome.market_regime, 0.5) - 0.5
 
-        return max(0, min(100, score))
+        return values
 
     def _parse_stage(self, stage_str: str) -> Optional[float]:
         """Parse stage string to numeric value."""
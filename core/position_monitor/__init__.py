@@ -19,6 +19,7 @@ from .checkers import (
 )
 
 from .monitor import PositionMonitor, MonitorCycleResult
+from .state_store import MonitorStateStore, StateMap
 
 __all__ = [
     'BaseChecker',
@@ -31,4 +32,6 @@ __all__ = [
     'ReentryChecker',
     'PositionMonitor',
     'MonitorCycleResult',
+    'MonitorStateStore',
+    'StateMap',
 ]
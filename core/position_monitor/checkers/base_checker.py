@@ -359,6 +359,24 @@ class BaseChecker(ABC):
         """
         return context.state >= 1  # Only active positions
     
+    def attach_state(self, store) -> None:
+        """
+        Keep cooldowns in a MonitorStateStore so they survive restarts.
+
+        Loaded cooldowns that have already expired are dropped.
+        """
+        cooldowns = store.map(f'cooldown.{self.name}', datetime_values=True)
+        now = datetime.now()
+        for key, last_alert in list(cooldowns.items()):
+            try:
+                subtype = AlertSubtype(key.split('_', 1)[1])
+            except (IndexError, ValueError):
+                cooldowns.pop(key)
+                continue
+            if now >= last_alert + timedelta(minutes=self._get_cooldown_minutes(subtype)):
+                cooldowns.pop(key)
+        self._cooldowns = cooldowns
+
     def is_on_cooldown(self, symbol: str, subtype: AlertSubtype) -> bool:
         """
         Check if alert is on cooldown.
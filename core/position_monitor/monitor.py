@@ -247,6 +247,11 @@ class PositionMonitor:
         result = self.run_cycle([position], price_data, tech_data)
         return result.alerts
     
+    def attach_state_store(self, store) -> None:
+        """Persist every checker's cooldowns in a MonitorStateStore."""
+        for checker in self.checkers:
+            checker.attach_state(store)
+
     def clear_cooldowns(self, symbol: str = None):
         """
         Clear cooldowns for all checkers.
@@ -0,0 +1,150 @@
+"""
+Monitor State Store - Write-behind persistence for position-monitor maps.
+
+PositionThread's trailing-stop high-water marks and each checker's
+cooldowns live in plain dicts that are read and written every cycle.
+MonitorStateStore hands out StateMap dicts that mark themselves dirty on
+any change; flush() rewrites only the changed maps, one compact packed row
+each, in a single upsert and transaction, once per cycle. load() reads
+everything back in one query at thread start.
+
+Usage:
+    store = MonitorStateStore(db_session_factory)
+    store.load()
+    max_prices = store.map('max_price')
+    cooldowns = store.map('cooldown.stop', datetime_values=True)
+    ...
+    max_prices['NVDA'] = 131.2
+    store.flush()           # end of cycle
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from canslim_monitor.data.repositories.monitor_state_repo import MonitorStateRepository
+
+
+class StateMap(dict):
+    """
+    dict that marks its scope dirty in its MonitorStateStore on change.
+
+    Values are floats, or datetimes when created with datetime_values
+    (stored as POSIX timestamps).
+    """
+
+    def __init__(self, store: 'MonitorStateStore', scope: str, datetime_values: bool = False):
+        super().__init__()
+        self._store = store
+        self._scope = scope
+        self._datetime_values = datetime_values
+
+    def _load(self, stored: Dict[str, float]):
+        decode = datetime.fromtimestamp if self._datetime_values else float
+        for key, value in stored.items():
+            dict.__setitem__(self, key, decode(value))
+
+    def snapshot(self) -> Dict[str, float]:
+        """Plain {key: float} copy for storage."""
+        if self._datetime_values:
+            return {key: value.timestamp() for key, value in self.items()}
+        return dict(self)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._store._dirty.add(self._scope)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._store._dirty.add(self._scope)
+
+    def pop(self, key, *default):
+        self._store._dirty.add(self._scope)
+        return super().pop(key, *default)
+
+    def clear(self):
+        super().clear()
+        self._store._dirty.add(self._scope)
+
+
+class MonitorStateStore:
+    """Write-behind store for StateMap scopes (``monitor_state`` table)."""
+
+    def __init__(self, db_session_factory, logger: Optional[logging.Logger] = None):
+        self.db_session_factory = db_session_factory
+        self.logger = logger or logging.getLogger('canslim.position_monitor')
+
+        self._loaded: Dict[str, Dict[str, float]] = {}
+        self._maps: Dict[str, StateMap] = {}
+        self._dirty: set = set()
+        self._lock = threading.Lock()
+
+        self.scopes_written = 0
+        self.flush_errors = 0
+
+    def load(self) -> int:
+        """
+        Read all stored state (one query). Call before map().
+
+        Returns:
+            Number of values loaded
+        """
+        if not self.db_session_factory:
+            return 0
+        try:
+            session = self.db_session_factory()
+            try:
+                self._loaded = MonitorStateRepository(session).load_all()
+            finally:
+                session.close()
+        except Exception as e:
+            self.logger.error(f"Failed to load monitor state: {e}")
+            self._loaded = {}
+        return sum(len(values) for values in self._loaded.values())
+
+    def map(self, scope: str, datetime_values: bool = False) -> StateMap:
+        """The StateMap for scope, pre-filled with loaded values."""
+        if scope not in self._maps:
+            state_map = StateMap(self, scope, datetime_values)
+            state_map._load(self._loaded.pop(scope, {}))
+            self._maps[scope] = state_map
+        return self._maps[scope]
+
+    def pending_count(self) -> int:
+        """Maps changed since the last flush."""
+        return len(self._dirty)
+
+    def flush(self) -> int:
+        """
+        Write the maps changed since the last flush in one transaction.
+
+        On failure they stay dirty for the next flush.
+
+        Returns:
+            Number of maps written
+        """
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty or not self.db_session_factory:
+            return 0
+
+        try:
+            maps = {scope: self._maps[scope].snapshot() for scope in dirty}
+            session = self.db_session_factory()
+            try:
+                MonitorStateRepository(session).save_scopes(maps)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+        except Exception as e:
+            self.flush_errors += 1
+            self.logger.error(f"Failed to write monitor state ({', '.join(sorted(dirty))}): {e}")
+            self._dirty |= dirty
+            return 0
+
+        self.scopes_written += len(maps)
+        return len(maps)
@@ -0,0 +1,372 @@
+"""
+CANSLIM Monitor - Database Backups
+===================================
+Online backups of the live WAL-mode database through SQLite's backup API.
+
+online_backup() copies the database in small page steps from its own
+connection, so the service and GUI keep reading and writing while it runs,
+and the result is a consistent image (unlike copying the file, which can
+miss pages still in the ``-wal`` file). Pages that change mid-backup make
+SQLite restart the copy; after a few restarts the remainder is copied in
+one step under a single read transaction (writers are not blocked in WAL
+mode).
+
+SnapshotStore keeps compressed, deduplicated snapshots: each backup image
+is split into fixed-size page chunks stored once by SHA-256, and a small
+JSON manifest lists the chunks of each snapshot. A nightly snapshot then
+writes only the chunks that changed since the previous one.
+
+Usage:
+    result = online_backup('canslim_monitor.db', 'backups/canslim_monitor_20260116.db')
+
+    store = SnapshotStore('backups/snapshots')
+    result = store.create('canslim_monitor.db')
+    store.verify(result.path)
+    store.restore(result.path, 'restored.db')
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+logger = logging.getLogger('canslim.database')
+
+PathLike = Union[str, Path]
+
+DEFAULT_STEP_PAGES = 256     # Pages copied per backup step
+DEFAULT_STEP_SLEEP = 0.005   # Seconds between steps, lets writers in
+DEFAULT_MAX_RESTARTS = 3     # Restarts (source changed) before one-step copy
+DEFAULT_CHUNK_PAGES = 16     # Pages per deduplicated snapshot chunk
+
+MANIFEST_SUFFIX = '.manifest.json'
+MANIFEST_VERSION = 1
+
+
+class BackupError(Exception):
+    """Raised when a backup cannot be created, verified or restored."""
+
+
+class _Restarted(Exception):
+    """Backup restarted too often because the source kept changing."""
+
+
+@dataclass
+class BackupResult:
+    """Outcome of one backup."""
+    path: str
+    duration_s: float
+    pages: int
+    page_size: int
+    bytes_written: int
+    restarts: int = 0
+    # Snapshot backups only
+    chunks: int = 0
+    new_chunks: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        result['duration_s'] = round(self.duration_s, 3)
+        return result
+
+
+def online_backup(
+    db_path: PathLike,
+    dest_path: PathLike,
+    step_pages: int = DEFAULT_STEP_PAGES,
+    step_sleep: float = DEFAULT_STEP_SLEEP,
+    max_restarts: int = DEFAULT_MAX_RESTARTS,
+) -> BackupResult:
+    """
+    Copy a live database to dest_path with the SQLite online backup API.
+
+    Args:
+        db_path: Source database (may be in use by other connections)
+        dest_path: Backup file to create (replaced if it exists)
+        step_pages: Pages per step; the source is unlocked between steps
+        step_sleep: Pause between steps (seconds)
+        max_restarts: Restarts tolerated before copying in one step
+
+    Returns:
+        BackupResult with duration, pages copied and bytes written
+    """
+    dest_path = Path(dest_path)
+    start = time.perf_counter()
+    restarts = 0
+
+    src = _connect_existing(db_path)
+    try:
+        page_size = src.execute('PRAGMA page_size').fetchone()[0]
+        last_remaining = [None]
+
+        def progress(status, remaining, total):
+            nonlocal restarts
+            if last_remaining[0] is not None and remaining > last_remaining[0]:
+                restarts += 1
+                if restarts > max_restarts:
+                    raise _Restarted()
+            last_remaining[0] = remaining
+
+        try:
+            pages = _backup_to(src, dest_path, step_pages, step_sleep, progress)
+        except _Restarted:
+            logger.info(f"Backup restarted {restarts} times, copying remainder in one step")
+            pages = _backup_to(src, dest_path, -1, 0, None)
+    finally:
+        src.close()
+
+    return BackupResult(
+        path=str(dest_path),
+        duration_s=time.perf_counter() - start,
+        pages=pages,
+        page_size=page_size,
+        bytes_written=dest_path.stat().st_size,
+        restarts=restarts,
+    )
+
+
+def _backup_to(src: sqlite3.Connection, dest_path: Path, step_pages: int, step_sleep: float, progress) -> int:
+    """Run one backup into dest_path; returns the page count of the copy."""
+    if dest_path.exists():
+        dest_path.unlink()
+    dest = sqlite3.connect(str(dest_path))
+    try:
+        src.backup(dest, pages=step_pages, progress=progress, sleep=step_sleep)
+        # A standalone file: no -wal to carry along
+        dest.execute('PRAGMA journal_mode=DELETE')
+        return dest.execute('PRAGMA page_count').fetchone()[0]
+    finally:
+        dest.close()
+
+
+def integrity_check(db_path: PathLike) -> str:
+    """PRAGMA integrity_check on a database file ('ok' when healthy)."""
+    conn = _connect_existing(db_path)
+    try:
+        rows = conn.execute('PRAGMA integrity_check').fetchall()
+        return '; '.join(row[0] for row in rows)
+    finally:
+        conn.close()
+
+
+class SnapshotStore:
+    """
+    Compressed, deduplicated database snapshots.
+
+    Layout under root:
+        chunks/ab/abcdef...     zlib-compressed page chunks, named by SHA-256
+        <name>_<ts>.manifest.json
+    """
+
+    def __init__(self, root: PathLike, chunk_pages: int = DEFAULT_CHUNK_PAGES, compress_level: int = 6):
+        self.root = Path(root)
+        self.chunk_dir = self.root / 'chunks'
+        self.chunk_pages = chunk_pages
+        self.compress_level = compress_level
+
+    # -------------------- CREATE --------------------
+
+    def create(self, db_path: PathLike, name: str = None, **backup_kwargs) -> BackupResult:
+        """
+        Snapshot a live database: an online backup to a temporary file, then
+        only chunks not already in the store are compressed and written.
+
+        Returns:
+            BackupResult; path is the manifest, bytes_written counts new
+            chunk bytes plus the manifest
+        """
+        db_path = Path(db_path)
+        name = name or db_path.stem
+        self.chunk_dir.mkdir(parents=True, exist_ok=True)
+
+        start = time.perf_counter()
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        temp_path = self.root / f'.{name}_{timestamp}.tmp'
+        try:
+            image = online_backup(db_path, temp_path, **backup_kwargs)
+            chunk_size = image.page_size * self.chunk_pages
+
+            chunks = []
+            new_chunks = 0
+            bytes_written = 0
+            whole = hashlib.sha256()
+            with open(temp_path, 'rb') as f:
+                while True:
+                    data = f.read(chunk_size)
+                    if not data:
+                        break
+                    whole.update(data)
+                    digest = hashlib.sha256(data).hexdigest()
+                    chunks.append(digest)
+                    path = self._chunk_path(digest)
+                    if not path.exists():
+                        path.parent.mkdir(exist_ok=True)
+                        packed = zlib.compress(data, self.compress_level)
+                        _write_atomic(path, packed)
+                        new_chunks += 1
+                        bytes_written += len(packed)
+            size = temp_path.stat().st_size
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'source': str(db_path),
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'page_size': image.page_size,
+            'pages': image.pages,
+            'chunk_pages': self.chunk_pages,
+            'size': size,
+            'sha256': whole.hexdigest(),
+            'chunks': chunks,
+        }
+        manifest_path = self.root / f'{name}_{timestamp}{MANIFEST_SUFFIX}'
+        n = 0
+        while manifest_path.exists():  # more than one snapshot in a second
+            n += 1
+            manifest_path = self.root / f'{name}_{timestamp}_{n}{MANIFEST_SUFFIX}'
+        payload = json.dumps(manifest, indent=1).encode()
+        _write_atomic(manifest_path, payload)
+
+        return BackupResult(
+            path=str(manifest_path),
+            duration_s=time.perf_counter() - start,
+            pages=image.pages,
+            page_size=image.page_size,
+            bytes_written=bytes_written + len(payload),
+            restarts=image.restarts,
+            chunks=len(chunks),
+            new_chunks=new_chunks,
+        )
+
+    # -------------------- LIST / ROTATE --------------------
+
+    def snapshots(self, name: str = None) -> List[Path]:
+        """Manifests, newest first."""
+        pattern = f'{name}_*{MANIFEST_SUFFIX}' if name else f'*{MANIFEST_SUFFIX}'
+        return sorted(self.root.glob(pattern), reverse=True)
+
+    def rotate(self, keep: int, name: str = None) -> Tuple[int, int]:
+        """
+        Keep the newest `keep` snapshots and delete chunks no longer referenced.
+
+        Returns:
+            (snapshots deleted, chunks deleted)
+        """
+        manifests = self.snapshots(name)
+        deleted = 0
+        for old in manifests[keep:]:
+            old.unlink()
+            deleted += 1
+        if not deleted:
+            return 0, 0
+
+        referenced = set()
+        for manifest_path in self.snapshots():
+            referenced.update(self._load_manifest(manifest_path)['chunks'])
+
+        removed_chunks = 0
+        for path in self.chunk_dir.glob('*/*'):
+            if path.name not in referenced:
+                path.unlink()
+                removed_chunks += 1
+        return deleted, removed_chunks
+
+    # -------------------- VERIFY / RESTORE --------------------
+
+    def restore(self, manifest_path: PathLike, dest_path: PathLike, overwrite: bool = False) -> Path:
+        """
+        Rebuild the database file of a snapshot, checking every chunk hash,
+        the whole-file hash and PRAGMA integrity_check.
+
+        Raises:
+            BackupError: On a missing or corrupt chunk, or a failed check
+        """
+        manifest = self._load_manifest(manifest_path)
+        dest_path = Path(dest_path)
+        if dest_path.exists() and not overwrite:
+            raise BackupError(f"Restore target exists: {dest_path}")
+
+        temp_path = dest_path.with_name(dest_path.name + '.restoring')
+        try:
+            whole = hashlib.sha256()
+            with open(temp_path, 'wb') as out:
+                for data in self._read_chunks(manifest):
+                    whole.update(data)
+                    out.write(data)
+            if whole.hexdigest() != manifest['sha256']:
+                raise BackupError("Restored image does not match the snapshot hash")
+            result = integrity_check(temp_path)
+            if result != 'ok':
+                raise BackupError(f"Integrity check failed: {result}")
+            os.replace(temp_path, dest_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        return dest_path
+
+    def verify(self, manifest_path: PathLike) -> Dict[str, Any]:
+        """
+        Check a snapshot without keeping the restored file.
+
+        Returns:
+            Dict with ok, chunks, size and the error (if any)
+        """
+        manifest = self._load_manifest(manifest_path)
+        temp_path = self.root / f'.verify_{os.getpid()}.tmp'
+        try:
+            self.restore(manifest_path, temp_path, overwrite=True)
+            return {'ok': True, 'chunks': len(manifest['chunks']), 'size': manifest['size']}
+        except BackupError as e:
+            return {'ok': False, 'chunks': len(manifest['chunks']), 'size': manifest['size'], 'error': str(e)}
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    # -------------------- INTERNAL --------------------
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunk_dir / digest[:2] / digest
+
+    def _read_chunks(self, manifest: Dict[str, Any]):
+        for digest in manifest['chunks']:
+            path = self._chunk_path(digest)
+            try:
+                data = zlib.decompress(path.read_bytes())
+            except (OSError, zlib.error) as e:
+                raise BackupError(f"Chunk {digest[:12]} unreadable: {e}")
+            if hashlib.sha256(data).hexdigest() != digest:
+                raise BackupError(f"Chunk {digest[:12]} is corrupt")
+            yield data
+
+    @staticmethod
+    def _load_manifest(manifest_path: PathLike) -> Dict[str, Any]:
+        try:
+            manifest = json.loads(Path(manifest_path).read_text())
+        except (OSError, ValueError) as e:
+            raise BackupError(f"Cannot read manifest {manifest_path}: {e}")
+        if manifest.get('version') != MANIFEST_VERSION:
+            raise BackupError(f"Unsupported manifest version: {manifest.get('version')}")
+        return manifest
+
+
+def _connect_existing(db_path: PathLike) -> sqlite3.Connection:
+    """Connect without creating the file when it is missing."""
+    if not Path(db_path).is_file():
+        raise BackupError(f"Database not found: {db_path}")
+    return sqlite3.connect(str(db_path))
+
+
+def _write_atomic(path: Path, data: bytes):
+    temp = path.with_name(path.name + '.part')
+    with open(temp, 'wb') as f:
+        f.write(data)
+    os.replace(temp, path)
@@ -0,0 +1,409 @@
+"""
+CANSLIM Monitor - Columnar Bar Cache
+=====================================
+Per-symbol, per-timeframe OHLCV history on disk as fixed-width NumPy
+columns, memory-mapped copy-on-write.
+
+Chart dialogs and DataFrame consumers used to re-download bars or rebuild
+them from ORM rows into dicts and then a DataFrame on every open. With the
+cache, opening a chart is an mmap of the stored columns plus a fetch of
+the missing tail, and ``BarArrays.to_dataframe`` wraps the mapped arrays
+without copying.
+
+Layout (one directory per series, one file per column):
+
+    <root>/<timeframe>/<SYMBOL>/g<generation>/{timestamp,open,high,low,close,volume}.bin
+
+- Columns are raw little-endian int64 / float64; the row count is the
+  shortest column, so a torn append is simply not visible
+- New bars are appended in place and a revised last bar is overwritten in
+  place; files never shrink, so live mappings stay valid
+- History that cannot be appended (prepends, split adjustments, gaps) is
+  written to a new generation directory; older generations are removed
+  once nothing maps them
+- Writers serialize on a per-series lock file (threads and processes)
+- Maps are copy-on-write: a caller editing a DataFrame built on them
+  changes private pages only, never the files or other loads
+
+Usage:
+    from canslim_monitor.data.bar_cache import get_bar_cache
+
+    arrays = get_bar_cache().sync('NVDA', 'day', fetch)
+    df = arrays[-500:].to_dataframe()
+"""
+
+import logging
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('timestamp', '<i8'),   # epoch milliseconds (UTC)
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<i8'),
+)
+OVERLAP_BARS = 3              # Cached bars re-fetched with every tail to catch revisions
+ADJUSTMENT_TOLERANCE = 1e-3   # Relative close change on a settled bar that forces a rebuild
+COMPLETE_MARKER = 'complete'
+
+logger = logging.getLogger('canslim.bar_cache')
+
+
+def bar_timestamp_ms(bar) -> int:
+    """Epoch ms for a bar: its intraday ``_timestamp_ms``, else UTC midnight of its date."""
+    ts_ms = getattr(bar, '_timestamp_ms', None)
+    if ts_ms is not None:
+        return int(ts_ms)
+    bar_dt = getattr(bar, 'bar_date', None) or getattr(bar, 'date')
+    if isinstance(bar_dt, datetime):
+        bar_dt = bar_dt.date()
+    return int(datetime(bar_dt.year, bar_dt.month, bar_dt.day, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def timestamp_to_date(ts_ms: int) -> date:
+    """UTC calendar date of an epoch-ms timestamp (inverse of bar_timestamp_ms for daily bars)."""
+    return datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc).date()
+
+
+class BarArrays:
+    """Column views over one cached series (copy-on-write memmaps or slices of them)."""
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns = columns
+
+    @classmethod
+    def from_bars(cls, bars: Sequence) -> 'BarArrays':
+        """Build in-memory columns from bar objects (sorted by timestamp, last duplicate wins)."""
+        rows = {}
+        for bar in bars:
+            rows[bar_timestamp_ms(bar)] = (
+                bar.open, bar.high, bar.low, bar.close, getattr(bar, 'volume', 0) or 0,
+            )
+        stamps = sorted(rows)
+        values = [rows[ts] for ts in stamps]
+        columns = {'timestamp': np.array(stamps, dtype=COLUMNS[0][1])}
+        for i, (name, dtype) in enumerate(COLUMNS[1:]):
+            columns[name] = np.array([v[i] for v in values], dtype=dtype)
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(self.columns['timestamp'])
+
+    def __getitem__(self, item) -> 'BarArrays':
+        if not isinstance(item, slice):
+            raise TypeError("BarArrays supports slicing only")
+        return BarArrays({name: col[item] for name, col in self.columns.items()})
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__['columns'][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def since(self, ts_ms: int) -> 'BarArrays':
+        """Bars at or after *ts_ms* (view)."""
+        return self[int(np.searchsorted(self.columns['timestamp'], ts_ms, side='left')):]
+
+    def rows(self) -> Iterator[Tuple[int, float, float, float, float, int]]:
+        """(timestamp_ms, open, high, low, close, volume) per bar, as Python scalars."""
+        return zip(*(self.columns[name].tolist() for name, _ in COLUMNS))
+
+    def to_dataframe(self) -> 'pd.DataFrame':
+        """DataFrame (timestamp, open, high, low, close, volume) wrapping the arrays without a copy."""
+        import pandas as pd
+        return pd.DataFrame(
+            {name: self.columns[name].view(np.ndarray) for name, _ in COLUMNS}, copy=False
+        )
+
+
+class BarCache:
+    """Memory-mapped columnar OHLCV store, one series per (symbol, timeframe)."""
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: Cache directory (created on first write)
+        """
+        self.root = root
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def load(self, symbol: str, timeframe: str) -> Optional[BarArrays]:
+        """Map the stored series copy-on-write; None if nothing is cached."""
+        gen_dir = self._current_generation(symbol, timeframe)
+        if gen_dir is None:
+            return None
+        rows = self._row_count(gen_dir)
+        if rows == 0:
+            return None
+        return BarArrays({
+            name: np.memmap(os.path.join(gen_dir, f'{name}.bin'), dtype=dtype, mode='c', shape=(rows,))
+            for name, dtype in COLUMNS
+        })
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def sync(
+        self,
+        symbol: str,
+        timeframe: str,
+        fetch: Callable[[Optional[int]], Sequence],
+    ) -> Optional[BarArrays]:
+        """
+        Bring the series up to date and return it mapped.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Series key ('day', 'hour', ...)
+            fetch: ``fetch(since_ms)`` returns bars (oldest first) from
+                   *since_ms* onwards, or the full history when None
+
+        A cold cache takes the full history. Otherwise only the tail from
+        the last OVERLAP_BARS cached bars is fetched; revised bars are
+        overwritten in place and new ones appended. If the tail does not
+        reach back to the cached bars, or a settled bar changed (split /
+        dividend adjustment), the full history is fetched and rebuilt.
+        """
+        with self._write_lock(symbol, timeframe):
+            cached = self.load(symbol, timeframe)
+            if cached is None:
+                bars = fetch(None)
+                if bars:
+                    self._write_generation(symbol, timeframe, BarArrays.from_bars(bars))
+            else:
+                anchor = int(cached.timestamp[max(0, len(cached) - OVERLAP_BARS)])
+                bars = fetch(anchor)
+                if bars:
+                    tail = BarArrays.from_bars(bars)
+                    if not self._merge_tail(symbol, timeframe, cached, tail, anchor):
+                        logger.info(f"{symbol} [{timeframe}]: cached history stale, rebuilding")
+                        full = fetch(None)
+                        if full:
+                            self._write_generation(symbol, timeframe, BarArrays.from_bars(full))
+        return self.load(symbol, timeframe)
+
+    def rebuild(
+        self,
+        symbol: str,
+        timeframe: str,
+        fetch: Callable[[Optional[int]], Sequence],
+    ) -> Optional[BarArrays]:
+        """Replace the series with ``fetch(None)`` (e.g. after older bars were backfilled at the source)."""
+        with self._write_lock(symbol, timeframe):
+            self._write_generation(symbol, timeframe, BarArrays.from_bars(fetch(None) or []))
+        return self.load(symbol, timeframe)
+
+    def extend(self, symbol: str, timeframe: str, bars: Sequence) -> Optional[BarArrays]:
+        """Merge arbitrary bars (e.g. an older history chunk) into the series as a new generation."""
+        if not bars:
+            return self.load(symbol, timeframe)
+        with self._write_lock(symbol, timeframe):
+            incoming = BarArrays.from_bars(bars)
+            cached = self.load(symbol, timeframe)
+            if cached is not None:
+                keep = ~np.isin(cached.timestamp, incoming.timestamp)
+                combined = {
+                    name: np.concatenate([np.asarray(cached.columns[name])[keep], incoming.columns[name]])
+                    for name, _ in COLUMNS
+                }
+                order = np.argsort(combined['timestamp'], kind='stable')
+                incoming = BarArrays({name: col[order] for name, col in combined.items()})
+            self._write_generation(symbol, timeframe, incoming)
+        return self.load(symbol, timeframe)
+
+    def clear(self, symbol: str, timeframe: str = None):
+        """Drop a series (all timeframes by default); mapped files are removed once released."""
+        timeframes = [timeframe] if timeframe else (
+            os.listdir(self.root) if os.path.isdir(self.root) else []
+        )
+        for tf in timeframes:
+            shutil.rmtree(self._series_dir(symbol, tf), ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _series_dir(self, symbol: str, timeframe: str) -> str:
+        return os.path.join(self.root, timeframe, symbol.upper())
+
+    def _generations(self, series_dir: str) -> List[int]:
+        try:
+            names = os.listdir(series_dir)
+        except FileNotFoundError:
+            return []
+        gens = [int(n[1:]) for n in names if n.startswith('g') and n[1:].isdigit()]
+        return sorted(gens)
+
+    def _current_generation(self, symbol: str, timeframe: str) -> Optional[str]:
+        series_dir = self._series_dir(symbol, timeframe)
+        for gen in reversed(self._generations(series_dir)):
+            gen_dir = os.path.join(series_dir, f'g{gen:06d}')
+            if os.path.exists(os.path.join(gen_dir, COMPLETE_MARKER)):
+                return gen_dir
+        return None
+
+    @staticmethod
+    def _row_count(gen_dir: str) -> int:
+        return min(
+            os.path.getsize(os.path.join(gen_dir, f'{name}.bin')) // np.dtype(dtype).itemsize
+            for name, dtype in COLUMNS
+        )
+
+    def _merge_tail(self, symbol: str, timeframe: str, cached: BarArrays,
+                    tail: BarArrays, anchor: int) -> bool:
+        """Overwrite revised bars and append new ones in place; False if a rebuild is needed."""
+        stamps = cached.timestamp
+        last = int(stamps[-1])
+        if int(tail.timestamp[0]) > anchor:
+            return False   # Tail does not reach the cached bars: possible gap
+        tail = tail.since(anchor)
+
+        overlap = tail[:int(np.searchsorted(tail.timestamp, last, side='right'))]
+        positions = np.searchsorted(stamps, overlap.timestamp)
+        positions = np.minimum(positions, len(stamps) - 1)
+        if not np.array_equal(stamps[positions], overlap.timestamp) or (
+            len(overlap) and (positions[0] + len(overlap) != len(stamps))
+        ):
+            return False   # Bar set changed inside the cached range
+
+        # Settled bars (all but the newest cached one) must match
+        settled = overlap.timestamp < last
+        if settled.any():
+            old = cached.close[positions[settled]]
+            new = overlap.close[settled]
+            if np.any(np.abs(new - old) > ADJUSTMENT_TOLERANCE * np.abs(old)):
+                return False
+
+        new = tail[len(overlap):]
+        if len(overlap) and all(
+            np.array_equal(cached.columns[name][positions], overlap.columns[name])
+            for name, _ in COLUMNS
+        ):
+            overlap = overlap[:0]   # Unchanged: nothing to overwrite
+        if not len(overlap) and not len(new):
+            return True
+
+        gen_dir = self._current_generation(symbol, timeframe)
+        rows = len(cached)
+        for name, dtype in COLUMNS:
+            itemsize = np.dtype(dtype).itemsize
+            with open(os.path.join(gen_dir, f'{name}.bin'), 'r+b') as f:
+                if len(overlap):
+                    f.seek(int(positions[0]) * itemsize)
+                    f.write(np.ascontiguousarray(overlap.columns[name], dtype=dtype).tobytes())
+                if len(new):
+                    # Write at the logical end: overwrites any torn tail from an earlier crash
+                    f.seek(rows * itemsize)
+                    f.write(np.ascontiguousarray(new.columns[name], dtype=dtype).tobytes())
+        return True
+
+    def _write_generation(self, symbol: str, timeframe: str, arrays: BarArrays):
+        """Write *arrays* as a new generation, then drop the older ones."""
+        series_dir = self._series_dir(symbol, timeframe)
+        os.makedirs(series_dir, exist_ok=True)
+        gens = self._generations(series_dir)
+        gen = (gens[-1] + 1) if gens else 1
+        gen_dir = os.path.join(series_dir, f'g{gen:06d}')
+        os.makedirs(gen_dir)
+        for name, dtype in COLUMNS:
+            np.ascontiguousarray(arrays.columns[name], dtype=dtype).tofile(
+                os.path.join(gen_dir, f'{name}.bin')
+            )
+        open(os.path.join(gen_dir, COMPLETE_MARKER), 'w').close()
+
+        for old in gens:
+            # Fails while another reader still maps the files (Windows); retried next rebuild
+            shutil.rmtree(os.path.join(series_dir, f'g{old:06d}'), ignore_errors=True)
+
+    @contextmanager
+    def _write_lock(self, symbol: str, timeframe: str):
+        """Serialize writers of one series across threads and processes."""
+        key = f'{timeframe}/{symbol.upper()}'
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            series_dir = self._series_dir(symbol, timeframe)
+            os.makedirs(series_dir, exist_ok=True)
+            with open(os.path.join(series_dir, '.lock'), 'a+b') as handle:
+                _lock_file(handle)
+                try:
+                    yield
+                finally:
+                    _unlock_file(handle)
+
+
+if os.name == 'nt':
+    import msvcrt
+
+    def _lock_file(handle):
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(handle):
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(handle):
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(handle):
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+# Singleton instance
+_cache: Optional[BarCache] = None
+_cache_lock = threading.Lock()
+
+
+def default_cache_root() -> str:
+    """``bar_cache`` under CANSLIM_DATA_DIR (same default location as the database)."""
+    return os.path.join(os.environ.get('CANSLIM_DATA_DIR', '.'), 'bar_cache')
+
+
+def get_bar_cache() -> Optional[BarCache]:
+    """
+    Get the process-wide bar cache.
+
+    Returns:
+        BarCache instance, or None if init_bar_cache() was never called
+    """
+    return _cache
+
+
+def init_bar_cache(root: str = None) -> BarCache:
+    """
+    Create (or re-root) the process-wide bar cache.
+
+    Args:
+        root: Cache directory (default: ``default_cache_root()``); normally
+              a ``bar_cache`` directory next to the database file
+
+    Returns:
+        BarCache instance
+    """
+    global _cache
+    root = root or default_cache_root()
+    with _cache_lock:
+        if _cache is None or _cache.root != root:
+            _cache = BarCache(root)
+        return _cache
@@ -8,7 +8,7 @@ All tables defined according to the Unified Monitor Implementation Plan v1.0
 from datetime import datetime, date
 from typing import Optional, List
 from sqlalchemy import (
-    Column, Integer, String, Float, Text, Date, DateTime, Boolean,
+    Column, Integer, String, Float, Text, Date, DateTime, Boolean, LargeBinary,
     ForeignKey, Index, UniqueConstraint, create_engine, event
 )
 from sqlalchemy.orm import declarative_base, relationship, Session
@@ -993,3 +993,82 @@ class ProviderHealthLog(Base):
             f"<ProviderHealthLog(provider_id={self.provider_id}, "
             f"status='{self.status}', at='{self.recorded_at}')>"
         )
+
+
+class IBKRContract(Base):
+    """
+    Qualified IBKR stock contracts, cached by symbol.
+
+    Lets quote requests skip ``qualifyContracts`` (one TWS round trip per
+    symbol) in steady state.  Rows are refreshed after ``ContractCache``'s
+    TTL expires or when TWS reports the conId as invalid (error 200).
+    """
+    __tablename__ = 'ibkr_contract_cache'
+
+    symbol = Column(String(10), primary_key=True)
+    con_id = Column(Integer, nullable=False)
+    sec_type = Column(String(10), default='STK')
+    exchange = Column(String(20), default='SMART')
+    primary_exchange = Column(String(20))
+    currency = Column(String(5), default='USD')
+    local_symbol = Column(String(20))
+    qualified_at = Column(DateTime, nullable=False, default=func.now())
+
+    def __repr__(self):
+        return f"<IBKRContract(symbol='{self.symbol}', con_id={self.con_id})>"
+
+
+class AlertOutbox(Base):
+    """
+    Discord deliveries waiting on the alert delivery worker.
+
+    AlertService writes one row per routed alert (in batches, alongside the
+    Alert row) instead of posting inline; AlertDeliveryThread drains PENDING
+    rows with per-webhook rate limiting and retries them with back-off
+    until SENT or FAILED.
+    """
+    __tablename__ = 'alert_outbox'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    alert_id = Column(Integer, ForeignKey('alerts.id', ondelete='SET NULL'))
+    symbol = Column(String(10))
+    channel = Column(String(50), nullable=False)
+    priority = Column(String(5), default='P1')  # P0 delivered first
+    payload = Column(Text, nullable=False)  # JSON webhook body
+
+    status = Column(String(10), nullable=False, default='PENDING')  # PENDING, SENT, FAILED
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False)
+    last_error = Column(Text)
+
+    created_at = Column(DateTime, nullable=False)  # When the alert was raised
+    sent_at = Column(DateTime)
+
+    __table_args__ = (
+        Index('idx_outbox_due', 'status', 'next_attempt_at'),
+    )
+
+    def __repr__(self):
+        return f"<AlertOutbox(id={self.id}, channel='{self.channel}', status='{self.status}')>"
+
+
+class MonitorState(Base):
+    """
+    Position-monitor state that must survive a service restart.
+
+    One row per map: trailing-stop high-water marks (``max_price`` /
+    ``max_gain`` scopes, keyed by symbol) and each checker's cooldowns
+    (``cooldown.<checker>`` scopes, keyed by ``SYMBOL_SUBTYPE``, POSIX
+    timestamps). Stored compactly as newline-joined keys plus a packed
+    float64 array; changed maps are rewritten by MonitorStateStore once
+    per position cycle.
+    """
+    __tablename__ = 'monitor_state'
+
+    scope = Column(String(40), primary_key=True)
+    keys = Column(Text, nullable=False)             # '\n'-joined
+    values = Column(LargeBinary, nullable=False)    # array('d') bytes, same order
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<MonitorState(scope='{self.scope}', updated_at='{self.updated_at}')>"
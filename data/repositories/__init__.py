@@ -16,6 +16,9 @@ from canslim_monitor.data.repositories.market_config_repo import (
 from canslim_monitor.data.repositories.history_repo import HistoryRepository
 from canslim_monitor.data.repositories.learning_repo import LearningRepository
 from canslim_monitor.data.repositories.provider_repo import ProviderRepository
+from canslim_monitor.data.repositories.bar_repo import BarRepository
+from canslim_monitor.data.repositories.outbox_repo import OutboxRepository
+from canslim_monitor.data.repositories.monitor_state_repo import MonitorStateRepository
 
 __all__ = [
     'PositionRepository',
@@ -28,6 +31,9 @@ __all__ = [
     'HistoryRepository',
     'LearningRepository',
     'ProviderRepository',
+    'BarRepository',
+    'OutboxRepository',
+    'MonitorStateRepository',
 ]
 
 
@@ -116,3 +122,24 @@ class RepositoryManager:
         if 'providers' not in self._repos:
             self._repos['providers'] = ProviderRepository(self._session)
         return self._repos['providers']
+
+    @property
+    def bars(self) -> BarRepository:
+        """Get HistoricalBar repository."""
+        if 'bars' not in self._repos:
+            self._repos['bars'] = BarRepository(self._session)
+        return self._repos['bars']
+
+    @property
+    def outbox(self) -> OutboxRepository:
+        """Get AlertOutbox repository."""
+        if 'outbox' not in self._repos:
+            self._repos['outbox'] = OutboxRepository(self._session)
+        return self._repos['outbox']
+
+    @property
+    def monitor_state(self) -> MonitorStateRepository:
+        """Get MonitorState repository."""
+        if 'monitor_state' not in self._repos:
+            self._repos['monitor_state'] = MonitorStateRepository(self._session)
+        return self._repos['monitor_state']
@@ -5,14 +5,46 @@ Phase 1: Database Foundation
 Provides CRUD operations and queries for Alert entities.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, date, timedelta
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from sqlalchemy import and_, or_, func, desc
 from sqlalchemy.orm import Session
 
 from canslim_monitor.data.models import Alert
 
 
+@dataclass(frozen=True)
+class AlertFeedFilter:
+    """Filters for the alert feed, applied in SQL."""
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    symbol: Optional[str] = None
+    alert_types: FrozenSet[str] = frozenset()   # Empty = all types
+
+
+# Sort keys for the feed -> (column expression, NULL stand-in).  NULLs sort
+# as 0 / '' so the keyset comparison never meets a NULL.
+FEED_SORT_KEYS = {
+    'alert_time': (Alert.alert_time, None),
+    'symbol': (Alert.symbol, ''),
+    'alert_type': (Alert.alert_type, ''),
+    'alert_subtype': (Alert.alert_subtype, ''),
+    'price': (Alert.price, 0.0),
+    'pnl_pct_at_alert': (Alert.pnl_pct_at_alert, 0.0),
+    'acknowledged': (Alert.acknowledged, False),
+    'health_rating': (Alert.health_rating, ''),
+    'canslim_grade': (Alert.canslim_grade, ''),
+    'canslim_score': (Alert.canslim_score, 0),
+    'market_regime': (Alert.market_regime, ''),
+    'volume_ratio': (Alert.volume_ratio, 0.0),
+    'pivot_at_alert': (Alert.pivot_at_alert, 0.0),
+    'avg_cost_at_alert': (Alert.avg_cost_at_alert, 0.0),
+    'ma21': (Alert.ma21, 0.0),
+    'ma50': (Alert.ma50, 0.0),
+}
+
+
 class AlertRepository:
     """Repository for Alert entity operations."""
     
@@ -390,6 +422,93 @@ class AlertRepository:
         
         return list(stats.values())
     
+    # ==================== FEED (keyset pagination) ====================
+
+    def _feed_query(self, query, feed_filter: AlertFeedFilter):
+        if feed_filter.since:
+            query = query.filter(Alert.alert_time >= feed_filter.since)
+        if feed_filter.until:
+            query = query.filter(Alert.alert_time <= feed_filter.until)
+        if feed_filter.symbol:
+            query = query.filter(Alert.symbol == feed_filter.symbol.upper())
+        if feed_filter.alert_types:
+            query = query.filter(Alert.alert_type.in_(feed_filter.alert_types))
+        return query
+
+    @staticmethod
+    def _sort_expr(sort: str):
+        column, null_value = FEED_SORT_KEYS[sort]
+        return column if null_value is None else func.coalesce(column, null_value)
+
+    @staticmethod
+    def feed_cursor(alert: Alert, sort: str = 'alert_time') -> Tuple[Any, int]:
+        """Keyset cursor (sort value, id) of *alert* for get_feed_page(after=...)."""
+        column, null_value = FEED_SORT_KEYS[sort]
+        value = getattr(alert, column.key)
+        return (null_value if value is None else value, alert.id)
+
+    def get_feed_page(
+        self,
+        feed_filter: AlertFeedFilter = AlertFeedFilter(),
+        sort: str = 'alert_time',
+        descending: bool = True,
+        after: Tuple[Any, int] = None,
+        limit: int = 200
+    ) -> List[Alert]:
+        """
+        One page of the alert feed, ordered by (sort, id).
+
+        Keyset pagination: pass the feed_cursor() of the last row of the
+        previous page as *after*; cost does not grow with page depth.
+
+        Args:
+            feed_filter: SQL filters
+            sort: Key of FEED_SORT_KEYS
+            descending: Newest / largest first
+            after: Cursor of the previous page's last row (None = first page)
+            limit: Page size
+        """
+        key = self._sort_expr(sort)
+        query = self._feed_query(self.session.query(Alert), feed_filter)
+
+        if after is not None:
+            value, last_id = after
+            if descending:
+                query = query.filter(or_(key < value, and_(key == value, Alert.id < last_id)))
+            else:
+                query = query.filter(or_(key > value, and_(key == value, Alert.id > last_id)))
+
+        if descending:
+            query = query.order_by(key.desc(), Alert.id.desc())
+        else:
+            query = query.order_by(key.asc(), Alert.id.asc())
+        return query.limit(limit).all()
+
+    def get_feed_newer(
+        self,
+        after_id: int,
+        feed_filter: AlertFeedFilter = AlertFeedFilter(),
+        limit: int = 1000
+    ) -> List[Alert]:
+        """Alerts matching the filter with id > *after_id*, newest first."""
+        query = self._feed_query(self.session.query(Alert), feed_filter)
+        return query.filter(Alert.id > (after_id or 0)).order_by(
+            Alert.alert_time.desc(), Alert.id.desc()
+        ).limit(limit).all()
+
+    def get_feed_stats(self, feed_filter: AlertFeedFilter = AlertFeedFilter()) -> Tuple[int, int]:
+        """(matching alert count, highest matching id or 0) in one query."""
+        count, max_id = self._feed_query(
+            self.session.query(func.count(Alert.id), func.max(Alert.id)), feed_filter
+        ).one()
+        return count or 0, max_id or 0
+
+    def get_feed_values(self, column: str, feed_filter: AlertFeedFilter = AlertFeedFilter()) -> List[str]:
+        """Distinct non-null values of *column* ('symbol', 'alert_type') in the filtered feed."""
+        attr = getattr(Alert, column)
+        query = self._feed_query(self.session.query(attr).distinct(), feed_filter)
+        return sorted(v for (v,) in query.filter(attr.isnot(None)).all())
+
     # ==================== UPDATE ====================
     
     def update(self, alert: Alert, **kwargs) -> Alert:
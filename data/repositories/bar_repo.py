@@ -0,0 +1,199 @@
+"""
+CANSLIM Monitor - Historical Bar Repository
+============================================
+Local daily OHLCV store backed by the ``historical_bars`` table.
+
+Used by TechnicalDataService (MA calculations) and VolumeService so that
+only the missing tail of a symbol's history has to be downloaded.
+
+Bulk ingestion (``bulk_upsert``) bypasses the ORM: rows are streamed in
+chunks through one ``INSERT ... ON CONFLICT(symbol, bar_date) DO UPDATE``
+statement executed with executemany, one transaction per chunk.
+"""
+
+from datetime import date
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from canslim_monitor.data.models import HistoricalBar
+
+
+BULK_CHUNK_SIZE = 5000   # Rows per executemany / transaction
+
+# Positional parameters straight to the DBAPI: per-row bind processing in
+# SQLAlchemy costs more than the insert itself at this volume.
+_BULK_UPSERT_SQL = """
+    INSERT INTO historical_bars
+        (symbol, bar_date, open, high, low, close, volume, vwap, transactions, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(symbol, bar_date) DO UPDATE SET
+        open = excluded.open,
+        high = excluded.high,
+        low = excluded.low,
+        close = excluded.close,
+        volume = excluded.volume,
+        vwap = excluded.vwap,
+        transactions = excluded.transactions
+"""
+
+
+def _bar_row(bar) -> tuple:
+    """Parameter tuple for one bar (object with symbol/bar_date/OHLCV attrs)."""
+    return (
+        bar.symbol.upper(),
+        bar.bar_date.isoformat(),
+        bar.open,
+        bar.high,
+        bar.low,
+        bar.close,
+        bar.volume,
+        getattr(bar, 'vwap', None),
+        getattr(bar, 'transactions', None),
+    )
+
+
+class BarRepository:
+    """Repository for HistoricalBar (daily OHLCV) rows."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    # -------------------- READ --------------------
+
+    def get_last_bar_date(self, symbol: str) -> Optional[date]:
+        """Most recent stored bar_date for *symbol*, or None if none stored."""
+        return self.session.query(func.max(HistoricalBar.bar_date)).filter(
+            HistoricalBar.symbol == symbol.upper()
+        ).scalar()
+
+    def get_last_bar_dates(self, symbols: Iterable[str]) -> Dict[str, date]:
+        """Most recent stored bar_date per symbol (one query); symbols without bars are omitted."""
+        symbols = {s.upper() for s in symbols}
+        if not symbols:
+            return {}
+        return dict(
+            self.session.query(HistoricalBar.symbol, func.max(HistoricalBar.bar_date))
+            .filter(HistoricalBar.symbol.in_(symbols))
+            .group_by(HistoricalBar.symbol)
+            .all()
+        )
+
+    def count(self, symbol: str) -> int:
+        """Number of stored bars for *symbol*."""
+        return self.session.query(func.count(HistoricalBar.id)).filter(
+            HistoricalBar.symbol == symbol.upper()
+        ).scalar() or 0
+
+    def get_span(self, symbol: str) -> Tuple[int, Optional[date], Optional[date]]:
+        """(bar count, first bar_date, last bar_date) for *symbol* in one query."""
+        count, first, last = self.session.query(
+            func.count(HistoricalBar.id), func.min(HistoricalBar.bar_date), func.max(HistoricalBar.bar_date)
+        ).filter(HistoricalBar.symbol == symbol.upper()).one()
+        return count or 0, first, last
+
+    def get_bars(self, symbol: str, limit: int = None) -> List[HistoricalBar]:
+        """
+        Stored bars for *symbol*, oldest first.
+
+        Args:
+            symbol: Stock symbol
+            limit: Return only the most recent N bars
+        """
+        query = self.session.query(HistoricalBar).filter(
+            HistoricalBar.symbol == symbol.upper()
+        ).order_by(HistoricalBar.bar_date.desc())
+        if limit:
+            query = query.limit(limit)
+        bars = query.all()
+        bars.reverse()
+        return bars
+
+    # -------------------- WRITE --------------------
+
+    def upsert_bars(self, bars: Iterable) -> int:
+        """
+        Insert or update bars (any object with symbol/bar_date/OHLCV attrs).
+
+        Existing rows for the same (symbol, bar_date) are updated in place.
+        Existing dates are looked up with one query per symbol rather than
+        one per bar.
+
+        Returns:
+            Number of bars written
+        """
+        by_symbol = {}
+        for bar in bars:
+            by_symbol.setdefault(bar.symbol.upper(), []).append(bar)
+
+        written = 0
+        for symbol, symbol_bars in by_symbol.items():
+            dates = [b.bar_date for b in symbol_bars]
+            existing = {
+                row.bar_date: row
+                for row in self.session.query(HistoricalBar).filter(
+                    HistoricalBar.symbol == symbol,
+                    HistoricalBar.bar_date.in_(dates),
+                )
+            }
+            for bar in symbol_bars:
+                row = existing.get(bar.bar_date)
+                if row is None:
+                    row = HistoricalBar(symbol=symbol, bar_date=bar.bar_date)
+                    self.session.add(row)
+                    existing[bar.bar_date] = row
+                row.open = bar.open
+                row.high = bar.high
+                row.low = bar.low
+                row.close = bar.close
+                row.volume = bar.volume
+                row.vwap = getattr(bar, 'vwap', None)
+                row.transactions = getattr(bar, 'transactions', None)
+                written += 1
+
+        self.session.flush()
+        return written
+
+    def bulk_upsert(
+        self,
+        bars: Iterable,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        commit: bool = True,
+        on_commit: Callable[[int], None] = None,
+    ) -> int:
+        """
+        Insert or update many bars without the ORM.
+
+        *bars* may be any iterable, including a generator that is still
+        fetching: at most ``chunk_size`` rows are buffered, each chunk is
+        written with a single executemany and (with ``commit``) committed
+        as its own transaction, so no write lock is held between chunks.
+
+        Rows go through Core, so HistoricalBar objects already loaded in
+        this session are not refreshed.
+
+        Args:
+            bars: Objects with symbol/bar_date/OHLCV attributes
+            chunk_size: Rows per executemany / transaction
+            commit: Commit after every chunk (False: caller commits)
+            on_commit: Called with the running number of bars written
+                       after each chunk is committed
+
+        Returns:
+            Number of bars written
+        """
+        rows = map(_bar_row, bars)
+        written = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            self.session.connection().exec_driver_sql(_BULK_UPSERT_SQL, chunk)
+            written += len(chunk)
+            if commit:
+                self.session.commit()
+                if on_commit is not None:
+                    on_commit(written)
+        return written
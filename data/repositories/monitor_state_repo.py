@@ -0,0 +1,74 @@
+"""
+CANSLIM Monitor - Monitor State Repository
+===========================================
+Position-monitor maps persisted across restarts (``monitor_state`` table):
+trailing-stop high-water marks and checker cooldowns, one packed row per map.
+"""
+
+from array import array
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from canslim_monitor.data.models import MonitorState
+
+
+_table = MonitorState.__table__
+_insert = insert(_table)
+_UPSERT = _insert.on_conflict_do_update(
+    index_elements=[_table.c.scope],
+    set_={
+        'keys': _insert.excluded['keys'],
+        'values': _insert.excluded['values'],
+        'updated_at': _insert.excluded.updated_at,
+    },
+)
+
+
+class MonitorStateRepository:
+    """Repository for MonitorState rows."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    # -------------------- READ --------------------
+
+    def load_all(self) -> Dict[str, Dict[str, float]]:
+        """Every stored map as {scope: {key: value}} (one query)."""
+        state = {}
+        for scope, keys, packed in self.session.query(
+            MonitorState.scope, MonitorState.keys, MonitorState.values
+        ):
+            values = array('d')
+            values.frombytes(packed)
+            state[scope] = dict(zip(keys.split('\n'), values)) if keys else {}
+        return state
+
+    # -------------------- WRITE --------------------
+
+    def save_scopes(self, maps: Dict[str, Dict[str, float]], updated_at: datetime = None) -> int:
+        """
+        Insert or replace whole maps, one row each, in one executemany.
+
+        Returns:
+            Number of scopes written
+        """
+        updated_at = updated_at or datetime.now()
+        params = [
+            {
+                'scope': scope,
+                'keys': '\n'.join(values),
+                'values': array('d', values.values()).tobytes(),
+                'updated_at': updated_at,
+            }
+            for scope, values in maps.items()
+        ]
+        if not params:
+            return 0
+
+        # Core statement on the session's connection; the ORM bulk path
+        # costs more than the write itself at this size
+        self.session.connection().execute(_UPSERT, params)
+        return len(params)
@@ -0,0 +1,90 @@
+"""
+CANSLIM Monitor - Alert Outbox Repository
+==========================================
+Durable queue of Discord deliveries (``alert_outbox`` table) written by
+AlertService and drained by AlertDeliveryThread.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from canslim_monitor.data.models import Alert, AlertOutbox
+
+
+class OutboxRepository:
+    """Repository for AlertOutbox rows."""
+
+    PENDING = 'PENDING'
+    SENT = 'SENT'
+    FAILED = 'FAILED'
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    # -------------------- READ --------------------
+
+    def get_due(self, now: datetime = None, limit: int = 50) -> List[AlertOutbox]:
+        """PENDING entries whose next attempt is due, P0 first then oldest first."""
+        now = now or datetime.now()
+        priority_rank = case(
+            (AlertOutbox.priority == 'P0', 0),
+            (AlertOutbox.priority == 'P1', 1),
+            else_=2,
+        )
+        return self.session.query(AlertOutbox).filter(
+            AlertOutbox.status == self.PENDING,
+            AlertOutbox.next_attempt_at <= now,
+        ).order_by(priority_rank, AlertOutbox.id).limit(limit).all()
+
+    def count_pending(self) -> int:
+        """Entries still waiting for delivery (due or backing off)."""
+        return self.session.query(func.count(AlertOutbox.id)).filter(
+            AlertOutbox.status == self.PENDING
+        ).scalar() or 0
+
+    def oldest_pending(self) -> Optional[datetime]:
+        """created_at of the oldest undelivered entry, or None."""
+        return self.session.query(func.min(AlertOutbox.created_at)).filter(
+            AlertOutbox.status == self.PENDING
+        ).scalar()
+
+    # -------------------- WRITE --------------------
+
+    def mark_sent(self, entry: AlertOutbox, sent_at: datetime = None) -> None:
+        """Record a successful delivery on the entry and its Alert."""
+        sent_at = sent_at or datetime.now()
+        entry.status = self.SENT
+        entry.sent_at = sent_at
+        entry.attempts += 1
+        entry.last_error = None
+        if entry.alert_id:
+            self.session.query(Alert).filter(Alert.id == entry.alert_id).update(
+                {Alert.discord_sent: True, Alert.discord_sent_at: sent_at},
+                synchronize_session=False,
+            )
+
+    def mark_retry(self, entry: AlertOutbox, next_attempt_at: datetime, error: str) -> None:
+        """Count a failed attempt and schedule the next one."""
+        entry.attempts += 1
+        entry.next_attempt_at = next_attempt_at
+        entry.last_error = error
+
+    def defer(self, entry: AlertOutbox, next_attempt_at: datetime) -> None:
+        """Push an entry back without counting an attempt (e.g. webhook rate limit)."""
+        entry.next_attempt_at = next_attempt_at
+
+    def mark_failed(self, entry: AlertOutbox, error: str) -> None:
+        """Give up on an entry."""
+        entry.attempts += 1
+        entry.status = self.FAILED
+        entry.last_error = error
+
+    def purge_sent(self, before: datetime) -> int:
+        """Delete SENT entries delivered before *before*. Returns rows deleted."""
+        return self.session.query(AlertOutbox).filter(
+            AlertOutbox.status == self.SENT,
+            AlertOutbox.sent_at < before,
+        ).delete(synchronize_session=False)
@@ -8,13 +8,31 @@ Provides CRUD operations and queries for Position entities.
 import logging
 from datetime import datetime, date
 from typing import List, Optional, Dict, Any
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, bindparam, case, update
 from sqlalchemy.orm import Session
 
 from canslim_monitor.data.models import Position, TRACKED_FIELDS, PositionHistory
 
 logger = logging.getLogger('canslim.database')
 
+# One statement for bulk_update_prices, executed once per batch of symbols
+_positions = Position.__table__
+_PRICE_UPDATE = (
+    update(_positions)
+    .where(_positions.c.symbol == bindparam('b_symbol'))
+    .where(_positions.c.state >= bindparam('b_min_state'))
+    .values(
+        last_price=bindparam('b_price'),
+        last_price_time=bindparam('b_time'),
+        current_pnl_pct=case(
+            (_positions.c.avg_cost > 0,
+             (bindparam('b_price') - _positions.c.avg_cost) / _positions.c.avg_cost * 100),
+            else_=_positions.c.current_pnl_pct,
+        ),
+    )
+)
+_PRICE_FIELDS = ['last_price', 'last_price_time', 'current_pnl_pct', 'updated_at']
+
 
 class PositionRepository:
     """Repository for Position entity operations."""
@@ -607,31 +625,49 @@ class PositionRepository:
     
     # ==================== BULK OPERATIONS ====================
     
-    def bulk_update_prices(self, prices: Dict[str, float], timestamp: datetime = None) -> int:
+    def bulk_update_prices(
+        self,
+        prices: Dict[str, float],
+        timestamp: datetime = None,
+        min_state: int = 0
+    ) -> int:
         """
         Bulk update prices for multiple symbols.
         
+        Applies last_price, last_price_time and current_pnl_pct (computed in
+        SQL from avg_cost, as update_price does) with a single executemany
+        UPDATE, so the caller's transaction holds the SQLite write lock for
+        one statement instead of one flush per position.
+        
         Args:
             prices: Dict of symbol -> price
             timestamp: Price timestamp
+            min_state: Only update positions with state >= this
+                       (0 = watching and active, 1 = active only)
         
         Returns:
             Number of positions updated
         """
         timestamp = timestamp or datetime.now()
-        updated = 0
-        
-        for symbol, price in prices.items():
-            positions = self.session.query(Position).filter(
-                Position.symbol == symbol.upper(),
-                Position.state >= 0
-            ).all()
-            
-            for position in positions:
-                self.update_price(position, price, timestamp)
-                updated += 1
-        
-        return updated
+        params = [
+            {'b_symbol': symbol.upper(), 'b_price': price, 'b_time': timestamp}
+            for symbol, price in prices.items()
+            if price
+        ]
+        if not params:
+            return 0
+        
+        result = self.session.connection().execute(
+            _PRICE_UPDATE, [dict(p, b_min_state=min_state) for p in params]
+        )
+        
+        # Loaded instances would otherwise keep their pre-update values
+        symbols = {p['b_symbol'] for p in params}
+        for obj in list(self.session.identity_map.values()):
+            if isinstance(obj, Position) and obj.symbol in symbols:
+                self.session.expire(obj, _PRICE_FIELDS)
+        
+        return max(result.rowcount, 0)
     
     def bulk_create(self, positions_data: List[Dict[str, Any]]) -> List[Position]:
         """
@@ -5,6 +5,7 @@ Alert visualization components for the GUI.
 
 Components:
 - AlertTableWidget: Reusable sortable/filterable alert table
+- AlertTableView / AlertTableModel: Virtualized, SQL-paged alert feed
 - AlertDetailDialog: Single alert detail view with IBD education
 - PositionAlertDialog: Alerts for a specific symbol
 - AlertCheckDialog: Real-time alert status check dialog
@@ -24,6 +25,11 @@ from .alert_table_widget import (
     TypeFilterButton,
 )
 
+from .alert_table_model import (
+    AlertTableModel,
+    AlertTableView,
+)
+
 from .alert_detail_dialog import AlertDetailDialog
 
 from .position_alert_dialog import PositionAlertDialog
@@ -40,6 +46,8 @@ __all__ = [
     'ALERT_DESCRIPTIONS',
     'AlertTableWidget',
     'TypeFilterButton',
+    'AlertTableModel',
+    'AlertTableView',
     'AlertDetailDialog',
     'PositionAlertDialog',
     'AlertCheckDialog',
@@ -0,0 +1,502 @@
+"""
+CANSLIM Monitor - Alert Table Model
+====================================
+Virtualized alert feed for large alert histories.
+
+AlertTableModel is a QAbstractTableModel that pages rows from the
+database on demand (keyset pagination on (sort key, id), see
+AlertRepository.get_feed_page) instead of loading every alert into a
+QTableWidget.  Filters run in SQL; refresh() fetches only alerts newer
+than the highest id seen and inserts them at the top with
+beginInsertRows.
+
+AlertTableView is the matching QTableView: same signals, column set and
+severity colors as AlertTableWidget.
+"""
+
+from typing import Any, Dict, List, Optional, Set
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSettings, pyqtSignal
+from PyQt6.QtGui import QAction, QBrush, QColor, QFont
+from PyQt6.QtWidgets import QAbstractItemView, QMenu, QTableView
+
+from canslim_monitor.data.repositories.alert_repo import AlertFeedFilter, AlertRepository
+from canslim_monitor.services.alert_service import AlertService
+
+from .alert_table_widget import AlertTableWidget
+
+
+# View column key -> AlertRepository feed sort key (None = not sortable in SQL)
+COLUMN_SORT_KEYS = {
+    'time': 'alert_time',
+    'symbol': 'symbol',
+    'type': 'alert_type',
+    'subtype': 'alert_subtype',
+    'price': 'price',
+    'pnl_pct': 'pnl_pct_at_alert',
+    'severity': None,
+    'acknowledged': 'acknowledged',
+    'health_rating': 'health_rating',
+    'grade': 'canslim_grade',
+    'score': 'canslim_score',
+    'market_regime': 'market_regime',
+    'volume_ratio': 'volume_ratio',
+    'pivot': 'pivot_at_alert',
+    'avg_cost': 'avg_cost_at_alert',
+    'ma21': 'ma21',
+    'ma50': 'ma50',
+}
+
+NUMERIC_COLUMNS = ('price', 'pnl_pct', 'volume_ratio', 'pivot', 'avg_cost', 'ma21', 'ma50', 'score')
+CENTERED_COLUMNS = ('acknowledged', 'severity', 'health_rating', 'grade')
+
+
+def alert_to_dict(a) -> Dict[str, Any]:
+    """Alert row -> the dict shape used by the alert tables and dialogs."""
+    return {
+        'id': a.id,
+        'symbol': a.symbol,
+        'position_id': a.position_id,
+        'alert_type': a.alert_type,
+        'subtype': a.alert_subtype,
+        'alert_time': a.alert_time.isoformat() if a.alert_time else None,
+        'price': a.price,
+        'message': a.message,
+        'action': a.action,
+        'pivot_at_alert': a.pivot_at_alert,
+        'avg_cost_at_alert': a.avg_cost_at_alert,
+        'pnl_pct_at_alert': a.pnl_pct_at_alert,
+        'state_at_alert': a.state_at_alert,
+        'ma50': a.ma50,
+        'ma21': a.ma21,
+        'volume_ratio': a.volume_ratio,
+        'health_score': a.health_score,
+        'health_rating': a.health_rating,
+        'grade': a.canslim_grade,
+        'score': a.canslim_score,
+        'market_regime': a.market_regime,
+        'severity': AlertService.get_alert_severity(a.alert_type, a.alert_subtype),
+        'acknowledged': a.acknowledged or False,
+    }
+
+
+class AlertTableModel(QAbstractTableModel):
+    """
+    Lazily paged alert rows.
+
+    Only the pages the view has scrolled to are held in memory; the view
+    asks for more through canFetchMore()/fetchMore().
+    """
+
+    PAGE_SIZE = 200
+
+    def __init__(self, db_session_factory=None, columns: List[tuple] = None, parent=None):
+        super().__init__(parent)
+        self.db_session_factory = db_session_factory
+        self._columns = list(columns or [c for c in AlertTableWidget.ALL_COLUMNS if c[3]])
+
+        self._filter = AlertFeedFilter()
+        self._sort = 'alert_time'
+        self._descending = True
+
+        self._rows: List[Dict[str, Any]] = []
+        self._cursor = None           # Keyset cursor after the last loaded row
+        self._exhausted = True
+        self._total = 0               # Rows matching the filter
+        self._max_id = 0              # Highest matching id seen
+        self._highlighted: Set[int] = set()
+
+        self._brushes = {
+            name: (QBrush(QColor(c['bg'])), QBrush(QColor(c['fg'])))
+            for name, c in AlertTableWidget.SEVERITY_COLORS.items()
+        }
+        self._highlight_brush = QBrush(QColor(AlertTableWidget.HIGHLIGHT_COLOR))
+        self._bold = QFont()
+        self._bold.setBold(True)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def reload(self, feed_filter: AlertFeedFilter = None, sort: str = None, descending: bool = None):
+        """Reset to the first page for a new filter and/or sort."""
+        if feed_filter is not None:
+            self._filter = feed_filter
+        if sort is not None:
+            self._sort = sort
+        if descending is not None:
+            self._descending = descending
+
+        self.beginResetModel()
+        self._rows = []
+        self._cursor = None
+        self._exhausted = False
+        self._highlighted.clear()
+        with self._repo() as repo:
+            if repo is None:
+                self._total, self._max_id, self._exhausted = 0, 0, True
+            else:
+                self._total, self._max_id = repo.get_feed_stats(self._filter)
+                self._load_page(repo)
+        self.endResetModel()
+
+    def refresh(self) -> List[int]:
+        """
+        Pick up alerts created since the last load (id > highest seen).
+
+        With the default newest-first order they are inserted at the top;
+        under any other sort the feed is reloaded when something arrived.
+
+        Returns:
+            Ids of the new alerts
+        """
+        with self._repo() as repo:
+            if repo is None:
+                return []
+            new = repo.get_feed_newer(self._max_id, self._filter)
+            if not new:
+                return []
+            rows = [alert_to_dict(a) for a in new]
+
+        new_ids = [r['id'] for r in rows]
+        if self._sort != 'alert_time' or not self._descending:
+            self.reload()
+            return new_ids
+
+        self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+        self._rows[:0] = rows
+        self._total += len(rows)
+        self._max_id = max(self._max_id, *new_ids)
+        self.endInsertRows()
+        return new_ids
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        with self._repo() as repo:
+            if repo is not None:
+                self._load_page(repo, notify=True)
+
+    def fetch_all(self):
+        """Yield every matching alert dict in view order (for export), page by page."""
+        cursor = None
+        while True:
+            with self._repo() as repo:
+                if repo is None:
+                    return
+                page = repo.get_feed_page(self._filter, self._sort, self._descending,
+                                          after=cursor, limit=1000)
+                if not page:
+                    return
+                cursor = repo.feed_cursor(page[-1], self._sort)
+                rows = [alert_to_dict(a) for a in page]
+            yield from rows
+            if len(rows) < 1000:
+                return
+
+    def _load_page(self, repo: AlertRepository, notify: bool = False):
+        page = repo.get_feed_page(self._filter, self._sort, self._descending,
+                                  after=self._cursor, limit=self.PAGE_SIZE)
+        self._exhausted = len(page) < self.PAGE_SIZE
+        if not page:
+            return
+        self._cursor = repo.feed_cursor(page[-1], self._sort)
+        rows = [alert_to_dict(a) for a in page]
+        if notify:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+        self._rows.extend(rows)
+        if notify:
+            self.endInsertRows()
+
+    def _repo(self):
+        return _RepoSession(self.db_session_factory)
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def feed_filter(self) -> AlertFeedFilter:
+        return self._filter
+
+    @property
+    def sort_key(self) -> str:
+        return self._sort
+
+    @property
+    def descending(self) -> bool:
+        return self._descending
+
+    @property
+    def total_count(self) -> int:
+        """Alerts matching the filter (loaded or not)."""
+        return self._total
+
+    @property
+    def loaded_count(self) -> int:
+        return len(self._rows)
+
+    def set_columns(self, columns: List[tuple]):
+        self.beginResetModel()
+        self._columns = list(columns)
+        self.endResetModel()
+
+    def columns(self) -> List[tuple]:
+        return list(self._columns)
+
+    def alert_at(self, row: int) -> Optional[Dict[str, Any]]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def mark_acknowledged(self, alert_id: int):
+        for row, alert in enumerate(self._rows):
+            if alert.get('id') == alert_id:
+                alert['acknowledged'] = True
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._columns) - 1))
+                return
+
+    def set_highlighted(self, alert_ids, on: bool = True):
+        """Turn the new-alert highlight on or off for *alert_ids*."""
+        if on:
+            self._highlighted.update(alert_ids)
+        else:
+            self._highlighted.difference_update(alert_ids)
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._rows) - 1, len(self._columns) - 1),
+                [Qt.ItemDataRole.BackgroundRole]
+            )
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel
+    # ------------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(self._columns)):
+            return self._columns[section][1]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        alert = self._rows[index.row()]
+        key = self._columns[index.column()][0]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return AlertTableWidget._format_value(key, alert)
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if alert.get('id') in self._highlighted:
+                return self._highlight_brush
+            return self._severity_brushes(alert)[0]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._severity_brushes(alert)[1]
+        if role == Qt.ItemDataRole.FontRole:
+            if alert.get('severity') in ('critical', 'profit'):
+                return self._bold
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if key in NUMERIC_COLUMNS:
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            if key in CENTERED_COLUMNS:
+                return Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def _severity_brushes(self, alert: Dict[str, Any]):
+        return self._brushes.get(alert.get('severity', 'neutral'), self._brushes['neutral'])
+
+
+class _RepoSession:
+    """Context manager: AlertRepository on a fresh session (None without a factory)."""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+        self.session = None
+
+    def __enter__(self) -> Optional[AlertRepository]:
+        if not self.session_factory:
+            return None
+        self.session = self.session_factory()
+        return AlertRepository(self.session)
+
+    def __exit__(self, *exc):
+        if self.session is not None:
+            self.session.close()
+        return False
+
+
+class AlertTableView(QTableView):
+    """
+    Virtualized alert table (drop-in for AlertTableWidget on large feeds).
+
+    Signals:
+        alert_double_clicked(dict): Row double-clicked
+        alert_selected(dict): Row clicked
+
+    Clicking a header re-sorts in SQL; columns without a SQL sort key
+    (Severity) are not sortable.
+    """
+
+    alert_double_clicked = pyqtSignal(dict)
+    alert_selected = pyqtSignal(dict)
+
+    def __init__(self, db_session_factory=None, show_symbol_column: bool = True, parent=None):
+        super().__init__(parent)
+        self.show_symbol_column = show_symbol_column
+        self._visible_columns: Set[str] = self._load_column_visibility()
+
+        self.alert_model = AlertTableModel(db_session_factory, self._get_visible_columns(), self)
+        self.setModel(self.alert_model)
+        self._setup_view()
+
+    # Column visibility shares settings with AlertTableWidget
+    def _load_column_visibility(self) -> Set[str]:
+        saved = QSettings('CANSLIM', 'AlertTable').value('visible_columns', None)
+        if saved:
+            return set(saved)
+        return {key for key, _, _, default_visible in AlertTableWidget.ALL_COLUMNS if default_visible}
+
+    def _save_column_visibility(self):
+        QSettings('CANSLIM', 'AlertTable').setValue('visible_columns', list(self._visible_columns))
+
+    def _get_visible_columns(self) -> List[tuple]:
+        return [
+            c for c in AlertTableWidget.ALL_COLUMNS
+            if c[0] in self._visible_columns and (c[0] != 'symbol' or self.show_symbol_column)
+        ]
+
+    def _setup_view(self):
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.verticalHeader().setVisible(False)
+        # Fixed row height: the view never measures off-screen rows
+        self.verticalHeader().setDefaultSectionSize(24)
+        self.setShowGrid(True)
+
+        header = self.horizontalHeader()
+        header.setSectionsClickable(True)
+        header.setStretchLastSection(True)
+        header.setSortIndicatorShown(True)
+        header.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        header.customContextMenuRequested.connect(self._show_column_menu)
+        header.sectionClicked.connect(self._on_header_clicked)
+        self._apply_column_widths()
+
+        self.doubleClicked.connect(lambda index: self._emit(self.alert_double_clicked, index))
+        self.clicked.connect(lambda index: self._emit(self.alert_selected, index))
+
+        self.setStyleSheet("""
+            QTableView {
+                border: 1px solid #ddd;
+                font-size: 12px;
+            }
+            QTableView::item {
+                padding: 4px;
+            }
+            QTableView::item:selected {
+                background-color: #1976D2;
+                color: white;
+            }
+            QHeaderView::section {
+                background-color: #f5f5f5;
+                padding: 6px;
+                border: none;
+                border-bottom: 1px solid #ddd;
+                border-right: 1px solid #ddd;
+                font-weight: bold;
+            }
+        """)
+
+    def _apply_column_widths(self):
+        columns = self.alert_model.columns()
+        for i, (_, _, width, _) in enumerate(columns):
+            self.setColumnWidth(i, width)
+        keys = [c[0] for c in columns]
+        sort_column = next((k for k, v in COLUMN_SORT_KEYS.items() if v == self.alert_model.sort_key), 'time')
+        if sort_column in keys:
+            order = Qt.SortOrder.DescendingOrder if self.alert_model.descending else Qt.SortOrder.AscendingOrder
+            self.horizontalHeader().setSortIndicator(keys.index(sort_column), order)
+
+    def _emit(self, signal, index: QModelIndex):
+        alert = self.alert_model.alert_at(index.row())
+        if alert is not None:
+            signal.emit(alert)
+
+    def _on_header_clicked(self, column: int):
+        columns = self.alert_model.columns()
+        if column >= len(columns):
+            return
+        sort = COLUMN_SORT_KEYS.get(columns[column][0])
+        if sort is None:
+            self._apply_column_widths()   # Restore the indicator
+            return
+        if sort == self.alert_model.sort_key:
+            descending = not self.alert_model.descending
+        else:
+            descending = True   # Default desc for a new column
+        self.alert_model.reload(sort=sort, descending=descending)
+        self._apply_column_widths()
+
+    def _show_column_menu(self, pos):
+        menu = QMenu(self)
+        for key, header, _, _ in AlertTableWidget.ALL_COLUMNS:
+            if key == 'symbol' and not self.show_symbol_column:
+                continue
+            action = QAction(header, menu)
+            action.setCheckable(True)
+            action.setChecked(key in self._visible_columns)
+            action.triggered.connect(lambda checked, k=key: self._toggle_column(k, checked))
+            menu.addAction(action)
+
+        menu.addSeparator()
+        menu.addAction("Show All Columns").triggered.connect(self._show_all_columns)
+        menu.addAction("Reset to Defaults").triggered.connect(self._reset_columns)
+        menu.exec(self.horizontalHeader().mapToGlobal(pos))
+
+    def _toggle_column(self, key: str, visible: bool):
+        if visible:
+            self._visible_columns.add(key)
+        elif len(self._visible_columns) > 1:
+            self._visible_columns.discard(key)
+        self._columns_changed()
+
+    def _show_all_columns(self):
+        self._visible_columns = {key for key, _, _, _ in AlertTableWidget.ALL_COLUMNS}
+        self._columns_changed()
+
+    def _reset_columns(self):
+        self._visible_columns = {key for key, _, _, default in AlertTableWidget.ALL_COLUMNS if default}
+        self._columns_changed()
+
+    def _columns_changed(self):
+        self._save_column_visibility()
+        self.alert_model.set_columns(self._get_visible_columns())
+        self._apply_column_widths()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def set_filter(self, feed_filter: AlertFeedFilter):
+        """Reload the feed for a new SQL filter (keeps the current sort)."""
+        self.alert_model.reload(feed_filter)
+        self.scrollToTop()
+
+    def refresh(self) -> List[int]:
+        """Insert alerts created since the last load; returns their ids."""
+        return self.alert_model.refresh()
+
+    def get_selected_alert(self) -> Optional[Dict[str, Any]]:
+        index = self.currentIndex()
+        return self.alert_model.alert_at(index.row()) if index.isValid() else None
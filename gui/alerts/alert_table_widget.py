@@ -391,7 +391,8 @@ class AlertTableWidget(QTableWidget):
                 
                 self.setItem(row, col, item)
     
-    def _get_raw_value(self, key: str, alert: Dict[str, Any]) -> Any:
+    @staticmethod
+    def _get_raw_value(key: str, alert: Dict[str, Any]) -> Any:
         """Get raw value for a column key."""
         if key == 'time':
             return alert.get('alert_time')
@@ -429,9 +430,10 @@ class AlertTableWidget(QTableWidget):
             return alert.get('ma50')
         return alert.get(key)
     
-    def _format_value(self, key: str, alert: Dict[str, Any]) -> str:
+    @staticmethod
+    def _format_value(key: str, alert: Dict[str, Any]) -> str:
         """Format a value for display."""
-        val = self._get_raw_value(key, alert)
+        val = AlertTableWidget._get_raw_value(key, alert)
         
         if key == 'time':
             if isinstance(val, str):
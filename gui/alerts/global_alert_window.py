@@ -9,13 +9,15 @@ Features:
 - Date/time preset filters (15 min, 1 hour, 4 hours, today, 7 days, 30 days)
 - Custom date range picker
 - Quick time filter (last X minutes/hours/days)
-- Filter by symbol, type
-- Auto-refresh with configurable interval
+- Filter by symbol, type (applied in SQL)
+- Virtualized table: pages load on scroll (AlertTableModel)
+- Auto-refresh fetches only alerts newer than the last one shown
 - Real-time new alert highlighting
 """
 
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QComboBox, QCheckBox, QFrame, QStatusBar,
@@ -24,7 +26,10 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QDateTime
 from PyQt6.QtGui import QFont, QAction
 
-from .alert_table_widget import AlertTableWidget, TypeFilterButton
+from canslim_monitor.data.repositories.alert_repo import AlertFeedFilter, AlertRepository
+
+from .alert_table_widget import TypeFilterButton
+from .alert_table_model import AlertTableView
 from .alert_detail_dialog import AlertDetailDialog
 
 
@@ -187,6 +192,19 @@ class DateRangeFilterWidget(QGroupBox):
             delta = timedelta(minutes=preset_value)
             return (now - delta, now)
     
+    def get_feed_bounds(self) -> tuple:
+        """
+        (since, until) for the SQL feed filter.
+
+        until is None for the rolling presets so that alerts created after
+        the filter was applied still match on refresh.
+        """
+        from_dt, to_dt = self.get_date_range()
+        checked = self.preset_group.checkedButton()
+        if checked is not None and checked.property("preset_value") == "custom":
+            return (from_dt, to_dt)
+        return (from_dt, None)
+    
     def get_hours(self) -> int:
         """Get the selected range as hours (for backward compatibility)."""
         from_dt, to_dt = self.get_date_range()
@@ -261,15 +279,11 @@ class GlobalAlertWindow(QMainWindow):
         self.refresh_interval = display_config.get('refresh_interval', 30) * 1000  # ms
         self.highlight_duration = display_config.get('highlight_duration', 5) * 1000
         
-        # State
-        self._all_symbols: Set[str] = set()
-        self._current_alerts: List[Dict[str, Any]] = []
-        
         self._setup_ui()
         self._setup_refresh_timer()
         
         # Initial load
-        self._refresh_data()
+        self._reload_data()
     
     def _setup_ui(self):
         """Set up the window UI."""
@@ -286,7 +300,7 @@ class GlobalAlertWindow(QMainWindow):
         
         # Date/Time Filter Widget
         self.date_filter = DateRangeFilterWidget()
-        self.date_filter.filter_changed.connect(self._refresh_data)
+        self.date_filter.filter_changed.connect(self._reload_data)
         layout.addWidget(self.date_filter)
         
         # Additional filters row
@@ -297,8 +311,8 @@ class GlobalAlertWindow(QMainWindow):
         refresh_row = self._create_refresh_row()
         layout.addLayout(refresh_row)
         
-        # Alert table
-        self.table = AlertTableWidget(show_symbol_column=True)
+        # Alert table (rows are paged from the database as they scroll in)
+        self.table = AlertTableView(self.db_session_factory, show_symbol_column=True)
         self.table.alert_double_clicked.connect(self._on_alert_double_click)
         layout.addWidget(self.table, stretch=1)
         
@@ -374,7 +388,7 @@ class GlobalAlertWindow(QMainWindow):
         layout = QHBoxLayout()
         
         # Count label
-        self.count_label = QLabel("Showing 0 alerts")
+        self.count_label = QLabel("0 alerts")
         layout.addWidget(self.count_label)
         
         layout.addStretch()
@@ -425,121 +439,75 @@ class GlobalAlertWindow(QMainWindow):
     
     def _on_filter_changed(self):
         """Handle symbol filter change."""
-        self._apply_filters()
+        self._reload_data()
     
     def _on_type_filter_changed(self, selected_types: set):
         """Handle type filter change."""
-        self.table.set_type_filter(selected_types)
-        self._update_count()
+        self._reload_data()
     
-    def _apply_filters(self):
-        """Apply current filters to the table."""
+    def _build_filter(self) -> AlertFeedFilter:
+        """Current filter controls -> SQL feed filter."""
+        since, until = self.date_filter.get_feed_bounds()
         symbol = self.symbol_combo.currentText()
-        if symbol == "All":
-            symbol = None
-        
-        # Filter alerts by symbol
-        if symbol:
-            filtered = [a for a in self._current_alerts if a.get('symbol') == symbol]
-        else:
-            filtered = self._current_alerts
-        
-        self.table.set_alerts(filtered)
-        self._update_count()
+        return AlertFeedFilter(
+            since=since,
+            until=until,
+            symbol=None if symbol in ("", "All") else symbol,
+            alert_types=frozenset(self.type_filter._selected_types),
+        )
+    
+    def _reload_data(self):
+        """Filters changed: reload the first page of the feed."""
+        try:
+            feed_filter = self._build_filter()
+            self.table.set_filter(feed_filter)
+            self._update_filter_options(feed_filter)
+            self._update_count()
+            self._show_updated()
+        except Exception as e:
+            self.status_bar.showMessage(f"Refresh failed: {e}", 5000)
     
     def _refresh_data(self):
-        """Refresh alert data from database."""
+        """Timer / Refresh Now: add only alerts newer than the newest shown."""
         try:
-            # Get date range from filter widget
-            hours = self.date_filter.get_hours()
-            
-            symbol = self.symbol_combo.currentText()
-            if symbol == "All":
-                symbol = None
-            
-            # Fetch alerts
-            alerts = self._fetch_alerts_direct(symbol, hours)
-            
-            if alerts:
-                # Update symbol filter options
-                symbols = {a.get('symbol') for a in alerts if a.get('symbol')}
-                self._all_symbols.update(symbols)
-                self._update_symbol_filter(self._all_symbols)
-                
-                # Store and display
-                self._current_alerts = alerts
-                self.table.set_alerts(alerts)
+            new_ids = self.table.refresh()
+            if new_ids:
+                self._update_filter_options(self.table.alert_model.feed_filter)
                 self._update_count()
-            
-            # Update status
-            desc = self.date_filter.get_description()
-            self.status_bar.showMessage(
-                f"Showing: {desc} | Last updated: {datetime.now().strftime('%H:%M:%S')}", 
-                10000
-            )
-            
+                self._highlight(new_ids)
+            self._show_updated()
         except Exception as e:
             self.status_bar.showMessage(f"Refresh failed: {e}", 5000)
     
-    def _fetch_alerts_direct(self, symbol: Optional[str], hours: int) -> List[Dict]:
-        """Fetch alerts directly from database."""
+    def _show_updated(self):
+        desc = self.date_filter.get_description()
+        self.status_bar.showMessage(
+            f"Showing: {desc} | Last updated: {datetime.now().strftime('%H:%M:%S')}", 
+            10000
+        )
+    
+    def _highlight(self, alert_ids: List[int]):
+        """Highlight newly arrived alerts for highlight_duration."""
+        model = self.table.alert_model
+        model.set_highlighted(alert_ids)
+        QTimer.singleShot(self.highlight_duration, lambda: model.set_highlighted(alert_ids, on=False))
+    
+    def _update_filter_options(self, feed_filter: AlertFeedFilter):
+        """Symbols and types present in the date range, from SQL."""
         if not self.db_session_factory:
-            return []
-        
+            return
+        session = self.db_session_factory()
         try:
-            from canslim_monitor.data.models import Alert
-            from canslim_monitor.services.alert_service import AlertService
-            
-            session = self.db_session_factory()
-            try:
-                query = session.query(Alert)
-                
-                cutoff = datetime.now() - timedelta(hours=hours)
-                query = query.filter(Alert.alert_time >= cutoff)
-                
-                if symbol:
-                    query = query.filter(Alert.symbol == symbol)
-                
-                query = query.order_by(Alert.alert_time.desc()).limit(2000)
-                
-                alerts = []
-                for a in query.all():
-                    alerts.append({
-                        'id': a.id,
-                        'symbol': a.symbol,
-                        'position_id': a.position_id,
-                        'alert_type': a.alert_type,
-                        'subtype': a.alert_subtype,
-                        'alert_time': a.alert_time.isoformat() if a.alert_time else None,
-                        'price': a.price,
-                        'message': a.message,
-                        'action': a.action,
-                        'pivot_at_alert': a.pivot_at_alert,
-                        'avg_cost_at_alert': a.avg_cost_at_alert,
-                        'pnl_pct_at_alert': a.pnl_pct_at_alert,
-                        'state_at_alert': a.state_at_alert,
-                        'ma50': a.ma50,
-                        'ma21': a.ma21,
-                        'volume_ratio': a.volume_ratio,
-                        'health_score': a.health_score,
-                        'health_rating': a.health_rating,
-                        'grade': a.canslim_grade,
-                        'score': a.canslim_score,
-                        'market_regime': a.market_regime,
-                        'severity': AlertService.get_alert_severity(a.alert_type, a.alert_subtype),
-                        'acknowledged': a.acknowledged or False,
-                    })
-                
-                return alerts
-                
-            finally:
-                session.close()
-                
-        except Exception as e:
-            print(f"Error fetching alerts: {e}")
-            return []
-    
-    def _update_symbol_filter(self, symbols: Set[str]):
+            repo = AlertRepository(session)
+            base = replace(feed_filter, symbol=None, alert_types=frozenset())
+            symbols = repo.get_feed_values('symbol', base)
+            types = repo.get_feed_values('alert_type', base)
+        finally:
+            session.close()
+        self._update_symbol_filter(symbols)
+        self.type_filter.set_available_types(set(types))
+    
+    def _update_symbol_filter(self, symbols):
         """Update symbol filter combo box."""
         current = self.symbol_combo.currentText()
         
@@ -558,13 +526,7 @@ class GlobalAlertWindow(QMainWindow):
     
     def _update_count(self):
         """Update the alert count label."""
-        total = self.table.get_alert_count()
-        filtered = self.table.get_filtered_count()
-        
-        if total == filtered:
-            self.count_label.setText(f"Showing {total} alerts")
-        else:
-            self.count_label.setText(f"Showing {filtered} of {total} alerts")
+        self.count_label.setText(f"{self.table.alert_model.total_count} alerts")
     
     def _on_alert_double_click(self, alert: Dict[str, Any]):
         """Handle double-click on alert row."""
@@ -579,20 +541,16 @@ class GlobalAlertWindow(QMainWindow):
     
     def _on_alert_acknowledged(self, alert_id: int):
         """Handle alert acknowledgment."""
-        for alert in self._current_alerts:
-            if alert.get('id') == alert_id:
-                alert['acknowledged'] = True
-                break
-        
-        self.table.set_alerts(self._current_alerts)
+        self.table.alert_model.mark_acknowledged(alert_id)
         self.alert_acknowledged.emit(alert_id)
     
     def _clear_filters(self):
         """Clear all filters."""
+        self.symbol_combo.blockSignals(True)
         self.symbol_combo.setCurrentIndex(0)
+        self.symbol_combo.blockSignals(False)
         self.type_filter._selected_types.clear()
         self.type_filter._update_text()
-        self.table.set_type_filter(set())
         
         # Reset date filter to "Today"
         for btn in self.date_filter.preset_group.buttons():
@@ -601,11 +559,11 @@ class GlobalAlertWindow(QMainWindow):
                 break
         self.date_filter.custom_frame.setVisible(False)
         
-        self._refresh_data()
+        self._reload_data()
         self.status_bar.showMessage("Filters cleared", 2000)
     
     def _on_export(self):
-        """Export all alerts to CSV."""
+        """Export every alert matching the filters to CSV (not just loaded rows)."""
         from PyQt6.QtWidgets import QFileDialog
         import csv
         
@@ -618,11 +576,13 @@ class GlobalAlertWindow(QMainWindow):
         
         if filename:
             try:
+                count = 0
                 with open(filename, 'w', newline='') as f:
                     writer = csv.writer(f)
                     writer.writerow(['Time', 'Symbol', 'Type', 'Subtype', 'Price', 'P&L%', 'Acknowledged'])
                     
-                    for alert in self._current_alerts:
+                    for alert in self.table.alert_model.fetch_all():
+                        count += 1
                         writer.writerow([
                             alert.get('alert_time', ''),
                             alert.get('symbol', ''),
@@ -633,7 +593,7 @@ class GlobalAlertWindow(QMainWindow):
                             'Yes' if alert.get('acknowledged') else 'No'
                         ])
                 
-                self.status_bar.showMessage(f"Exported {len(self._current_alerts)} alerts to {filename}", 3000)
+                self.status_bar.showMessage(f"Exported {count} alerts to {filename}", 3000)
             except Exception as e:
                 self.status_bar.showMessage(f"Export failed: {e}", 5000)
     
@@ -648,22 +608,28 @@ if __name__ == "__main__":
     import sys
     from PyQt6.QtWidgets import QApplication
     
+    from canslim_monitor.data.database import DatabaseManager
+    from canslim_monitor.data.models import Alert
+    
     app = QApplication(sys.argv)
-    window = GlobalAlertWindow.get_instance()
-    
-    test_alerts = [
-        {'id': 1, 'symbol': 'NVDA', 'alert_type': 'BREAKOUT', 'subtype': 'CONFIRMED',
-         'alert_time': datetime.now().isoformat(), 'price': 142.50, 
-         'pnl_pct_at_alert': 2.3, 'severity': 'info', 'acknowledged': False},
-        {'id': 2, 'symbol': 'AMD', 'alert_type': 'STOP', 'subtype': 'WARNING',
-         'alert_time': datetime.now().isoformat(), 'price': 178.30, 
-         'pnl_pct_at_alert': -5.2, 'severity': 'warning', 'acknowledged': False},
-    ]
-    
-    window._current_alerts = test_alerts
-    window.table.set_alerts(test_alerts)
-    window._update_symbol_filter({'NVDA', 'AMD'})
-    window._update_count()
+    
+    db = DatabaseManager(in_memory=True)
+    db.initialize()
+    session = db.get_new_session()
+    now = datetime.now()
+    for i in range(1000):
+        session.add(Alert(
+            symbol=('NVDA', 'AMD', 'AAPL')[i % 3],
+            alert_type=('BREAKOUT', 'STOP', 'PROFIT')[i % 3],
+            alert_subtype=('CONFIRMED', 'WARNING', 'TP1')[i % 3],
+            alert_time=now - timedelta(minutes=i),
+            price=100.0 + i,
+            pnl_pct_at_alert=(i % 20) - 10.0,
+        ))
+    session.commit()
+    session.close()
+    
+    window = GlobalAlertWindow.get_instance(db_session_factory=db.get_new_session)
     window.show()
     
     sys.exit(app.exec())
@@ -9,6 +9,8 @@ from typing import List, Dict, Any, Optional
 
 import pandas as pd
 
+from canslim_monitor.data.bar_cache import BarArrays
+
 logger = logging.getLogger('canslim.gui.chart.indicators')
 
 # Guard pandas-ta import
@@ -180,7 +182,12 @@ INDICATOR_CATALOG = {
 # ---------------------------------------------------------------------------
 
 def bars_to_dataframe(bars) -> pd.DataFrame:
-    """Convert list of Bar objects to a pandas DataFrame for pandas-ta."""
+    """Convert list of Bar objects to a pandas DataFrame for pandas-ta.
+
+    Cached ``BarArrays`` (data.bar_cache) are wrapped without a copy.
+    """
+    if isinstance(bars, BarArrays):
+        return bars.to_dataframe()
     rows = []
     for bar in bars:
         ts_ms = getattr(bar, '_timestamp_ms', None)
@@ -11,6 +11,7 @@ Requires: PyQt6-WebEngine
 
 import json
 import logging
+import time
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -39,6 +40,66 @@ DEFAULT_BAR_COUNTS = {
     '30min': 10000, # ~3 years
 }
 
+# Bars per calendar day, for sizing tail fetches against the bar cache
+TAIL_BARS_PER_DAY = {
+    'week': 0.2,
+    'day': 1,
+    'hour': 16,
+    '30min': 32,
+}
+
+
+def fetch_bars_cached(provider, symbol: str, timeframe: str, tf_enum, count: int):
+    """
+    Fetch chart bars through the memory-mapped bar cache.
+
+    Cold cache: full ``count`` download. Warm cache: mmap plus a download
+    of only the bars since the cache's tail.
+
+    Returns:
+        (bars, arrays): provider Bar list (oldest first) and the cached
+        BarArrays it was built from (None when the cache is unavailable)
+    """
+    try:
+        from canslim_monitor.data.bar_cache import get_bar_cache, OVERLAP_BARS
+        cache = get_bar_cache()
+    except ImportError:
+        cache = None
+    if cache is None:
+        return provider.get_bars(symbol, timeframe=tf_enum, count=count), None
+
+    def fetch(since_ms):
+        if since_ms is None:
+            return provider.get_bars(symbol, timeframe=tf_enum, count=count)
+        days = (time.time() * 1000 - since_ms) / 86_400_000
+        tail = int(days * TAIL_BARS_PER_DAY.get(timeframe, 1)) + OVERLAP_BARS + 2
+        return provider.get_bars(symbol, timeframe=tf_enum, count=min(tail, count))
+
+    try:
+        arrays = cache.sync(symbol, timeframe, fetch)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Bar cache unavailable for {symbol} [{timeframe}]: {e}")
+        return provider.get_bars(symbol, timeframe=tf_enum, count=count), None
+    if arrays is None:
+        return [], None
+
+    arrays = arrays[-count:]
+    return arrays_to_bars(symbol, arrays), arrays
+
+
+def arrays_to_bars(symbol: str, arrays) -> list:
+    """Provider Bar objects (with ``_timestamp_ms``) from cached BarArrays."""
+    from canslim_monitor.data.bar_cache import timestamp_to_date
+    from canslim_monitor.providers.types import Bar
+
+    bars = []
+    for ts_ms, o, h, l, c, v in arrays.rows():
+        bar = Bar(symbol=symbol, bar_date=timestamp_to_date(ts_ms),
+                  open=o, high=h, low=l, close=c, volume=v)
+        bar._timestamp_ms = ts_ms
+        bars.append(bar)
+    return bars
+
 
 class PositionChartDataWorker(QThread):
     """Background thread to fetch bar data for a single symbol at any timeframe."""
@@ -52,6 +113,8 @@ class PositionChartDataWorker(QThread):
         self.timeframe = timeframe
         self.count = count
         self.db_session_factory = db_session_factory
+        self.bar_arrays = None    # cached columns behind the emitted bars
+        self.spy_arrays = None
 
     def run(self):
         try:
@@ -60,11 +123,10 @@ class PositionChartDataWorker(QThread):
             )
             self.progress.emit(f"Fetching {self.symbol} {tf_label} data...")
 
-            from canslim_monitor.providers.factory import ProviderFactory
+            from canslim_monitor.providers.pool import get_provider_pool
             from canslim_monitor.providers.types import Timeframe
 
-            factory = ProviderFactory(self.db_session_factory)
-            provider = factory.get_historical()
+            provider = get_provider_pool(self.db_session_factory).get_historical()
             if not provider:
                 self.error.emit("No historical data provider configured")
                 return
@@ -78,7 +140,9 @@ class PositionChartDataWorker(QThread):
             }
             tf_enum = tf_map.get(self.timeframe, Timeframe.DAY)
 
-            bars = provider.get_bars(self.symbol, timeframe=tf_enum, count=self.count)
+            bars, self.bar_arrays = fetch_bars_cached(
+                provider, self.symbol, self.timeframe, tf_enum, self.count
+            )
             if not bars:
                 self.error.emit(f"No {tf_label} data returned for {self.symbol}")
                 return
@@ -88,7 +152,9 @@ class PositionChartDataWorker(QThread):
             if self.symbol.upper() != 'SPY':
                 try:
                     self.progress.emit(f"Fetching SPY {tf_label} data for RS Line...")
-                    spy_bars = provider.get_bars('SPY', timeframe=tf_enum, count=self.count)
+                    spy_bars, self.spy_arrays = fetch_bars_cached(
+                        provider, 'SPY', self.timeframe, tf_enum, self.count
+                    )
                 except Exception as e:
                     logger.warning(f"Failed to fetch SPY bars for RS Line: {e}")
 
@@ -122,11 +188,10 @@ class HistoryChunkWorker(QThread):
 
     def run(self):
         try:
-            from canslim_monitor.providers.factory import ProviderFactory
+            from canslim_monitor.providers.pool import get_provider_pool
             from canslim_monitor.providers.types import Timeframe
 
-            factory = ProviderFactory(self.db_session_factory)
-            provider = factory.get_historical()
+            provider = get_provider_pool(self.db_session_factory).get_historical()
             if not provider:
                 self.error.emit("No provider")
                 return
@@ -140,6 +205,15 @@ class HistoryChunkWorker(QThread):
                 self.symbol, timeframe=tf_enum,
                 count=self.count, end_date=self.end_date,
             )
+            if bars:
+                # Keep older history for the next open of this chart
+                try:
+                    from canslim_monitor.data.bar_cache import get_bar_cache
+                    cache = get_bar_cache()
+                    if cache is not None:
+                        cache.extend(self.symbol, self.timeframe, bars)
+                except (ImportError, OSError, ValueError) as e:
+                    logger.warning(f"Bar cache extend failed for {self.symbol}: {e}")
             self.finished.emit(bars or [])
         except Exception as e:
             logger.error(f"History chunk fetch error: {e}", exc_info=True)
@@ -163,6 +237,8 @@ class PositionChartDialog(QDialog):
         self._worker = None
         self._bars = []
         self._spy_bars = []
+        self._bar_arrays = None          # cached columns matching self._bars (zero-copy DataFrame)
+        self._spy_arrays = None
         self._web_view = None
         self._chart_ready = False
         self._current_timeframe = 'day'
@@ -276,6 +352,9 @@ class PositionChartDialog(QDialog):
     def _on_data_loaded(self, bars: list, spy_bars: list, provider_name: str):
         self._bars = bars
         self._spy_bars = spy_bars
+        self._bar_arrays = self._worker.bar_arrays if self._worker else None
+        self._spy_arrays = self._worker.spy_arrays if self._worker else None
+        self._indicator_df = None
         self._provider_name = provider_name
 
         # Capture real current price and daily bars from the first (daily) load
@@ -367,6 +446,7 @@ class PositionChartDialog(QDialog):
                 self._bars = new_bars + self._bars
                 # Invalidate indicator cache
                 self._indicator_df = None
+                self._bar_arrays = None
 
         # Check if we can still fetch more
         self._can_fetch_more = bool(new_bars) and self._has_more_history()
@@ -668,9 +748,13 @@ class PositionChartDialog(QDialog):
         # Build DataFrame (cached per data load), enriched with SPY close for RS Line
         if self._indicator_df is None:
             display_bars = self._get_display_bars()
+            if display_bars is self._bars and self._bar_arrays is not None:
+                display_bars = self._bar_arrays   # unfiltered: wrap the cache columns
             self._indicator_df = bars_to_dataframe(display_bars)
             if self._spy_bars:
-                spy_df = bars_to_dataframe(self._spy_bars)
+                spy_df = bars_to_dataframe(
+                    self._spy_arrays if self._spy_arrays is not None else self._spy_bars
+                )
                 spy_close = spy_df[['timestamp', 'close']].rename(columns={'close': 'spy_close'})
                 self._indicator_df = self._indicator_df.merge(spy_close, on='timestamp', how='left')
                 self._indicator_df['spy_close'] = self._indicator_df['spy_close'].ffill()
@@ -1074,9 +1158,8 @@ class PositionChartDialog(QDialog):
     def _fetch_ticker_details(self) -> Optional[Dict]:
         """Fetch company name, industry, sector from Polygon (one API call)."""
         try:
-            from canslim_monitor.providers.factory import ProviderFactory
-            factory = ProviderFactory(self.db_session_factory)
-            provider = factory.get_historical()
+            from canslim_monitor.providers.pool import get_provider_pool
+            provider = get_provider_pool(self.db_session_factory).get_historical()
             if provider and hasattr(provider, 'get_ticker_details'):
                 return provider.get_ticker_details(self.symbol)
         except Exception as e:
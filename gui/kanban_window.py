@@ -27,6 +27,7 @@ from canslim_monitor.gui.kanban_column import KanbanColumn, ClosedPositionsPanel
 from canslim_monitor.gui.position_card import PositionCard
 from canslim_monitor.gui.transition_dialogs import TransitionDialog, AddPositionDialog, EditPositionDialog
 from canslim_monitor.gui.service_status_bar import ServiceStatusBar
+from canslim_monitor.gui.service_quote_feed import ServiceQuoteFeed
 from canslim_monitor.gui.ibd_exposure_dialog import IBDExposureDialog
 from canslim_monitor.gui.position_table_view import PositionTableView
 
@@ -242,14 +243,14 @@ class PriceUpdateWorker(QObject):
         logger = logging.getLogger('canslim.gui')
 
         try:
-            import requests
+            from canslim_monitor.utils.http_pool import get_http_pool
             url = 'https://query2.finance.yahoo.com/v8/finance/chart/%5EVIX'
             params = {'interval': '1d', 'range': '2d'}
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
                               'AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36'
             }
-            resp = requests.get(url, params=params, headers=headers, timeout=5)
+            resp = get_http_pool().get(url, params=params, headers=headers, timeout=5)
             resp.raise_for_status()
             data = resp.json()
 
@@ -1260,6 +1261,25 @@ class KanbanMainWindow(QMainWindow):
 
         self.logger.info(f"GUI refresh intervals: prices={price_interval}s, futures={futures_interval}s")
 
+        # Live quotes pushed by the running service; direct provider polling
+        # is only the fallback when no service is reachable.
+        # price_source: auto (service, else poll), service (never poll), direct
+        self.price_source = gui_config.get('price_source', 'auto')
+        self.quote_feed = None
+        self.quote_feed_timer = QTimer()
+        if self.price_source != 'direct':
+            ipc_config = self.config.get('service', {}).get('ipc', {}) or {}
+            self.quote_feed = ServiceQuoteFeed(
+                transport=ipc_config.get('transport', 'auto'),
+                address=ipc_config.get('address'),
+                logger=self.logger,
+                parent=self,
+            )
+            self.quote_feed.quotes_received.connect(self._on_service_quotes)
+            self.quote_feed.connection_changed.connect(self._on_service_feed_changed)
+            # Keeps subscribed symbols in sync and reconnects after a service restart
+            self.quote_feed_timer.timeout.connect(self._start_service_quote_feed)
+
         # Google Sheets auto-sync timer
         self.auto_sync_timer = QTimer()
         self.auto_sync_timer.timeout.connect(self._auto_sync_check)
@@ -1281,25 +1301,30 @@ class KanbanMainWindow(QMainWindow):
         self._load_positions()
         self._load_market_regime()  # Load regime data from database
         self._load_index_stats()    # Load index SMAs in background
+
+        if self.quote_feed is not None:
+            self._start_service_quote_feed()
+            self.quote_feed_timer.start(max(self.price_update_interval, 10000))
     
     def _init_providers(self):
-        """Initialize data providers via ProviderFactory.
+        """Initialize data providers via the process-wide ProviderPool.
 
         Creates Massive providers (historical + delayed realtime) that are
         always available.  IBKR providers are created later in
         ``_on_start_service()`` when the user connects to IB Gateway.
         """
         try:
-            from canslim_monitor.providers.factory import ProviderFactory
+            from canslim_monitor.providers.pool import get_provider_pool
 
-            factory = ProviderFactory(self.db.get_new_session)
+            # Process-wide pool: chart windows and workers reuse these instances
+            pool = get_provider_pool(self.db.get_new_session)
 
             # Seed DB from YAML if first run (safe to re-run)
             if self.config:
-                factory.seed_from_yaml(self.config)
+                pool.factory.seed_from_yaml(self.config)
 
             # Historical provider (Massive/Polygon) — always available
-            self.historical_provider = factory.get_historical()
+            self.historical_provider = pool.get_historical()
             if self.historical_provider:
                 self.logger.info(f"Historical provider ready: {self.historical_provider.name}")
             else:
@@ -1650,6 +1675,9 @@ class KanbanMainWindow(QMainWindow):
             
         finally:
             session.close()
+
+        # Rebuilt cards show database prices; repaint them from a fresh service snapshot
+        self._refresh_service_quotes()
     
     def _get_latest_alerts_for_positions(self, session, position_ids: list) -> dict:
         """
@@ -3194,6 +3222,7 @@ class KanbanMainWindow(QMainWindow):
                 tech_service = TechnicalDataService(
                     polygon_api_key=polygon_api_key,
                     cache_duration_hours=4,
+                    db_session_factory=self.db.get_new_session,
                     logger=self.logger
                 )
                 technical_data = tech_service.get_technical_data(position.symbol)
@@ -3323,6 +3352,7 @@ class KanbanMainWindow(QMainWindow):
                 tech_service = TechnicalDataService(
                     polygon_api_key=polygon_api_key,
                     cache_duration_hours=4,
+                    db_session_factory=self.db.get_new_session,
                     logger=self.logger
                 )
                 technical_data = tech_service.get_technical_data(position.symbol)
@@ -4821,9 +4851,8 @@ class KanbanMainWindow(QMainWindow):
 
             # Look up company info from data provider
             try:
-                from canslim_monitor.providers.factory import ProviderFactory
-                factory = ProviderFactory(self.db_session_factory)
-                hist_provider = factory.get_historical()
+                from canslim_monitor.providers.pool import get_provider_pool
+                hist_provider = get_provider_pool(self.db_session_factory).get_historical()
                 if hist_provider and hasattr(hist_provider, 'get_ticker_details'):
                     ticker_info = hist_provider.get_ticker_details(result['symbol'])
                     if ticker_info:
@@ -6150,6 +6179,13 @@ class KanbanMainWindow(QMainWindow):
     
     def _update_prices(self):
         """Start background price update from IBKR (with Polygon fallback)."""
+        # The service's quote stream, when reachable, replaces polling
+        if self._start_service_quote_feed():
+            return
+        if self.price_source == 'service':
+            self.status_bar.showMessage("Price refresh skipped - service quote stream not reachable")
+            return
+
         if not self.ibkr_client:
             self.status_bar.showMessage("Price refresh skipped - IBKR not initialized (use Service > Start IBKR)")
             return
@@ -6231,17 +6267,17 @@ class KanbanMainWindow(QMainWindow):
                     'state': pos.state
                 }
 
-            # Update database prices
-            updated_count = 0
-            for pos in positions:
-                if pos.symbol in prices:
-                    price_data = prices[pos.symbol]
+            # Update database prices (one UPDATE for all positions)
+            new_prices = {}
+            for symbol in position_data:
+                if symbol in prices:
+                    price_data = prices[symbol]
                     last_price = price_data.get('last') or price_data.get('close')
 
                     if last_price and last_price > 0:
-                        repos.positions.update_price(pos, last_price)
-                        updated_count += 1
+                        new_prices[symbol] = last_price
 
+            updated_count = repos.positions.bulk_update_prices(new_prices)
             session.commit()
 
             # Incremental card updates (no rebuild) - much faster!
@@ -6269,6 +6305,64 @@ class KanbanMainWindow(QMainWindow):
         finally:
             session.close()
 
+    def _price_symbols(self) -> List[str]:
+        """Symbols shown on the board (open states) plus banner indices."""
+        symbols = [s for s, card in self._cards_by_symbol.items() if card.state >= 0]
+        for idx in ['SPY', 'QQQ', 'DIA', 'IWM', 'VIX']:
+            if idx not in symbols:
+                symbols.append(idx)
+        return symbols
+
+    def _start_service_quote_feed(self) -> bool:
+        """
+        Subscribe to (or re-sync symbols on) the service's quote stream.
+
+        Returns:
+            True if prices are coming from the service
+        """
+        if self.quote_feed is None:
+            return False
+        try:
+            return self.quote_feed.start(self._price_symbols(), timeout=0)
+        except Exception as e:
+            self.logger.debug(f"Service quote stream unavailable: {e}")
+            return False
+
+    def _refresh_service_quotes(self):
+        """Ask the service for a full quote snapshot of the current board."""
+        if self.quote_feed is None or not self.quote_feed.is_active():
+            return
+        try:
+            self.quote_feed.refresh(self._price_symbols())
+        except Exception as e:
+            self.logger.debug(f"Service quote snapshot request failed: {e}")
+
+    def _on_service_feed_changed(self, connected: bool):
+        """Switch between the service quote stream and direct polling."""
+        if connected:
+            self.status_bar.showMessage("Live prices streaming from service")
+            return
+
+        self.status_bar.showMessage("Service quote stream lost - falling back to direct polling")
+        if self.ibkr_client:
+            self._update_prices()
+
+    def _on_service_quotes(self, prices: Dict):
+        """
+        Apply quote deltas pushed by the service.
+
+        The service writes prices to the database (PositionThread for
+        State 1+, BreakoutThread for the watchlist), so only the cards and
+        the banner are repainted here.
+        """
+        position_data = {
+            symbol: {'avg_cost': card.avg_cost, 'state': card.state}
+            for symbol, card in self._cards_by_symbol.items()
+        }
+        self._update_card_prices(prices, position_data)
+        self._update_market_banner(prices)
+        self._last_price_update_time = datetime.now()
+
     def _update_card_prices(self, prices: Dict, position_data: Dict):
         """
         Update card prices incrementally without rebuilding the board.
@@ -6681,6 +6775,11 @@ class KanbanMainWindow(QMainWindow):
         if self.ibkr_connected or self.ibkr_client:
             self._on_stop_service()
 
+        # Drop the service quote stream
+        self.quote_feed_timer.stop()
+        if self.quote_feed is not None:
+            self.quote_feed.stop()
+
         # Disconnect Massive providers
         if self.historical_provider:
             try:
@@ -6805,6 +6904,17 @@ def launch_gui(db_path: str):
     db = DatabaseManager(db_path)
     db.initialize()
     logger.info("Database initialized")
+
+    # GUI API calls yield to the service's position monitoring on a shared key
+    from canslim_monitor.utils.shared_rate_limit import RatePriority, set_default_rate_priority
+    set_default_rate_priority(RatePriority.LOW)
+
+    # Chart bars are cached as memory-mapped columns next to the database
+    try:
+        from canslim_monitor.data.bar_cache import init_bar_cache
+        init_bar_cache(os.path.join(os.path.dirname(os.path.abspath(db_path)), 'bar_cache'))
+    except ImportError as e:
+        logger.warning(f"Bar cache disabled: {e}")
     
     # Pre-import QtWebEngineWidgets before QApplication (Qt requirement)
     try:
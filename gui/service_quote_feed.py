@@ -0,0 +1,125 @@
+"""
+CANSLIM Monitor - Service Quote Feed
+Qt bridge from the running service's IPC quote stream to the GUI.
+
+When the service is reachable over the socket transport, the Kanban
+window subscribes to its QuoteBook instead of polling IBKR/Polygon
+itself: the service already streams every monitored symbol and writes
+prices to the database (PositionThread for State 1+, BreakoutThread for
+the watchlist), so the GUI only repaints cards from the pushed deltas.  Direct polling remains the fallback when no service answers.
+
+Pushes arrive on the IPC client's reader thread and are re-emitted as
+Qt signals, which Qt queues onto the GUI thread.
+"""
+
+import logging
+from typing import Iterable, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class ServiceQuoteFeed(QObject):
+    """
+    Live quotes pushed by the service over IPC.
+
+    Signals:
+        quotes_received: {symbol: quote dict} (same shape as
+            PriceUpdateWorker.finished)
+        connection_changed: True when subscribed, False when the stream
+            is lost
+    """
+
+    quotes_received = pyqtSignal(dict)
+    connection_changed = pyqtSignal(bool)
+
+    def __init__(
+        self,
+        transport: str = 'auto',
+        address=None,
+        logger: Optional[logging.Logger] = None,
+        parent=None
+    ):
+        super().__init__(parent)
+        self.transport = transport
+        self.address = address
+        self.logger = logger or logging.getLogger('canslim.gui.quote_feed')
+
+        self._client = None
+        self._symbols: Optional[frozenset] = None
+        self._active = False
+        self.pushes = 0
+
+    def is_active(self) -> bool:
+        return self._active
+
+    def start(self, symbols: Iterable[str], timeout: float = 0.5) -> bool:
+        """
+        Connect to the service and subscribe to quotes for *symbols*.
+
+        Returns:
+            True if subscribed; False if no service (or only a named-pipe
+            service without push support) is reachable
+        """
+        if self._active:
+            self.set_symbols(symbols)
+            return True
+
+        from canslim_monitor.service.ipc import create_pipe_client
+
+        client = create_pipe_client(
+            logger=self.logger, transport=self.transport, address=self.address
+        )
+        if not hasattr(client, 'subscribe'):
+            return False
+        if not client.connect(timeout=timeout):
+            return False
+
+        client.disconnect_callback = self._on_connection_lost
+        symbols = frozenset(s.upper() for s in symbols)
+        reply = client.subscribe(['quotes'], self._on_push, symbols=sorted(symbols), timeout=2.0)
+        if not reply or 'quotes' not in reply.get('subscribed', []):
+            client.disconnect()
+            return False
+
+        self._client = client
+        self._symbols = symbols
+        self._active = True
+        self.logger.info(f"Subscribed to service quote stream for {len(symbols)} symbols")
+        self.connection_changed.emit(True)
+        return True
+
+    def set_symbols(self, symbols: Iterable[str]):
+        """Change the subscribed symbols (no-op when unchanged)."""
+        symbols = frozenset(s.upper() for s in symbols)
+        if not self._active or symbols == self._symbols:
+            return
+        self._symbols = symbols
+        self._client.set_quote_symbols(sorted(symbols), timeout=2.0)
+
+    def refresh(self, symbols: Iterable[str]):
+        """Re-subscribe to *symbols* so the service resends a full quote snapshot."""
+        if not self._active:
+            return
+        self._symbols = frozenset(s.upper() for s in symbols)
+        self._client.set_quote_symbols(sorted(self._symbols), timeout=2.0)
+
+    def stop(self):
+        """Unsubscribe and disconnect (no connection_changed signal)."""
+        client, self._client = self._client, None
+        self._active = False
+        self._symbols = None
+        if client is not None:
+            client.disconnect()
+
+    def _on_push(self, message: dict):
+        prices = message.get('data') or {}
+        if prices:
+            self.pushes += 1
+            self.quotes_received.emit(prices)
+
+    def _on_connection_lost(self):
+        self.logger.warning("Service quote stream lost")
+        self._client = None
+        self._active = False
+        self._symbols = None
+        self.connection_changed.emit(False)
@@ -150,11 +150,11 @@ class ServiceStatusBar(QWidget):
         # === IPC FIX: Auto-create IPC client if not provided ===
         if ipc_client is None:
             try:
-                from canslim_monitor.service.ipc import PipeClient
-                self.ipc_client = PipeClient()
+                from canslim_monitor.service.ipc import create_pipe_client
+                self.ipc_client = create_pipe_client()
                 self.logger.debug("IPC client auto-created")
             except ImportError as e:
-                self.logger.warning(f"Could not import PipeClient: {e}")
+                self.logger.warning(f"Could not import IPC client: {e}")
                 self.ipc_client = None
         else:
             self.ipc_client = ipc_client
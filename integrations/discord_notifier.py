@@ -6,13 +6,15 @@ Supports multiple channels for different alert types.
 """
 
 import logging
-import requests
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 from enum import Enum
 from threading import Lock
 import time
 
+from canslim_monitor.utils.http_pool import get_http_pool
+
 
 class AlertChannel(Enum):
     """Discord channel types for different alerts."""
@@ -22,6 +24,15 @@ class AlertChannel(Enum):
     SYSTEM = 'system'
 
 
+@dataclass
+class DeliveryResult:
+    """Outcome of a single webhook POST (see DiscordNotifier.deliver)."""
+    ok: bool
+    retry_after: Optional[float] = None  # Seconds Discord asked us to wait (HTTP 429)
+    error: Optional[str] = None
+    permanent: bool = False  # Retrying cannot help (disabled, no webhook, rejected payload)
+
+
 class DiscordNotifier:
     """
     Discord webhook notifier for trading alerts.
@@ -150,7 +161,7 @@ class DiscordNotifier:
         """Send with retry logic."""
         for attempt in range(max_retries):
             try:
-                response = requests.post(
+                response = get_http_pool().post(
                     webhook_url,
                     json=payload,
                     timeout=10
@@ -195,6 +206,45 @@ class DiscordNotifier:
         """Record a sent message for rate limiting."""
         with self._lock:
             self._message_times.append(datetime.now())
+
+    def webhook_for(self, channel: str = None) -> Optional[str]:
+        """Webhook URL a channel's messages are posted to."""
+        return self.webhooks.get(channel) or self.default_webhook
+
+    def deliver(self, payload: Dict, channel: str = None) -> DeliveryResult:
+        """
+        POST a prepared webhook payload once, without sleeping.
+
+        Used by the alert delivery worker, which owns rate limiting,
+        retries and back-off; send() keeps the blocking retry loop for
+        direct callers.
+        """
+        if not self.enabled:
+            return DeliveryResult(ok=False, error="notifications disabled", permanent=True)
+
+        webhook_url = self.webhook_for(channel)
+        if not webhook_url:
+            return DeliveryResult(ok=False, error=f"no webhook for channel {channel}", permanent=True)
+
+        try:
+            response = get_http_pool().post(webhook_url, json=payload, timeout=10)
+        except Exception as e:
+            return DeliveryResult(ok=False, error=str(e))
+
+        if response.status_code in (200, 204):
+            self._record_message()
+            return DeliveryResult(ok=True)
+
+        if response.status_code == 429:
+            try:
+                retry_after = float(response.json().get('retry_after', 5))
+            except Exception:
+                retry_after = 5.0
+            return DeliveryResult(ok=False, retry_after=retry_after, error="rate limited (429)")
+
+        error = f"HTTP {response.status_code}: {response.text[:200]}"
+        # 4xx means Discord rejected this payload; server errors are worth retrying
+        return DeliveryResult(ok=False, error=error, permanent=400 <= response.status_code < 500)
     
     # ==================== ALERT HELPERS ====================
     
@@ -9,6 +9,9 @@ Key Features:
 - Automatic reconnection with exponential backoff
 - Connection health monitoring
 - Thread-safe price queries from any thread
+- Batched snapshots: one qualify call + concurrent reqMktData per cycle
+- Contract cache: qualified conIds reused across cycles and restarts
+- Streaming: persistent reqMktData subscriptions pushed to a callback
 """
 
 import asyncio
@@ -19,6 +22,11 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List, Callable
 from dataclasses import dataclass
 
+from canslim_monitor.integrations.ibkr_contract_cache import ContractCache
+
+# TWS error codes that mean a (cached) contract is no longer valid
+_INVALID_CONTRACT_ERRORS = {200}
+
 
 @dataclass
 class ReconnectConfig:
@@ -51,6 +59,9 @@ class ThreadSafeIBKRClient:
         reconnect_config: Optional[ReconnectConfig] = None,
         on_connect: Optional[Callable] = None,
         on_disconnect: Optional[Callable] = None,
+        snapshot_timeout: float = 4.0,
+        batch_size: int = 50,
+        contract_cache: Optional[ContractCache] = None,
     ):
         self.host = host
         self.port = port
@@ -58,6 +69,14 @@ class ThreadSafeIBKRClient:
         self.logger = logger or logging.getLogger('canslim.service.ibkr')
         self.reconnect_config = reconnect_config or ReconnectConfig()
         
+        # Batched snapshot settings: one overall deadline per batch, and a cap
+        # on simultaneous market data lines (TWS default allowance is 100)
+        self.snapshot_timeout = snapshot_timeout
+        self.batch_size = max(1, batch_size)
+        
+        # Qualified contracts (memory-only unless a persistent cache is injected)
+        self.contract_cache = contract_cache or ContractCache(logger=self.logger)
+        
         # Callbacks for connection state changes
         self.on_connect = on_connect
         self.on_disconnect = on_disconnect
@@ -70,6 +89,11 @@ class ThreadSafeIBKRClient:
         self._shutdown = threading.Event()
         self._lock = threading.Lock()
         
+        # Streaming subscriptions: {symbol: (contract, ticker)}
+        self._streams: Dict[str, tuple] = {}
+        self._stream_symbols: Dict[int, str] = {}  # id(ticker) -> symbol
+        self._stream_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        
         # Reconnection state
         self._reconnect_attempts = 0
         self._last_connect_time: Optional[datetime] = None
@@ -166,6 +190,8 @@ class ThreadSafeIBKRClient:
             
             # Set up disconnect handler
             self._ib.disconnectedEvent += self._on_ib_disconnect
+            self._ib.errorEvent += self._on_ib_error
+            self._ib.pendingTickersEvent += self._on_pending_tickers
             
             # Initial connection
             self._loop.run_until_complete(self._async_connect())
@@ -219,6 +245,14 @@ class ThreadSafeIBKRClient:
             )
             self._handle_disconnect()
 
+    def _on_ib_error(self, reqId, errorCode, errorString, contract=None):
+        """Drop cached contracts that TWS no longer recognizes."""
+        if errorCode in _INVALID_CONTRACT_ERRORS and contract is not None:
+            if getattr(contract, 'symbol', None):
+                self.contract_cache.invalidate(contract.symbol, f"(error {errorCode})")
+            elif getattr(contract, 'conId', 0):
+                self.contract_cache.invalidate_con_id(contract.conId, f"(error {errorCode})")
+
     def _handle_disconnect(self):
         """Handle disconnect and trigger reconnection."""
         was_connected = self._connected.is_set()
@@ -390,6 +424,9 @@ class ThreadSafeIBKRClient:
                 # Restart health check
                 self._start_health_check()
 
+                # Streams died with the old connection - re-open them
+                self._resubscribe_streams()
+
                 # Notify callback
                 if self.on_connect:
                     try:
@@ -527,18 +564,51 @@ class ThreadSafeIBKRClient:
         except Exception as e:
             self.logger.debug(f"Quote error for {symbol}: {e}")
             return None
+        finally:
+            self.contract_cache.flush()
     
-    async def _async_get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Async quote retrieval."""
+    async def _async_qualify(self, symbols: List[str]) -> Dict[str, Any]:
+        """
+        Resolve symbols to qualified contracts.
+        
+        Cached conIds are used as-is; only cache misses are qualified, all in
+        a single qualifyContractsAsync call.  Returns {symbol: contract} for
+        symbols that resolved.
+        """
         from ib_insync import Stock
         
-        contract = Stock(symbol, 'SMART', 'USD')
+        resolved = {}
+        misses = []
+        for symbol in symbols:
+            cached = self.contract_cache.get(symbol)
+            if cached:
+                contract = Stock(symbol, cached['exchange'] or 'SMART', cached['currency'] or 'USD')
+                contract.conId = cached['con_id']
+                if cached.get('primary_exchange'):
+                    contract.primaryExchange = cached['primary_exchange']
+                resolved[symbol] = contract
+            else:
+                misses.append((symbol, Stock(symbol, 'SMART', 'USD')))
+        
+        if misses:
+            try:
+                await self._ib.qualifyContractsAsync(*(c for _, c in misses))
+            except Exception as e:
+                self.logger.debug(f"Contract qualification error: {e}")
+            for symbol, contract in misses:
+                if contract.conId:
+                    self.contract_cache.put(symbol, contract)
+                    resolved[symbol] = contract
         
+        return resolved
+    
+    async def _async_get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Async quote retrieval."""
         try:
-            # Qualify contract
-            await self._ib.qualifyContractsAsync(contract)
+            # Qualify contract (skipped when cached)
+            contract = (await self._async_qualify([symbol])).get(symbol)
             
-            if not contract.conId:
+            if contract is None:
                 return None
             
             # Request market data snapshot
@@ -548,61 +618,265 @@ class ThreadSafeIBKRClient:
             # Wait for data - increased time for reliable results
             await asyncio.sleep(2.0)
             
-            def safe_float(val, default=0.0):
-                if val is None or (isinstance(val, float) and val != val):
-                    return default
-                return float(val)
-            
-            # Check if volume data is available (not None and not NaN)
-            volume_available = ticker.volume is not None and not (isinstance(ticker.volume, float) and ticker.volume != ticker.volume)
-            
-            last_price = safe_float(ticker.last) or safe_float(ticker.close)
-            if last_price <= 0:
-                bid = safe_float(ticker.bid)
-                ask = safe_float(ticker.ask)
-                if bid > 0 and ask > 0:
-                    last_price = (bid + ask) / 2
-            
             # Cancel market data subscription
             self._ib.cancelMktData(contract)
             
-            if last_price <= 0:
-                return None
-            
-            return {
-                'symbol': symbol,
-                'last': last_price,
-                'bid': safe_float(ticker.bid),
-                'ask': safe_float(ticker.ask),
-                'volume': int(safe_float(ticker.volume)),
-                'avg_volume': int(safe_float(ticker.avVolume, 500000)),
-                'high': safe_float(ticker.high),
-                'low': safe_float(ticker.low),
-                'open': safe_float(ticker.open),
-                'close': safe_float(ticker.close),
-                'volume_available': volume_available,
-            }
+            return self._ticker_to_quote(symbol, ticker)
             
         except Exception as e:
             self.logger.debug(f"Quote fetch error for {symbol}: {e}")
             return None
     
-    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    async def _async_get_quotes(
+        self,
+        symbols: List[str],
+        timeout: float,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Async batched quote retrieval.
+        
+        Qualifies every contract in one call, fires all snapshot requests at
+        once, then waits until each ticker has a last/close price or the
+        overall deadline passes - whichever comes first.
+        """
+        contracts = await self._async_qualify(symbols)
+        
+        # Fire all snapshots at once
+        pending: Dict[str, Any] = {}
+        tickers: Dict[str, Any] = {}
+        for symbol in symbols:
+            contract = contracts.get(symbol)
+            if contract is None:
+                self.logger.debug(f"{symbol}: contract not qualified, skipping")
+                continue
+            try:
+                tickers[symbol] = self._ib.reqMktData(contract, '', True, False)
+                pending[symbol] = contract
+            except Exception as e:
+                self.logger.debug(f"Snapshot request error for {symbol}: {e}")
+        
+        # Resolve each ticker as soon as its price tick arrives
+        deadline = time.monotonic() + timeout
+        while pending and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            for symbol in list(pending):
+                ticker = tickers[symbol]
+                if self._has_price(ticker.last) or self._has_price(ticker.close):
+                    self._cancel_snapshot(pending.pop(symbol))
+        
+        # Deadline reached - release whatever is still outstanding
+        for contract in pending.values():
+            self._cancel_snapshot(contract)
+        if pending:
+            self.logger.debug(
+                f"Snapshot deadline ({timeout:.1f}s) reached with "
+                f"{len(pending)}/{len(tickers)} tickers unresolved"
+            )
+        
+        results = {}
+        for symbol, ticker in tickers.items():
+            quote = self._ticker_to_quote(symbol, ticker)
+            if quote:
+                results[symbol] = quote
+        return results
+    
+    def _cancel_snapshot(self, contract):
+        """Cancel a snapshot request, ignoring already-completed requests."""
+        try:
+            self._ib.cancelMktData(contract)
+        except Exception:
+            pass
+    
+    @staticmethod
+    def _has_price(val) -> bool:
+        """True if a ticker field holds a usable (non-NaN, positive) price."""
+        return val is not None and val == val and val > 0
+    
+    @staticmethod
+    def _ticker_to_quote(symbol: str, ticker) -> Optional[Dict[str, Any]]:
+        """Convert an ib_insync Ticker into the quote dict returned by get_quote()."""
+        def safe_float(val, default=0.0):
+            if val is None or (isinstance(val, float) and val != val):
+                return default
+            return float(val)
+        
+        # Check if volume data is available (not None and not NaN)
+        volume_available = ticker.volume is not None and not (isinstance(ticker.volume, float) and ticker.volume != ticker.volume)
+        
+        last_price = safe_float(ticker.last) or safe_float(ticker.close)
+        if last_price <= 0:
+            bid = safe_float(ticker.bid)
+            ask = safe_float(ticker.ask)
+            if bid > 0 and ask > 0:
+                last_price = (bid + ask) / 2
+        
+        if last_price <= 0:
+            return None
+        
+        return {
+            'symbol': symbol,
+            'last': last_price,
+            'bid': safe_float(ticker.bid),
+            'ask': safe_float(ticker.ask),
+            'volume': int(safe_float(ticker.volume)),
+            'avg_volume': int(safe_float(ticker.avVolume, 500000)),
+            'high': safe_float(ticker.high),
+            'low': safe_float(ticker.low),
+            'open': safe_float(ticker.open),
+            'close': safe_float(ticker.close),
+            'volume_available': volume_available,
+        }
+    
+    def get_quotes(
+        self,
+        symbols: List[str],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Get quotes for multiple symbols (thread-safe).
         
+        Symbols are fetched in batches of ``batch_size``; each batch costs one
+        qualification round trip plus at most ``timeout`` seconds of waiting,
+        instead of 2 s per symbol.
+        
         Args:
             symbols: List of stock symbols
+            timeout: Overall deadline per batch (default: snapshot_timeout)
             
         Returns:
             Dict mapping symbols to their quote data
         """
+        if not symbols:
+            return {}
+        if not self.is_connected():
+            self.logger.warning("Not connected to IBKR")
+            return {}
+        
+        timeout = self.snapshot_timeout if timeout is None else timeout
+        
+        # De-duplicate while preserving order
+        unique = list(dict.fromkeys(symbols))
+        
         results = {}
+        for start in range(0, len(unique), self.batch_size):
+            batch = unique[start:start + self.batch_size]
+            try:
+                future = asyncio.run_coroutine_threadsafe(
+                    self._async_get_quotes(batch, timeout),
+                    self._loop
+                )
+                # Allow for qualification round trip on top of the snapshot deadline
+                results.update(future.result(timeout=timeout + 10.0))
+            except Exception as e:
+                self.logger.warning(f"Batch quote error ({len(batch)} symbols): {e}")
+        
+        self.contract_cache.flush()
+        return results
+    
+    # =========================================================================
+    # Streaming subscriptions
+    # =========================================================================
+    
+    def subscribe(
+        self,
+        symbols: List[str],
+        on_update: Callable[[Dict[str, Any]], None],
+    ) -> List[str]:
+        """
+        Open persistent (non-snapshot) market data streams (thread-safe).
+        
+        *on_update* receives a get_quote()-style dict on every tick batch.
+        It runs on the IB event loop thread, so it must be quick and must
+        not call back into this client.
+        
+        Args:
+            symbols: Symbols to stream (already-streaming symbols are ignored)
+            on_update: Callback for each updated quote
+            
+        Returns:
+            Symbols newly subscribed
+        """
+        self._stream_callback = on_update
+        with self._lock:
+            new = [s for s in dict.fromkeys(symbols) if s not in self._streams]
+        if not new or not self.is_connected():
+            return []
+        
+        try:
+            future = asyncio.run_coroutine_threadsafe(
+                self._async_subscribe(new),
+                self._loop
+            )
+            added = future.result(timeout=15.0)
+        except Exception as e:
+            self.logger.warning(f"Stream subscribe error ({len(new)} symbols): {e}")
+            added = []
+        finally:
+            self.contract_cache.flush()
+        
+        if added:
+            self.logger.debug(f"Streaming {len(added)} new symbols ({len(self._streams)} total)")
+        return added
+    
+    async def _async_subscribe(self, symbols: List[str]) -> List[str]:
+        """Async stream setup - one qualify call, one reqMktData per symbol."""
+        contracts = await self._async_qualify(symbols)
+        added = []
         for symbol in symbols:
-            quote = self.get_quote(symbol)
+            contract = contracts.get(symbol)
+            if contract is None:
+                continue
+            ticker = self._ib.reqMktData(contract, '', False, False)
+            with self._lock:
+                self._streams[symbol] = (contract, ticker)
+                self._stream_symbols[id(ticker)] = symbol
+            added.append(symbol)
+        return added
+    
+    def unsubscribe(self, symbols: List[str]):
+        """Close market data streams for *symbols* (thread-safe)."""
+        removed = []
+        with self._lock:
+            for symbol in symbols:
+                entry = self._streams.pop(symbol, None)
+                if entry:
+                    self._stream_symbols.pop(id(entry[1]), None)
+                    removed.append(entry[0])
+        
+        if removed and self._loop and self.is_connected():
+            for contract in removed:
+                self._loop.call_soon_threadsafe(self._cancel_snapshot, contract)
+    
+    def get_subscriptions(self) -> List[str]:
+        """Symbols with an open market data stream."""
+        with self._lock:
+            return list(self._streams)
+    
+    def _on_pending_tickers(self, tickers):
+        """IB event loop callback: forward streamed ticks to the subscriber."""
+        callback = self._stream_callback
+        if callback is None:
+            return
+        for ticker in tickers:
+            symbol = self._stream_symbols.get(id(ticker))
+            if symbol is None:
+                continue  # snapshot request, not a stream
+            quote = self._ticker_to_quote(symbol, ticker)
             if quote:
-                results[symbol] = quote
-        return results
+                try:
+                    callback(quote)
+                except Exception as e:
+                    self.logger.debug(f"Stream callback error for {symbol}: {e}")
+    
+    def _resubscribe_streams(self):
+        """Re-open every stream after a reconnect."""
+        with self._lock:
+            symbols = list(self._streams)
+            self._streams.clear()
+            self._stream_symbols.clear()
+        if symbols and self._stream_callback:
+            self.logger.info(f"Re-subscribing {len(symbols)} market data streams")
+            self.subscribe(symbols, self._stream_callback)
     
     def sleep(self, seconds: float):
         """
@@ -649,4 +923,6 @@ class ThreadSafeIBKRClient:
             'reconnect_attempts': self._reconnect_attempts,
             'reconnecting': self._reconnecting,
             'reconnect_enabled': self.reconnect_config.enabled,
+            'contract_cache': self.contract_cache.get_stats(),
+            'streams': len(self._streams),
         }
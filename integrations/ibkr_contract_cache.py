@@ -0,0 +1,216 @@
+"""
+CANSLIM Monitor - IBKR Contract Cache
+======================================
+Keeps qualified IBKR contracts (conId, primary exchange, ...) keyed by
+symbol so quote requests don't re-qualify ``Stock(symbol, 'SMART', 'USD')``
+on every cycle.
+
+Persistence is optional: with a ``db_session_factory`` the cache is loaded
+from the ``ibkr_contract_cache`` table when constructed and written back
+to it, so it survives restarts; without one it is memory-only.
+
+Invalidation:
+- TTL: entries older than ``ttl_hours`` count as misses and are re-qualified
+- Errors: ``invalidate()`` drops a symbol (e.g. on TWS error 200)
+
+Lookups never touch SQLite: the table is read once up front, on the
+constructing thread. Writes are batched: ``put()`` / ``invalidate()`` only
+mark entries dirty, and ``flush()`` persists them.  Callers flush from
+their own thread so the IB event loop never blocks on SQLite.
+
+Usage:
+    cache = ContractCache(db_session_factory)
+    entry = cache.get('AAPL')          # dict or None
+    cache.put('AAPL', qualified_contract)
+    cache.flush()
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Callable
+
+
+class ContractCache:
+    """Thread-safe symbol -> qualified contract cache with TTL."""
+
+    DEFAULT_TTL_HOURS = 24 * 7
+
+    def __init__(
+        self,
+        db_session_factory: Optional[Callable] = None,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.db_session_factory = db_session_factory
+        self.ttl = timedelta(hours=ttl_hours)
+        self.logger = logger or logging.getLogger('canslim.service.ibkr')
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty: set = set()
+        self._deleted: set = set()
+        self._lock = threading.Lock()
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        # Preload here, off the IB event loop that later calls get()
+        self.load()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Return the cached contract fields for *symbol*, or None on miss (memory only)."""
+        symbol = symbol.upper()
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry and datetime.now() - entry['qualified_at'] < self.ttl:
+                self.hits += 1
+                return entry
+            if entry:
+                # Expired - force re-qualification
+                del self._entries[symbol]
+            self.misses += 1
+            return None
+
+    def put(self, symbol: str, contract) -> None:
+        """Store a qualified ib_insync contract."""
+        if not getattr(contract, 'conId', 0):
+            return
+        symbol = symbol.upper()
+        entry = {
+            'symbol': symbol,
+            'con_id': contract.conId,
+            'sec_type': getattr(contract, 'secType', None) or 'STK',
+            'exchange': getattr(contract, 'exchange', None) or 'SMART',
+            'primary_exchange': getattr(contract, 'primaryExchange', None) or None,
+            'currency': getattr(contract, 'currency', None) or 'USD',
+            'local_symbol': getattr(contract, 'localSymbol', None) or None,
+            'qualified_at': datetime.now(),
+        }
+        with self._lock:
+            self._entries[symbol] = entry
+            self._dirty.add(symbol)
+            self._deleted.discard(symbol)
+
+    def invalidate(self, symbol: str, reason: str = '') -> None:
+        """Drop *symbol* so the next request re-qualifies it."""
+        symbol = symbol.upper()
+        with self._lock:
+            if self._entries.pop(symbol, None) is None:
+                return
+            self._dirty.discard(symbol)
+            self._deleted.add(symbol)
+            self.invalidations += 1
+        self.logger.debug(f"{symbol}: contract cache invalidated {reason}".rstrip())
+
+    def invalidate_con_id(self, con_id: int, reason: str = '') -> None:
+        """Drop whichever symbol maps to *con_id*."""
+        with self._lock:
+            symbol = next(
+                (s for s, e in self._entries.items() if e['con_id'] == con_id),
+                None,
+            )
+        if symbol:
+            self.invalidate(symbol, reason)
+
+    def clear(self) -> None:
+        """Drop every entry (and, on next flush, every persisted row)."""
+        with self._lock:
+            self._deleted.update(self._entries)
+            self._entries.clear()
+            self._dirty.clear()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load(self) -> int:
+        """Load persisted contracts.  Returns number of entries loaded."""
+        if not self.db_session_factory:
+            return 0
+
+        from canslim_monitor.data.models import IBKRContract
+
+        session = self.db_session_factory()
+        try:
+            IBKRContract.__table__.create(bind=session.get_bind(), checkfirst=True)
+            rows = session.query(IBKRContract).all()
+            with self._lock:
+                for row in rows:
+                    self._entries[row.symbol] = {
+                        'symbol': row.symbol,
+                        'con_id': row.con_id,
+                        'sec_type': row.sec_type,
+                        'exchange': row.exchange,
+                        'primary_exchange': row.primary_exchange,
+                        'currency': row.currency,
+                        'local_symbol': row.local_symbol,
+                        'qualified_at': row.qualified_at,
+                    }
+            self.logger.debug(f"Loaded {len(rows)} cached IBKR contracts")
+            return len(rows)
+        except Exception as e:
+            self.logger.warning(f"Could not load IBKR contract cache: {e}")
+            return 0
+        finally:
+            session.close()
+
+    def flush(self) -> int:
+        """Persist pending puts/invalidations in one transaction."""
+        if not self.db_session_factory:
+            with self._lock:
+                self._dirty.clear()
+                self._deleted.clear()
+            return 0
+
+        with self._lock:
+            if not self._dirty and not self._deleted:
+                return 0
+            upserts = [dict(self._entries[s]) for s in self._dirty if s in self._entries]
+            deletes = list(self._deleted)
+            self._dirty.clear()
+            self._deleted.clear()
+
+        from canslim_monitor.data.models import IBKRContract
+
+        session = self.db_session_factory()
+        try:
+            if deletes:
+                session.query(IBKRContract).filter(
+                    IBKRContract.symbol.in_(deletes)
+                ).delete(synchronize_session=False)
+            for entry in upserts:
+                session.merge(IBKRContract(**entry))
+            session.commit()
+            return len(upserts) + len(deletes)
+        except Exception as e:
+            session.rollback()
+            self.logger.warning(f"Could not persist IBKR contract cache: {e}")
+            # Retry on next flush
+            with self._lock:
+                self._dirty.update(entry['symbol'] for entry in upserts)
+                self._deleted.update(deletes)
+            return 0
+        finally:
+            session.close()
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for status reporting."""
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+            'invalidations': self.invalidations,
+            'persistent': self.db_session_factory is not None,
+        }
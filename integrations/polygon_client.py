@@ -12,12 +12,17 @@ Usage:
 """
 
 import logging
+import sqlite3
+import threading
 import requests
 from datetime import date, datetime, timedelta, timezone
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
 from time import sleep
 
+from canslim_monitor.utils.http_pool import get_http_pool
+from canslim_monitor.utils.shared_rate_limit import get_shared_rate_limiter
+
 
 @dataclass
 class Bar:
@@ -44,9 +49,15 @@ class PolygonClient:
     Rate limits:
     - Free tier: 5 calls/minute
     - Paid tiers: Higher limits
+
+    When a shared budget is configured for the API key (see
+    ``utils.shared_rate_limit``), every request draws a token from it at
+    the calling thread's priority, and a 429 starts a back-off shared by
+    all processes instead of sleeping inline.
     """
     
     DEFAULT_BASE_URL = "https://api.polygon.io"
+    SNAPSHOT_BATCH_SIZE = 100   # Tickers per multi-ticker snapshot request
     
     def __init__(
         self,
@@ -73,6 +84,7 @@ class PolygonClient:
         self.logger = logger or logging.getLogger('canslim.polygon')
         
         self._last_request_time = 0
+        self._throttle_lock = threading.Lock()   # Callers share one client across worker threads
     
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """
@@ -85,11 +97,27 @@ class PolygonClient:
         Returns:
             JSON response dict or None on error
         """
-        # Rate limiting
-        now = datetime.now().timestamp()
-        elapsed = now - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            sleep(self.rate_limit_delay - elapsed)
+        # Rate limiting: reserve the next slot under the lock, sleep outside it
+        with self._throttle_lock:
+            now = datetime.now().timestamp()
+            wait = max(0.0, self._last_request_time + self.rate_limit_delay - now)
+            self._last_request_time = now + wait
+        if wait > 0:
+            sleep(wait)
+
+        # Cross-process budget for this key (GUI + service)
+        shared_limiter = get_shared_rate_limiter(self.api_key)
+        if shared_limiter is not None:
+            try:
+                if shared_limiter.acquire() is None:
+                    # LOW (GUI) callers have a bounded wait; don't hang the caller
+                    self.logger.warning(f"Shared rate budget busy, skipping request: {endpoint}")
+                    return None
+            except sqlite3.Error as e:
+                # Budget file unusable (e.g. locked past its timeout): the
+                # local rate_limit_delay above is the only throttle for this call
+                self.logger.warning(f"Shared rate limit unavailable, using local delay: {e}")
+                shared_limiter = None
         
         url = f"{self.base_url}{endpoint}"
         params = params or {}
@@ -97,14 +125,18 @@ class PolygonClient:
         
         try:
             self.logger.debug(f"Requesting: {endpoint}")
-            response = requests.get(url, params=params, timeout=self.timeout)
-            self._last_request_time = datetime.now().timestamp()
+            response = get_http_pool().get(url, params=params, timeout=self.timeout)
+            with self._throttle_lock:
+                self._last_request_time = max(self._last_request_time, datetime.now().timestamp())
             
             if response.status_code == 200:
+                self._report_shared(shared_limiter, 'report_success')
                 return response.json()
             elif response.status_code == 429:
                 self.logger.warning("Rate limited by Polygon API")
-                sleep(60)  # Wait a minute on rate limit
+                # Every process backs off before its next call
+                if not self._report_shared(shared_limiter, 'report_429'):
+                    sleep(60)  # Wait a minute on rate limit
                 return None
             elif response.status_code == 403:
                 self.logger.error("Invalid API key or unauthorized access")
@@ -120,6 +152,17 @@ class PolygonClient:
             self.logger.error(f"Request failed: {e}")
             return None
     
+    def _report_shared(self, shared_limiter, report: str) -> bool:
+        """Call *report* on the shared limiter; False if there is none or it failed."""
+        if shared_limiter is None:
+            return False
+        try:
+            getattr(shared_limiter, report)()
+            return True
+        except sqlite3.Error as e:
+            self.logger.warning(f"Shared rate limit {report} failed: {e}")
+            return False
+    
     def get_daily_bars(
         self,
         symbol: str,
@@ -390,7 +433,44 @@ class PolygonClient:
             self.logger.debug(f"{symbol}: Snapshot endpoint returned {response}")
             return None
 
-        ticker = response.get('ticker', {})
+        return self._parse_snapshot_ticker(symbol, response.get('ticker', {}))
+
+    def get_snapshots(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get snapshots for many tickers in a single request.
+
+        Uses ``/v2/snapshot/locale/us/markets/stocks/tickers?tickers=A,B,...``.
+        Callers are responsible for keeping the list to a sensible size
+        (see ``SNAPSHOT_BATCH_SIZE``); the URL grows with every ticker.
+
+        Returns:
+            Dict mapping symbol to the same dict ``get_snapshot()`` returns.
+            Symbols Polygon did not return (unknown, no trades) are omitted.
+        """
+        symbols = [s.upper() for s in symbols]
+        if not symbols:
+            return {}
+
+        endpoint = "/v2/snapshot/locale/us/markets/stocks/tickers"
+        response = self._make_request(endpoint, {'tickers': ','.join(symbols)})
+
+        if not response or response.get('status') != 'OK':
+            self.logger.debug(f"Batch snapshot ({len(symbols)} tickers) returned {response}")
+            return {}
+
+        results = {}
+        for ticker in response.get('tickers') or []:
+            symbol = (ticker.get('ticker') or '').upper()
+            if not symbol:
+                continue
+            snap = self._parse_snapshot_ticker(symbol, ticker)
+            if snap:
+                results[symbol] = snap
+        return results
+
+    @staticmethod
+    def _parse_snapshot_ticker(symbol: str, ticker: Dict) -> Optional[Dict[str, Any]]:
+        """Flatten one snapshot ``ticker`` object into the get_snapshot() dict."""
         day = ticker.get('day', {})
         prev = ticker.get('prevDay', {})
         last_trade = ticker.get('lastTrade', {})
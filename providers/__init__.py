@@ -29,8 +29,10 @@ from canslim_monitor.providers.base import (
     FuturesProvider,
 )
 from canslim_monitor.providers.throttle import RateLimiter
+from canslim_monitor.providers.quote_book import QuoteBook
 from canslim_monitor.providers.registry import ProviderRegistry
 from canslim_monitor.providers.factory import ProviderFactory
+from canslim_monitor.providers.pool import ProviderPool, get_provider_pool, close_provider_pool
 
 # Import concrete providers so they auto-register with the registry
 import canslim_monitor.providers.massive  # noqa: F401 — registers MassiveHistoricalProvider
@@ -55,6 +57,10 @@ __all__ = [
     'FuturesProvider',
     # Infrastructure
     'RateLimiter',
+    'QuoteBook',
     'ProviderRegistry',
     'ProviderFactory',
+    'ProviderPool',
+    'get_provider_pool',
+    'close_provider_pool',
 ]
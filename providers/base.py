@@ -61,6 +61,16 @@ class BaseProvider(ABC):
     def health(self) -> ProviderHealth:
         return self._health
 
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self._limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, limiter: Optional[RateLimiter]):
+        """Replace the limiter, e.g. with one shared by every provider on
+        the same API credential (see ProviderPool)."""
+        self._limiter = limiter
+
     # ------------------------------------------------------------------
     # Lifecycle (override in subclasses)
     # ------------------------------------------------------------------
@@ -22,7 +22,7 @@ Usage:
 
 import json
 import logging
-from typing import Optional, Callable
+from typing import Callable, Dict, Optional
 
 from sqlalchemy.orm import Session
 
@@ -33,8 +33,10 @@ from canslim_monitor.providers.base import (
     FuturesProvider,
 )
 from canslim_monitor.providers.registry import ProviderRegistry
+from canslim_monitor.providers.throttle import RateLimiter
 from canslim_monitor.data.models import ProviderConfig, ProviderCredential
 from canslim_monitor.data.repositories.provider_repo import ProviderRepository
+from canslim_monitor.utils.shared_rate_limit import configure_shared_rate_limit
 
 logger = logging.getLogger(__name__)
 
@@ -42,13 +44,22 @@ logger = logging.getLogger(__name__)
 class ProviderFactory:
     """Creates provider instances from database configuration."""
 
-    def __init__(self, db_session_factory: Callable[[], Session]):
+    def __init__(
+        self,
+        db_session_factory: Callable[[], Session],
+        rate_limiters: Optional[Dict[tuple, RateLimiter]] = None,
+    ):
         """
         Args:
             db_session_factory: Callable that returns a new SQLAlchemy Session.
                                 Typically ``db_manager.get_new_session``.
+            rate_limiters: Shared ``{(implementation, credential): RateLimiter}``
+                           map.  When given, providers on the same API key
+                           share one limiter (one budget) instead of each
+                           getting its own.
         """
         self._session_factory = db_session_factory
+        self._rate_limiters = rate_limiters
 
         # Cache live provider instances so repeated calls return the same
         # connected object (important for shared IBKR connections).
@@ -189,6 +200,20 @@ class ProviderFactory:
             )
             return None
 
+        # One rate-limit budget per credential, however many domains use it
+        if self._rate_limiters is not None and getattr(instance, "rate_limiter", None) is not None:
+            key = (impl_name, credentials.get("api_key") or cfg.name)
+            instance.rate_limiter = self._rate_limiters.setdefault(key, instance.rate_limiter)
+
+        # Same credential in other processes (GUI + service): shared budget
+        if throttle is not None and credentials.get("api_key"):
+            configure_shared_rate_limit(
+                credentials["api_key"],
+                throttle.calls_per_minute,
+                throttle.burst_size,
+                throttle.min_delay_seconds,
+            )
+
         # Connect
         try:
             if instance.connect():
@@ -332,6 +357,10 @@ class ProviderFactory:
     # Cleanup
     # ------------------------------------------------------------------
 
+    def evict(self, domain: str):
+        """Forget the cached instance for *domain* (without disconnecting)."""
+        self._instances.pop(domain, None)
+
     def disconnect_all(self):
         """Disconnect and clear all cached provider instances.
 
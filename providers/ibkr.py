@@ -152,6 +152,42 @@ class IBKRRealtimeProvider(RealtimeProvider):
             self._logger.debug("get_quotes failed: %s", exc)
             return {}
 
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def supports_streaming(self) -> bool:
+        return True
+
+    def subscribe(self, symbols: List[str], callback: Callable[[Quote], None]) -> bool:
+        """Open persistent IBKR market data streams for *symbols*.
+
+        *callback* runs on the IB event loop thread for every tick batch;
+        a ``QuoteBook.update`` is the intended target.
+        """
+        if not self.is_connected():
+            return False
+
+        def on_update(raw: dict):
+            callback(self._dict_to_quote(raw))
+
+        try:
+            self._client.subscribe(symbols, on_update)
+            return True
+        except Exception as exc:
+            self._logger.debug("subscribe failed: %s", exc)
+            return False
+
+    def unsubscribe(self, symbols: List[str]):
+        if self._client is not None:
+            self._client.unsubscribe(symbols)
+
+    def get_subscriptions(self) -> List[str]:
+        """Symbols currently streaming."""
+        if self._client is None:
+            return []
+        return self._client.get_subscriptions()
+
     # ------------------------------------------------------------------
     # Conversion
     # ------------------------------------------------------------------
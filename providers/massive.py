@@ -8,7 +8,8 @@ Historical provider:
   - Canonical ``Bar`` return type, ThrottleProfile, ProviderHealth bookkeeping
 
 Realtime provider (Phase 7):
-  - Wraps ``PolygonClient.get_snapshot()`` behind the ``RealtimeProvider`` ABC
+  - Wraps ``PolygonClient.get_snapshot()`` / ``get_snapshots()`` behind the
+    ``RealtimeProvider`` ABC
   - Returns 15-minute-delayed quotes on the Stocks Starter tier
   - Serves as a fallback when IBKR is unavailable (e.g. GUI without IB Gateway)
   - 60-second response cache to respect the 5 calls/min rate limit
@@ -219,7 +220,9 @@ class MassiveRealtimeProvider(RealtimeProvider):
 
     Rate-limit friendly:
     - Caches each symbol's snapshot for ``cache_seconds`` (default 60s).
-    - Batch ``get_quotes()`` calls ``get_snapshot()`` once per symbol.
+    - Batch ``get_quotes()`` serves fresh symbols from cache and fetches
+      the rest with one multi-ticker snapshot per ``batch_size`` symbols,
+      so a board refresh costs ceil(N / batch_size) calls instead of N.
     - Stays well within the 5 calls/min Starter-tier budget.
     """
 
@@ -233,6 +236,7 @@ class MassiveRealtimeProvider(RealtimeProvider):
         timeout: int = 30,
         rate_limit_delay: float = 0.5,
         cache_seconds: int = None,
+        batch_size: int = None,
         throttle_profile: ThrottleProfile = None,
         logger: logging.Logger = None,
     ):
@@ -246,6 +250,7 @@ class MassiveRealtimeProvider(RealtimeProvider):
         self._timeout = timeout
         self._rate_limit_delay = rate_limit_delay
         self._cache_seconds = cache_seconds if cache_seconds is not None else self.DEFAULT_CACHE_SECONDS
+        self._batch_size = max(1, batch_size or PolygonClient.SNAPSHOT_BATCH_SIZE)
 
         self._client: Optional[PolygonClient] = None
 
@@ -305,21 +310,9 @@ class MassiveRealtimeProvider(RealtimeProvider):
 
         try:
             snap = self._timed_call(self._client.get_snapshot, symbol)
-            if not snap or snap.get('last', 0) <= 0:
+            quote = self._snap_to_quote(snap)
+            if quote is None:
                 return None
-
-            quote = Quote(
-                symbol=snap['symbol'],
-                last=snap['last'],
-                open=snap.get('open'),
-                high=snap.get('high'),
-                low=snap.get('low'),
-                volume=int(snap.get('volume', 0)) or None,
-                avg_volume=int(snap.get('avg_volume', 0)) or None,
-                close=snap.get('prev_close'),
-                timestamp=datetime.fromtimestamp(snap['timestamp'] / 1000)
-                    if snap.get('timestamp') else None,
-            )
             self._put_cached(symbol, quote)
             return quote
         except Exception as exc:
@@ -327,14 +320,67 @@ class MassiveRealtimeProvider(RealtimeProvider):
             return None
 
     def get_quotes(self, symbols: List[str]) -> Dict[str, Quote]:
-        """Fetch delayed quotes for multiple symbols (one API call each)."""
+        """Fetch delayed quotes for multiple symbols.
+
+        Fresh cache entries are returned as-is; the remaining symbols are
+        fetched with one multi-ticker snapshot per ``batch_size`` chunk.
+        """
+        if not self._client:
+            return {}
+
         results: Dict[str, Quote] = {}
+        missing: List[str] = []
         for sym in symbols:
-            q = self.get_quote(sym)
-            if q is not None:
-                results[sym] = q
+            cached = self._get_cached(sym)
+            if cached is not None:
+                results[sym] = cached
+            else:
+                missing.append(sym)
+
+        # De-duplicate case-insensitively, preserving order
+        to_fetch = list(dict.fromkeys(sym.upper() for sym in missing))
+        fetched: Dict[str, Quote] = {}
+        for i in range(0, len(to_fetch), self._batch_size):
+            chunk = to_fetch[i:i + self._batch_size]
+            try:
+                snaps = self._timed_call(self._client.get_snapshots, chunk)
+            except Exception as exc:
+                self._logger.debug("get_snapshots(%d symbols) failed: %s", len(chunk), exc)
+                continue
+
+            for sym in chunk:
+                quote = self._snap_to_quote(snaps.get(sym))
+                if quote is not None:
+                    self._put_cached(sym, quote)
+                    fetched[sym] = quote
+
+        for sym in missing:
+            quote = fetched.get(sym.upper())
+            if quote is not None:
+                results[sym] = quote
         return results
 
+    @staticmethod
+    def _snap_to_quote(snap: Optional[Dict]) -> Optional[Quote]:
+        """Convert a PolygonClient snapshot dict to a canonical Quote."""
+        if not snap or snap.get('last', 0) <= 0:
+            return None
+        ts = snap.get('timestamp')
+        if ts:
+            # lastTrade.t is SIP nanoseconds on the v2 snapshot; older payloads used ms
+            ts = ts / 1e9 if ts > 1e14 else ts / 1000
+        return Quote(
+            symbol=snap['symbol'],
+            last=snap['last'],
+            open=snap.get('open'),
+            high=snap.get('high'),
+            low=snap.get('low'),
+            volume=int(snap.get('volume', 0)) or None,
+            avg_volume=int(snap.get('avg_volume', 0)) or None,
+            close=snap.get('prev_close'),
+            timestamp=datetime.fromtimestamp(ts) if ts else None,
+        )
+
     # ------------------------------------------------------------------
     # Cache helpers
     # ------------------------------------------------------------------
@@ -0,0 +1,214 @@
+"""
+CANSLIM Monitor - Provider Pool
+================================
+Process-wide cache of connected provider instances.
+
+Creating a ``ProviderFactory`` per chart load re-reads provider_config
+and credentials from SQLite, builds a new ``PolygonClient`` and spends a
+``test_connection()`` API call (against a 5/min budget) before fetching
+any bars.  The pool does that once per process and hands the same
+instance to every thread:
+
+  - Instances are created on first acquire and kept until invalidated
+  - Providers on the same API credential share one ``RateLimiter``
+  - Health is re-checked at most every ``health_check_interval`` seconds;
+    a provider that went DOWN is reconnected in place, so references
+    held by callers stay valid
+
+Usage:
+    from canslim_monitor.providers.pool import get_provider_pool
+
+    provider = get_provider_pool(db_session_factory).get_historical()
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from canslim_monitor.providers.factory import ProviderFactory
+from canslim_monitor.providers.throttle import RateLimiter
+from canslim_monitor.providers.types import ProviderStatus
+
+logger = logging.getLogger(__name__)
+
+
+class _PoolEntry:
+    """Cached provider for one domain."""
+
+    def __init__(self, instance, checked_at: float):
+        self.instance = instance
+        self.healthy = instance is not None
+        self.checked_at = checked_at
+        self.acquires = 0
+        self.reconnects = 0
+
+
+class ProviderPool:
+    """Thread-safe, process-wide provider instances keyed by domain."""
+
+    DEFAULT_HEALTH_CHECK_INTERVAL = 60.0  # seconds
+
+    def __init__(
+        self,
+        db_session_factory: Callable[[], Session],
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+    ):
+        """
+        Args:
+            db_session_factory: Callable that returns a new SQLAlchemy Session.
+            health_check_interval: Minimum seconds between health checks
+                                   (and reconnect / re-create attempts) per
+                                   domain.
+        """
+        self.health_check_interval = health_check_interval
+        self._rate_limiters: Dict[tuple, RateLimiter] = {}
+        self._factory = ProviderFactory(db_session_factory, rate_limiters=self._rate_limiters)
+        self._entries: Dict[str, _PoolEntry] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def factory(self) -> ProviderFactory:
+        """Underlying factory (for ``seed_from_yaml``)."""
+        return self._factory
+
+    # ------------------------------------------------------------------
+    # Acquire
+    # ------------------------------------------------------------------
+
+    def acquire(self, domain: str):
+        """Return the shared provider for *domain* ('historical', 'realtime',
+        'futures'), or None if none is configured / reachable.
+
+        Cheap on the hot path: no DB read and no API call unless the
+        health-check interval has elapsed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(domain)
+
+            if entry is None:
+                entry = self._entries[domain] = _PoolEntry(self._create(domain), now)
+            elif now - entry.checked_at >= self.health_check_interval:
+                entry.checked_at = now
+                self._check(domain, entry)
+
+            entry.acquires += 1
+            return entry.instance if entry.healthy else None
+
+    def get_historical(self):
+        return self.acquire("historical")
+
+    def get_realtime(self):
+        return self.acquire("realtime")
+
+    def get_futures(self):
+        return self.acquire("futures")
+
+    def _create(self, domain: str):
+        getter = getattr(self._factory, f"get_{domain}", None)
+        if getter is None:
+            raise ValueError(f"Unknown provider domain: {domain}")
+        return getter()
+
+    def _check(self, domain: str, entry: _PoolEntry):
+        """Health check: reconnect a DOWN provider in place, or retry creation."""
+        instance = entry.instance
+        if instance is None:
+            entry.instance = self._create(domain)
+            entry.healthy = entry.instance is not None
+            return
+
+        if instance.is_connected() and instance.health.status != ProviderStatus.DOWN:
+            entry.healthy = True
+            return
+
+        logger.info("Provider '%s' unhealthy (%s) — reconnecting", instance.name,
+                    instance.health.status.value)
+        entry.reconnects += 1
+        try:
+            entry.healthy = bool(instance.connect())
+        except Exception as exc:
+            logger.warning("Provider '%s' reconnect raised: %s", instance.name, exc)
+            entry.healthy = False
+
+    # ------------------------------------------------------------------
+    # Invalidation / cleanup
+    # ------------------------------------------------------------------
+
+    def invalidate(self, domain: Optional[str] = None):
+        """Drop cached providers (all domains by default) so the next
+        acquire re-reads provider_config, e.g. after settings changed.
+
+        Dropped instances are disconnected; shared rate limiters are
+        kept so the API budget survives the rebuild.
+        """
+        with self._lock:
+            domains = [domain] if domain else list(self._entries)
+            for name in domains:
+                entry = self._entries.pop(name, None)
+                self._factory.evict(name)
+                if entry is not None and entry.instance is not None and not self._in_use(entry.instance):
+                    try:
+                        entry.instance.disconnect()
+                    except Exception as exc:
+                        logger.warning("Error disconnecting %s: %s", name, exc)
+
+    def _in_use(self, instance) -> bool:
+        """True if another domain still holds *instance* (shared clients)."""
+        return any(e.instance is instance for e in self._entries.values())
+
+    def close(self):
+        """Disconnect every provider (service shutdown)."""
+        with self._lock:
+            self._entries.clear()
+            self._factory.disconnect_all()
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Per-domain pool bookkeeping for status displays."""
+        with self._lock:
+            return {
+                domain: {
+                    "provider": entry.instance.name if entry.instance is not None else None,
+                    "healthy": entry.healthy,
+                    "status": (entry.instance.health.status.value
+                               if entry.instance is not None else None),
+                    "acquires": entry.acquires,
+                    "reconnects": entry.reconnects,
+                }
+                for domain, entry in self._entries.items()
+            }
+
+
+# Singleton instance
+_pool: Optional[ProviderPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_provider_pool(db_session_factory: Callable[[], Session] = None) -> Optional[ProviderPool]:
+    """
+    Get the process-wide provider pool.
+
+    Args:
+        db_session_factory: Session factory (required on first call only)
+
+    Returns:
+        ProviderPool instance, or None if never created and no session
+        factory was given
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None and db_session_factory is not None:
+            _pool = ProviderPool(db_session_factory)
+        return _pool
+
+
+def close_provider_pool():
+    """Disconnect all pooled providers and forget the pool."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,139 @@
+"""
+CANSLIM Monitor - Shared Quote Book
+====================================
+Thread-safe, in-process store of the latest ``Quote`` per symbol.
+
+A streaming ``RealtimeProvider`` pushes quotes into the book as ticks
+arrive; every consumer (PositionThread, BreakoutThread, EOD summary, ...)
+reads from it with no network cost.  Each update is stamped with a
+monotonically increasing sequence number so readers can ask for "what
+changed since seq N" instead of re-reading the whole book.
+
+Usage:
+    book = QuoteBook()
+    provider.subscribe(symbols, book.update)
+
+    quote = book.get('AAPL', max_age=60)       # None if missing / stale
+    quotes = book.get_many(symbols, max_age=60)
+    seq, changed = book.changes_since(last_seq)
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from canslim_monitor.providers.types import Quote
+
+
+class QuoteBook:
+    """Latest quote per symbol with a global update sequence."""
+
+    def __init__(self):
+        # {symbol: (quote, seq, monotonic_ts)}
+        self._quotes: Dict[str, Tuple[Quote, int, float]] = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Quote, int], None]] = []
+
+    # ------------------------------------------------------------------
+    # Writers
+    # ------------------------------------------------------------------
+
+    def update(self, quote: Quote) -> int:
+        """Store *quote* and return its sequence number."""
+        if quote is None or not quote.symbol:
+            return self._seq
+        symbol = quote.symbol.upper()
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            self._quotes[symbol] = (quote, seq, time.monotonic())
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(quote, seq)
+            except Exception:
+                pass
+        return seq
+
+    def remove(self, symbols: Iterable[str]):
+        """Drop symbols that are no longer subscribed."""
+        with self._lock:
+            for symbol in symbols:
+                self._quotes.pop(symbol.upper(), None)
+
+    def clear(self):
+        with self._lock:
+            self._quotes.clear()
+
+    # ------------------------------------------------------------------
+    # Readers
+    # ------------------------------------------------------------------
+
+    def get(self, symbol: str, max_age: Optional[float] = None) -> Optional[Quote]:
+        """Latest quote for *symbol*, or None if missing or older than *max_age* s."""
+        with self._lock:
+            entry = self._quotes.get(symbol.upper())
+        if entry is None:
+            return None
+        quote, _, ts = entry
+        if max_age is not None and time.monotonic() - ts > max_age:
+            return None
+        return quote
+
+    def get_many(
+        self,
+        symbols: Iterable[str],
+        max_age: Optional[float] = None,
+    ) -> Dict[str, Quote]:
+        """Fresh quotes for *symbols*, keyed by the symbol as passed in."""
+        now = time.monotonic()
+        result = {}
+        with self._lock:
+            for symbol in symbols:
+                entry = self._quotes.get(symbol.upper())
+                if entry is None:
+                    continue
+                quote, _, ts = entry
+                if max_age is None or now - ts <= max_age:
+                    result[symbol] = quote
+        return result
+
+    def changes_since(self, seq: int) -> Tuple[int, Dict[str, Quote]]:
+        """Return (current_seq, {symbol: quote}) for updates after *seq*."""
+        with self._lock:
+            changed = {
+                symbol: quote
+                for symbol, (quote, s, _) in self._quotes.items()
+                if s > seq
+            }
+            return self._seq, changed
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the most recent update (0 = empty)."""
+        return self._seq
+
+    def symbols(self) -> List[str]:
+        with self._lock:
+            return list(self._quotes)
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol.upper() in self._quotes
+
+    # ------------------------------------------------------------------
+    # Listeners
+    # ------------------------------------------------------------------
+
+    def add_listener(self, callback: Callable[[Quote, int], None]):
+        """Call *callback(quote, seq)* on every update (from the writer's thread)."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[Quote, int], None]):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
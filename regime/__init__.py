@@ -39,6 +39,7 @@ from .models_regime import (
 
 from .distribution_tracker import (
     DistributionDayTracker,
+    DistributionDayEngine,
     DistributionType,
     DistributionDayResult,
     CombinedDistributionData
@@ -117,6 +118,7 @@ __all__ = [
     
     # Trackers/Calculators
     'DistributionDayTracker',
+    'DistributionDayEngine',
     'FollowThroughDayTracker',
     'MarketRegimeCalculator',
     'MassiveHistoricalClient',
@@ -16,6 +16,8 @@ import requests
 from datetime import datetime, date, timedelta
 from typing import Optional, List
 
+from canslim_monitor.utils.http_pool import get_http_pool
+
 from .market_regime import (
     RegimeScore, 
     calculate_entry_risk_score, 
@@ -839,7 +841,7 @@ FTD Success: {success_count} | Failed: {failed_count} | Rate: {success_rate:.0f}
             return False
         
         try:
-            response = requests.post(
+            response = get_http_pool().post(
                 self.webhook_url,
                 json={"content": message},
                 timeout=10
@@ -66,7 +66,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, or_
 
 from .models_regime import (
     DistributionDay, DistributionDayCount, 
@@ -163,6 +163,161 @@ class CombinedDistributionData:
         return self.spy_new_d_days + self.qqq_new_d_days
 
 
+class DistributionDayEngine:
+    """
+    In-memory distribution-day state for one symbol during one update.
+
+    load() reads everything an update can touch in two queries: the
+    symbol's active D-days plus any D-day recorded inside the scan window
+    (active or expired, for the "already recorded" check), and today's
+    override. detect() and expire() then apply the tracker's rules to those
+    objects, and flush() writes new rows and expirations back in a single
+    flush.
+
+    Detection thresholds and the trading-day count come from the owning
+    DistributionDayTracker, so results match its query-per-bar behavior.
+    """
+
+    def __init__(self, tracker: 'DistributionDayTracker', symbol: str):
+        self.tracker = tracker
+        self.symbol = symbol
+        self.days: Dict[date, DistributionDay] = {}
+        self.added: List[DistributionDay] = []
+        self.override: Optional[DistributionDayOverride] = None
+
+    def load(self, session: Session, window_start: date):
+        """Load active D-days, D-days dated on/after window_start, and today's override."""
+        rows = session.query(DistributionDay).filter(
+            DistributionDay.symbol == self.symbol,
+            or_(
+                DistributionDay.expired == False,
+                DistributionDay.date >= window_start,
+            )
+        ).all()
+        self.days = {row.date: row for row in rows}
+        self.override = self.tracker._get_active_override(self.symbol)
+
+    def detect(self, daily_bars: List[DailyBar], scan_range: int) -> Tuple[int, int]:
+        """
+        Record new D-days among the last scan_range bars.
+
+        Returns:
+            (new_distribution_days, new_stalling_days)
+        """
+        new_d_days = 0
+        new_stalling_days = 0
+
+        for i in range(scan_range):
+            today = daily_bars[-(i + 1)]  # Work backwards from most recent
+            yesterday = daily_bars[-(i + 2)]
+
+            is_d_day, pct_change, d_type = self.tracker.is_distribution_day(
+                today.close, today.volume,
+                yesterday.close, yesterday.volume,
+                bar_date=today.date
+            )
+            if not is_d_day or today.date in self.days:
+                continue
+
+            d_day = DistributionDay(
+                symbol=self.symbol,
+                date=today.date,
+                close_price=today.close,
+                volume=today.volume,
+                pct_change=pct_change,
+                expired=False,
+            )
+            self.days[today.date] = d_day
+            self.added.append(d_day)
+
+            if d_type == DistributionType.STALLING:
+                new_stalling_days += 1
+                logger.info(f"New STALLING day: {self.symbol} {today.date} ({pct_change:+.2f}%)")
+            else:
+                new_d_days += 1
+                logger.info(f"New distribution day: {self.symbol} {today.date} ({pct_change:+.2f}%)")
+
+        return new_d_days, new_stalling_days
+
+    def active(self, as_of_date: date) -> List[DistributionDay]:
+        """Non-expired D-days dated on or before as_of_date, oldest first."""
+        return sorted(
+            (d for d in self.days.values() if not d.expired and d.date <= as_of_date),
+            key=lambda d: d.date
+        )
+
+    def expire(
+        self,
+        current_close: float,
+        current_date: date,
+        daily_bars: List[DailyBar]
+    ) -> Tuple[int, List[Dict]]:
+        """
+        Mark D-days expired by time (lookback trading days) or rally.
+
+        Returns:
+            Tuple of (expired_count, expiration_details)
+        """
+        tracker = self.tracker
+        expiration_details = []
+
+        # Build date->bar lookup for accurate trading day counting
+        bar_dates = {bar.date: bar for bar in daily_bars}
+
+        for d_day in self.active(current_date):
+            trading_days_elapsed = tracker._count_trading_days(
+                d_day.date, current_date, bar_dates
+            )
+
+            if trading_days_elapsed >= tracker.lookback_days:
+                d_day.expired = True
+                d_day.expiry_reason = 'TIME'
+                d_day.expiry_date = current_date
+                expiration_details.append({
+                    'symbol': self.symbol,
+                    'date': d_day.date,
+                    'reason': 'TIME',
+                    'days_elapsed': trading_days_elapsed,
+                    'close_price': d_day.close_price
+                })
+                logger.info(f"D-day expired (time): {self.symbol} {d_day.date}")
+                continue
+
+            rally_pct = (current_close - d_day.close_price) / d_day.close_price * 100
+            if rally_pct >= tracker.rally_expiration_pct:
+                d_day.expired = True
+                d_day.expiry_reason = 'RALLY'
+                d_day.expiry_date = current_date
+                expiration_details.append({
+                    'symbol': self.symbol,
+                    'date': d_day.date,
+                    'reason': 'RALLY',
+                    'rally_pct': rally_pct,
+                    'close_price': d_day.close_price
+                })
+                logger.info(f"D-day expired (rally {rally_pct:.1f}%): {self.symbol} {d_day.date}")
+
+        return len(expiration_details), expiration_details
+
+    def counts(self, as_of_date: date) -> Tuple[int, List[date], int]:
+        """
+        Active D-day dates (newest first) and counts as of a date.
+
+        Returns:
+            Tuple of (display_count, active_dates, raw_count), display_count
+            having today's override applied.
+        """
+        active_dates = [d.date for d in reversed(self.active(as_of_date))]
+        raw_count = len(active_dates)
+        return self.tracker._apply_override(self.override, self.symbol, raw_count), active_dates, raw_count
+
+    def flush(self, session: Session):
+        """Write new D-days and expirations in one flush."""
+        session.add_all(self.added)
+        session.flush()
+        self.added = []
+
+
 class DistributionDayTracker:
     """
     Tracks distribution days using IBD methodology.
@@ -381,6 +536,22 @@ class DistributionDayTracker:
         Returns:
             DistributionDayResult with counts and details
         """
+        result = self._update_distribution_days(symbol, daily_bars, current_date)
+        self.db.commit()
+        return result
+
+    def _update_distribution_days(
+        self,
+        symbol: str,
+        daily_bars: List[DailyBar],
+        current_date: date = None
+    ) -> DistributionDayResult:
+        """
+        update_distribution_days() without the commit.
+
+        Runs a DistributionDayEngine for the symbol: one load, detection and
+        expiration in memory, one flush.
+        """
         if len(daily_bars) < 2:
             logger.warning(f"Insufficient data for {symbol}: {len(daily_bars)} bars")
             return DistributionDayResult(
@@ -397,68 +568,31 @@ class DistributionDayTracker:
         current_close = daily_bars[-1].close
         current_dt = current_date or daily_bars[-1].date
         
-        new_d_days = 0
-        new_stalling_days = 0
-        
         # Scan the lookback window for new distribution days
         scan_range = min(self.lookback_days, len(daily_bars) - 1)
-        
-        for i in range(scan_range):
-            today = daily_bars[-(i + 1)]  # Work backwards from most recent
-            yesterday = daily_bars[-(i + 2)]
-            
-            bar_date = today.date
-            
-            # Check if this day qualifies as distribution day
-            is_d_day, pct_change, d_type = self.is_distribution_day(
-                today.close, today.volume,
-                yesterday.close, yesterday.volume,
-                bar_date=bar_date
-            )
-            
-            if is_d_day:
-                # Check if already recorded
-                existing = self.db.query(DistributionDay).filter(
-                    DistributionDay.symbol == symbol,
-                    DistributionDay.date == bar_date
-                ).first()
-                
-                if not existing:
-                    # Record new distribution day
-                    d_day = DistributionDay(
-                        symbol=symbol,
-                        date=bar_date,
-                        close_price=today.close,
-                        volume=today.volume,
-                        pct_change=pct_change,
-                    )
-                    self.db.add(d_day)
-                    
-                    if d_type == DistributionType.STALLING:
-                        new_stalling_days += 1
-                        logger.info(f"New STALLING day: {symbol} {bar_date} ({pct_change:+.2f}%)")
-                    else:
-                        new_d_days += 1
-                        logger.info(f"New distribution day: {symbol} {bar_date} ({pct_change:+.2f}%)")
-        
+
+        engine = DistributionDayEngine(self, symbol)
+        engine.load(self.db, window_start=min(b.date for b in daily_bars[-scan_range:]))
+
+        new_d_days, new_stalling_days = engine.detect(daily_bars, scan_range)
+
         # Expire old distribution days
-        expired_count, expiration_details = self._expire_distribution_days(
-            symbol, current_close, current_dt, daily_bars
+        expired_count, expiration_details = engine.expire(
+            current_close, current_dt, daily_bars
         )
 
-        self.db.commit()
+        engine.flush(self.db)
 
-        # Get current active count and dates
         # Pass current_date for historical seeding to filter out future D-days
-        active_count, active_dates, raw_count = self._get_active_distribution_days(
-            symbol, as_of_date=current_dt
-        )
+        active_count, active_dates, raw_count = engine.counts(current_dt)
 
         if active_count != raw_count:
             logger.info(f"{symbol}: Display count={active_count}, Raw detected={raw_count} (override active)")
 
         # Get count from 5 days ago for trend
-        count_5_ago = self._get_count_n_days_ago(symbol, self.trend_days, current_dt)
+        count_5_ago = self._get_count_n_days_ago(
+            symbol, self.trend_days, current_dt, active_dates=active_dates
+        )
         delta = active_count - count_5_ago
 
         return DistributionDayResult(
@@ -474,78 +608,6 @@ class DistributionDayTracker:
             expiration_details=expiration_details
         )
     
-    def _expire_distribution_days(
-        self,
-        symbol: str,
-        current_close: float,
-        current_date: date,
-        daily_bars: List[DailyBar]
-    ) -> Tuple[int, List[Dict]]:
-        """
-        Mark distribution days as expired based on time or rally.
-
-        Returns:
-            Tuple of (expired_count, expiration_details)
-            - expired_count: Number of D-days expired
-            - expiration_details: List of dicts with expiration info
-        """
-        expired_count = 0
-        expiration_details = []
-
-        query = self.db.query(DistributionDay).filter(
-            DistributionDay.symbol == symbol,
-            DistributionDay.expired == False
-        )
-
-        # For historical seeding, only process D-days up to current simulation date
-        if current_date:
-            query = query.filter(DistributionDay.date <= current_date)
-
-        active_days = query.all()
-
-        # Build date->bar lookup for accurate trading day counting
-        bar_dates = {bar.date: bar for bar in daily_bars}
-
-        for d_day in active_days:
-            # Count trading days elapsed
-            trading_days_elapsed = self._count_trading_days(
-                d_day.date, current_date, bar_dates
-            )
-
-            # Time expiration: 25 trading days
-            if trading_days_elapsed >= self.lookback_days:
-                d_day.expired = True
-                d_day.expiry_reason = 'TIME'
-                d_day.expiry_date = current_date
-                expired_count += 1
-                expiration_details.append({
-                    'symbol': symbol,
-                    'date': d_day.date,
-                    'reason': 'TIME',
-                    'days_elapsed': trading_days_elapsed,
-                    'close_price': d_day.close_price
-                })
-                logger.info(f"D-day expired (time): {symbol} {d_day.date}")
-                continue
-
-            # Rally expiration: 5% rally from D-day close
-            rally_pct = (current_close - d_day.close_price) / d_day.close_price * 100
-            if rally_pct >= self.rally_expiration_pct:
-                d_day.expired = True
-                d_day.expiry_reason = 'RALLY'
-                d_day.expiry_date = current_date
-                expired_count += 1
-                expiration_details.append({
-                    'symbol': symbol,
-                    'date': d_day.date,
-                    'reason': 'RALLY',
-                    'rally_pct': rally_pct,
-                    'close_price': d_day.close_price
-                })
-                logger.info(f"D-day expired (rally {rally_pct:.1f}%): {symbol} {d_day.date}")
-
-        return expired_count, expiration_details
-    
     def _count_trading_days(
         self,
         start_date: date,
@@ -600,15 +662,7 @@ class DistributionDayTracker:
         
         # Apply any manual overrides to display count only
         override = self._get_active_override(symbol)
-        display_count = raw_count
-        
-        if override:
-            if override.action == 'SET':
-                display_count = override.adjustment
-                logger.info(f"Applied override SET {symbol} count to {display_count} (raw: {raw_count})")
-            else:  # ADJUST
-                display_count = max(0, raw_count + override.adjustment)
-                logger.info(f"Applied override ADJUST {symbol} by {override.adjustment} (raw: {raw_count})")
+        display_count = self._apply_override(override, symbol, raw_count)
         
         return display_count, active_dates, raw_count
     
@@ -619,11 +673,36 @@ class DistributionDayTracker:
             DistributionDayOverride.symbol == symbol,
             DistributionDayOverride.date == today
         ).order_by(DistributionDayOverride.created_at.desc()).first()
+
+    def _apply_override(
+        self,
+        override: Optional[DistributionDayOverride],
+        symbol: str,
+        raw_count: int
+    ) -> int:
+        """Display count for raw_count after an override (SET or ADJUST)."""
+        if not override:
+            return raw_count
+        if override.action == 'SET':
+            logger.info(f"Applied override SET {symbol} count to {override.adjustment} (raw: {raw_count})")
+            return override.adjustment
+        # ADJUST
+        logger.info(f"Applied override ADJUST {symbol} by {override.adjustment} (raw: {raw_count})")
+        return max(0, raw_count + override.adjustment)
     
-    def _get_count_n_days_ago(self, symbol: str, days: int, current_date: date = None) -> int:
+    def _get_count_n_days_ago(
+        self,
+        symbol: str,
+        days: int,
+        current_date: date = None,
+        active_dates: List[date] = None
+    ) -> int:
         """
         Get the distribution day count from N trading days ago.
         Used for trend calculation.
+
+        active_dates (raw detected dates as of current_date) is used when no
+        count snapshot exists; it is queried if not supplied.
         """
         reference_date = current_date or date.today()
         target_date = reference_date - timedelta(days=days)
@@ -640,9 +719,10 @@ class DistributionDayTracker:
         
         # No historical record - calculate from active D-day dates
         # Use raw detected dates, not override-affected count
-        _, active_dates, _ = self._get_active_distribution_days(
-            symbol, as_of_date=reference_date
-        )
+        if active_dates is None:
+            _, active_dates, _ = self._get_active_distribution_days(
+                symbol, as_of_date=reference_date
+            )
         
         if not active_dates:
             return 0
@@ -731,8 +811,9 @@ class DistributionDayTracker:
         Note: Uses configured symbols (sp500_symbol, nasdaq_symbol) for storage.
               Default is SPY/QQQ unless use_indices=True (then SPX/COMP).
         """
-        sp500_result = self.update_distribution_days(self.sp500_symbol, sp500_bars, current_date)
-        nasdaq_result = self.update_distribution_days(self.nasdaq_symbol, nasdaq_bars, current_date)
+        # Both symbols and the daily snapshot go out in one commit (save_daily_counts)
+        sp500_result = self._update_distribution_days(self.sp500_symbol, sp500_bars, current_date)
+        nasdaq_result = self._update_distribution_days(self.nasdaq_symbol, nasdaq_bars, current_date)
         
         calc_date = current_date or sp500_bars[-1].date if sp500_bars else date.today()
         
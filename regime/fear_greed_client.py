@@ -19,6 +19,8 @@ from typing import Optional, List, Tuple
 
 import requests
 
+from canslim_monitor.utils.http_pool import get_http_pool
+
 logger = logging.getLogger('canslim.regime')
 
 # CNN dataviz API endpoint
@@ -151,7 +153,7 @@ class FearGreedClient:
 
         for attempt in range(3):
             try:
-                response = requests.get(url, headers=headers, timeout=self._timeout)
+                response = get_http_pool().get(url, headers=headers, timeout=self._timeout)
                 response.raise_for_status()
                 return response
             except requests.exceptions.HTTPError as e:
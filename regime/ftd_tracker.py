@@ -32,7 +32,7 @@ from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Boolean, Enum as SQLEnum, and_, or_
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -776,8 +776,16 @@ class FollowThroughDayTracker:
         start_date = trading_days[0]
         end_date = trading_days[-1]
         
+        # Rallies that ended (FTD and any later failure) before the window
+        # cannot mark any day in it; skipping them keeps this query bounded
+        # instead of growing with the whole rally history.
         query = self.db.query(RallyAttempt).filter(
-            RallyAttempt.start_date <= end_date
+            RallyAttempt.start_date <= end_date,
+            or_(
+                and_(RallyAttempt.ftd_date.is_(None), RallyAttempt.failure_date.is_(None)),
+                RallyAttempt.ftd_date >= start_date,
+                RallyAttempt.failure_date >= start_date,
+            )
         )
         if symbol:
             query = query.filter(RallyAttempt.symbol == symbol)
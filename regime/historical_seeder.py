@@ -21,7 +21,7 @@ import logging
 import argparse
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
@@ -46,6 +46,26 @@ class SeedResult:
         return len(self.errors) == 0
 
 
+class _DeferredCommitSession:
+    """
+    Session proxy that turns ``commit()`` into ``flush()``.
+
+    The regime components commit after every write, which on SQLite means
+    one fsync per D-day / rally / status row. During seeding they are
+    handed this proxy instead, so their writes stay visible to later
+    queries (flushed) while the seeder commits once per chunk.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def commit(self):
+        self._session.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+
 class HistoricalSeeder:
     """
     Seeds historical market regime data into the database.
@@ -57,6 +77,9 @@ class HistoricalSeeder:
     - Regime scores and alerts
     """
 
+    LOOKBACK_BARS = 35          # Bars per day handed to the regime components
+    CHUNK_DAYS = 250            # Trading days per write transaction
+
     def __init__(
         self,
         db_session: Session,
@@ -216,6 +239,9 @@ class HistoricalSeeder:
         """
         Get bars up to and including a specific date.
 
+        Scans the whole list; seed_range() uses _index_through_dates()
+        instead so each day's window is a slice.
+
         Args:
             all_bars: All historical bars
             through_date: Date to include up to
@@ -235,23 +261,71 @@ class HistoricalSeeder:
         # Return only the last `lookback` days
         return result[-lookback:] if len(result) > lookback else result
 
+    def _index_through_dates(self, all_bars: List, days: List[date]) -> List[int]:
+        """
+        For each date in *days* (sorted), the number of bars dated on or
+        before it - i.e. ``all_bars[:end]`` is everything through that day.
+
+        One merge pass over the bars, so a day's window is an O(1) slice.
+        """
+        bar_dates = [
+            b.date.date() if isinstance(b.date, datetime) else b.date
+            for b in all_bars
+        ]
+        ends = []
+        j = 0
+        for d in days:
+            while j < len(bar_dates) and bar_dates[j] <= d:
+                j += 1
+            ends.append(j)
+        return ends
+
     def seed_range(
         self,
         start_date: date,
         end_date: date,
-        verbose: bool = True
+        verbose: bool = True,
+        chunk_size: int = None
     ) -> SeedResult:
         """
         Seed historical regime data for a date range.
 
+        Each day's 35-bar window is a slice of the fetched bars, and all
+        writes (D-days, rallies/FTDs, phase changes, regime alerts, market
+        status) are committed once per ``chunk_size`` trading days. Each
+        day runs in its own savepoint, so a failing day rolls back only its
+        own writes and is not counted.
+
         Args:
             start_date: Start date (inclusive)
             end_date: End date (inclusive)
             verbose: Print progress updates
+            chunk_size: Trading days per transaction (default CHUNK_DAYS)
 
         Returns:
             SeedResult with statistics
         """
+        chunk_size = chunk_size or self.CHUNK_DAYS
+        session = self.db
+        self.db = _DeferredCommitSession(session)
+        # Components capture self.db when built: rebuild them on both sides
+        # so none outlives the proxy (or misses it)
+        self.reset_components()
+        try:
+            return self._seed_range(start_date, end_date, verbose, chunk_size, session)
+        finally:
+            self.db = session
+            self.reset_components()
+
+    def _seed_range(
+        self,
+        start_date: date,
+        end_date: date,
+        verbose: bool,
+        chunk_size: int,
+        session: Session
+    ) -> SeedResult:
+        """seed_range() body; self.db is the deferred-commit proxy here."""
         from .models_regime import (
             MarketRegimeAlert, DistributionDay, DDayTrend,
             PhaseChangeType
@@ -272,8 +346,6 @@ class HistoricalSeeder:
             errors=[]
         )
 
-        # Reset and get fresh components
-        self.reset_components()
         dist_tracker, ftd_tracker, phase_manager, calculator = self._get_components()
 
         # Force phase manager to start from CORRECTION for clean historical seeding
@@ -309,17 +381,31 @@ class HistoricalSeeder:
         if verbose:
             print(f"Processing {len(trading_days)} trading days...")
 
+        # Bars are oldest first; day i's window ends at *_ends[i]
+        spy_ends = self._index_through_dates(spy_bars_all, trading_days)
+        qqq_ends = self._index_through_dates(qqq_bars_all, trading_days)
+        lookback = self.LOOKBACK_BARS
+
         prior_score = None
+        committed = replace(result, errors=[])
 
         for i, current_date in enumerate(trading_days):
+            if i and i % chunk_size == 0:
+                committed = self._commit_chunk(session, result, committed, current_date)
+
+            # Each day is a savepoint: a failed day rolls back only its own writes
+            self._begin_chunk(session)
+            savepoint = session.begin_nested()
+            day = dict(d_days_created=0, ftds_detected=0, phase_changes_recorded=0)
             try:
                 # Get bars up to this date
-                spy_bars = self._get_bars_through_date(spy_bars_all, current_date)
-                qqq_bars = self._get_bars_through_date(qqq_bars_all, current_date)
+                spy_bars = spy_bars_all[max(0, spy_ends[i] - lookback):spy_ends[i]]
+                qqq_bars = qqq_bars_all[max(0, qqq_ends[i] - lookback):qqq_ends[i]]
 
                 if len(spy_bars) < 5 or len(qqq_bars) < 5:
                     if verbose:
                         print(f"  {current_date}: Skipping - insufficient data")
+                    savepoint.commit()
                     continue
 
                 # Calculate distribution days (also creates/updates D-day records)
@@ -328,7 +414,7 @@ class HistoricalSeeder:
                 )
 
                 # Track new D-days created
-                result.d_days_created += combined_dist.total_new_d_days
+                day['d_days_created'] = combined_dist.total_new_d_days
 
                 # Check FTD status
                 ftd_status = ftd_tracker.get_market_phase_status(
@@ -338,7 +424,7 @@ class HistoricalSeeder:
                 )
 
                 if ftd_status.any_ftd_today:
-                    result.ftds_detected += 1
+                    day['ftds_detected'] = 1
 
                 # Check phase transitions
                 phase_transition = phase_manager.update_phase(
@@ -348,7 +434,7 @@ class HistoricalSeeder:
                 )
 
                 if phase_transition and phase_transition.phase_changed:
-                    result.phase_changes_recorded += 1
+                    day['phase_changes_recorded'] = 1
 
                 # Build FTD data
                 trading_day_list = [bar.date for bar in spy_bars]
@@ -402,7 +488,6 @@ class HistoricalSeeder:
 
                 # Save to database
                 self._save_regime_alert(score, current_date)
-                result.regime_alerts_created += 1
 
                 # Save market status snapshot
                 # Use the phase from phase_manager (tracks transitions correctly)
@@ -413,18 +498,30 @@ class HistoricalSeeder:
                     combined_dist
                 )
 
+                savepoint.commit()
+
+                # Count the day only once its writes are in the transaction
+                result.d_days_created += day['d_days_created']
+                result.ftds_detected += day['ftds_detected']
+                result.phase_changes_recorded += day['phase_changes_recorded']
+                result.regime_alerts_created += 1
+                result.days_processed += 1
+
                 # Update prior score for next iteration
                 prior_score = score
-                result.days_processed += 1
 
                 if verbose and (i + 1) % 10 == 0:
                     print(f"  Processed {i + 1}/{len(trading_days)} days...")
 
             except Exception as e:
+                if savepoint.is_active:
+                    savepoint.rollback()
                 error_msg = f"Error processing {current_date}: {e}"
                 result.errors.append(error_msg)
                 logger.error(error_msg, exc_info=True)
 
+        self._commit_chunk(session, result, committed, end_date)
+
         if verbose:
             print(f"\nSeeding complete!")
             print(f"  Days processed: {result.days_processed}")
@@ -437,6 +534,51 @@ class HistoricalSeeder:
 
         return result
 
+    def _begin_chunk(self, session: Session):
+        """
+        Make sure the chunk's outer transaction is open before a savepoint.
+
+        pysqlite only emits BEGIN ahead of DML, so a SAVEPOINT issued first
+        starts no transaction and its RELEASE commits on its own - one
+        commit per day instead of per chunk. Opening the transaction
+        explicitly keeps every day's savepoint inside it.
+        """
+        connection = session.connection()
+        if connection.dialect.name != 'sqlite':
+            return
+        if not connection.connection.dbapi_connection.in_transaction:
+            connection.exec_driver_sql('BEGIN')
+
+    def _commit_chunk(
+        self,
+        session: Session,
+        result: SeedResult,
+        committed: SeedResult,
+        through_date: date
+    ) -> SeedResult:
+        """
+        Commit the writes accumulated since the last chunk.
+
+        Args:
+            result: Running totals (updated in place)
+            committed: Totals as of the last successful commit
+
+        Returns:
+            Totals as of this commit; if it fails, *result* is wound back
+            to *committed* so it does not count rolled-back days
+        """
+        try:
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            for name in ('days_processed', 'd_days_created', 'regime_alerts_created',
+                         'phase_changes_recorded', 'ftds_detected'):
+                setattr(result, name, getattr(committed, name))
+            error_msg = f"Error committing chunk through {through_date}: {e}"
+            result.errors.append(error_msg)
+            logger.error(error_msg, exc_info=True)
+        return replace(result, errors=[])
+
     def _save_regime_alert(self, score, alert_date: date):
         """Save a regime alert to the database."""
         from .models_regime import MarketRegimeAlert
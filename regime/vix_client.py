@@ -14,7 +14,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, date
 from typing import Optional, List, Tuple
 
-import requests
+from canslim_monitor.utils.http_pool import get_http_pool
 
 logger = logging.getLogger('canslim.regime')
 
@@ -142,7 +142,7 @@ class VixClient:
             data = None
             for attempt in range(3):
                 headers = {'User-Agent': random.choice(USER_AGENTS)}
-                resp = requests.get(YAHOO_VIX_URL, params=params, headers=headers, timeout=self._timeout)
+                resp = get_http_pool().get(YAHOO_VIX_URL, params=params, headers=headers, timeout=self._timeout)
                 if resp.status_code == 429:
                     wait = (attempt + 1) * 5
                     logger.debug(f"Yahoo Finance rate limited, waiting {wait}s (attempt {attempt + 1})")
@@ -206,7 +206,7 @@ class VixClient:
                 params = {'interval': '1d', 'range': '2d'}
                 headers = {'User-Agent': random.choice(USER_AGENTS)}
 
-                resp = requests.get(YAHOO_VIX_URL, params=params, headers=headers, timeout=self._timeout)
+                resp = get_http_pool().get(YAHOO_VIX_URL, params=params, headers=headers, timeout=self._timeout)
                 if resp.status_code == 429:
                     wait = (attempt + 1) * 3
                     logger.debug(f"Yahoo Finance VIX rate limited, waiting {wait}s (attempt {attempt + 1})")
@@ -1,14 +1,20 @@
 """
 CANSLIM Monitor - IPC Package
-Named pipe server/client for GUI-Service communication.
+Named pipe (Windows) and Unix socket / TCP (cross-platform) server/client
+for GUI-Service communication.
 """
 
 from .pipe_server import PipeServer, create_pipe_server
-from .pipe_client import PipeClient, ServiceStatusData
+from .pipe_client import PipeClient, ServiceStatusData, create_pipe_client
+from .socket_server import SocketServer
+from .socket_client import SocketClient
 
 __all__ = [
     'PipeServer',
     'PipeClient',
+    'SocketServer',
+    'SocketClient',
     'ServiceStatusData',
-    'create_pipe_server'
+    'create_pipe_server',
+    'create_pipe_client'
 ]
@@ -323,13 +323,23 @@ class MockPipeClient:
 
 def create_pipe_client(
     notification_callback: Callable[[dict], None] = None,
-    logger: logging.Logger = None
+    logger: logging.Logger = None,
+    transport: str = 'auto',
+    address: Any = None
 ) -> Any:
     """
-    Create appropriate pipe client for the platform.
+    Create appropriate IPC client for the platform.
     
-    Returns PipeClient on Windows, MockPipeClient otherwise.
+    transport='auto' returns PipeClient on Windows and SocketClient
+    elsewhere; 'pipe' or 'socket' forces one (must match the service).
     """
+    if transport == 'socket' or (transport == 'auto' and not HAS_WIN32):
+        from .socket_client import SocketClient
+        return SocketClient(
+            notification_callback=notification_callback,
+            logger=logger,
+            address=address
+        )
     if HAS_WIN32:
         return PipeClient(
             notification_callback=notification_callback,
@@ -346,13 +346,31 @@ def create_pipe_server(
     command_queue: Queue,
     shutdown_event: threading.Event,
     command_handler: Callable[[dict], dict] = None,
-    logger: logging.Logger = None
+    logger: logging.Logger = None,
+    transport: str = 'auto',
+    address: Any = None,
+    quote_book=None,
+    stats_provider: Callable[[], Dict[str, dict]] = None
 ) -> Any:
     """
-    Create appropriate pipe server for the platform.
+    Create appropriate IPC server for the platform.
     
-    Returns PipeServer on Windows, MockPipeServer otherwise.
+    transport='auto' returns PipeServer on Windows and SocketServer
+    (Unix domain socket / localhost TCP) elsewhere; 'pipe' or 'socket'
+    forces one.  address, quote_book and stats_provider only apply to
+    SocketServer (push subscriptions).
     """
+    if transport == 'socket' or (transport == 'auto' and not HAS_WIN32):
+        from .socket_server import SocketServer
+        return SocketServer(
+            command_queue=command_queue,
+            shutdown_event=shutdown_event,
+            command_handler=command_handler,
+            logger=logger,
+            address=address,
+            quote_book=quote_book,
+            stats_provider=stats_provider
+        )
     if HAS_WIN32:
         return PipeServer(
             command_queue=command_queue,
@@ -0,0 +1,276 @@
+"""
+CANSLIM Monitor - Socket IPC Client
+GUI/CLI-side client for SocketServer (Unix domain socket or localhost TCP).
+
+Provides:
+- The PipeClient API (send_command, get_status, force_check, ...)
+- Concurrent requests from several threads over one connection
+- Server-push subscriptions (quotes, alerts, thread_stats)
+
+Usage:
+    client = SocketClient()
+    if client.connect():
+        client.subscribe(['quotes'], on_quotes, symbols=['NVDA', 'AAPL'])
+        status = client.get_status()
+
+Subscription callbacks receive the push message dict and run on the
+client's reader thread; GUI code must marshal them to its own thread.
+"""
+
+import json
+import logging
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .pipe_client import PipeClient
+from .pipe_server import IPCMessage
+from .socket_server import format_address, resolve_address
+
+
+class SocketClient(PipeClient):
+    """IPC client for SocketServer with push subscriptions."""
+
+    def __init__(
+        self,
+        notification_callback: Callable[[dict], None] = None,
+        logger: Optional[logging.Logger] = None,
+        address: Any = None,
+        disconnect_callback: Callable[[], None] = None,
+    ):
+        """
+        Args:
+            notification_callback: Called with pushes that have no topic
+                callback, and with send_notification() broadcasts
+            logger: Logger instance
+            address: See socket_server.resolve_address()
+            disconnect_callback: Called (from the reader thread) when the
+                service closes the connection; not called by disconnect()
+        """
+        super().__init__(notification_callback, logger)
+        self.address = resolve_address(address)
+        self.disconnect_callback = disconnect_callback
+
+        self._sock: Optional[socket.socket] = None
+        self._reader: Optional[threading.Thread] = None
+        self._send_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        # request_id -> [Event, response]
+        self._pending: Dict[str, list] = {}
+        self._topic_callbacks: Dict[str, Callable[[dict], None]] = {}
+
+    # ------------------------------------------------------------------
+    # Connection
+    # ------------------------------------------------------------------
+
+    def connect(self, timeout: float = 5.0) -> bool:
+        """Connect to the service socket, retrying until *timeout*."""
+        if self._connected:
+            return True
+
+        deadline = time.time() + timeout
+        while True:
+            family = socket.AF_INET if isinstance(self.address, tuple) else socket.AF_UNIX
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            try:
+                sock.settimeout(max(0.1, deadline - time.time()))
+                sock.connect(self.address)
+                break
+            except OSError as e:
+                sock.close()
+                if time.time() >= deadline:
+                    self.logger.debug(f"Cannot connect to {format_address(self.address)}: {e}")
+                    return False
+                time.sleep(0.1)
+
+        sock.settimeout(None)
+        self._sock = sock
+        self._connected = True
+        self._reader = threading.Thread(target=self._read_loop, args=(sock,),
+                                        name='ipc-client-reader', daemon=True)
+        self._reader.start()
+        self.logger.debug(f"Connected to service at {format_address(self.address)}")
+        return True
+
+    def disconnect(self):
+        """Disconnect from the service."""
+        sock, self._sock = self._sock, None
+        self._connected = False
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        self._fail_pending()
+        self.logger.debug("Disconnected from service")
+
+    def _fail_pending(self):
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for slot in pending.values():
+            slot[0].set()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def send_command(self, command_type: str, data: dict = None, timeout: float = 5.0) -> Optional[dict]:
+        """
+        Send a command and wait for its response.
+
+        Safe to call from several threads at once; responses are matched
+        by request_id.
+
+        Returns:
+            Response data dict, or None on error / timeout
+        """
+        if not self._connected:
+            self.logger.warning("Not connected - cannot send command")
+            return None
+
+        message = IPCMessage(command_type, data)
+        slot = [threading.Event(), None]
+        with self._pending_lock:
+            self._pending[message.request_id] = slot
+
+        try:
+            with self._send_lock:
+                self._sock.sendall(message.to_json().encode('utf-8') + b'\n')
+        except (OSError, AttributeError) as e:
+            self.logger.error(f"Command error: {e}")
+            with self._pending_lock:
+                self._pending.pop(message.request_id, None)
+            self.disconnect()
+            return None
+
+        if not slot[0].wait(timeout):
+            with self._pending_lock:
+                self._pending.pop(message.request_id, None)
+            self.logger.warning(f"{command_type} timed out after {timeout}s")
+            return None
+
+        response = slot[1]
+        if response is None:
+            return None
+        if response.get('status') == 'error':
+            self.logger.warning(f"{command_type} failed: {response.get('error')}")
+        return response.get('data', {})
+
+    def ping(self, timeout: float = 2.0) -> bool:
+        result = self.send_command('PING', timeout=timeout)
+        return bool(result) and result.get('status') == 'ok'
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def subscribe(
+        self,
+        topics: Iterable[str],
+        callback: Callable[[dict], None] = None,
+        symbols: Optional[Iterable[str]] = None,
+        timeout: float = 5.0,
+    ) -> Optional[dict]:
+        """
+        Subscribe to server pushes.
+
+        A snapshot push (``'snapshot': True``) follows for quotes and
+        thread_stats, then deltas as they change.
+
+        Args:
+            topics: Any of 'quotes', 'alerts', 'thread_stats'
+            callback: Called with each push for these topics (default:
+                notification_callback)
+            symbols: Restrict quote pushes to these symbols (None = all)
+
+        Returns:
+            Server reply {'subscribed': [...], 'topics': [...]}, or None
+        """
+        topics = list(topics)
+        if callback is not None:
+            for topic in topics:
+                self._topic_callbacks[topic] = callback
+        data: Dict[str, Any] = {'topics': topics}
+        if symbols is not None:
+            data['symbols'] = [s.upper() for s in symbols]
+        return self.send_command('SUBSCRIBE', data, timeout=timeout)
+
+    def set_quote_symbols(self, symbols: Optional[Iterable[str]], timeout: float = 5.0) -> Optional[dict]:
+        """Change the quote filter (None = all symbols); a fresh snapshot follows."""
+        data = {
+            'topics': ['quotes'],
+            'symbols': [s.upper() for s in symbols] if symbols is not None else None,
+        }
+        return self.send_command('SUBSCRIBE', data, timeout=timeout)
+
+    def unsubscribe(self, topics: Iterable[str] = None, timeout: float = 5.0) -> Optional[dict]:
+        """Stop pushes for *topics* (default: all)."""
+        topics = list(topics) if topics is not None else list(self._topic_callbacks)
+        for topic in topics:
+            self._topic_callbacks.pop(topic, None)
+        return self.send_command('UNSUBSCRIBE', {'topics': topics}, timeout=timeout)
+
+    # ------------------------------------------------------------------
+    # Reader
+    # ------------------------------------------------------------------
+
+    def _read_loop(self, sock: socket.socket):
+        buffer = bytearray()
+        while True:
+            try:
+                data = sock.recv(65536)
+            except OSError:
+                data = b''
+            if not data:
+                break
+            buffer += data
+            while True:
+                end = buffer.find(b'\n')
+                if end < 0:
+                    break
+                line = bytes(buffer[:end])
+                del buffer[:end + 1]
+                if line.strip():
+                    self._handle_line(line)
+
+        if self._sock is sock:
+            self.logger.info("Connection to service lost")
+            self._sock = None
+            self._connected = False
+            sock.close()
+            self._fail_pending()
+            if self.disconnect_callback is not None:
+                try:
+                    self.disconnect_callback()
+                except Exception as e:
+                    self.logger.error(f"Disconnect callback error: {e}")
+
+    def _handle_line(self, line: bytes):
+        try:
+            message = json.loads(line.decode('utf-8'))
+        except ValueError as e:
+            self.logger.error(f"Invalid message JSON: {e}")
+            return
+
+        request_id = message.get('request_id')
+        if request_id is not None:
+            with self._pending_lock:
+                slot = self._pending.pop(request_id, None)
+            if slot is not None:
+                slot[1] = message
+                slot[0].set()
+                return
+
+        callback = self._topic_callbacks.get(message.get('topic')) or self.notification_callback
+        if callback is None:
+            return
+        try:
+            callback(message)
+        except Exception as e:
+            self.logger.error(f"Push callback error: {e}", exc_info=True)
+
+    @property
+    def subscribed_topics(self) -> List[str]:
+        return list(self._topic_callbacks)
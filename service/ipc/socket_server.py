@@ -0,0 +1,557 @@
+"""
+CANSLIM Monitor - Socket IPC Server
+Cross-platform service-side IPC over a Unix domain socket (localhost TCP
+where AF_UNIX is unavailable).
+
+Provides:
+- Multiple concurrent GUI/CLI clients served from one selector loop
+- The named-pipe command protocol (IPCMessage / IPCResponse JSON), one
+  message per line
+- Server-push subscriptions: clients SUBSCRIBE to 'quotes', 'alerts' or
+  'thread_stats' and receive deltas instead of polling GET_STATUS
+
+Push messages carry no request_id:
+    {"type": "PUSH", "topic": "quotes", "seq": 812, "timestamp": ..., "data": {...}}
+"""
+
+import json
+import logging
+import os
+import selectors
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from queue import Queue
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
+
+from .pipe_server import IPCMessage, IPCResponse, PipeServer
+
+
+HAS_AF_UNIX = hasattr(socket, 'AF_UNIX')
+
+ADDRESS_ENV = 'CANSLIM_IPC_ADDRESS'
+DEFAULT_SOCKET_NAME = 'canslim_monitor.sock'
+DEFAULT_TCP_ADDRESS = ('127.0.0.1', 47810)
+
+TOPICS = ('quotes', 'alerts', 'thread_stats')
+
+Address = Union[str, Tuple[str, int]]
+
+
+def resolve_address(address: Any = None) -> Address:
+    """
+    Resolve the IPC endpoint.
+
+    Args:
+        address: Unix socket path, 'tcp://host:port', (host, port), or None
+            for $CANSLIM_IPC_ADDRESS / the platform default
+
+    Returns:
+        Socket path (AF_UNIX) or (host, port) tuple (TCP)
+    """
+    address = address or os.environ.get(ADDRESS_ENV)
+    if isinstance(address, (tuple, list)):
+        return (address[0], int(address[1]))
+    if address:
+        if address.startswith('tcp://'):
+            host, port = address[len('tcp://'):].rsplit(':', 1)
+            return (host, int(port))
+        return address
+    if HAS_AF_UNIX:
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+        return os.path.join(runtime_dir, DEFAULT_SOCKET_NAME)
+    return DEFAULT_TCP_ADDRESS
+
+
+def format_address(address: Address) -> str:
+    if isinstance(address, tuple):
+        return f"tcp://{address[0]}:{address[1]}"
+    return address
+
+
+def _to_json(obj: dict) -> bytes:
+    return json.dumps(obj, default=str).encode('utf-8') + b'\n'
+
+
+class _Client:
+    """Per-connection state (owned by the selector loop)."""
+
+    def __init__(self, sock: socket.socket, peer: str):
+        self.sock = sock
+        self.peer = peer
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()        # guarded by SocketServer._lock
+        self.topics: Set[str] = set()
+        self.symbols: Optional[Set[str]] = None   # quotes filter (None = all)
+        self.closed = False
+
+
+class SocketServer(PipeServer):
+    """
+    Multi-client IPC server on a Unix domain socket or localhost TCP.
+
+    Drop-in for PipeServer: same constructor arguments, command handling
+    (command_handler or command_queue), send_notification() and
+    is_client_connected().  Commands run on a small worker pool so a slow
+    handler never stalls pushes to other clients.
+    """
+
+    MAX_LINE = 1 << 20          # Largest accepted request (bytes)
+    MAX_BUFFERED = 8 << 20      # Drop clients that stop reading
+
+    def __init__(
+        self,
+        command_queue: Queue,
+        shutdown_event: threading.Event,
+        command_handler: Callable[[dict], dict] = None,
+        logger: Optional[logging.Logger] = None,
+        address: Any = None,
+        quote_book=None,
+        stats_provider: Callable[[], Dict[str, dict]] = None,
+        push_interval: float = 0.25,
+        stats_interval: float = 2.0,
+        max_workers: int = 4,
+    ):
+        """
+        Args:
+            address: See resolve_address()
+            quote_book: QuoteBook whose changes are pushed on 'quotes'
+            stats_provider: Returns {thread_name: stats}; diffs are pushed
+                on 'thread_stats'
+            push_interval: Seconds between quote-delta pushes (coalesces ticks)
+            stats_interval: Seconds between thread-stats diffs
+            max_workers: Command handler pool size
+        """
+        super().__init__(command_queue, shutdown_event, command_handler, logger)
+        self.address = resolve_address(address)
+        self.quote_book = quote_book
+        self.stats_provider = stats_provider
+        self.push_interval = push_interval
+        self.stats_interval = stats_interval
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._clients: Dict[socket.socket, _Client] = {}
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._listener: Optional[socket.socket] = None
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._ready = threading.Event()
+
+        self._quote_seq = quote_book.sequence if quote_book is not None else 0
+        self._last_stats: Dict[str, dict] = {}
+        self._next_stats = 0.0
+
+        self.pushes_sent = 0
+        self.clients_dropped = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def run(self):
+        """Selector loop: accept, read requests, flush responses and pushes."""
+        try:
+            self._listener = self._bind()
+        except OSError as e:
+            self.logger.error(f"IPC server cannot listen on {format_address(self.address)}: {e}")
+            self._ready.set()
+            return
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ, None)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, 'wake')
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='ipc-cmd')
+        self.logger.info(f"IPC server listening on {format_address(self.address)}")
+        self._ready.set()
+
+        try:
+            while not self.shutdown_event.is_set():
+                for key, mask in self._selector.select(timeout=self.push_interval):
+                    if key.data is None:
+                        self._accept()
+                    elif key.data == 'wake':
+                        self._drain_wake()
+                    else:
+                        client = key.data
+                        if mask & selectors.EVENT_READ:
+                            self._read(client, pool)
+                        if mask & selectors.EVENT_WRITE and not client.closed:
+                            self._flush(client)
+                self._push_due()
+                self._update_interest()
+        except Exception as e:
+            self.logger.error(f"IPC server error: {e}", exc_info=True)
+        finally:
+            pool.shutdown(wait=False)
+            self._close_all()
+
+        self.logger.info("IPC server stopped")
+
+    def wait_ready(self, timeout: float = 5.0) -> bool:
+        """Block until the server is listening (or failed to)."""
+        return self._ready.wait(timeout) and self._listener is not None
+
+    def _bind(self) -> socket.socket:
+        if isinstance(self.address, tuple):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(self.address)
+            # Pick up the real port when bound to port 0
+            self.address = sock.getsockname()[:2]
+        else:
+            self._remove_stale_socket(self.address)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(self.address)
+            # Status and shutdown commands: owner only
+            os.chmod(self.address, 0o600)
+        sock.listen(16)
+        sock.setblocking(False)
+        return sock
+
+    def _remove_stale_socket(self, path: str):
+        """Unlink a socket file left by a crashed service; refuse if one is live."""
+        if not os.path.exists(path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+        finally:
+            probe.close()
+        raise OSError(f"another service is already listening on {path}")
+
+    def _close_all(self):
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            self._drop(client)
+        if self._selector:
+            self._selector.close()
+        if self._listener:
+            self._listener.close()
+            if not isinstance(self.address, tuple):
+                try:
+                    os.unlink(self.address)
+                except OSError:
+                    pass
+        self._wake_r.close()
+        self._wake_w.close()
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _accept(self):
+        try:
+            sock, peer = self._listener.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        sock.setblocking(False)
+        client = _Client(sock, str(peer) or 'unix')
+        with self._lock:
+            self._clients[sock] = client
+        self._selector.register(sock, selectors.EVENT_READ, client)
+        self.logger.info(f"Client connected ({len(self._clients)} total)")
+
+    def _drop(self, client: _Client):
+        if client.closed:
+            return
+        client.closed = True
+        with self._lock:
+            self._clients.pop(client.sock, None)
+            remaining = len(self._clients)
+        try:
+            self._selector.unregister(client.sock)
+        except (KeyError, ValueError):
+            pass
+        client.sock.close()
+        self.logger.info(f"Client disconnected ({remaining} remaining)")
+
+    def _read(self, client: _Client, pool: ThreadPoolExecutor):
+        try:
+            data = client.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b''
+        if not data:
+            self._drop(client)
+            return
+
+        client.inbuf += data
+        while True:
+            end = client.inbuf.find(b'\n')
+            if end < 0:
+                break
+            line = bytes(client.inbuf[:end]).decode('utf-8', errors='replace').strip()
+            del client.inbuf[:end + 1]
+            if line:
+                self._dispatch(client, line, pool)
+
+        if len(client.inbuf) > self.MAX_LINE:
+            self.logger.warning(f"Dropping client {client.peer}: request exceeds {self.MAX_LINE} bytes")
+            self._drop(client)
+
+    def _dispatch(self, client: _Client, line: str, pool: ThreadPoolExecutor):
+        """Handle subscriptions inline; everything else goes to the worker pool."""
+        try:
+            msg = IPCMessage.from_json(line)
+        except (ValueError, AttributeError):
+            msg = None
+
+        if msg is not None and msg.type in ('SUBSCRIBE', 'UNSUBSCRIBE', 'PING'):
+            # Runs on the selector thread: a bad request must not stop the loop
+            try:
+                if msg.type == 'SUBSCRIBE':
+                    data = self._subscribe(client, msg.data)
+                elif msg.type == 'UNSUBSCRIBE':
+                    data = self._unsubscribe(client, msg.data)
+                else:
+                    data = {'status': 'ok', 'message': 'pong'}
+                response = IPCResponse(msg.request_id, status='success', data=data).to_json()
+            except Exception as e:
+                self.logger.warning(f"Rejected {msg.type} from {client.peer}: {e}")
+                response = IPCResponse(msg.request_id, status='error', error=str(e)).to_json()
+                data = None
+            self._send(client, response.encode('utf-8') + b'\n')
+            if msg.type == 'SUBSCRIBE' and data is not None:
+                try:
+                    self._send_snapshots(client, data['subscribed'])
+                except Exception as e:
+                    self.logger.error(f"Snapshot push to {client.peer} failed: {e}", exc_info=True)
+                    self._drop(client)
+            return
+
+        def work():
+            response = self._process_message(line)
+            if response:
+                self._send(client, response.encode('utf-8') + b'\n')
+
+        pool.submit(work)
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def _send(self, client: _Client, payload: bytes):
+        """Queue bytes for a client (any thread) and wake the loop."""
+        with self._lock:
+            if client.closed:
+                return
+            client.outbuf += payload
+        self._wake()
+
+    def _wake(self):
+        try:
+            self._wake_w.send(b'\0')
+        except (BlockingIOError, OSError):
+            pass   # Already pending, or closing
+
+    def _drain_wake(self):
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError, OSError):
+            pass
+
+    def _update_interest(self):
+        """Watch for writability only while a client has buffered output."""
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            with self._lock:
+                pending = len(client.outbuf)
+            if pending > self.MAX_BUFFERED:
+                self.logger.warning(f"Dropping slow client {client.peer} ({pending} bytes unsent)")
+                self.clients_dropped += 1
+                self._drop(client)
+                continue
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if pending else 0)
+            try:
+                if self._selector.get_key(client.sock).events != events:
+                    self._selector.modify(client.sock, events, client)
+            except (KeyError, ValueError):
+                pass
+
+    def _flush(self, client: _Client):
+        with self._lock:
+            if not client.outbuf:
+                return
+            try:
+                sent = client.sock.send(client.outbuf)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                sent = -1
+            if sent > 0:
+                del client.outbuf[:sent]
+        if sent < 0:
+            self._drop(client)
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _request_data(data: Any) -> dict:
+        if data is None:
+            return {}
+        if not isinstance(data, dict):
+            raise ValueError("'data' must be an object")
+        return data
+
+    @staticmethod
+    def _string_list(data: dict, key: str) -> Optional[list]:
+        """data[key] as a list of strings; None when absent or null."""
+        value = data.get(key)
+        if value is None:
+            return None
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            raise ValueError(f"'{key}' must be a list of strings")
+        return value
+
+    def _subscribe(self, client: _Client, data: dict) -> dict:
+        data = self._request_data(data)
+        requested = self._string_list(data, 'topics')
+        symbols = self._string_list(data, 'symbols')
+        topics = [t for t in (requested or TOPICS) if t in TOPICS]
+        unknown = [t for t in (requested or []) if t not in TOPICS]
+        client.topics.update(topics)
+        if 'symbols' in data:
+            client.symbols = {s.upper() for s in symbols} if symbols is not None else None
+        result = {'subscribed': topics, 'topics': sorted(client.topics)}
+        if unknown:
+            result['unknown'] = unknown
+        return result
+
+    def _unsubscribe(self, client: _Client, data: dict) -> dict:
+        topics = self._string_list(self._request_data(data), 'topics') or list(client.topics)
+        client.topics.difference_update(topics)
+        return {'unsubscribed': topics, 'topics': sorted(client.topics)}
+
+    def _send_snapshots(self, client: _Client, topics):
+        """Full state for newly subscribed topics; later pushes are deltas."""
+        if 'quotes' in topics and self.quote_book is not None:
+            seq, quotes = self.quote_book.changes_since(0)
+            self._send(client, self._push_payload('quotes', self._quote_dicts(quotes, client.symbols),
+                                                  seq=seq, snapshot=True))
+        if 'thread_stats' in topics and self.stats_provider is not None:
+            if not self._last_stats:
+                self._last_stats = self._collect_stats()
+            if self._last_stats:
+                self._send(client, self._push_payload('thread_stats', self._last_stats, snapshot=True))
+
+    def _subscribers(self, topic: str):
+        with self._lock:
+            return [c for c in self._clients.values() if topic in c.topics]
+
+    def _push_payload(self, topic: str, data: Any, seq: int = None, snapshot: bool = False) -> bytes:
+        message = {
+            'type': 'PUSH',
+            'topic': topic,
+            'timestamp': datetime.now().isoformat(),
+            'data': data,
+        }
+        if seq is not None:
+            message['seq'] = seq
+        if snapshot:
+            message['snapshot'] = True
+        return _to_json(message)
+
+    @staticmethod
+    def _quote_dicts(quotes: Dict[str, Any], symbols: Optional[Set[str]]) -> Dict[str, dict]:
+        return {
+            symbol: quote.to_dict()
+            for symbol, quote in quotes.items()
+            if symbols is None or symbol in symbols
+        }
+
+    def _push_due(self):
+        """Push quote deltas every loop pass and stats diffs every stats_interval."""
+        if self.quote_book is not None:
+            self._push_quotes()
+        if self.stats_provider is not None and time.monotonic() >= self._next_stats:
+            self._next_stats = time.monotonic() + self.stats_interval
+            self._push_stats()
+
+    def _push_quotes(self):
+        seq, changed = self.quote_book.changes_since(self._quote_seq)
+        if seq == self._quote_seq:
+            return
+        self._quote_seq = seq
+        for client in self._subscribers('quotes'):
+            quotes = self._quote_dicts(changed, client.symbols)
+            if quotes:
+                self._send(client, self._push_payload('quotes', quotes, seq=seq))
+                self.pushes_sent += 1
+
+    def _collect_stats(self) -> Dict[str, dict]:
+        try:
+            # Round-trip so comparisons see exactly what clients will see
+            return json.loads(json.dumps(self.stats_provider(), default=str))
+        except Exception as e:
+            self.logger.debug(f"Stats provider failed: {e}")
+            return {}
+
+    def _push_stats(self):
+        subscribers = self._subscribers('thread_stats')
+        if not subscribers:
+            self._last_stats = {}
+            return
+        stats = self._collect_stats()
+        delta = {}
+        for name, values in stats.items():
+            previous = self._last_stats.get(name)
+            if isinstance(values, dict) and isinstance(previous, dict):
+                changed = {k: v for k, v in values.items() if previous.get(k) != v}
+            else:
+                changed = values if values != previous else None
+            if changed:
+                delta[name] = changed
+        self._last_stats = stats
+        if delta:
+            payload = self._push_payload('thread_stats', delta)
+            for client in subscribers:
+                self._send(client, payload)
+                self.pushes_sent += 1
+
+    def publish(self, topic: str, data: Any):
+        """
+        Push *data* to every client subscribed to *topic* (thread-safe).
+
+        Used for event topics such as 'alerts'; quotes and thread stats are
+        pushed by the server loop itself.
+        """
+        subscribers = self._subscribers(topic)
+        if not subscribers:
+            return
+        payload = self._push_payload(topic, data)
+        for client in subscribers:
+            self._send(client, payload)
+            self.pushes_sent += 1
+
+    # ------------------------------------------------------------------
+    # PipeServer interface
+    # ------------------------------------------------------------------
+
+    def send_notification(self, notification: dict):
+        """Send a notification to every connected client."""
+        payload = _to_json(notification)
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            self._send(client, payload)
+
+    def is_client_connected(self) -> bool:
+        return bool(self._clients)
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
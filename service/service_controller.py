@@ -15,7 +15,10 @@ import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 
-from .threads import BreakoutThread, PositionThread, MarketThread, MaintenanceThread
+from .threads import (
+    BreakoutThread, PositionThread, MarketThread, MaintenanceThread,
+    QuoteStreamThread, AlertDeliveryThread,
+)
 from .ipc import create_pipe_server
 
 # Phase 2 dependencies
@@ -79,14 +82,20 @@ class ServiceController:
         self.scoring_engine = None
         self.position_sizer = None
         self.alert_service = None
+        self.alert_outbox = None
 
         # Market data — provider abstraction layer
         self.provider_factory = None
+        self.provider_pool = None
         self.historical_provider = None
         self.realtime_provider = None
         self.futures_provider = None
         self.polygon_client = None  # Legacy compat — backed by historical_provider.client
 
+        # Latest streamed quote per symbol, shared by all threads
+        from ..providers.quote_book import QuoteBook
+        self.quote_book = QuoteBook()
+
         # Tracking
         self._start_time: Optional[datetime] = None
         self._is_running = False
@@ -107,8 +116,10 @@ class ServiceController:
         self._load_config()
         
         # Initialize shared resources
+        self._init_http_pool()
         self._init_market_calendar()
         self._init_database()
+        self._init_bar_cache()
         self._init_ibkr()
         self._init_discord()
         self._init_providers()
@@ -174,15 +185,25 @@ class ServiceController:
             self.logger.error(f"Failed to load config: {e}")
             self.config = {}
     
+    def _init_http_pool(self):
+        """Size the shared keep-alive HTTP pool used by all REST clients."""
+        from ..utils.http_pool import init_http_pool
+        pool = init_http_pool(self.config)
+        self.logger.info(
+            f"HTTP pool: {pool.pool_maxsize} connections/host, {pool.pool_connections} hosts"
+        )
+    
     def _init_market_calendar(self):
         """Initialize shared MarketCalendar with Polygon API key."""
         try:
             from ..utils.market_calendar import init_market_calendar
             api_key = self.config.get('polygon', {}).get('api_key', '')
             self.market_calendar = init_market_calendar(api_key=api_key)
+            # Lookups are table-based; the API only refreshes the table in the background
+            self.market_calendar.start_reconciler()
             self.logger.info(
                 "MarketCalendar initialized (api_key=%s)",
-                'set' if api_key else 'none — using fallback calendar'
+                'set — reconciling with API' if api_key else 'none — rule-based calendar'
             )
         except Exception as e:
             self.logger.warning(f"MarketCalendar init failed: {e}")
@@ -203,6 +224,18 @@ class ServiceController:
         except Exception as e:
             self.logger.error(f"Failed to initialize database: {e}")
     
+    def _init_bar_cache(self):
+        """Open the memory-mapped bar cache next to the database file."""
+        if not self.db_path:
+            return
+        try:
+            from ..data.bar_cache import init_bar_cache
+            root = os.path.join(os.path.dirname(os.path.abspath(self.db_path)), 'bar_cache')
+            init_bar_cache(root)
+            self.logger.info(f"Bar cache: {root}")
+        except ImportError as e:
+            self.logger.warning(f"Bar cache disabled: {e}")
+    
     def _init_ibkr(self):
         """Initialize IBKR connection using thread-safe IBKRClient wrapper."""
         ibkr_config = self.config.get('ibkr', {})
@@ -225,6 +258,13 @@ class ServiceController:
             
             self.logger.info(f"IBKR config: host={host}, port={port}, client_id_base={client_id_base}")
             
+            # Persistent conId cache so quote requests skip re-qualification
+            from ..integrations.ibkr_contract_cache import ContractCache
+            contract_cache = ContractCache(
+                db_session_factory=self.db_session_factory,
+                ttl_hours=ibkr_config.get('contract_cache_ttl_hours', ContractCache.DEFAULT_TTL_HOURS),
+            )
+
             # Load reconnect config from user config
             from ..integrations.ibkr_client_threadsafe import ReconnectConfig
             reconnect_settings = ibkr_config.get('reconnect', {})
@@ -255,6 +295,7 @@ class ServiceController:
                         port=port,
                         client_id=client_id,
                         reconnect_config=reconnect_config,
+                        contract_cache=contract_cache,
                     )
                     
                     if self.ibkr_client.connect():
@@ -358,9 +399,10 @@ class ServiceController:
             return
 
         try:
-            from ..providers import ProviderFactory
+            from ..providers import get_provider_pool
 
-            self.provider_factory = ProviderFactory(self.db_session_factory)
+            self.provider_pool = get_provider_pool(self.db_session_factory)
+            self.provider_factory = self.provider_pool.factory
 
             # Seed from YAML if provider_config table is empty
             session = self.db_session_factory()
@@ -375,7 +417,7 @@ class ServiceController:
                 self.provider_factory.seed_from_yaml(self.config)
 
             # Create historical provider (Massive / Polygon)
-            self.historical_provider = self.provider_factory.get_historical()
+            self.historical_provider = self.provider_pool.get_historical()
 
             if self.historical_provider:
                 # Expose underlying PolygonClient for legacy consumers
@@ -460,6 +502,11 @@ class ServiceController:
             from ..utils.logging import get_logger
             
             alert_config = self.config.get('alerts', {})
+
+            # Batched writes + background Discord delivery (drained by AlertDeliveryThread)
+            if alert_config.get('outbox', {}).get('enabled', True) and self.db_session_factory:
+                from ..services.alert_outbox import AlertOutboxWriter
+                self.alert_outbox = AlertOutboxWriter(self.db_session_factory, logger=get_logger('breakout'))
             
             self.alert_service = AlertService(
                 db_session_factory=self.db_session_factory,
@@ -468,9 +515,10 @@ class ServiceController:
                 enable_cooldown=alert_config.get('enable_cooldown', False),
                 enable_suppression=alert_config.get('enable_suppression', True),
                 alert_routing=alert_config.get('alert_routing', {}),
-                logger=get_logger('breakout')  # Use breakout logger so alerts appear in breakout log
+                logger=get_logger('breakout'),  # Use breakout logger so alerts appear in breakout log
+                outbox=self.alert_outbox
             )
-            self.logger.info(f"Alert service initialized (cooldown={'enabled' if alert_config.get('enable_cooldown', False) else 'disabled'}, discord={'configured' if self.discord_notifier else 'NOT configured'})")
+            self.logger.info(f"Alert service initialized (outbox={'on' if self.alert_outbox else 'off'}, cooldown={'enabled' if alert_config.get('enable_cooldown', False) else 'disabled'}, discord={'configured' if self.discord_notifier else 'NOT configured'})")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize alert service: {e}")
@@ -494,6 +542,16 @@ class ServiceController:
                 logger=get_logger('volume')
             )
 
+        # Dynamic-scoring profiles shared by the breakout thread (lookups)
+        # and the maintenance thread (rebuilt after the nightly bar update)
+        profile_cache = None
+        canslim_scorer = None
+        if volume_service:
+            from ..services.technical_profile_cache import TechnicalProfileCache
+            from ..utils.scoring import CANSLIMScorer
+            profile_cache = TechnicalProfileCache(volume_service, logger=get_logger('breakout'))
+            canslim_scorer = CANSLIMScorer()
+
         # Phase 2: Pass scoring engine, position sizer, and alert service to breakout thread
         # Merge breakout config with full config so thread has access to Polygon API key for MAs
         full_breakout_config = {**self.config, **breakout_config}
@@ -510,8 +568,11 @@ class ServiceController:
             alert_service=self.alert_service,
             # Volume service for intraday fallback
             volume_service=volume_service,
+            canslim_scorer=canslim_scorer,
+            profile_cache=profile_cache,
             # Provider abstraction layer (Phase 6)
             realtime_provider=self.realtime_provider,
+            quote_book=self.quote_book,
             logger=get_logger('breakout')  # Use configured logger
         )
 
@@ -524,9 +585,40 @@ class ServiceController:
             config=self.config,  # Pass full config for position_monitoring section
             # Provider abstraction layer (Phase 6)
             realtime_provider=self.realtime_provider,
+            quote_book=self.quote_book,
+            alert_outbox=self.alert_outbox,
             logger=get_logger('position')  # Use configured logger
         )
 
+        # Drains the alert outbox (writes + Discord) off the monitoring threads
+        if self.alert_outbox:
+            self.threads['alert_delivery'] = AlertDeliveryThread(
+                shutdown_event=self.shutdown_event,
+                outbox=self.alert_outbox,
+                discord_notifier=self.discord_notifier,
+                db_session_factory=self.db_session_factory,
+                poll_interval=thread_config.get('alert_delivery_interval', 1),
+                config=alert_cfg.get('outbox', {}),
+                logger=get_logger('breakout')
+            )
+
+        # Streaming subscriptions feeding the shared quote book
+        stream_config = self.config.get('ibkr', {}).get('streaming', {})
+        if (
+            stream_config.get('enabled', True)
+            and self.realtime_provider
+            and self.realtime_provider.supports_streaming()
+        ):
+            self.threads['quote_stream'] = QuoteStreamThread(
+                shutdown_event=self.shutdown_event,
+                quote_book=self.quote_book,
+                realtime_provider=self.realtime_provider,
+                poll_interval=stream_config.get('sync_interval', 30),
+                db_session_factory=self.db_session_factory,
+                config=stream_config,
+                logger=get_logger('ibkr')
+            )
+
         # Use comprehensive RegimeThread (ported from MarketRegime-MonitorSystem)
         # Lazy import to avoid circular dependency
         from ..regime.regime_thread import RegimeThread
@@ -554,6 +646,7 @@ class ServiceController:
                 config=self.config,
                 # Provider abstraction layer (Phase 6)
                 historical_provider=self.historical_provider,
+                profile_cache=profile_cache,
                 logger=get_logger('maintenance')
             )
         else:
@@ -568,14 +661,40 @@ class ServiceController:
     
     def _start_ipc_server(self):
         """Start the IPC server for GUI communication."""
+        ipc_config = self.config.get('service', {}).get('ipc', {}) or {}
         self.pipe_server = create_pipe_server(
             command_queue=self.command_queue,
             shutdown_event=self.shutdown_event,
             command_handler=self._handle_ipc_command,
-            logger=self.logger.getChild('ipc')
+            logger=self.logger.getChild('ipc'),
+            transport=ipc_config.get('transport', 'auto'),
+            address=ipc_config.get('address'),
+            quote_book=self.quote_book,
+            stats_provider=self._get_thread_stats
         )
         self.pipe_server.start()
-        self.logger.info("IPC server started on \\\\.\\pipe\\CANSLIMMonitor")
+
+        # Push every alert to subscribed clients (socket transport)
+        if hasattr(self.pipe_server, 'publish'):
+            alert_services = [self.alert_service] + [
+                getattr(thread, 'alert_service', None) for thread in self.threads.values()
+            ]
+            for service in {id(s): s for s in alert_services if s is not None}.values():
+                service.add_listener(self._publish_alert)
+
+        address = getattr(self.pipe_server, 'address', None)
+        if address is not None:
+            from .ipc.socket_server import format_address
+            self.logger.info(f"IPC server started on {format_address(address)}")
+        else:
+            self.logger.info("IPC server started on \\\\.\\pipe\\CANSLIMMonitor")
+
+    def _get_thread_stats(self) -> Dict[str, dict]:
+        """Per-thread stats for IPC thread_stats pushes."""
+        return {name: thread.get_stats() for name, thread in self.threads.items()}
+
+    def _publish_alert(self, alert_data):
+        self.pipe_server.publish('alerts', alert_data.to_dict())
     
     def _command_loop(self):
         """Main loop processing commands from queue."""
@@ -626,7 +745,10 @@ class ServiceController:
         - threads: dict of thread status
         - ibkr_connected: bool
         - database_ok: bool
+        - http: per-host request counts and latency percentiles
         """
+        from ..utils.http_pool import get_http_pool
+        
         uptime = 0.0
         if self._start_time:
             uptime = (datetime.now() - self._start_time).total_seconds()
@@ -655,6 +777,7 @@ class ServiceController:
             'threads': thread_status,
             'ibkr_connected': ibkr_connected,
             'database_ok': self.db_session_factory is not None,
+            'http': get_http_pool().get_stats(),
             'timestamp': datetime.now().isoformat()
         }
     
@@ -710,10 +833,20 @@ class ServiceController:
     
     def _cleanup(self):
         """Clean up resources on shutdown."""
+        # Write any alerts raised after the delivery thread's last cycle
+        if self.alert_outbox:
+            written = self.alert_outbox.flush()
+            if written:
+                self.logger.info(f"Flushed {written} buffered alerts")
+
+        if self.market_calendar:
+            self.market_calendar.stop_reconciler()
+
         # Disconnect providers (historical, and future realtime/futures)
-        if self.provider_factory:
+        if self.provider_pool:
             try:
-                self.provider_factory.disconnect_all()
+                from ..providers import close_provider_pool
+                close_provider_pool()
                 self.logger.info("Providers disconnected")
             except Exception as e:
                 self.logger.warning(f"Error disconnecting providers: {e}")
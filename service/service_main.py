@@ -469,9 +469,9 @@ def main():
     elif args.command == 'status':
         # Check service status
         try:
-            from canslim_monitor.service.ipc import PipeClient
+            from canslim_monitor.service.ipc import create_pipe_client
             
-            client = PipeClient()
+            client = create_pipe_client()
             if client.connect(timeout=1.0):
                 status = client.get_status()
                 client.disconnect()
@@ -3,16 +3,22 @@ CANSLIM Monitor - Service Threads Package
 """
 
 from .base_thread import BaseThread, ThreadStats
+from .scheduler import FixedRateScheduler
 from .breakout_thread import BreakoutThread
 from .position_thread import PositionThread
 from .market_thread import MarketThread
 from .maintenance_thread import MaintenanceThread
+from .quote_stream_thread import QuoteStreamThread
+from .alert_delivery_thread import AlertDeliveryThread
 
 __all__ = [
     'BaseThread',
     'ThreadStats',
+    'FixedRateScheduler',
     'BreakoutThread',
     'PositionThread',
     'MarketThread',
-    'MaintenanceThread'
+    'MaintenanceThread',
+    'QuoteStreamThread',
+    'AlertDeliveryThread',
 ]
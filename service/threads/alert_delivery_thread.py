@@ -0,0 +1,231 @@
+"""
+CANSLIM Monitor - Alert Delivery Thread
+Writes buffered alerts and drains the ``alert_outbox`` table to Discord.
+
+Each cycle:
+1. Flush the AlertOutboxWriter buffer (alert rows + delivery entries,
+   one transaction)
+2. Post due PENDING entries, P0 first, through DiscordNotifier.deliver()
+   - per-webhook sliding-window rate limit; a limited or 429'd webhook
+     only defers its own entries
+   - failures retry with exponential back-off until max_attempts
+
+Monitoring threads never block on Discord; they only append to the
+outbox buffer.
+"""
+
+import json
+import logging
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from .base_thread import BaseThread
+from canslim_monitor.data.repositories.outbox_repo import OutboxRepository
+from canslim_monitor.integrations.discord_notifier import DiscordNotifier
+
+
+class WebhookRateLimiter:
+    """Sliding-window send limit per webhook, plus Discord-imposed pauses."""
+
+    def __init__(self, max_messages: int, window_seconds: float):
+        self.max_messages = max_messages
+        self.window = timedelta(seconds=window_seconds)
+        self._sent: Dict[str, deque] = {}
+        self._blocked_until: Dict[str, datetime] = {}
+
+    def next_slot(self, key: str, now: datetime) -> Optional[datetime]:
+        """None if key may send now, else the earliest time it may."""
+        blocked = self._blocked_until.get(key)
+        if blocked and blocked > now:
+            return blocked
+
+        sent = self._sent.setdefault(key, deque())
+        while sent and sent[0] <= now - self.window:
+            sent.popleft()
+        if len(sent) >= self.max_messages:
+            return sent[0] + self.window
+        return None
+
+    def record(self, key: str, now: datetime):
+        self._sent.setdefault(key, deque()).append(now)
+
+    def block(self, key: str, until: datetime):
+        self._blocked_until[key] = until
+
+
+class AlertDeliveryThread(BaseThread):
+    """
+    Background Discord delivery for AlertService's outbox.
+
+    Stats (get_stats): queue_depth, delivered, retried, failed and
+    delivery latency (alert raised -> Discord accepted) last/avg/p95.
+    """
+
+    DEFAULT_BATCH_SIZE = 50
+    DEFAULT_MAX_ATTEMPTS = 6
+    DEFAULT_BACKOFF_BASE = 2.0     # seconds; doubles per failed attempt
+    DEFAULT_BACKOFF_MAX = 300.0
+    DEFAULT_RETENTION_DAYS = 7     # SENT entries kept this long
+    LATENCY_SAMPLES = 200
+    PURGE_EVERY_CYCLES = 3600
+
+    def __init__(
+        self,
+        shutdown_event,
+        outbox,
+        discord_notifier: DiscordNotifier,
+        db_session_factory,
+        poll_interval: float = 1,
+        config: Dict[str, Any] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        super().__init__(
+            name="alert_delivery",
+            shutdown_event=shutdown_event,
+            poll_interval=poll_interval,
+            logger=logger or logging.getLogger('canslim.alerts')
+        )
+
+        self.outbox = outbox
+        self.discord_notifier = discord_notifier
+        self.db_session_factory = db_session_factory
+        config = config or {}
+
+        self.batch_size = config.get('batch_size', self.DEFAULT_BATCH_SIZE)
+        self.max_attempts = config.get('max_attempts', self.DEFAULT_MAX_ATTEMPTS)
+        self.backoff_base = config.get('backoff_base', self.DEFAULT_BACKOFF_BASE)
+        self.backoff_max = config.get('backoff_max', self.DEFAULT_BACKOFF_MAX)
+        self.retention_days = config.get('retention_days', self.DEFAULT_RETENTION_DAYS)
+        self.rate_limiter = WebhookRateLimiter(
+            config.get('rate_limit_messages', DiscordNotifier.RATE_LIMIT_MESSAGES),
+            config.get('rate_limit_window', DiscordNotifier.RATE_LIMIT_WINDOW),
+        )
+
+        self._delivered = 0
+        self._retried = 0
+        self._failed = 0
+        self._queue_depth = 0
+        self._oldest_pending: Optional[datetime] = None
+        self._latencies_ms: deque = deque(maxlen=self.LATENCY_SAMPLES)
+
+    def _do_work(self):
+        """Write buffered alerts, then deliver whatever is due."""
+        self.outbox.flush()
+        self.deliver_due()
+
+        if self._stats.cycle_count % self.PURGE_EVERY_CYCLES == 0:
+            self._purge_sent()
+
+    def deliver_due(self, now: datetime = None) -> int:
+        """
+        Attempt every due entry once.
+
+        Returns:
+            Number of entries delivered
+        """
+        if not self.db_session_factory or not self.discord_notifier:
+            return 0
+
+        delivered = 0
+        session = self.db_session_factory()
+        try:
+            repo = OutboxRepository(session)
+            for entry in repo.get_due(now=now, limit=self.batch_size):
+                if self._deliver(repo, entry):
+                    delivered += 1
+                # Commit per entry: a crash re-sends at most the one in flight
+                session.commit()
+
+            depth = repo.count_pending()
+            oldest = repo.oldest_pending()
+        finally:
+            session.close()
+
+        with self._stats_lock:
+            self._queue_depth = depth
+            self._oldest_pending = oldest
+        return delivered
+
+    def _deliver(self, repo: OutboxRepository, entry) -> bool:
+        """Post one entry and record the outcome. True if delivered."""
+        now = datetime.now()
+        key = self.discord_notifier.webhook_for(entry.channel) or entry.channel
+
+        next_slot = self.rate_limiter.next_slot(key, now)
+        if next_slot is not None:
+            repo.defer(entry, next_slot)
+            return False
+
+        self.rate_limiter.record(key, now)
+        result = self.discord_notifier.deliver(json.loads(entry.payload), channel=entry.channel)
+        now = datetime.now()
+
+        if result.ok:
+            repo.mark_sent(entry, sent_at=now)
+            latency_ms = (now - entry.created_at).total_seconds() * 1000
+            with self._stats_lock:
+                self._delivered += 1
+                self._latencies_ms.append(latency_ms)
+            self.increment_message_count()
+            return True
+
+        if result.retry_after is not None:
+            # Discord throttled this webhook: pause it, don't count an attempt
+            until = now + timedelta(seconds=result.retry_after)
+            self.rate_limiter.block(key, until)
+            repo.defer(entry, until)
+            self.logger.warning(f"Discord rate limited #{entry.channel}, pausing {result.retry_after:.1f}s")
+            return False
+
+        if result.permanent or entry.attempts + 1 >= self.max_attempts:
+            repo.mark_failed(entry, result.error)
+            with self._stats_lock:
+                self._failed += 1
+            self.logger.error(
+                f"Alert delivery failed for good ({entry.symbol} #{entry.channel}, "
+                f"{entry.attempts} attempts): {result.error}"
+            )
+            return False
+
+        delay = min(self.backoff_base * (2 ** entry.attempts), self.backoff_max)
+        repo.mark_retry(entry, now + timedelta(seconds=delay), result.error)
+        with self._stats_lock:
+            self._retried += 1
+        self.logger.warning(
+            f"Alert delivery attempt {entry.attempts} failed ({entry.symbol} #{entry.channel}), "
+            f"retrying in {delay:.0f}s: {result.error}"
+        )
+        return False
+
+    def _purge_sent(self):
+        """Drop delivered entries past the retention window."""
+        if not self.db_session_factory:
+            return
+        session = self.db_session_factory()
+        try:
+            cutoff = datetime.now() - timedelta(days=self.retention_days)
+            deleted = OutboxRepository(session).purge_sent(cutoff)
+            session.commit()
+            if deleted:
+                self.logger.debug(f"Purged {deleted} delivered outbox entries")
+        finally:
+            session.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Thread stats plus outbox depth and delivery latency."""
+        stats = super().get_stats()
+        with self._stats_lock:
+            latencies = sorted(self._latencies_ms)
+            stats['queue_depth'] = self._queue_depth + self.outbox.pending_count()
+            stats['oldest_pending_s'] = (
+                (datetime.now() - self._oldest_pending).total_seconds()
+                if self._oldest_pending else 0.0
+            )
+            stats['delivered'] = self._delivered
+            stats['retried'] = self._retried
+            stats['failed'] = self._failed
+            stats['latency_last_ms'] = self._latencies_ms[-1] if self._latencies_ms else 0.0
+        stats['latency_avg_ms'] = sum(latencies) / len(latencies) if latencies else 0.0
+        stats['latency_p95_ms'] = latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0
+        return stats
@@ -9,7 +9,32 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Tuple
+
+from .scheduler import FixedRateScheduler
+from canslim_monitor.utils.shared_rate_limit import RatePriority, rate_priority
+
+
+# Histogram buckets: (upper bound, label); values above the last bound go to the overflow label
+LATENESS_BUCKETS_MS: Tuple[Tuple[float, str], ...] = (
+    (1, '<1ms'), (10, '<10ms'), (100, '<100ms'), (1000, '<1s'), (10000, '<10s'),
+)
+LATENESS_OVERFLOW = '>=10s'
+MISSED_BUCKETS: Tuple[Tuple[float, str], ...] = ((1, '1'), (2, '2'), (4, '3-4'), (8, '5-8'))
+MISSED_OVERFLOW = '>8'
+
+
+def _empty_hist(buckets, overflow) -> Dict[str, int]:
+    hist = {label: 0 for _, label in buckets}
+    hist[overflow] = 0
+    return hist
+
+
+def _bucket(value: float, buckets, overflow, inclusive: bool = False) -> str:
+    for bound, label in buckets:
+        if value < bound or (inclusive and value == bound):
+            return label
+    return overflow
 
 
 @dataclass
@@ -24,7 +49,20 @@ class ThreadStats:
     last_error: Optional[str] = None
     avg_cycle_ms: float = 0.0
     is_market_hours: bool = False
-    
+    # Scheduler: deadlines skipped by overrunning cycles, start-time lateness
+    missed_ticks: int = 0
+    missed_hist: Dict[str, int] = field(default_factory=lambda: _empty_hist(MISSED_BUCKETS, MISSED_OVERFLOW))
+    lateness_hist: Dict[str, int] = field(default_factory=lambda: _empty_hist(LATENESS_BUCKETS_MS, LATENESS_OVERFLOW))
+    last_lateness_ms: float = 0.0
+
+    def record_lateness(self, lateness_ms: float):
+        self.last_lateness_ms = lateness_ms
+        self.lateness_hist[_bucket(lateness_ms, LATENESS_BUCKETS_MS, LATENESS_OVERFLOW)] += 1
+
+    def record_missed(self, skipped: int):
+        self.missed_ticks += skipped
+        self.missed_hist[_bucket(skipped, MISSED_BUCKETS, MISSED_OVERFLOW, inclusive=True)] += 1
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'name': self.name,
@@ -35,7 +73,11 @@ class ThreadStats:
             'last_check': self.last_check,
             'last_error': self.last_error,
             'avg_cycle_ms': self.avg_cycle_ms,
-            'is_market_hours': self.is_market_hours
+            'is_market_hours': self.is_market_hours,
+            'missed_ticks': self.missed_ticks,
+            'missed_hist': dict(self.missed_hist),
+            'lateness_hist': dict(self.lateness_hist),
+            'last_lateness_ms': self.last_lateness_ms,
         }
 
 
@@ -48,22 +90,41 @@ class BaseThread(threading.Thread, ABC):
     - Message/error counting
     - Status reporting for IPC
     - Market hours awareness
+    - Fixed-rate scheduling: cycles start every poll_interval seconds on a
+      wall-clock grid (with a per-thread random phase), overrun deadlines
+      are skipped and counted
+    - market_hours_only threads sleep until the open instead of polling
+      while the market is closed
+    - API calls made from _do_work draw from the shared rate budget at
+      api_priority
     """
-    
+
+    api_priority = RatePriority.NORMAL
+
+    DEFAULT_MAX_JITTER = 5.0    # seconds; default phase is 10% of poll_interval up to this
+    MAX_CLOSED_SLEEP = 3600     # re-check the calendar at least hourly while closed
+
     def __init__(
         self,
         name: str,
         shutdown_event: threading.Event,
         poll_interval: int = 60,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        market_hours_only: bool = False,
+        jitter: Optional[float] = None
     ):
         super().__init__(name=name, daemon=True)
 
         self.thread_name = name
         self.shutdown_event = shutdown_event
         self.poll_interval = poll_interval
+        self.market_hours_only = market_hours_only
         self.logger = logger or logging.getLogger(f'canslim.{name}')
 
+        if jitter is None:
+            jitter = min(poll_interval * 0.1, self.DEFAULT_MAX_JITTER)
+        self._scheduler = FixedRateScheduler(poll_interval, jitter=jitter)
+
         # Market calendar — set via _init_market_calendar() or by ServiceController
         self._market_calendar = None
 
@@ -80,21 +141,29 @@ class BaseThread(threading.Thread, ABC):
         with self._stats_lock:
             self._stats.state = "running"
         
-        while not self.shutdown_event.is_set():
+        scheduler = self._scheduler
+        scheduler.start()
+
+        while not self.shutdown_event.wait(scheduler.time_until_next()):
+            lateness_ms = scheduler.begin_tick() * 1000
             cycle_start = time.time()
-            
+            ran = False
+
             try:
                 # Check market hours
                 is_market = self._is_market_hours()
                 with self._stats_lock:
                     self._stats.is_market_hours = is_market
+                    self._stats.record_lateness(lateness_ms)
                 
                 # Only run during appropriate hours (can be overridden)
                 if self._should_run():
+                    ran = True
                     with self._stats_lock:
                         self._stats.state = "running"
                     
-                    self._do_work()
+                    with rate_priority(self.api_priority):
+                        self._do_work()
                     
                     with self._stats_lock:
                         self._stats.cycle_count += 1
@@ -114,8 +183,16 @@ class BaseThread(threading.Thread, ABC):
             cycle_ms = (time.time() - cycle_start) * 1000
             self._update_cycle_time(cycle_ms)
             
-            # Wait for next cycle
-            self.shutdown_event.wait(self.poll_interval)
+            # Schedule next cycle
+            idle = self._closed_sleep_seconds() if not ran else 0
+            if idle > self.poll_interval:
+                self.logger.debug(f"{self.thread_name}: market closed, sleeping {idle:.0f}s")
+                scheduler.reanchor(idle)
+            else:
+                skipped = scheduler.advance()
+                if skipped:
+                    with self._stats_lock:
+                        self._stats.record_missed(skipped)
         
         with self._stats_lock:
             self._stats.state = "stopped"
@@ -145,10 +222,25 @@ class BaseThread(threading.Thread, ABC):
         except Exception as e:
             self.logger.debug(f"MarketCalendar init failed, using fallback: {e}")
 
+    def _closed_sleep_seconds(self) -> float:
+        """
+        Seconds a market_hours_only thread can sleep after a skipped cycle.
+
+        0 for other threads, or when the calendar can't tell (the thread
+        then keeps its normal cadence).
+        """
+        if not self.market_hours_only or self._market_calendar is None:
+            return 0
+        try:
+            return min(self._market_calendar.seconds_until_open(), self.MAX_CLOSED_SLEEP)
+        except Exception as e:
+            self.logger.debug(f"MarketCalendar.seconds_until_open() failed: {e}")
+            return 0
+
     def _is_market_hours(self) -> bool:
         """Check if currently in US market hours using MarketCalendar.
 
-        Uses Polygon API for real-time status (handles holidays, early closes).
+        Uses MarketCalendar's session table (handles holidays, early closes).
         Falls back to hardcoded 9:30-4:00 ET weekday check if unavailable.
         """
         if self._market_calendar:
@@ -11,8 +11,9 @@ Updated: Dynamic scoring for consistent grades with GUI
 
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Any, Dict
-from datetime import datetime, date, time, timedelta
+from datetime import datetime, date, time
 import pytz
 
 from .base_thread import BaseThread
@@ -23,10 +24,13 @@ from ...services.alert_service import (
 from ...utils.scoring_engine import ScoringEngine, ScoringResult
 from ...utils.position_sizer import PositionSizer, PositionSizeResult
 from ...utils.pivot_status import calculate_pivot_status, PivotAnalysis, format_pivot_status_alert
+from ...integrations.ibkr_contract_cache import ContractCache
 
 # Dynamic scoring imports
 try:
     from ...utils.scoring import CANSLIMScorer
+    from ...utils.indicators import reprice_profile
+    from ...services.technical_profile_cache import TechnicalProfileCache
     DYNAMIC_SCORING_AVAILABLE = True
 except ImportError:
     DYNAMIC_SCORING_AVAILABLE = False
@@ -76,6 +80,7 @@ class BreakoutThread(BaseThread):
     BUY_ZONE_MAX_PCT = 5.0             # Max % above pivot to still be in buy zone
     APPROACHING_PCT = 1.0              # Within 1% of pivot = approaching
     STRONG_CLOSE_THRESHOLD = 0.5       # Close > midpoint of day's range
+    FETCH_WORKERS = 8                  # Concurrent per-symbol fallback fetches
     
     def __init__(
         self,
@@ -93,14 +98,18 @@ class BreakoutThread(BaseThread):
         # Dynamic scoring dependencies
         volume_service: Optional['VolumeService'] = None,
         canslim_scorer: Optional['CANSLIMScorer'] = None,
+        profile_cache: Optional['TechnicalProfileCache'] = None,
         # Provider abstraction layer (Phase 6)
         realtime_provider=None,
+        # Shared streaming quote book (read before polling)
+        quote_book=None,
     ):
         super().__init__(
             name="breakout",
             shutdown_event=shutdown_event,
             poll_interval=poll_interval,
-            logger=logger or logging.getLogger('canslim.breakout')
+            logger=logger or logging.getLogger('canslim.breakout'),
+            market_hours_only=True
         )
         
         self.db_session_factory = db_session_factory
@@ -116,14 +125,29 @@ class BreakoutThread(BaseThread):
         # Dynamic scoring dependencies
         self.volume_service = volume_service
         self.canslim_scorer = canslim_scorer
+        if profile_cache is None and volume_service and DYNAMIC_SCORING_AVAILABLE:
+            profile_cache = TechnicalProfileCache(volume_service, logger=self.logger)
+        self.profile_cache = profile_cache
 
         # Provider abstraction layer — prefers provider over raw client
         self.realtime_provider = realtime_provider
         
-        # Cache for SPY data (for RS Trend calculation)
-        self._spy_df_cache = None
-        self._spy_df_cache_time: Optional[datetime] = None
-        self._spy_cache_duration = timedelta(hours=4)
+        # Streamed quotes older than this fall back to polling
+        self.quote_book = quote_book
+        self.quote_max_age = 2 * poll_interval
+        
+        # Worker pool size for per-symbol fallbacks (quotes the batch calls
+        # missed, Massive intraday volume)
+        self.fetch_workers = self.config.get('fetch_workers', self.FETCH_WORKERS)
+        self._last_quote_fallbacks = 0
+        self._last_intraday_fallbacks = 0
+        
+        # Qualified contracts for the raw-IB fallback path (shared with the
+        # client when it already carries a cache)
+        self._contract_cache = getattr(ibkr_client, 'contract_cache', None) or ContractCache(
+            db_session_factory=db_session_factory,
+            logger=self.logger,
+        )
         
         # Volume thresholds from config - fully configurable per alert type
         # Set to 0 to disable volume requirement for that alert type
@@ -210,6 +234,7 @@ class BreakoutThread(BaseThread):
             self.technical_service = TechnicalDataService(
                 polygon_api_key=polygon_key,
                 cache_duration_hours=4,
+                db_session_factory=self.db_session_factory,
                 logger=logging.getLogger('canslim.breakout_technical'),
             )
         else:
@@ -236,13 +261,28 @@ class BreakoutThread(BaseThread):
             # Update market regime cache
             self._update_market_regime()
             
-            # Check each position
+            # Prefetch everything the evaluation needs: batched quotes and
+            # technicals, then per-symbol fallbacks on the worker pool
+            symbols = list(dict.fromkeys(pos.symbol for pos in positions if pos.symbol))
+            quotes = self._prefetch_quotes(symbols)
+            self._save_watchlist_prices(quotes)
+            technicals = self._prefetch_technicals(symbols)
+            intraday = self._prefetch_intraday_volume(positions, quotes)
+            if self.profile_cache and self.canslim_scorer:
+                self.profile_cache.sync(symbols)
+            
+            # Evaluate each position against the snapshot (no I/O until an alert fires)
             breakout_count = 0
             positions_to_update = []  # Track positions with updated pivot status
             
             for pos in positions:
                 try:
-                    result = self._check_position(pos)
+                    result = self._evaluate_position(
+                        pos,
+                        quotes.get(pos.symbol),
+                        technicals.get(pos.symbol),
+                        intraday.get(pos.symbol),
+                    )
                     if result:
                         breakout_count += 1
                     # Track position for pivot status update (only if attributes exist)
@@ -268,6 +308,103 @@ class BreakoutThread(BaseThread):
             self.logger.error(f"Error in breakout cycle: {e}", exc_info=True)
             raise
     
+    # ==================== PREFETCH ====================
+    
+    def _prefetch_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Quotes for all symbols: quote book, then one batched provider call,
+        then one batched IBKR call. Symbols still missing go through
+        _get_price_data on the worker pool.
+        """
+        quotes: Dict[str, Dict] = {}
+        
+        if self.quote_book is not None:
+            for symbol, quote in self.quote_book.get_many(symbols, max_age=self.quote_max_age).items():
+                if quote and quote.last > 0:
+                    quotes[symbol] = quote.to_dict()
+        
+        missing = [s for s in symbols if s not in quotes]
+        if missing and self.realtime_provider and self.realtime_provider.is_connected():
+            try:
+                for symbol, quote in self.realtime_provider.get_quotes(missing).items():
+                    if quote and quote.last > 0:
+                        quotes[symbol] = quote.to_dict()
+            except Exception as e:
+                self.logger.debug(f"Provider get_quotes failed: {e}, falling back to raw client")
+        
+        missing = [s for s in symbols if s not in quotes]
+        if missing and self.ibkr_client and hasattr(self.ibkr_client, 'get_quotes'):
+            try:
+                for symbol, quote in self.ibkr_client.get_quotes(missing).items():
+                    if quote and (quote.get('last') or 0) > 0:
+                        quotes[symbol] = quote
+            except Exception as e:
+                self.logger.debug(f"Batch quote failed: {e}, falling back to individual quotes")
+        
+        missing = [s for s in symbols if s not in quotes]
+        self._last_quote_fallbacks = len(missing)
+        if missing:
+            self.logger.debug(f"Batched {len(quotes)} quotes, {len(missing)} per-symbol fallbacks")
+            # A raw ib_insync connection is not thread-safe
+            raw_ib = self.ibkr_client is not None and not (
+                hasattr(self.ibkr_client, 'get_quote') or hasattr(self.ibkr_client, 'get_quote_with_technicals')
+            )
+            quotes.update(self._fetch_each(missing, self._get_price_data, parallel=not raw_ib))
+        
+        return quotes
+    
+    def _prefetch_technicals(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Moving averages for all symbols in one TechnicalDataService call."""
+        if not self.technical_service:
+            return {}
+        try:
+            return self.technical_service.get_multiple(symbols)
+        except Exception as e:
+            self.logger.debug(f"Could not fetch MA data: {e}")
+            return {}
+    
+    def _prefetch_intraday_volume(self, positions: List[Position], quotes: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Massive minute-bar volume for symbols whose quoted volume looks invalid."""
+        if not self.volume_service:
+            self._last_intraday_fallbacks = 0
+            return {}
+        
+        suspect = []
+        for pos in positions:
+            price_data = quotes.get(pos.symbol)
+            if not price_data or (price_data.get('last') or 0) <= 0:
+                continue
+            _, expected_volume, volume_seems_invalid = self._check_volume(pos, price_data)
+            if volume_seems_invalid:
+                volume = price_data.get('volume') or 0
+                self.logger.info(
+                    f"{pos.symbol}: IBKR volume={volume:,} (expected ~{int(expected_volume):,}), trying Massive..."
+                )
+                suspect.append(pos.symbol)
+        
+        self._last_intraday_fallbacks = len(suspect)
+        return self._fetch_each(list(dict.fromkeys(suspect)), self._get_intraday_volume_fallback)
+    
+    def _fetch_each(self, symbols: List[str], fetch, parallel: bool = True) -> Dict[str, Dict]:
+        """Run a per-symbol fetch over symbols on a bounded worker pool."""
+        def safe_fetch(symbol):
+            try:
+                return fetch(symbol)
+            except Exception as e:
+                self.logger.debug(f"{symbol}: {fetch.__name__} failed: {e}")
+                return None
+        
+        if not parallel or self.fetch_workers <= 1 or len(symbols) <= 1:
+            fetched = map(safe_fetch, symbols)
+            return {symbol: data for symbol, data in zip(symbols, fetched) if data}
+        
+        with ThreadPoolExecutor(
+            max_workers=min(self.fetch_workers, len(symbols)),
+            thread_name_prefix='breakout-fetch',
+        ) as pool:
+            fetched = list(pool.map(safe_fetch, symbols))
+        return {symbol: data for symbol, data in zip(symbols, fetched) if data}
+    
     def _get_watchlist_positions(self) -> List[Position]:
         """Get all State 0 positions from database."""
         if not self.db_session_factory:
@@ -300,6 +437,31 @@ class BreakoutThread(BaseThread):
             self.logger.error(f"Error fetching watchlist: {e}")
             return []
     
+    def _save_watchlist_prices(self, quotes: Dict[str, Dict]) -> None:
+        """
+        Persist last prices of watchlist positions.
+
+        PositionThread only writes State 1+ prices; the GUI reads State 0
+        prices from the database when it streams quotes from the service.
+        """
+        prices = {
+            symbol: quote.get('last') or quote.get('price')
+            for symbol, quote in quotes.items()
+        }
+        if not self.db_session_factory or not any(prices.values()):
+            return
+        
+        try:
+            session = self.db_session_factory()
+            try:
+                from canslim_monitor.data.repositories import PositionRepository
+                PositionRepository(session).bulk_update_prices(prices, datetime.now(), min_state=0)
+                session.commit()
+            finally:
+                session.close()
+        except Exception as e:
+            self.logger.warning(f"Error saving watchlist prices: {e}")
+    
     def _save_pivot_status_updates(self, updates: List[Dict]) -> None:
         """
         Save pivot status updates to database.
@@ -327,43 +489,21 @@ class BreakoutThread(BaseThread):
         except Exception as e:
             self.logger.warning(f"Error saving pivot status updates: {e}")
     
-    def _check_position(self, pos: Position) -> Optional[bool]:
+    def _check_volume(self, pos: Position, price_data: Dict):
         """
-        Check a single position for breakout conditions.
-        
-        Returns True if an alert was generated, None otherwise.
+        Average volume, expected volume so far today, and whether the quoted
+        volume looks invalid (IBKR snapshot mode often returns 0 or garbage).
         """
-        symbol = pos.symbol
-        pivot = pos.pivot
-        
-        if not symbol or not pivot or pivot <= 0:
-            return None
+        volume = price_data.get('volume') or 0
         
-        # 1. Get current price and volume data from IBKR
-        price_data = self._get_price_data(symbol)
-        if not price_data:
-            self.logger.debug(f"{symbol}: No price data available")
-            return None
-
-        current_price = price_data.get('last', 0)
-        if current_price <= 0:
-            return None
-
-        volume = price_data.get('volume', 0)
-        high = price_data.get('high', current_price)
-        low = price_data.get('low', current_price)
-
-        # 2. Get average volume FIRST (needed for validity check)
         avg_volume = getattr(pos, 'avg_volume_50d', None)
         if not avg_volume or avg_volume <= 0:
             avg_volume = price_data.get('avg_volume', 0)
         if not avg_volume or avg_volume <= 0:
             avg_volume = 500000  # Default
-
-        # 1b. Check if IBKR volume seems valid by comparing to expected volume at this time
-        # IBKR snapshot mode often returns 0 or garbage values
+        
         volume_available = price_data.get('volume_available', False)
-
+        
         # Calculate expected volume at this time of day (rough estimate)
         et_tz = pytz.timezone('America/New_York')
         now_et = datetime.now(et_tz)
@@ -374,29 +514,62 @@ class BreakoutThread(BaseThread):
             expected_volume = avg_volume * day_fraction
         else:
             expected_volume = avg_volume * 0.1  # Pre-market: expect 10%
-
+        
         # Volume is suspect if it's less than 5% of expected, or below 1000 shares
         volume_seems_invalid = (
             not volume_available or
             volume < 1000 or
             (expected_volume > 10000 and volume < expected_volume * 0.05)
         )
+        return avg_volume, expected_volume, volume_seems_invalid
+    
+    def _evaluate_position(
+        self,
+        pos: Position,
+        price_data: Optional[Dict],
+        tech_data: Optional[Dict] = None,
+        intraday: Optional[Dict] = None
+    ) -> Optional[bool]:
+        """
+        Check a single position for breakout conditions against prefetched data.
+        
+        Args:
+            pos: Watchlist position
+            price_data: Quote dict (last, volume, high, low, ...)
+            tech_data: TechnicalDataService dict (ema_21, ma_50, ...)
+            intraday: Massive intraday volume, fetched when the quote volume is suspect
+        
+        Returns True if an alert was generated, None otherwise.
+        """
+        symbol = pos.symbol
+        pivot = pos.pivot
+        
+        if not symbol or not pivot or pivot <= 0:
+            return None
+        
+        if not price_data:
+            self.logger.debug(f"{symbol}: No price data available")
+            return None
 
-        # Fetch MA data from TechnicalDataService and merge into price_data
-        if self.technical_service:
-            try:
-                tech_data = self.technical_service.get_technical_data(symbol)
-                if tech_data:
-                    # Use EMA 21 if available, otherwise SMA 21
-                    price_data['ma21'] = tech_data.get('ema_21') or tech_data.get('ma_21', 0)
-                    price_data['ma50'] = tech_data.get('ma_50', 0)
-                    price_data['ma200'] = tech_data.get('ma_200', 0)
-            except Exception as e:
-                self.logger.debug(f"{symbol}: Could not fetch MA data: {e}")
+        current_price = price_data.get('last') or 0
+        if current_price <= 0:
+            return None
+
+        volume = price_data.get('volume') or 0
+        high = price_data.get('high') or current_price
+        low = price_data.get('low') or current_price
+
+        # Average volume and validity of the quoted volume
+        avg_volume, _, volume_seems_invalid = self._check_volume(pos, price_data)
+
+        # Merge MA data from TechnicalDataService
+        if tech_data:
+            # Use EMA 21 if available, otherwise SMA 21
+            price_data['ma21'] = tech_data.get('ema_21') or tech_data.get('ma_21', 0)
+            price_data['ma50'] = tech_data.get('ma_50', 0)
+            price_data['ma200'] = tech_data.get('ma_200', 0)
 
         if volume_seems_invalid and self.volume_service:
-            self.logger.info(f"{symbol}: IBKR volume={volume:,} (expected ~{int(expected_volume):,}), trying Massive...")
-            intraday = self._get_intraday_volume_fallback(symbol)
             if intraday and intraday.get('cumulative_volume', 0) > volume:
                 volume = intraday.get('cumulative_volume', 0)
                 # Also use Massive data for high/low if available
@@ -554,15 +727,14 @@ class BreakoutThread(BaseThread):
         grade = ""
         
         # Try dynamic scoring first (matches GUI behavior)
-        if self.canslim_scorer and self.volume_service:
+        if self.canslim_scorer and self.profile_cache:
             try:
-                # Get historical data for the symbol
-                daily_df = self.volume_service.get_dataframe(symbol, days=200)
+                # Daily-bar factors come from the cache (rebuilt when new
+                # bars land); only the live-price factor is scored here
+                base_length = self.canslim_scorer.base_length_weeks(pos.base_length or 7)
+                profile = self.profile_cache.get(symbol, base_length)
                 
-                # Get SPY data for RS Trend calculation (cached)
-                spy_df = self._get_spy_dataframe()
-                
-                if daily_df is not None and len(daily_df) >= 50:
+                if profile is not None:
                     # Build position data dict
                     position_data = {
                         'symbol': symbol,
@@ -582,9 +754,9 @@ class BreakoutThread(BaseThread):
                     # Calculate score WITH dynamic factors
                     total_score, grade, details = self.canslim_scorer.calculate_score_with_dynamic(
                         position_data=position_data,
-                        daily_df=daily_df,
-                        index_df=spy_df,
-                        market_regime=market_regime
+                        daily_df=None,
+                        market_regime=market_regime,
+                        profile=reprice_profile(profile, current_price),
                     )
                     
                     static_score = details.get('static_score', 0)
@@ -982,7 +1154,13 @@ class BreakoutThread(BaseThread):
             self.logger.error(f"Failed to send Discord alert: {e}")
     
     def _get_price_data(self, symbol: str) -> Optional[Dict]:
-        """Get current price data from realtime provider (or IBKR fallback)."""
+        """Get current price data from the quote book, realtime provider, or IBKR fallback."""
+        # Streamed quote costs no network round trip
+        if self.quote_book is not None:
+            quote = self.quote_book.get(symbol, max_age=self.quote_max_age)
+            if quote and quote.last > 0:
+                return quote.to_dict()
+
         # Prefer provider abstraction — returns canonical Quote → dict
         if self.realtime_provider and self.realtime_provider.is_connected():
             try:
@@ -1011,6 +1189,7 @@ class BreakoutThread(BaseThread):
                     return float(val)
                 
                 contract = Stock(symbol, 'SMART', 'USD')
+                cached = self._contract_cache.get(symbol)
                 
                 # Use synchronous qualification - ensure we're in IB's event loop context
                 # by letting ib_insync handle the async internally via sleep()
@@ -1018,12 +1197,21 @@ class BreakoutThread(BaseThread):
                     # First, give the event loop a chance to process
                     self.ibkr_client.sleep(0)
                     
-                    # Qualify the contract - this schedules into the event loop
-                    qualified = self.ibkr_client.qualifyContracts(contract)
-                    
-                    if not qualified or not qualified[0].conId:
-                        self.logger.debug(f"{symbol}: Contract qualification failed")
-                        return None
+                    if cached:
+                        # Known conId - skip the qualification round trip
+                        contract.conId = cached['con_id']
+                        if cached.get('primary_exchange'):
+                            contract.primaryExchange = cached['primary_exchange']
+                    else:
+                        # Qualify the contract - this schedules into the event loop
+                        qualified = self.ibkr_client.qualifyContracts(contract)
+                        
+                        if not qualified or not qualified[0].conId:
+                            self.logger.debug(f"{symbol}: Contract qualification failed")
+                            return None
+                        
+                        self._contract_cache.put(symbol, qualified[0])
+                        self._contract_cache.flush()
                     
                     # Request snapshot data (True = snapshot, no subscription needed)
                     # NOTE: Generic tick types (like '233') are NOT compatible with snapshot mode
@@ -1047,6 +1235,10 @@ class BreakoutThread(BaseThread):
                 
                 if last_price <= 0:
                     self.logger.debug(f"{symbol}: No valid price data received")
+                    if cached:
+                        # Cached conId may be stale - re-qualify next cycle
+                        self._contract_cache.invalidate(symbol, "(no data for cached contract)")
+                        self._contract_cache.flush()
                     return None
                 
                 # Debug logging for volume data
@@ -1210,35 +1402,6 @@ class BreakoutThread(BaseThread):
         else:
             return float(base_rank)
     
-    def _get_spy_dataframe(self) -> Optional['pd.DataFrame']:
-        """
-        Get SPY historical data for RS Trend calculation.
-        Caches result for 4 hours to minimize database queries.
-        
-        Returns:
-            DataFrame with SPY OHLCV data, or None if unavailable
-        """
-        # Check cache validity
-        if (self._spy_df_cache is not None and 
-            self._spy_df_cache_time and
-            (datetime.now() - self._spy_df_cache_time) < self._spy_cache_duration):
-            return self._spy_df_cache
-        
-        # Fetch fresh SPY data
-        if self.volume_service:
-            try:
-                self._spy_df_cache = self.volume_service.get_dataframe('SPY', days=200)
-                self._spy_df_cache_time = datetime.now()
-                
-                if self._spy_df_cache is not None:
-                    self.logger.debug(f"Cached SPY data: {len(self._spy_df_cache)} bars")
-                    
-            except Exception as e:
-                self.logger.warning(f"Could not fetch SPY data for RS Trend: {e}")
-                self._spy_df_cache = None
-        
-        return self._spy_df_cache
-    
     def _update_market_regime(self):
         """Update cached market regime from database."""
         # Cache for 5 minutes
@@ -1297,5 +1460,9 @@ class BreakoutThread(BaseThread):
             'has_position_sizer': self.position_sizer is not None,
             'has_alert_service': self.alert_service is not None,
             'has_volume_service': self.volume_service is not None,
+            'fetch_workers': self.fetch_workers,
+            'last_quote_fallbacks': self._last_quote_fallbacks,
+            'last_intraday_fallbacks': self._last_intraday_fallbacks,
+            'profile_cache': self.profile_cache.get_stats() if self.profile_cache else None,
         })
         return stats
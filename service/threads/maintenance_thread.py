@@ -9,13 +9,15 @@ Runs after market close to update data for the next trading day.
 
 import logging
 import shutil
-from datetime import datetime, time
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 import pytz
 
 from .base_thread import BaseThread
+from ...data.backup import DEFAULT_STEP_PAGES, SnapshotStore, online_backup
 
 
 class MaintenanceThread(BaseThread):
@@ -36,11 +38,12 @@ class MaintenanceThread(BaseThread):
     DEFAULT_RUN_MINUTE = 0
 
     # Default cleanup settings
-    DEFAULT_BARS_DAYS_TO_KEEP = 200  # Keep more for backtesting/ML work
+    DEFAULT_BARS_DAYS_TO_KEEP = 400  # >250 trading days for the 200-day MA bar store
 
     # Default backup settings
     DEFAULT_BACKUP_COUNT = 7  # Keep 7 daily backups
     DEFAULT_BACKUP_DIR = None  # Same directory as database
+    DEFAULT_BACKUP_MODE = 'online'  # online, incremental or copy
 
     def __init__(
         self,
@@ -52,6 +55,8 @@ class MaintenanceThread(BaseThread):
         logger: Optional[logging.Logger] = None,
         # Provider abstraction layer (Phase 6)
         historical_provider=None,
+        # Breakout scoring profiles, rebuilt from the new bars
+        profile_cache=None,
     ):
         super().__init__(
             name="maintenance",
@@ -66,6 +71,7 @@ class MaintenanceThread(BaseThread):
         if historical_provider and hasattr(historical_provider, 'client'):
             self.polygon_client = historical_provider.client
         self.config = config or {}
+        self.profile_cache = profile_cache
 
         # Configuration
         maintenance_config = self.config.get('maintenance', {})
@@ -84,6 +90,8 @@ class MaintenanceThread(BaseThread):
         # Backup settings
         self.backup_count = maintenance_config.get('backup_count', self.DEFAULT_BACKUP_COUNT)
         self.backup_dir = maintenance_config.get('backup_dir', self.DEFAULT_BACKUP_DIR)
+        self.backup_mode = maintenance_config.get('backup_mode', self.DEFAULT_BACKUP_MODE)
+        self.backup_step_pages = maintenance_config.get('backup_step_pages', DEFAULT_STEP_PAGES)
 
         # Get database path from config for backup
         self.db_path = self.config.get('database', {}).get('path')
@@ -94,7 +102,7 @@ class MaintenanceThread(BaseThread):
         self.logger.info(
             f"Maintenance thread initialized. Run time: {self.run_hour}:{self.run_minute:02d} ET, "
             f"volume_update={self.enable_volume_update}, earnings_update={self.enable_earnings_update}, "
-            f"backup={self.enable_backup}, bars_keep={self.bars_days_to_keep} days"
+            f"backup={self.enable_backup} ({self.backup_mode}), bars_keep={self.bars_days_to_keep} days"
         )
 
     def _should_run(self) -> bool:
@@ -135,6 +143,7 @@ class MaintenanceThread(BaseThread):
             'earnings_update': None,
             'cleanup': None,
             'backup': None,
+            'profile_warm': None,
         }
 
         # Backup database first (before any modifications)
@@ -169,6 +178,14 @@ class MaintenanceThread(BaseThread):
                 self.logger.error(f"Cleanup failed: {e}", exc_info=True)
                 results['cleanup'] = {'error': str(e)}
 
+        # Precompute breakout scoring profiles so intraday alerts hit the cache
+        if self.profile_cache is not None:
+            try:
+                results['profile_warm'] = self._warm_profile_cache()
+            except Exception as e:
+                self.logger.error(f"Profile cache warm failed: {e}", exc_info=True)
+                results['profile_warm'] = {'error': str(e)}
+
         # Mark as run for today
         self._last_run_date = now_et.date()
 
@@ -209,25 +226,40 @@ class MaintenanceThread(BaseThread):
 
         self.logger.info(f"Updating volume data for {len(symbols)} symbols")
 
-        success = 0
-        failed = 0
-
-        for symbol in symbols:
-            try:
-                result = volume_service.update_symbol(symbol, days=50)
-                if result.success:
-                    success += 1
-                    self.logger.debug(f"{symbol}: avg_vol={result.avg_volume_50d:,}")
-                else:
-                    failed += 1
-                    self.logger.warning(f"{symbol}: {result.error}")
-            except Exception as e:
-                failed += 1
-                self.logger.error(f"{symbol}: {e}")
+        # Fetched bars stream straight into one chunked bulk upsert
+        results = volume_service.update_symbols(symbols, days=50)
+        success = sum(1 for r in results.values() if r.success)
+        failed = len(symbols) - success
+        for symbol, result in results.items():
+            if not result.success:
+                self.logger.warning(f"{symbol}: {result.error}")
 
-        self.logger.info(f"Volume update complete: {success}/{len(symbols)} successful")
         return {'symbols': len(symbols), 'success': success, 'failed': failed}
 
+    def _warm_profile_cache(self) -> Dict[str, Any]:
+        """Build technical profiles for all watchlist symbols from the stored bars."""
+        if not self.db_session_factory:
+            return {'skipped': 'missing dependencies'}
+
+        from ...utils.scoring import CANSLIMScorer
+
+        session = self.db_session_factory()
+        try:
+            from ...data.models import Position
+            rows = session.query(Position.symbol, Position.base_length).filter(
+                Position.state == 0
+            ).all()
+        finally:
+            session.close()
+
+        # Same base length the breakout thread scores with
+        base_lengths = {
+            symbol: CANSLIMScorer.base_length_weeks(base_length or 7)
+            for symbol, base_length in rows
+        }
+        built = self.profile_cache.warm(list(base_lengths), base_lengths)
+        return {'symbols': len(base_lengths), 'built': built, **self.profile_cache.get_stats()}
+
     def _update_earnings_dates(self) -> Dict[str, Any]:
         """Update earnings dates for positions missing or past dates."""
         if not self.db_session_factory or not self.polygon_client:
@@ -308,7 +340,14 @@ class MaintenanceThread(BaseThread):
 
     def _backup_database(self) -> Dict[str, Any]:
         """
-        Create a backup of the database file.
+        Create a backup of the database.
+
+        backup_mode:
+            online       consistent copy via SQLite's online backup API, in
+                         paged steps so the service keeps writing (default)
+            incremental  compressed snapshot that stores only the page
+                         chunks changed since the previous one
+            copy         plain file copy (legacy; may miss -wal pages)
 
         Maintains a rotating set of backups based on backup_count setting.
         """
@@ -330,28 +369,47 @@ class MaintenanceThread(BaseThread):
         # Create backup directory if it doesn't exist
         backup_dir.mkdir(parents=True, exist_ok=True)
 
+        if self.backup_mode == 'incremental':
+            return self._snapshot_database(db_file, backup_dir / 'snapshots')
+
         # Generate backup filename with timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_name = f"{db_file.stem}_{timestamp}{db_file.suffix}"
         backup_path = backup_dir / backup_name
 
-        self.logger.info(f"Creating database backup: {backup_path}")
+        self.logger.info(f"Creating database backup ({self.backup_mode}): {backup_path}")
 
         try:
-            # Copy database file
-            shutil.copy2(db_file, backup_path)
-            backup_size = backup_path.stat().st_size
+            if self.backup_mode == 'copy':
+                start = time.perf_counter()
+                shutil.copy2(db_file, backup_path)
+                stats = {
+                    'duration_s': round(time.perf_counter() - start, 3),
+                    'bytes_written': backup_path.stat().st_size,
+                }
+            else:
+                result = online_backup(db_file, backup_path, step_pages=self.backup_step_pages)
+                stats = {
+                    'duration_s': round(result.duration_s, 3),
+                    'bytes_written': result.bytes_written,
+                    'pages_copied': result.pages,
+                    'restarts': result.restarts,
+                }
+            backup_size = stats['bytes_written']
 
             self.logger.info(
-                f"Backup created: {backup_name} ({backup_size / 1024 / 1024:.1f} MB)"
+                f"Backup created: {backup_name} ({backup_size / 1024 / 1024:.1f} MB "
+                f"in {stats['duration_s']:.2f}s)"
             )
 
             # Rotate old backups
             deleted_backups = self._rotate_backups(backup_dir, db_file.stem, db_file.suffix)
 
             return {
+                'mode': self.backup_mode,
                 'backup_path': str(backup_path),
                 'backup_size_mb': round(backup_size / 1024 / 1024, 2),
+                **stats,
                 'deleted_old_backups': deleted_backups
             }
 
@@ -359,6 +417,37 @@ class MaintenanceThread(BaseThread):
             self.logger.error(f"Database backup failed: {e}")
             return {'error': str(e)}
 
+    def _snapshot_database(self, db_file: Path, snapshot_dir: Path) -> Dict[str, Any]:
+        """Incremental backup: deduplicated snapshot, rotated to backup_count."""
+        store = SnapshotStore(snapshot_dir)
+        try:
+            result = store.create(db_file, step_pages=self.backup_step_pages)
+            deleted, removed_chunks = store.rotate(self.backup_count, name=db_file.stem)
+
+            self.logger.info(
+                f"Snapshot created: {Path(result.path).name} ({result.new_chunks}/{result.chunks} "
+                f"chunks new, {result.bytes_written / 1024 / 1024:.1f} MB written "
+                f"in {result.duration_s:.2f}s)"
+            )
+            if deleted:
+                self.logger.info(f"Rotated {deleted} old snapshot(s), {removed_chunks} unused chunk(s) removed")
+
+            return {
+                'mode': self.backup_mode,
+                'backup_path': result.path,
+                'duration_s': round(result.duration_s, 3),
+                'bytes_written': result.bytes_written,
+                'pages_copied': result.pages,
+                'restarts': result.restarts,
+                'chunks': result.chunks,
+                'new_chunks': result.new_chunks,
+                'deleted_old_backups': deleted,
+            }
+
+        except Exception as e:
+            self.logger.error(f"Database snapshot failed: {e}")
+            return {'error': str(e)}
+
     def _rotate_backups(
         self,
         backup_dir: Path,
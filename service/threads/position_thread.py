@@ -13,12 +13,13 @@ from typing import Optional, List, Any, Dict
 from datetime import datetime
 
 from .base_thread import BaseThread
-from canslim_monitor.core.position_monitor import PositionMonitor
+from canslim_monitor.core.position_monitor import PositionMonitor, MonitorStateStore
 from canslim_monitor.services.alert_service import (
     AlertService, AlertType, AlertSubtype, AlertContext, AlertData
 )
 from canslim_monitor.services.technical_data_service import TechnicalDataService
 from canslim_monitor.utils.config import get_config
+from canslim_monitor.utils.shared_rate_limit import RatePriority
 
 
 class PositionThread(BaseThread):
@@ -38,6 +39,8 @@ class PositionThread(BaseThread):
         - Update health scores
         - Track max gain/drawdown
     """
+
+    api_priority = RatePriority.HIGH   # Pre-empts GUI and background API calls
     
     def __init__(
         self,
@@ -50,12 +53,17 @@ class PositionThread(BaseThread):
         logger: Optional[logging.Logger] = None,
         # Provider abstraction layer (Phase 6)
         realtime_provider=None,
+        # Shared streaming quote book (read before polling)
+        quote_book=None,
+        # Batched alert writes / background Discord delivery
+        alert_outbox=None,
     ):
         super().__init__(
             name="position",
             shutdown_event=shutdown_event,
             poll_interval=poll_interval,
-            logger=logger or logging.getLogger('canslim.position')
+            logger=logger or logging.getLogger('canslim.position'),
+            market_hours_only=True
         )
         
         self.db_session_factory = db_session_factory
@@ -65,6 +73,10 @@ class PositionThread(BaseThread):
         # Provider abstraction layer — prefers provider over raw client
         self.realtime_provider = realtime_provider
         
+        # Streamed quotes older than this fall back to polling
+        self.quote_book = quote_book
+        self.quote_max_age = 2 * poll_interval
+        
         # Load config
         if config is None:
             config = get_config()
@@ -87,6 +99,7 @@ class PositionThread(BaseThread):
             enable_suppression=alert_config.get('enable_suppression', True),
             alert_routing=alert_config.get('alert_routing', {}),
             logger=logging.getLogger('canslim.alerts'),
+            outbox=alert_outbox,
         )
         
         # Log cooldown status
@@ -110,12 +123,20 @@ class PositionThread(BaseThread):
         self.technical_service = TechnicalDataService(
             polygon_api_key=polygon_key,
             cache_duration_hours=4,  # Refresh MAs every 4 hours
+            db_session_factory=db_session_factory,
             logger=logging.getLogger('canslim.technical_data'),
         )
         
-        # Track max prices for trailing stop calculation
-        self._max_prices: Dict[str, float] = {}
-        self._max_gains: Dict[str, float] = {}
+        # Track max prices for trailing stop calculation. These and the
+        # checkers' cooldowns are checkpointed once per cycle so a restart
+        # keeps trailing stops and doesn't re-fire cooled-down alerts.
+        self.state_store = MonitorStateStore(db_session_factory, logger=self.logger)
+        loaded = self.state_store.load()
+        self._max_prices: Dict[str, float] = self.state_store.map('max_price')
+        self._max_gains: Dict[str, float] = self.state_store.map('max_gain')
+        self.position_monitor.attach_state_store(self.state_store)
+        if loaded:
+            self.logger.info(f"Restored {loaded} monitor state values")
     
     def _should_run(self) -> bool:
         """Only run during market hours."""
@@ -137,6 +158,7 @@ class PositionThread(BaseThread):
             
             # Get price data for all symbols
             symbols = [p.symbol for p in positions]
+            self._prune_tracking(symbols)
             price_data = self._get_prices(symbols)
             
             if not price_data:
@@ -185,6 +207,9 @@ class PositionThread(BaseThread):
         except Exception as e:
             self.logger.error(f"Error in position cycle: {e}", exc_info=True)
             raise
+        finally:
+            # One batched write for this cycle's high-water marks and cooldowns
+            self.state_store.flush()
     
     def _get_active_positions(self) -> List:
         """Get all State 1+ positions from database."""
@@ -205,7 +230,57 @@ class PositionThread(BaseThread):
             return []
     
     def _get_prices(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
-        """Get current prices and volume from realtime provider (or IBKR fallback)."""
+        """Get current prices, reading the streaming quote book first.
+
+        Only symbols without a fresh streamed quote are polled from the
+        realtime provider (or IBKR fallback).
+        """
+        price_data = {}
+        if self.quote_book is not None:
+            for symbol, quote in self.quote_book.get_many(symbols, max_age=self.quote_max_age).items():
+                entry = self._build_price_entry(symbol, quote.to_dict())
+                if entry:
+                    price_data[symbol] = entry
+
+        missing = [s for s in symbols if s not in price_data]
+        if missing:
+            if price_data:
+                self.logger.debug(
+                    f"Quote book: {len(price_data)} streamed, polling {len(missing)}"
+                )
+            price_data.update(self._fetch_prices(missing))
+        return price_data
+
+    def _build_price_entry(self, symbol: str, quote: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Convert a quote dict to a price_data entry and track the max price."""
+        if not quote or (quote.get('last') or 0) <= 0:
+            return None
+
+        price = quote['last']
+        volume = quote.get('volume') or 0
+
+        # Calculate volume ratio using quote data
+        avg_volume = quote.get('avg_volume') or 500000
+        volume_ratio = volume / avg_volume if avg_volume > 0 else 1.0
+
+        # Track max price for trailing stop
+        max_price = self._max_prices.get(symbol)
+        if max_price is None or price > max_price:
+            self._max_prices[symbol] = price
+            max_price = price
+
+        return {
+            'price': price,
+            'volume_ratio': volume_ratio,
+            'max_price': max_price,
+            'max_gain_pct': self._max_gains.get(symbol, 0),
+            'high': quote.get('high') or price,
+            'low': quote.get('low') or price,
+            'open': quote.get('open') or price,
+        }
+
+    def _fetch_prices(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Poll current prices and volume from realtime provider (or IBKR fallback)."""
         # Prefer provider abstraction — returns canonical Quote objects
         if self.realtime_provider and self.realtime_provider.is_connected():
             try:
@@ -214,27 +289,9 @@ class PositionThread(BaseThread):
                     price_data = {}
                     for symbol, quote in provider_quotes.items():
                         if quote:
-                            qd = quote.to_dict()
-                            if qd.get('last', 0) > 0:
-                                price = qd['last']
-                                volume = qd.get('volume', 0)
-                                avg_volume = qd.get('avg_volume', 500000)
-                                volume_ratio = volume / avg_volume if avg_volume > 0 else 1.0
-
-                                max_price = self._max_prices.get(symbol, price)
-                                if price > max_price:
-                                    self._max_prices[symbol] = price
-                                    max_price = price
-
-                                price_data[symbol] = {
-                                    'price': price,
-                                    'volume_ratio': volume_ratio,
-                                    'max_price': max_price,
-                                    'max_gain_pct': self._max_gains.get(symbol, 0),
-                                    'high': qd.get('high', price),
-                                    'low': qd.get('low', price),
-                                    'open': qd.get('open', price),
-                                }
+                            entry = self._build_price_entry(symbol, quote.to_dict())
+                            if entry:
+                                price_data[symbol] = entry
                     if price_data:
                         return price_data
             except Exception as e:
@@ -250,29 +307,9 @@ class PositionThread(BaseThread):
             try:
                 quotes = self.ibkr_client.get_quotes(symbols)
                 for symbol, quote in quotes.items():
-                    if quote and quote.get('last', 0) > 0:
-                        price = quote['last']
-                        volume = quote.get('volume', 0)
-                        
-                        # Calculate volume ratio using quote data
-                        avg_volume = quote.get('avg_volume', 500000)
-                        volume_ratio = volume / avg_volume if avg_volume > 0 else 1.0
-                        
-                        # Track max price for trailing stop
-                        max_price = self._max_prices.get(symbol, price)
-                        if price > max_price:
-                            self._max_prices[symbol] = price
-                            max_price = price
-                        
-                        price_data[symbol] = {
-                            'price': price,
-                            'volume_ratio': volume_ratio,
-                            'max_price': max_price,
-                            'max_gain_pct': self._max_gains.get(symbol, 0),
-                            'high': quote.get('high', price),
-                            'low': quote.get('low', price),
-                            'open': quote.get('open', price),
-                        }
+                    entry = self._build_price_entry(symbol, quote)
+                    if entry:
+                        price_data[symbol] = entry
                 
                 if price_data:
                     return price_data
@@ -289,28 +326,10 @@ class PositionThread(BaseThread):
                 else:
                     self.logger.warning(f"IBKR client has no get_quote method")
                     continue
-                    
-                if quote and quote.get('last', 0) > 0:
-                    price = quote['last']
-                    volume = quote.get('volume', 0)
-                    avg_volume = quote.get('avg_volume', 500000)
-                    volume_ratio = volume / avg_volume if avg_volume > 0 else 1.0
-                    
-                    # Track max price for trailing stop
-                    max_price = self._max_prices.get(symbol, price)
-                    if price > max_price:
-                        self._max_prices[symbol] = price
-                        max_price = price
-                    
-                    price_data[symbol] = {
-                        'price': price,
-                        'volume_ratio': volume_ratio,
-                        'max_price': max_price,
-                        'max_gain_pct': self._max_gains.get(symbol, 0),
-                        'high': quote.get('high', price),
-                        'low': quote.get('low', price),
-                        'open': quote.get('open', price),
-                    }
+                
+                entry = self._build_price_entry(symbol, quote)
+                if entry:
+                    price_data[symbol] = entry
                     
             except Exception as e:
                 self.logger.debug(f"Could not get price for {symbol}: {e}")
@@ -372,8 +391,13 @@ class PositionThread(BaseThread):
             except Exception as e:
                 self.logger.debug(f"Could not fetch market regime: {e}")
 
-        # Try to get SPY price from IBKR
-        if self.ibkr_client:
+        # SPY from the streaming quote book, else poll IBKR
+        if self.quote_book is not None:
+            spy_quote = self.quote_book.get('SPY', max_age=self.quote_max_age)
+            if spy_quote and spy_quote.last > 0:
+                spy_price = spy_quote.last
+
+        if not spy_price and self.ibkr_client:
             try:
                 if hasattr(self.ibkr_client, 'get_quote'):
                     spy_quote = self.ibkr_client.get_quote('SPY')
@@ -482,14 +506,14 @@ class PositionThread(BaseThread):
                 from canslim_monitor.data.repositories import PositionRepository
                 repo = PositionRepository(session)
                 
+                prices = {}
                 for position in positions:
                     symbol = position.symbol
                     price_info = price_data.get(symbol, {})
                     price = price_info.get('price')
                     
                     if price:
-                        # Update last price
-                        repo.update_price(position, price, datetime.now())
+                        prices[symbol] = price
                         
                         # Update max gain tracking
                         # Use avg_cost if set, otherwise fall back to e1_price
@@ -500,6 +524,8 @@ class PositionThread(BaseThread):
                             if gain_pct > current_max:
                                 self._max_gains[symbol] = gain_pct
                 
+                # Last price and P&L for every position in one UPDATE
+                repo.bulk_update_prices(prices, datetime.now(), min_state=1)
                 session.commit()
                 
             finally:
@@ -508,6 +534,13 @@ class PositionThread(BaseThread):
         except Exception as e:
             self.logger.error(f"Error updating position tracking: {e}")
     
+    def _prune_tracking(self, active_symbols: List[str]):
+        """Drop high-water marks of symbols no longer held."""
+        active = set(active_symbols)
+        for tracked in (self._max_prices, self._max_gains):
+            for symbol in [s for s in tracked if s not in active]:
+                tracked.pop(symbol)
+
     def reset_tracking(self, symbol: str = None):
         """
         Reset max price/gain tracking.
@@ -0,0 +1,116 @@
+"""
+CANSLIM Monitor - Quote Stream Thread
+Keeps one streaming market data subscription per monitored symbol and
+feeds the shared QuoteBook.
+
+Every sync cycle the thread reads the symbols that should be streaming
+(active positions, market indices, then the watchlist), subscribes the
+new ones and unsubscribes the ones that left - so subscriptions follow
+positions as they change state without any other thread polling.
+"""
+
+import logging
+from typing import Optional, List, Any, Dict
+
+from .base_thread import BaseThread
+from canslim_monitor.providers.quote_book import QuoteBook
+
+
+class QuoteStreamThread(BaseThread):
+    """
+    Maintains streaming subscriptions for the quote book.
+
+    Scope: State 0+ positions plus index ETFs
+    Priority (when capped by max_lines):
+        1. Active positions (State 1+)
+        2. Market indices (SPY, QQQ, ...)
+        3. Watchlist (State 0)
+    """
+
+    DEFAULT_INDICES = ['SPY', 'QQQ', 'DIA', 'IWM']
+    DEFAULT_MAX_LINES = 90      # IBKR default allowance is 100 simultaneous lines
+
+    def __init__(
+        self,
+        shutdown_event,
+        quote_book: QuoteBook,
+        realtime_provider,
+        poll_interval: int = 30,
+        db_session_factory=None,
+        config: Dict[str, Any] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        super().__init__(
+            name="quote_stream",
+            shutdown_event=shutdown_event,
+            poll_interval=poll_interval,
+            logger=logger or logging.getLogger('canslim.quote_stream')
+        )
+
+        self.quote_book = quote_book
+        self.realtime_provider = realtime_provider
+        self.db_session_factory = db_session_factory
+        self.config = config or {}
+
+        self.indices = self.config.get('indices', self.DEFAULT_INDICES)
+        self.max_lines = self.config.get('max_lines', self.DEFAULT_MAX_LINES)
+
+    def _do_work(self):
+        """Reconcile open streams with the monitored symbol set."""
+        if not self.realtime_provider or not self.realtime_provider.is_connected():
+            self.logger.debug("Realtime provider not connected, skipping stream sync")
+            return
+
+        self.sync(self._get_desired_symbols())
+
+    def sync(self, desired: List[str]):
+        """Subscribe new symbols and unsubscribe ones no longer wanted."""
+        current = set(self.realtime_provider.get_subscriptions())
+        wanted = set(desired)
+
+        removed = sorted(current - wanted)
+        added = [s for s in desired if s not in current]
+
+        if removed:
+            self.realtime_provider.unsubscribe(removed)
+            self.quote_book.remove(removed)
+            self.logger.info(f"Stopped streaming {len(removed)} symbols: {', '.join(removed)}")
+
+        if added:
+            if self.realtime_provider.subscribe(added, self.quote_book.update):
+                self.logger.info(f"Streaming {len(added)} new symbols")
+            else:
+                self.logger.warning(f"Could not subscribe {len(added)} symbols")
+
+    def _get_desired_symbols(self) -> List[str]:
+        """Monitored symbols in priority order, capped at max_lines."""
+        active, watching = [], []
+
+        if self.db_session_factory:
+            try:
+                session = self.db_session_factory()
+                try:
+                    from canslim_monitor.data.repositories import PositionRepository
+                    repo = PositionRepository(session)
+                    active = [p.symbol for p in repo.get_in_position()]
+                    watching = [p.symbol for p in repo.get_watching()]
+                finally:
+                    session.close()
+            except Exception as e:
+                self.logger.warning(f"Could not load monitored symbols: {e}")
+
+        ordered = list(dict.fromkeys(active + list(self.indices) + watching))
+        if len(ordered) > self.max_lines:
+            self.logger.debug(
+                f"{len(ordered)} symbols exceed {self.max_lines} stream lines; "
+                f"{len(ordered) - self.max_lines} watchlist names left to polling"
+            )
+        return ordered[:self.max_lines]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Thread stats plus stream/book size."""
+        stats = super().get_stats()
+        stats['streams'] = len(self.realtime_provider.get_subscriptions()) if self.realtime_provider else 0
+        stats['book_size'] = len(self.quote_book)
+        stats['book_sequence'] = self.quote_book.sequence
+        return stats
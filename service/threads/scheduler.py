@@ -0,0 +1,89 @@
+"""
+CANSLIM Monitor - Fixed-Rate Scheduler
+Wall-clock cadence for BaseThread cycles.
+
+Deadlines are laid out on a fixed grid (start + phase + k * period), so a
+30s thread runs every 30s regardless of how long each cycle takes. A cycle
+that overruns one or more deadlines skips them (counted as missed) rather
+than running them back to back. The random phase offset keeps threads with
+the same or harmonic periods (position 30s, breakout 60s, market 300s) from
+hitting IBKR at the same instant.
+"""
+
+import random
+import time
+from typing import Callable, Optional
+
+
+class FixedRateScheduler:
+    """
+    Deadline bookkeeping for a fixed-rate loop.
+
+    Usage:
+        scheduler.start()
+        while running:
+            wait(scheduler.time_until_next())
+            lateness = scheduler.begin_tick()
+            ... work ...
+            skipped = scheduler.advance()
+    """
+
+    def __init__(
+        self,
+        period: float,
+        jitter: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Args:
+            period: Seconds between deadlines
+            jitter: Phase offset is drawn uniformly from [0, jitter) once
+            clock: Monotonic time source (injectable for tests)
+            rng: Random source for the phase
+        """
+        self.period = float(period)
+        self.clock = clock
+        self.phase = (rng or random).uniform(0, jitter) if jitter > 0 else 0.0
+        self._next: Optional[float] = None
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        return self._next
+
+    def start(self, now: float = None):
+        """Anchor the grid: first deadline is now + phase."""
+        now = self.clock() if now is None else now
+        self._next = now + self.phase
+
+    def time_until_next(self, now: float = None) -> float:
+        """Seconds to wait before the next deadline (0 if due)."""
+        now = self.clock() if now is None else now
+        return max(0.0, self._next - now)
+
+    def begin_tick(self, now: float = None) -> float:
+        """Mark the start of a cycle. Returns lateness vs. its deadline (seconds)."""
+        now = self.clock() if now is None else now
+        return max(0.0, now - self._next)
+
+    def advance(self, now: float = None) -> int:
+        """
+        Move to the next deadline after a cycle, skipping any that already
+        passed.
+
+        Returns:
+            Number of deadlines skipped because the cycle overran
+        """
+        now = self.clock() if now is None else now
+        self._next += self.period
+        if now <= self._next:
+            return 0
+
+        skipped = int((now - self._next) // self.period) + 1
+        self._next += skipped * self.period
+        return skipped
+
+    def reanchor(self, delay: float, now: float = None):
+        """Restart the grid *delay* seconds from now (e.g. at market open)."""
+        now = self.clock() if now is None else now
+        self._next = now + delay + self.phase
@@ -0,0 +1,131 @@
+"""
+CANSLIM Monitor - Alert Outbox
+===============================
+Batches alert persistence and Discord delivery off the monitoring threads.
+
+AlertService hands each alert to the outbox instead of opening a session
+and posting to Discord inline. The outbox buffers the Alert row together
+with its ``alert_outbox`` delivery entry; AlertDeliveryThread flushes the
+buffer in one transaction every cycle and then drains PENDING entries
+(rate limited per webhook, retried with back-off).
+
+A position/breakout cycle therefore never waits on SQLite commits or on
+Discord, and an alert that was accepted survives a Discord outage.
+
+Usage:
+    outbox = AlertOutboxWriter(db_session_factory)
+    alert_service = AlertService(db_session_factory, notifier, outbox=outbox)
+    ...
+    outbox.flush()   # normally done by AlertDeliveryThread
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..data.models import Alert, AlertOutbox
+
+
+class AlertOutboxWriter:
+    """
+    Thread-safe buffer of alerts awaiting a batched write.
+
+    enqueue() is called from any monitoring thread and only appends to a
+    list; flush() (delivery worker, and once more at shutdown) writes the
+    whole buffer in a single commit.
+    """
+
+    def __init__(self, db_session_factory, logger: Optional[logging.Logger] = None):
+        self.db_session_factory = db_session_factory
+        self.logger = logger or logging.getLogger('canslim.alerts')
+
+        self._pending: List[Tuple[Alert, Optional[AlertOutbox]]] = []
+        self._lock = threading.Lock()
+
+        self.alerts_written = 0
+        self.entries_written = 0
+        self.flush_errors = 0
+
+    def enqueue(
+        self,
+        alert: Alert,
+        payload: Optional[Dict[str, Any]] = None,
+        channel: str = None,
+        priority: str = 'P1',
+    ):
+        """
+        Buffer an Alert row, plus a delivery entry when payload is given
+        (alerts routed as DB-only have none).
+        """
+        entry = None
+        if payload is not None:
+            created_at = alert.alert_time or datetime.now()
+            entry = AlertOutbox(
+                symbol=alert.symbol,
+                channel=channel or 'system',
+                priority=priority,
+                payload=json.dumps(payload),
+                status='PENDING',
+                attempts=0,
+                next_attempt_at=created_at,
+                created_at=created_at,
+            )
+        with self._lock:
+            self._pending.append((alert, entry))
+
+    def pending_count(self) -> int:
+        """Alerts buffered in memory, not yet written."""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write all buffered alerts and delivery entries in one transaction.
+
+        On failure the batch is put back at the front of the buffer for the
+        next flush.
+
+        Returns:
+            Number of alerts written
+        """
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+
+        if not self.db_session_factory:
+            self.logger.warning(f"No database - dropping {len(batch)} buffered alerts")
+            return 0
+
+        try:
+            session = self.db_session_factory()
+            try:
+                session.add_all([alert for alert, _ in batch])
+                session.flush()  # Assign alert ids for the outbox entries
+
+                entries = 0
+                for alert, entry in batch:
+                    if entry is not None:
+                        entry.alert_id = alert.id
+                        session.add(entry)
+                        entries += 1
+
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+        except Exception as e:
+            self.flush_errors += 1
+            self.logger.error(f"Failed to write {len(batch)} alerts to outbox: {e}")
+            with self._lock:
+                self._pending[:0] = batch
+            return 0
+
+        self.alerts_written += len(batch)
+        self.entries_written += entries
+        return len(batch)
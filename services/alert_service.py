@@ -9,6 +9,7 @@ Handles:
 - Discord routing based on alert type
 - Alert persistence to database
 - Suppression based on market regime
+- Optional outbox: batched writes with Discord delivery on a worker thread
 
 Version: 1.0
 Created: January 15, 2026
@@ -17,7 +18,7 @@ Created: January 15, 2026
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
@@ -182,6 +183,22 @@ class AlertData:
     discord_channel: str = "breakout"  # breakout, position, market, system
     priority: str = "P1"  # P0 (immediate), P1 (normal), P2 (low)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe dict (used for IPC alert pushes)."""
+        return {
+            'symbol': self.symbol,
+            'position_id': self.position_id,
+            'alert_type': self.alert_type.value if hasattr(self.alert_type, 'value') else str(self.alert_type),
+            'subtype': self.subtype.value if hasattr(self.subtype, 'value') else str(self.subtype),
+            'title': self.title,
+            'message': self.message,
+            'action': self.action,
+            'thread_source': self.thread_source,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'priority': self.priority,
+            'context': asdict(self.context),
+        }
+
 
 class AlertService:
     """
@@ -236,7 +253,8 @@ class AlertService:
         enable_cooldown: bool = False,
         enable_suppression: bool = True,
         alert_routing: Dict[str, Any] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        outbox=None
     ):
         """
         Initialize alert service.
@@ -249,9 +267,13 @@ class AlertService:
             enable_suppression: Enable market-based suppression
             alert_routing: Per-subtype routing overrides (discord on/off, log level)
             logger: Logger instance
+            outbox: AlertOutboxWriter - when set, alerts are buffered for a
+                batched write and Discord delivery happens on the delivery
+                worker instead of inline
         """
         self.db_session_factory = db_session_factory
         self.discord_notifier = discord_notifier
+        self.outbox = outbox
         self.cooldown_minutes = cooldown_minutes
         self.enable_cooldown = enable_cooldown
         self.enable_suppression = enable_suppression
@@ -260,6 +282,9 @@ class AlertService:
         # In-memory cooldown cache: {(symbol, type, subtype): last_alert_time}
         self._cooldown_cache: Dict[Tuple[str, str, str], datetime] = {}
 
+        # Callbacks notified of every created alert (e.g. IPC push)
+        self._listeners: List[Callable[[AlertData], None]] = []
+
         # Alert routing overrides (per-subtype Discord + log level control)
         self.load_routing(alert_routing or {})
     
@@ -377,19 +402,40 @@ class AlertService:
         # even if they get converted to SUPPRESSED
         self._update_cooldown(symbol, alert_type, original_subtype)
         
-        # Persist to database (always, regardless of routing)
-        self._persist_alert(alert_data)
-
         # Check routing config before Discord
         subtype_str = alert_data.subtype.value if hasattr(alert_data.subtype, 'value') else str(alert_data.subtype)
+        send_discord = self._should_send_discord(subtype_str)
+
+        if self.outbox is not None:
+            # Buffered write + queued delivery; returns without touching DB or Discord
+            self._enqueue_alert(alert_data, send_discord)
+        else:
+            # Persist to database (always, regardless of routing)
+            self._persist_alert(alert_data)
+            if send_discord:
+                self._send_discord(alert_data)
 
-        if self._should_send_discord(subtype_str):
-            self._send_discord(alert_data)
+        if send_discord:
             self._log_alert(subtype_str, f"[DISCORD] {alert_data.symbol} - {subtype_str}: {alert_data.action}")
         else:
             self._log_alert(subtype_str, f"[DB ONLY] {alert_data.symbol} - {subtype_str}: {alert_data.action}")
 
+        for listener in list(self._listeners):
+            try:
+                listener(alert_data)
+            except Exception as e:
+                self.logger.debug(f"Alert listener failed: {e}")
+
         return alert_data
+
+    def add_listener(self, callback: Callable[[AlertData], None]):
+        """Call *callback(alert_data)* for every alert created (from the caller's thread)."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[AlertData], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
     
     def _is_on_cooldown(
         self,
@@ -483,6 +529,36 @@ class AlertService:
         
         return emoji_map.get(alert_type, "📢")
     
+    def _build_alert_row(self, alert_data: AlertData) -> Alert:
+        """Alert ORM row for alert_data."""
+        return Alert(
+            symbol=alert_data.symbol,
+            position_id=alert_data.position_id,
+            alert_time=alert_data.created_at,
+            alert_type=alert_data.alert_type.value,
+            alert_subtype=alert_data.subtype.value,
+            price=alert_data.context.current_price,
+            message=alert_data.message,  # Full formatted message
+            action=alert_data.action,    # Recommended action
+            state_at_alert=alert_data.context.state_at_alert,
+            pivot_at_alert=alert_data.context.pivot_price,
+            avg_cost_at_alert=alert_data.context.avg_cost,
+            pnl_pct_at_alert=alert_data.context.pnl_pct,
+            ma50=alert_data.context.ma_50,
+            ma21=alert_data.context.ma_21,
+            ma200=alert_data.context.ma_200,
+            volume_ratio=alert_data.context.volume_ratio,
+            health_score=alert_data.context.health_score,
+            health_rating=alert_data.context.health_rating,
+            market_regime=alert_data.context.market_regime,
+            spy_price=alert_data.context.spy_price,
+            canslim_grade=alert_data.context.grade,
+            canslim_score=alert_data.context.score,
+            static_score=alert_data.context.static_score,
+            dynamic_score=alert_data.context.dynamic_score,
+            discord_channel=alert_data.discord_channel,
+        )
+
     def _persist_alert(self, alert_data: AlertData):
         """Save alert to database."""
         if not self.db_session_factory:
@@ -491,33 +567,7 @@ class AlertService:
         try:
             session = self.db_session_factory()
             try:
-                alert = Alert(
-                    symbol=alert_data.symbol,
-                    position_id=alert_data.position_id,
-                    alert_time=alert_data.created_at,
-                    alert_type=alert_data.alert_type.value,
-                    alert_subtype=alert_data.subtype.value,
-                    price=alert_data.context.current_price,
-                    message=alert_data.message,  # Full formatted message
-                    action=alert_data.action,    # Recommended action
-                    state_at_alert=alert_data.context.state_at_alert,
-                    pivot_at_alert=alert_data.context.pivot_price,
-                    avg_cost_at_alert=alert_data.context.avg_cost,
-                    pnl_pct_at_alert=alert_data.context.pnl_pct,
-                    ma50=alert_data.context.ma_50,
-                    ma21=alert_data.context.ma_21,
-                    ma200=alert_data.context.ma_200,
-                    volume_ratio=alert_data.context.volume_ratio,
-                    health_score=alert_data.context.health_score,
-                    health_rating=alert_data.context.health_rating,
-                    market_regime=alert_data.context.market_regime,
-                    spy_price=alert_data.context.spy_price,
-                    canslim_grade=alert_data.context.grade,
-                    canslim_score=alert_data.context.score,
-                    static_score=alert_data.context.static_score,
-                    dynamic_score=alert_data.context.dynamic_score,
-                    discord_channel=alert_data.discord_channel,
-                )
+                alert = self._build_alert_row(alert_data)
                 session.add(alert)
                 session.commit()
                 
@@ -567,6 +617,35 @@ class AlertService:
             
         except Exception as e:
             self.logger.error(f"Failed to send Discord alert: {e}")
+
+    def _enqueue_alert(self, alert_data: AlertData, send_discord: bool):
+        """Hand the alert row (and its Discord payload, if routed) to the outbox."""
+        payload = None
+        if send_discord and self.discord_notifier:
+            try:
+                payload = self._build_discord_payload(alert_data)
+            except Exception as e:
+                self.logger.error(f"Failed to build Discord payload: {e}")
+
+        self.outbox.enqueue(
+            self._build_alert_row(alert_data),
+            payload=payload,
+            channel=alert_data.discord_channel,
+            priority=alert_data.priority,
+        )
+
+    def _build_discord_payload(self, alert_data: AlertData) -> Dict[str, Any]:
+        """Webhook body _send_discord() would post for this alert."""
+        message = alert_data.message or ""
+        payload = {'username': 'CANSLIM Monitor'}
+
+        # Check if message is an embed (starts with EMBED: prefix)
+        if message.strip().startswith("EMBED:"):
+            payload['embeds'] = [json.loads(message.strip()[6:])]
+        else:
+            payload['content'] = self._format_discord_message(alert_data)
+
+        return payload
     
     def _format_discord_message(self, alert_data: AlertData) -> str:
         """
@@ -6,18 +6,31 @@ Fetches and caches technical indicators (MAs, volume) for position monitoring.
 Uses Polygon API for historical data, caches results to minimize API calls.
 Data is refreshed once per day since Polygon free tier is 1-day delayed.
 
+With a ``db_session_factory`` the daily bars are kept in the local
+``historical_bars`` store: a symbol is backfilled once, after which only
+the bars since the last stored ``bar_date`` are downloaded (normally one
+per day). If Polygon is unavailable or rate-limited, MAs are computed
+from whatever is already stored.
+
 Usage:
-    service = TechnicalDataService(polygon_api_key="your_key")
+    service = TechnicalDataService(polygon_api_key="your_key", db_session_factory=db.get_new_session)
     data = service.get_technical_data("NVDA")
     # Returns: {'ma_21': 145.50, 'ma_50': 142.30, 'ma_200': 130.00, ...}
 """
 
 import logging
+import math
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 import threading
 
+try:
+    from canslim_monitor.utils.ma_engine import BarMatrix, compute_indicators
+    MA_ENGINE_AVAILABLE = True
+except ImportError:  # NumPy not installed - per-symbol calculations only
+    MA_ENGINE_AVAILABLE = False
+
 
 @dataclass
 class TechnicalData:
@@ -56,16 +69,20 @@ class TechnicalDataService:
     Service for fetching and caching technical data.
     
     Features:
-    - Fetches daily bars from Polygon API
+    - Fetches daily bars from Polygon API (incremental top-up when a
+      local bar store is available)
     - Calculates MAs (21, 50, 200 daily + 10-week)
     - Caches data for the day (refreshes once per day)
     - Thread-safe for concurrent access
     """
     
+    BARS_NEEDED = 250   # Enough for the 200-day MA
+    
     def __init__(
         self,
         polygon_api_key: str = None,
         cache_duration_hours: int = 4,
+        db_session_factory=None,
         logger: Optional[logging.Logger] = None
     ):
         """
@@ -74,12 +91,20 @@ class TechnicalDataService:
         Args:
             polygon_api_key: Polygon.io API key
             cache_duration_hours: How long to cache data (default 4 hours)
+            db_session_factory: Session factory for the local bar store
+                (None = download the full history on every refresh)
             logger: Logger instance
         """
         self.api_key = polygon_api_key
         self.cache_duration = timedelta(hours=cache_duration_hours)
+        self.db_session_factory = db_session_factory
         self.logger = logger or logging.getLogger('canslim.technical_data')
         
+        # Symbols backfilled this session; short histories (recent IPOs)
+        # are topped up afterwards instead of re-downloaded in full
+        self._backfilled: set = set()
+        self._api_calls = 0
+        
         # Cache: symbol -> TechnicalData
         self._cache: Dict[str, TechnicalData] = {}
         self._cache_lock = threading.Lock()
@@ -142,23 +167,106 @@ class TechnicalDataService:
             symbols: List of stock symbols
             force_refresh: Force fetch for all
             
+        Symbols that need a refresh are computed together in one
+        vectorized pass (see ``utils.ma_engine``) when NumPy is available.
+        
         Returns:
             Dict mapping symbol to technical data dict
         """
+        if not MA_ENGINE_AVAILABLE:
+            results = {}
+            for symbol in symbols:
+                try:
+                    results[symbol] = self.get_technical_data(symbol, force_refresh)
+                except Exception as e:
+                    self.logger.error(f"Error fetching {symbol}: {e}")
+                    results[symbol] = {}
+            return results
+        
         results = {}
-        for symbol in symbols:
+        stale = []
+        now = datetime.now()
+        with self._cache_lock:
+            for symbol in symbols:
+                cached = self._cache.get(symbol.upper())
+                if cached and not force_refresh and now - cached.fetched_at < self.cache_duration:
+                    results[symbol] = cached.to_dict()
+                else:
+                    stale.append(symbol)
+        
+        if stale:
+            bars_by_symbol = {}
+            for symbol in dict.fromkeys(s.upper() for s in stale):
+                try:
+                    bars_by_symbol[symbol] = self._get_bars(symbol)
+                except Exception as e:
+                    self.logger.error(f"Error fetching {symbol}: {e}")
+                    bars_by_symbol[symbol] = []
+            
             try:
-                results[symbol] = self.get_technical_data(symbol, force_refresh)
+                fresh = self.compute_bulk(bars_by_symbol)
             except Exception as e:
-                self.logger.error(f"Error fetching {symbol}: {e}")
-                results[symbol] = {}
+                # One bad series must not blank every symbol: isolate it
+                self.logger.error(f"Bulk indicator pass failed ({e}), computing per symbol")
+                fresh = {}
+                for symbol, bars in bars_by_symbol.items():
+                    try:
+                        fresh.update(self.compute_bulk({symbol: bars}))
+                    except Exception as e:
+                        self.logger.error(f"Error computing indicators for {symbol}: {e}")
+                        fresh[symbol] = TechnicalData(symbol=symbol, as_of_date=date.today())
+            with self._cache_lock:
+                self._cache.update(fresh)
+            for symbol in stale:
+                results[symbol] = fresh[symbol.upper()].to_dict()
+        
+        return results
+    
+    def compute_bulk(self, bars_by_symbol: Dict[str, List]) -> Dict[str, TechnicalData]:
+        """
+        Compute technical data for many symbols in one vectorized pass.
+        
+        Args:
+            bars_by_symbol: Symbol -> daily bars (oldest first)
+            
+        Returns:
+            Symbol -> TechnicalData, same values as the per-symbol path
+        """
+        today = date.today()
+        matrix = BarMatrix.from_bars(bars_by_symbol, depth=self.BARS_NEEDED)
+        values = compute_indicators(matrix)
+        
+        def price(name, row):
+            v = float(values[name][row])
+            return None if math.isnan(v) or not v else round(v, 2)
+        
+        results = {}
+        for row, symbol in enumerate(matrix.symbols):
+            if matrix.lengths[row] < 21:
+                self.logger.warning(f"{symbol}: Insufficient data ({matrix.lengths[row]} bars)")
+                results[symbol] = TechnicalData(symbol=symbol, as_of_date=today)
+                continue
+            
+            avg_volume = values['avg_volume_50d'][row]
+            results[symbol] = TechnicalData(
+                symbol=symbol,
+                as_of_date=matrix.last_dates[row],
+                ma_21=price('ma_21', row),
+                ma_50=price('ma_50', row),
+                ma_200=price('ma_200', row),
+                ma_10_week=price('ma_10_week', row),
+                ema_21=price('ema_21', row),
+                avg_volume_50d=None if math.isnan(avg_volume) else int(avg_volume),
+                last_close=price('last_close', row),
+            )
         return results
     
     def _fetch_technical_data(self, symbol: str) -> TechnicalData:
         """
-        Fetch fresh technical data from Polygon.
+        Fetch fresh technical data.
         
-        Fetches 250 daily bars to calculate:
+        Uses 250 daily bars (local store + missing tail, or a full
+        Polygon download without a store) to calculate:
         - 21-day SMA and EMA
         - 50-day SMA
         - 200-day SMA
@@ -167,13 +275,12 @@ class TechnicalDataService:
         """
         today = date.today()
         
-        if not self.polygon_client:
+        if not self.polygon_client and not self.db_session_factory:
             self.logger.warning(f"{symbol}: No Polygon client, returning empty data")
             return TechnicalData(symbol=symbol, as_of_date=today)
         
         try:
-            # Fetch 250 daily bars (need 200+ for 200-day MA)
-            bars = self.polygon_client.get_daily_bars(symbol, days=250)
+            bars = self._get_bars(symbol)
             
             if not bars or len(bars) < 21:
                 self.logger.warning(f"{symbol}: Insufficient data ({len(bars) if bars else 0} bars)")
@@ -222,6 +329,81 @@ class TechnicalDataService:
             self.logger.error(f"{symbol}: Error fetching data: {e}")
             return TechnicalData(symbol=symbol, as_of_date=today)
     
+    def _get_bars(self, symbol: str) -> List:
+        """250 daily bars (need 200+ for 200-day MA), oldest first."""
+        if self.db_session_factory:
+            return self._load_bars(symbol)
+        return self._download_bars(symbol, self.BARS_NEEDED)
+    
+    def _load_bars(self, symbol: str) -> List:
+        """
+        Read bars from the local store after topping up the missing tail.
+        
+        Cold start (nothing stored, or a short history not yet backfilled
+        this session) downloads BARS_NEEDED bars; otherwise only bars after
+        the last stored bar_date are requested.
+        """
+        from canslim_monitor.data.repositories.bar_repo import BarRepository
+        
+        session = self.db_session_factory()
+        try:
+            repo = BarRepository(session)
+            last_date = repo.get_last_bar_date(symbol)
+            
+            if last_date is None or (
+                symbol not in self._backfilled and repo.count(symbol) < self.BARS_NEEDED
+            ):
+                new_bars = self._download_bars(symbol, self.BARS_NEEDED)
+                if new_bars:
+                    self._backfilled.add(symbol)
+            else:
+                missing = self._missing_sessions(last_date)
+                new_bars = []
+                if missing:
+                    new_bars = [
+                        b for b in self._download_bars(symbol, missing)
+                        if b.bar_date > last_date
+                    ]
+            
+            if new_bars:
+                repo.bulk_upsert(new_bars)
+                self.logger.debug(f"{symbol}: Stored {len(new_bars)} new bars")
+            
+            return repo.get_bars(symbol, limit=self.BARS_NEEDED)
+        except Exception as e:
+            session.rollback()
+            self.logger.error(f"{symbol}: Bar store error: {e}")
+            return []
+        finally:
+            session.close()
+    
+    def _download_bars(self, symbol: str, days: int) -> List:
+        """Download daily bars from Polygon; [] if unavailable or rate-limited."""
+        if not self.polygon_client:
+            return []
+        try:
+            self._api_calls += 1
+            return self.polygon_client.get_daily_bars(symbol, days=days) or []
+        except Exception as e:
+            self.logger.warning(f"{symbol}: Bar download failed, using stored bars: {e}")
+            return []
+    
+    @staticmethod
+    def _missing_sessions(last_date: date) -> int:
+        """
+        Upper bound on trading sessions after *last_date* through yesterday
+        (Polygon's delayed end date). Weekdays only; holidays just cost a
+        request that returns nothing new.
+        """
+        end = date.today() - timedelta(days=1)
+        count = 0
+        d = last_date + timedelta(days=1)
+        while d <= end:
+            if d.weekday() < 5:
+                count += 1
+            d += timedelta(days=1)
+        return count
+    
     def _calculate_sma(self, prices: List[float], period: int) -> Optional[float]:
         """Calculate Simple Moving Average."""
         if len(prices) < period:
@@ -348,6 +530,8 @@ class TechnicalDataService:
             return {
                 'cached_symbols': len(self._cache),
                 'symbols': list(self._cache.keys()),
+                'bar_store': self.db_session_factory is not None,
+                'api_calls': self._api_calls,
             }
 
 
@@ -0,0 +1,207 @@
+"""
+CANSLIM Monitor - Technical Profile Cache
+==========================================
+Per-symbol dynamic-scoring profiles (``utils.indicators.build_technical_profile``)
+cached between alerts.
+
+A profile depends only on daily bars, which change at most once a day, so
+it is keyed on (symbol, last bar date, base length) plus the last bar date
+of the RS index. sync() reads the last bar dates for a whole watchlist in
+one query per cycle; a lookup is then a dict hit until new bars land.
+warm() precomputes profiles after the close. Intraday callers re-score the
+price-dependent factor with ``reprice_profile``.
+
+Usage:
+    cache = TechnicalProfileCache(volume_service)
+    cache.sync(symbols)                   # once per cycle
+    profile = cache.get('NVDA', base_length_weeks=7)
+    profile = reprice_profile(profile, live_price)
+"""
+
+import logging
+import threading
+import time
+from datetime import date
+from typing import Dict, Iterable, Optional, Tuple
+
+from canslim_monitor.data.repositories.bar_repo import BarRepository
+
+try:
+    from canslim_monitor.utils.indicators import TechnicalProfile, build_technical_profile
+    INDICATORS_AVAILABLE = True
+except ImportError:
+    INDICATORS_AVAILABLE = False
+
+
+# Key: (last bar date, index last bar date, base length weeks)
+_Key = Tuple[Optional[date], Optional[date], int]
+
+
+class TechnicalProfileCache:
+    """Thread-safe cache of TechnicalProfile per symbol."""
+
+    def __init__(
+        self,
+        volume_service,
+        index_symbol: str = 'SPY',
+        days: int = 200,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.volume_service = volume_service
+        self.index_symbol = index_symbol
+        self.days = days
+        self.logger = logger or logging.getLogger('canslim.profile_cache')
+
+        self._lock = threading.Lock()
+        self._last_dates: Dict[str, date] = {}
+        # symbol -> (key, profile or None when there is not enough data)
+        self._profiles: Dict[str, Tuple[_Key, Optional['TechnicalProfile']]] = {}
+        self._index_df = None
+        self._index_date: Optional[date] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.compute_ms = 0.0
+
+    # -------------------- FRESHNESS --------------------
+
+    def sync(self, symbols: Iterable[str]) -> int:
+        """
+        Refresh the last stored bar date of symbols (and the index) in one
+        query. Profiles whose bars changed are rebuilt on their next get().
+
+        Returns:
+            Number of symbols with stored bars
+        """
+        symbols = {s.upper() for s in symbols}
+        symbols.add(self.index_symbol)
+        last_dates = self._query_last_dates(symbols)
+        with self._lock:
+            for symbol in symbols:
+                self._last_dates[symbol] = last_dates.get(symbol)
+        return len(last_dates)
+
+    def invalidate(self, symbol: str = None):
+        """Drop the cached profile for symbol, or everything."""
+        with self._lock:
+            if symbol:
+                self._profiles.pop(symbol.upper(), None)
+                self._last_dates.pop(symbol.upper(), None)
+            else:
+                self._profiles.clear()
+                self._last_dates.clear()
+                self._index_df = None
+                self._index_date = None
+
+    # -------------------- LOOKUP --------------------
+
+    def get(self, symbol: str, base_length_weeks: int = 12) -> Optional['TechnicalProfile']:
+        """
+        Profile for symbol as of its last stored bar, or None if there are
+        fewer than 50 bars. Built (and counted as a miss) only when the bars
+        changed since the cached one.
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            if symbol not in self._last_dates or self.index_symbol not in self._last_dates:
+                synced = False
+            else:
+                synced = True
+                key = (self._last_dates[symbol], self._last_dates[self.index_symbol], base_length_weeks)
+                cached = self._profiles.get(symbol)
+                if cached and cached[0] == key:
+                    self.hits += 1
+                    return cached[1]
+
+        if not synced:
+            self.sync([symbol])
+            with self._lock:
+                key = (self._last_dates[symbol], self._last_dates[self.index_symbol], base_length_weeks)
+
+        return self._build(symbol, key)
+
+    def warm(self, symbols: Iterable[str], base_lengths: Dict[str, int] = None) -> int:
+        """
+        Precompute profiles (e.g. after the close, once new bars are stored).
+
+        Args:
+            symbols: Symbols to build
+            base_lengths: Base length in weeks per symbol (default 12)
+
+        Returns:
+            Number of profiles built
+        """
+        symbols = [s.upper() for s in symbols]
+        base_lengths = {s.upper(): n for s, n in (base_lengths or {}).items()}
+        self.sync(symbols)
+        built = 0
+        for symbol in symbols:
+            misses = self.misses
+            self.get(symbol, base_lengths.get(symbol, 12))
+            built += self.misses - misses
+        self.logger.info(f"Profile cache warmed: {built} built for {len(symbols)} symbols")
+        return built
+
+    def get_stats(self) -> Dict[str, float]:
+        """Hit rate and compute time."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._profiles),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'compute_ms': round(self.compute_ms, 1),
+                'avg_compute_ms': round(self.compute_ms / self.misses, 1) if self.misses else 0.0,
+            }
+
+    # -------------------- BUILD --------------------
+
+    def _build(self, symbol: str, key: _Key) -> Optional['TechnicalProfile']:
+        start = time.perf_counter()
+        profile = None
+        if INDICATORS_AVAILABLE and key[0] is not None:
+            try:
+                daily_df = self.volume_service.get_dataframe(symbol, days=self.days)
+                if daily_df is not None and len(daily_df) >= 50:
+                    profile = build_technical_profile(
+                        symbol=symbol,
+                        daily_df=daily_df,
+                        index_df=self._get_index_df(key[1]),
+                        base_length_weeks=key[2],
+                    )
+            except Exception as e:
+                self.logger.warning(f"{symbol}: Could not build technical profile: {e}")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            self._profiles[symbol] = (key, profile)
+            self.misses += 1
+            self.compute_ms += elapsed_ms
+        self.logger.debug(f"{symbol}: Technical profile built in {elapsed_ms:.1f}ms (bars to {key[0]})")
+        return profile
+
+    def _get_index_df(self, index_date: Optional[date]):
+        """Index bars for RS trend, reloaded when a new index bar lands."""
+        with self._lock:
+            if self._index_df is not None and self._index_date == index_date:
+                return self._index_df
+        index_df = self.volume_service.get_dataframe(self.index_symbol, days=self.days)
+        with self._lock:
+            self._index_df = index_df
+            self._index_date = index_date
+        return index_df
+
+    def _query_last_dates(self, symbols: Iterable[str]) -> Dict[str, date]:
+        session_factory = getattr(self.volume_service, 'db_session_factory', None)
+        if not session_factory:
+            return {}
+        try:
+            session = session_factory()
+            try:
+                return BarRepository(session).get_last_bar_dates(symbols)
+            finally:
+                session.close()
+        except Exception as e:
+            self.logger.warning(f"Could not read last bar dates: {e}")
+            return {}
@@ -14,15 +14,19 @@ Usage:
     service.update_all_watchlist()
 """
 
+import hashlib
 import logging
+import os
 import sys
+from collections import deque
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import Iterable, Iterator, List, Dict, Optional, Any
 from dataclasses import dataclass
 
 from sqlalchemy.orm import Session
 
 from ..data.models import Position, HistoricalBar
+from ..data.repositories.bar_repo import BarRepository
 from ..integrations.polygon_client import PolygonClient, Bar
 
 
@@ -127,12 +131,15 @@ class VolumeService:
                 error=str(e)
             )
     
-    def _store_bars(self, bars: List[Bar]) -> int:
+    def _store_bars(self, bars: Iterable[Bar]) -> int:
         """
         Store bars in database, updating existing ones.
+
+        Goes through BarRepository.bulk_upsert (chunked executemany
+        upsert), so *bars* may be a generator that is still fetching.
         
         Args:
-            bars: List of Bar objects
+            bars: Bar objects
             
         Returns:
             Number of bars stored/updated
@@ -140,53 +147,16 @@ class VolumeService:
         if not bars or not self.db_session_factory:
             return 0
         
-        stored = 0
         session = self.db_session_factory()
         
         try:
-            for bar in bars:
-                # Check if bar exists
-                existing = session.query(HistoricalBar).filter(
-                    HistoricalBar.symbol == bar.symbol,
-                    HistoricalBar.bar_date == bar.bar_date
-                ).first()
-                
-                if existing:
-                    # Update existing
-                    existing.open = bar.open
-                    existing.high = bar.high
-                    existing.low = bar.low
-                    existing.close = bar.close
-                    existing.volume = bar.volume
-                    existing.vwap = bar.vwap
-                    existing.transactions = bar.transactions
-                else:
-                    # Insert new
-                    new_bar = HistoricalBar(
-                        symbol=bar.symbol,
-                        bar_date=bar.bar_date,
-                        open=bar.open,
-                        high=bar.high,
-                        low=bar.low,
-                        close=bar.close,
-                        volume=bar.volume,
-                        vwap=bar.vwap,
-                        transactions=bar.transactions
-                    )
-                    session.add(new_bar)
-                
-                stored += 1
-            
-            session.commit()
-            
+            return BarRepository(session).bulk_upsert(bars)
         except Exception as e:
             session.rollback()
             self.logger.error(f"Error storing bars: {e}")
-            stored = 0
+            return 0
         finally:
             session.close()
-        
-        return stored
     
     def _update_position_volume(self, symbol: str, avg_volume: int) -> bool:
         """
@@ -223,6 +193,91 @@ class VolumeService:
         finally:
             session.close()
     
+    def update_symbols(self, symbols: List[str], days: int = 50) -> Dict[str, VolumeUpdateResult]:
+        """
+        Update volume data for many symbols in one bulk write.
+
+        Fetched bars are streamed straight into a single bulk upsert
+        (committed in chunks) instead of one transaction per symbol. A
+        symbol's position average volume is updated, and its result marked
+        successful, only once the chunk holding its last bar is committed.
+        
+        Args:
+            symbols: Stock symbols
+            days: Number of days to fetch per symbol
+            
+        Returns:
+            Dict mapping symbol to result (every requested symbol)
+        """
+        if not self.db_session_factory:
+            return {}
+        
+        results: Dict[str, VolumeUpdateResult] = {}
+        pending = deque()   # (bars yielded through this symbol, symbol, bar count, avg volume)
+        
+        def fetched() -> Iterator[Bar]:
+            yielded = 0
+            for i, symbol in enumerate(symbols):
+                symbol = symbol.upper()
+                try:
+                    bars = self.polygon_client.get_daily_bars(symbol, days=days)
+                except Exception as e:
+                    self.logger.error(f"Error updating {symbol}: {e}")
+                    results[symbol] = VolumeUpdateResult(symbol, 0, 0, 0, False, str(e))
+                    continue
+                
+                if not bars:
+                    results[symbol] = VolumeUpdateResult(
+                        symbol, 0, 0, 0, False, "No data returned from API"
+                    )
+                    continue
+                
+                yielded += len(bars)
+                avg_volume = self.polygon_client.calculate_average_volume(bars, days)
+                pending.append((yielded, symbol, len(bars), avg_volume))
+                yield from bars
+                
+                if (i + 1) % 10 == 0:
+                    self.logger.info(f"Progress: {i+1}/{len(symbols)}")
+        
+        def committed(written: int):
+            while pending and pending[0][0] <= written:
+                _, symbol, count, avg_volume = pending.popleft()
+                self._update_position_volume(symbol, avg_volume)
+                results[symbol] = VolumeUpdateResult(symbol, count, count, avg_volume, True)
+        
+        error = None
+        session = self.db_session_factory()
+        try:
+            BarRepository(session).bulk_upsert(fetched(), on_commit=committed)
+        except Exception as e:
+            session.rollback()
+            error = f"Error storing bars: {e}"
+            self.logger.error(error)
+        finally:
+            session.close()
+        
+        # Fetched, but their chunk was never committed
+        for _, symbol, count, avg_volume in pending:
+            results[symbol] = VolumeUpdateResult(symbol, count, 0, avg_volume, False, error)
+        
+        # Never reached: the bulk write stopped before they were fetched
+        skipped = [s.upper() for s in symbols if s.upper() not in results]
+        for symbol in skipped:
+            results[symbol] = VolumeUpdateResult(
+                symbol, 0, 0, 0, False, f"Not fetched: {error or 'update aborted'}"
+            )
+        if skipped:
+            self.logger.warning(f"Volume update stopped before fetching {len(skipped)} symbols")
+        
+        success_count = sum(1 for r in results.values() if r.success)
+        stored = sum(r.bars_stored for r in results.values())
+        self.logger.info(
+            f"Volume update complete: {success_count}/{len(symbols)} successful, "
+            f"{stored} bars stored"
+        )
+        return results
+    
     def update_all_watchlist(self, state: int = 0) -> Dict[str, VolumeUpdateResult]:
         """
         Update volume data for all positions in a given state.
@@ -251,21 +306,7 @@ class VolumeService:
             return {}
         
         self.logger.info(f"Updating volume data for {len(symbols)} symbols")
-        
-        results = {}
-        for i, symbol in enumerate(symbols):
-            result = self.update_symbol(symbol)
-            results[symbol] = result
-            
-            # Progress update
-            if (i + 1) % 10 == 0:
-                self.logger.info(f"Progress: {i+1}/{len(symbols)}")
-        
-        # Summary
-        success_count = sum(1 for r in results.values() if r.success)
-        self.logger.info(f"Volume update complete: {success_count}/{len(symbols)} successful")
-        
-        return results
+        return self.update_symbols(symbols)
     
     def get_average_volume(self, symbol: str, days: int = 50) -> int:
         """
@@ -349,10 +390,17 @@ class VolumeService:
         Get historical data as a pandas DataFrame for technical analysis.
         
         Used by indicators module for dynamic scoring calculations.
+
+        When the process-wide bar cache is initialized (see
+        ``data.bar_cache``), the stored series is memory-mapped, topped up
+        with bars newer than the cache from SQLite, and the OHLCV columns
+        are wrapped without a copy. The cached series is rebuilt when its
+        bar count or date range no longer matches SQLite (older gaps
+        backfilled after it was cached).
         
         Args:
             symbol: Stock symbol
-            days: Number of days to retrieve
+            days: Number of most recent days to retrieve
             
         Returns:
             DataFrame with columns: date, open, high, low, close, volume
@@ -367,21 +415,41 @@ class VolumeService:
         if not self.db_session_factory:
             return None
         
+        symbol = symbol.upper()
         session = self.db_session_factory()
         
         try:
-            bars = session.query(HistoricalBar).filter(
-                HistoricalBar.symbol == symbol.upper()
-            ).order_by(
-                HistoricalBar.bar_date.asc()
-            ).limit(days).all()
+            cache, series = self._bar_cache_series(session)
+            if cache is not None:
+                fetch = lambda since_ms: self._query_bars(session, symbol, since_ms)
+                arrays = cache.sync(symbol, series, fetch)
+                if not self._cache_matches(session, symbol, arrays):
+                    self.logger.info(f"{symbol}: bar cache out of step with database, rebuilding")
+                    arrays = cache.rebuild(symbol, series, fetch)
+                count = len(arrays) if arrays is not None else 0
+            else:
+                bars = session.query(HistoricalBar).filter(
+                    HistoricalBar.symbol == symbol
+                ).order_by(
+                    HistoricalBar.bar_date.desc()
+                ).limit(days).all()
+                bars.reverse()
+                count = len(bars)
             
-            if len(bars) < 50:  # Minimum for meaningful analysis
+            if count < 50:  # Minimum for meaningful analysis
                 self.logger.warning(
-                    f"{symbol}: Only {len(bars)} bars available, need at least 50"
+                    f"{symbol}: Only {count} bars available, need at least 50"
                 )
                 return None
             
+            if cache is not None:
+                arrays = arrays[-days:]
+                df = arrays.to_dataframe().drop(columns='timestamp')
+                # Same dtype the ORM path gets from pd.to_datetime on date objects
+                date_dtype = pd.to_datetime(pd.Series([date(2000, 1, 1)])).dtype
+                df.insert(0, 'date', pd.Series(arrays.timestamp.view('datetime64[ms]')).astype(date_dtype))
+                return df
+            
             # Convert to DataFrame
             data = [{
                 'date': bar.bar_date,
@@ -403,6 +471,48 @@ class VolumeService:
         finally:
             session.close()
     
+    @staticmethod
+    def _bar_cache_series(session: Session):
+        """
+        (BarCache, series key) for mirroring this database's bars, or
+        (None, None) if no cache is initialized or the database is in-memory.
+
+        The series key embeds a hash of the database path, so caches never
+        mix bars from different databases.
+        """
+        try:
+            from ..data.bar_cache import get_bar_cache
+        except ImportError:   # numpy not installed
+            return None, None
+        cache = get_bar_cache()
+        database = session.get_bind().url.database
+        if cache is None or not database or database == ':memory:':
+            return None, None
+        digest = hashlib.sha1(os.path.abspath(database).encode('utf-8')).hexdigest()[:10]
+        return cache, f'sqlite-day-{digest}'
+    
+    @staticmethod
+    def _cache_matches(session: Session, symbol: str, arrays) -> bool:
+        """True if the cached series has the bar count and date range stored in SQLite."""
+        from ..data.bar_cache import timestamp_to_date
+        count, first, last = BarRepository(session).get_span(symbol)
+        if arrays is None or not len(arrays):
+            return count == 0
+        return (
+            count == len(arrays)
+            and first == timestamp_to_date(int(arrays.timestamp[0]))
+            and last == timestamp_to_date(int(arrays.timestamp[-1]))
+        )
+    
+    @staticmethod
+    def _query_bars(session: Session, symbol: str, since_ms: Optional[int]) -> List[HistoricalBar]:
+        """Stored bars for *symbol*, oldest first, from *since_ms* (all when None)."""
+        query = session.query(HistoricalBar).filter(HistoricalBar.symbol == symbol)
+        if since_ms is not None:
+            from ..data.bar_cache import timestamp_to_date
+            query = query.filter(HistoricalBar.bar_date >= timestamp_to_date(since_ms))
+        return query.order_by(HistoricalBar.bar_date.asc()).all()
+    
     def ensure_data_seeded(self, symbol: str, days: int = 200) -> bool:
         """
         Ensure historical data is available for a symbol, fetching if needed.
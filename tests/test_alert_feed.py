@@ -0,0 +1,107 @@
+"""
+CANSLIM Monitor - Alert Feed Tests
+===================================
+Tests for AlertRepository's keyset-paginated alert feed used by the
+virtualized Alert Monitor table: stable paging across equal timestamps,
+SQL filters, incremental "newer than" fetches and NULL-safe sorting.
+
+Run: python -m pytest tests/test_alert_feed.py
+"""
+
+import sys
+import os
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.data.models import Alert
+from canslim_monitor.data.repositories.alert_repo import AlertFeedFilter, AlertRepository
+
+
+class AlertFeedTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = DatabaseManager(in_memory=True)
+        self.db.initialize(seed_config=False)
+        self.session = self.db.get_new_session()
+        self.repo = AlertRepository(self.session)
+        self.now = datetime(2026, 3, 2, 15, 0)
+
+        # 50 alerts, five per timestamp so pages split ties
+        for i in range(50):
+            self.session.add(Alert(
+                symbol=('NVDA', 'AAPL')[i % 2],
+                alert_type=('BREAKOUT', 'STOP')[i % 2],
+                alert_subtype='CONFIRMED',
+                alert_time=self.now - timedelta(minutes=i // 5),
+                price=None if i % 7 == 0 else float(i),
+            ))
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+        self.db.close()
+
+    def page_through(self, feed_filter=AlertFeedFilter(), sort='alert_time', descending=True, limit=7):
+        rows, cursor = [], None
+        while True:
+            page = self.repo.get_feed_page(feed_filter, sort, descending, after=cursor, limit=limit)
+            rows.extend(page)
+            if len(page) < limit:
+                return rows
+            cursor = self.repo.feed_cursor(page[-1], sort)
+
+    def test_pages_cover_feed_once_in_order(self):
+        rows = self.page_through()
+        self.assertEqual(len(rows), 50)
+        self.assertEqual(len({a.id for a in rows}), 50)
+        keys = [(a.alert_time, a.id) for a in rows]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+
+    def test_filters_run_in_sql(self):
+        feed_filter = AlertFeedFilter(
+            since=self.now - timedelta(minutes=4),
+            symbol='nvda',
+            alert_types=frozenset({'BREAKOUT'}),
+        )
+        rows = self.page_through(feed_filter)
+        self.assertEqual(len(rows), 13)
+        self.assertTrue(all(a.symbol == 'NVDA' and a.alert_type == 'BREAKOUT' for a in rows))
+        self.assertEqual(self.repo.get_feed_stats(feed_filter)[0], 13)
+
+        until = AlertFeedFilter(until=self.now - timedelta(minutes=8))
+        self.assertEqual(len(self.page_through(until)), 10)
+
+    def test_sort_with_nulls_ascending(self):
+        rows = self.page_through(sort='price', descending=False)
+        self.assertEqual(len({a.id for a in rows}), 50)
+        prices = [a.price or 0.0 for a in rows]
+        self.assertEqual(prices, sorted(prices))
+        # NULL prices sort as 0 and come first
+        self.assertTrue(all(a.price is None for a in rows[:8]))
+
+    def test_newer_and_stats(self):
+        count, max_id = self.repo.get_feed_stats()
+        self.assertEqual(count, 50)
+        self.assertEqual(self.repo.get_feed_newer(max_id), [])
+
+        for symbol in ('MSFT', 'NVDA'):
+            self.session.add(Alert(symbol=symbol, alert_type='BREAKOUT', alert_time=self.now))
+        self.session.commit()
+
+        newer = self.repo.get_feed_newer(max_id)
+        self.assertEqual([a.symbol for a in newer], ['NVDA', 'MSFT'])
+        only_nvda = self.repo.get_feed_newer(max_id, AlertFeedFilter(symbol='NVDA'))
+        self.assertEqual([a.symbol for a in only_nvda], ['NVDA'])
+
+    def test_feed_values(self):
+        self.assertEqual(self.repo.get_feed_values('symbol'), ['AAPL', 'NVDA'])
+        self.assertEqual(
+            self.repo.get_feed_values('alert_type', AlertFeedFilter(symbol='AAPL')), ['STOP']
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,234 @@
+"""
+CANSLIM Monitor - Alert Outbox Tests
+=====================================
+Tests for AlertService's outbox mode (batched writes, no inline Discord)
+and AlertDeliveryThread's rate-limited, retrying delivery.
+
+A scripted notifier stands in for Discord: each deliver() call pops the
+next DeliveryResult for its channel.
+
+Run: python -m pytest tests/test_alert_outbox.py
+"""
+
+import json
+import logging
+import sys
+import os
+import threading
+import unittest
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.data.models import Alert, AlertOutbox
+from canslim_monitor.integrations.discord_notifier import DiscordNotifier, DeliveryResult
+from canslim_monitor.services.alert_outbox import AlertOutboxWriter
+from canslim_monitor.services.alert_service import (
+    AlertService, AlertType, AlertSubtype, AlertContext
+)
+from canslim_monitor.service.threads.alert_delivery_thread import AlertDeliveryThread
+
+
+class ScriptedNotifier(DiscordNotifier):
+    """DiscordNotifier whose deliver() replays scripted results (default: success)."""
+
+    def __init__(self):
+        super().__init__(webhooks={
+            'position': 'https://discord.test/hooks/position',
+            'breakout': 'https://discord.test/hooks/breakout',
+        })
+        self.script = defaultdict(deque)
+        self.posts = []
+
+    def deliver(self, payload, channel=None):
+        self.posts.append((channel, payload))
+        if self.script[channel]:
+            return self.script[channel].popleft()
+        return DeliveryResult(ok=True)
+
+    def send(self, *args, **kwargs):
+        raise AssertionError("outbox mode must not post inline")
+
+
+class OutboxTestCase(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.db = DatabaseManager(in_memory=True)
+        self.db.initialize(seed_config=False)
+        self.factory = self.db.get_new_session
+        self.notifier = ScriptedNotifier()
+        self.outbox = AlertOutboxWriter(self.factory)
+        self.service = AlertService(
+            db_session_factory=self.factory,
+            discord_notifier=self.notifier,
+            alert_routing={'overrides': {'WARNING': {'discord': False}}},
+            outbox=self.outbox,
+        )
+
+    def tearDown(self):
+        self.db.close()
+        logging.disable(logging.NOTSET)
+
+    def _worker(self, **config):
+        return AlertDeliveryThread(
+            shutdown_event=threading.Event(),
+            outbox=self.outbox,
+            discord_notifier=self.notifier,
+            db_session_factory=self.factory,
+            config=config,
+        )
+
+    def _alert(self, symbol, alert_type=AlertType.STOP, subtype=AlertSubtype.HARD_STOP, message="msg"):
+        return self.service.create_alert(
+            symbol=symbol,
+            alert_type=alert_type,
+            subtype=subtype,
+            context=AlertContext(current_price=100.0),
+            message=message,
+            action="SELL",
+        )
+
+    def _entries(self):
+        session = self.factory()
+        try:
+            return [
+                (e.symbol, e.status, e.attempts, e.alert_id)
+                for e in session.query(AlertOutbox).order_by(AlertOutbox.id)
+            ]
+        finally:
+            session.close()
+
+    def _count(self, model):
+        session = self.factory()
+        try:
+            return session.query(model).count()
+        finally:
+            session.close()
+
+
+class TestAlertServiceOutbox(OutboxTestCase):
+
+    def test_create_alert_only_buffers(self):
+        alert = self._alert('NVDA')
+
+        self.assertIsNotNone(alert)
+        self.assertEqual(self.outbox.pending_count(), 1)
+        self.assertEqual(self._count(Alert), 0)
+        self.assertEqual(self.notifier.posts, [])
+
+    def test_flush_writes_alert_and_entry_in_one_batch(self):
+        self._alert('NVDA')
+        self._alert('AAPL', AlertType.HEALTH, AlertSubtype.WARNING)  # routed DB-only
+        self._alert('MSFT', AlertType.BREAKOUT, AlertSubtype.CONFIRMED,
+                    message='EMBED:' + json.dumps({'title': 'MSFT'}))
+
+        self.assertEqual(self.outbox.flush(), 3)
+        self.assertEqual(self.outbox.pending_count(), 0)
+        self.assertEqual(self._count(Alert), 3)
+
+        entries = self._entries()
+        self.assertEqual([(s, st) for s, st, _, _ in entries], [('NVDA', 'PENDING'), ('MSFT', 'PENDING')])
+        self.assertTrue(all(alert_id for *_, alert_id in entries))
+
+        session = self.factory()
+        payloads = [json.loads(e.payload) for e in session.query(AlertOutbox).order_by(AlertOutbox.id)]
+        session.close()
+        self.assertIn('NVDA', payloads[0]['content'])
+        self.assertEqual(payloads[1]['embeds'], [{'title': 'MSFT'}])
+
+    def test_failed_flush_keeps_batch(self):
+        self._alert('NVDA')
+        self.outbox.db_session_factory = lambda: (_ for _ in ()).throw(RuntimeError("db locked"))
+
+        self.assertEqual(self.outbox.flush(), 0)
+        self.assertEqual(self.outbox.pending_count(), 1)
+
+        self.outbox.db_session_factory = self.factory
+        self.assertEqual(self.outbox.flush(), 1)
+
+
+class TestAlertDeliveryThread(OutboxTestCase):
+
+    def test_delivers_and_marks_alert_sent(self):
+        self._alert('NVDA')
+        worker = self._worker()
+        worker._do_work()
+
+        self.assertEqual(self._entries()[0][:3], ('NVDA', 'SENT', 1))
+        session = self.factory()
+        self.assertTrue(session.query(Alert).one().discord_sent)
+        session.close()
+
+        stats = worker.get_stats()
+        self.assertEqual(stats['delivered'], 1)
+        self.assertEqual(stats['queue_depth'], 0)
+        self.assertGreater(stats['latency_last_ms'], 0)
+
+    def test_retries_with_backoff_then_fails(self):
+        self.notifier.script['position'].extend(
+            DeliveryResult(ok=False, error="HTTP 502") for _ in range(3)
+        )
+        self._alert('NVDA')
+        worker = self._worker(max_attempts=3, backoff_base=10)
+        worker._do_work()
+
+        self.assertEqual(self._entries()[0][1:3], ('PENDING', 1))
+        # Not due yet: back-off holds it
+        self.assertEqual(worker.deliver_due(), 0)
+        self.assertEqual(len(self.notifier.posts), 1)
+        self.assertEqual(worker.get_stats()['queue_depth'], 1)
+
+        later = datetime.now() + timedelta(hours=1)
+        worker.deliver_due(now=later)
+        worker.deliver_due(now=later)
+
+        self.assertEqual(self._entries()[0][1:3], ('FAILED', 3))
+        stats = worker.get_stats()
+        self.assertEqual((stats['retried'], stats['failed']), (2, 1))
+
+    def test_permanent_error_fails_immediately(self):
+        self.notifier.script['position'].append(
+            DeliveryResult(ok=False, error="HTTP 400", permanent=True)
+        )
+        self._alert('NVDA')
+        self._worker()._do_work()
+        self.assertEqual(self._entries()[0][1:3], ('FAILED', 1))
+
+    def test_429_pauses_only_that_webhook(self):
+        self.notifier.script['position'].append(DeliveryResult(ok=False, retry_after=30))
+        self._alert('NVDA')                                               # position
+        self._alert('AMD')                                                # position
+        self._alert('MSFT', AlertType.BREAKOUT, AlertSubtype.CONFIRMED)   # breakout
+        self._worker()._do_work()
+
+        self.assertEqual(
+            [(s, st, n) for s, st, n, _ in self._entries()],
+            [('NVDA', 'PENDING', 0), ('AMD', 'PENDING', 0), ('MSFT', 'SENT', 1)],
+        )
+        # AMD was deferred by the pause, not posted
+        self.assertEqual([c for c, _ in self.notifier.posts], ['position', 'breakout'])
+
+    def test_rate_limit_per_webhook(self):
+        for symbol in ('A', 'B', 'C', 'D'):
+            self._alert(symbol)
+        worker = self._worker(rate_limit_messages=2, rate_limit_window=60)
+        worker._do_work()
+
+        statuses = [st for _, st, _, _ in self._entries()]
+        self.assertEqual(statuses, ['SENT', 'SENT', 'PENDING', 'PENDING'])
+        self.assertEqual(worker.get_stats()['queue_depth'], 2)
+
+    def test_p0_delivered_first(self):
+        self._alert('LOW', AlertType.BREAKOUT, AlertSubtype.APPROACHING)    # P2
+        self._alert('STOP', AlertType.STOP, AlertSubtype.HARD_STOP)          # P0
+        self._worker()._do_work()
+
+        self.assertEqual([c for c, _ in self.notifier.posts], ['position', 'breakout'])
+        self.assertIn('STOP', self.notifier.posts[0][1]['content'])
+
+
+if __name__ == '__main__':
+    unittest.main()
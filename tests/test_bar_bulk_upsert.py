@@ -0,0 +1,162 @@
+"""
+CANSLIM Monitor - Bulk Bar Ingestion Tests
+===========================================
+Tests for BarRepository.bulk_upsert (chunked INSERT ... ON CONFLICT DO
+UPDATE) and VolumeService.update_symbols streaming fetched bars into it.
+
+Run: python -m pytest tests/test_bar_bulk_upsert.py
+"""
+
+import sys
+import os
+import sqlite3
+import unittest
+from datetime import date, timedelta
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.data.models import Position
+from canslim_monitor.data.repositories import BarRepository, PositionRepository
+from canslim_monitor.integrations.polygon_client import Bar
+from canslim_monitor.services.volume_service import VolumeService
+
+
+def make_bars(symbol, count, close=10.0, start=date(2024, 1, 1)):
+    return [
+        Bar(symbol=symbol, bar_date=start + timedelta(days=i), open=close, high=close + 1,
+            low=close - 1, close=close + i, volume=1000 + i)
+        for i in range(count)
+    ]
+
+
+class FakePolygon:
+    """Serves make_bars() per symbol; 'EMPTY' returns nothing."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_daily_bars(self, symbol, days=50, end_date=None):
+        self.calls.append(symbol)
+        return [] if symbol == 'EMPTY' else make_bars(symbol, days)
+
+    def calculate_average_volume(self, bars, days=50):
+        return int(sum(b.volume for b in bars) / len(bars))
+
+
+class TestBulkUpsert(unittest.TestCase):
+
+    def setUp(self):
+        self.db = DatabaseManager(in_memory=True)
+        self.db.initialize(seed_config=False)
+        self.session = self.db.get_new_session()
+        self.repo = BarRepository(self.session)
+
+    def tearDown(self):
+        self.session.close()
+        self.db.close()
+
+    def test_insert_then_update_on_conflict(self):
+        self.assertEqual(self.repo.bulk_upsert(make_bars('nvda', 5)), 5)
+        self.assertEqual(self.repo.bulk_upsert(make_bars('NVDA', 7, close=20.0)), 7)
+
+        bars = self.repo.get_bars('NVDA')
+        self.assertEqual(len(bars), 7)
+        self.assertEqual([b.close for b in bars], [20.0 + i for i in range(7)])
+        self.assertEqual(bars[0].bar_date, date(2024, 1, 1))
+        self.assertIsNotNone(bars[0].created_at)
+
+    def test_streams_generator_in_chunks(self):
+        consumed = []
+
+        def stream():
+            for bar in make_bars('AAPL', 25):
+                consumed.append(bar)
+                yield bar
+
+        written = self.repo.bulk_upsert(stream(), chunk_size=10)
+        self.assertEqual(written, 25)
+        self.assertEqual(len(consumed), 25)
+
+        # Chunks were committed: visible from another session
+        other = self.db.get_new_session()
+        self.assertEqual(BarRepository(other).count('AAPL'), 25)
+        other.close()
+
+    def test_duplicates_within_chunk_keep_last(self):
+        bars = make_bars('MSFT', 2) + make_bars('MSFT', 2, close=50.0)
+        self.assertEqual(self.repo.bulk_upsert(bars), 4)
+        self.assertEqual([b.close for b in self.repo.get_bars('MSFT')], [50.0, 51.0])
+
+    def test_empty_input(self):
+        self.assertEqual(self.repo.bulk_upsert([]), 0)
+
+
+class TestVolumeServiceUpdateSymbols(unittest.TestCase):
+
+    def setUp(self):
+        self.db = DatabaseManager(in_memory=True)
+        self.db.initialize(seed_config=False)
+        session = self.db.get_new_session()
+        repo = PositionRepository(session)
+        for symbol in ('NVDA', 'AAPL', 'MSFT', 'EMPTY'):
+            repo.create(symbol=symbol, pivot=100.0, pattern='Base', state=0)
+        session.commit()
+        session.close()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_update_symbols_streams_into_bulk_upsert(self):
+        fake = FakePolygon()
+        service = VolumeService(self.db.get_new_session, fake)
+
+        results = service.update_symbols(['NVDA', 'aapl', 'EMPTY'], days=50)
+
+        self.assertEqual(fake.calls, ['NVDA', 'AAPL', 'EMPTY'])
+        self.assertTrue(results['NVDA'].success)
+        self.assertEqual(results['AAPL'].bars_stored, 50)
+        self.assertFalse(results['EMPTY'].success)
+
+        session = self.db.get_new_session()
+        self.assertEqual(BarRepository(session).count('NVDA'), 50)
+        avg = session.query(Position.avg_volume_50d).filter(Position.symbol == 'AAPL').scalar()
+        self.assertEqual(avg, results['AAPL'].avg_volume_50d)
+        session.close()
+
+    def test_store_failure_marks_uncommitted_symbols_failed(self):
+        fake = FakePolygon()
+        service = VolumeService(self.db.get_new_session, fake)
+        bulk_upsert = BarRepository.bulk_upsert
+
+        def failing_upsert(repo, bars, on_commit=None, **kwargs):
+            def stream():
+                for n, bar in enumerate(bars):
+                    if n == 75:
+                        raise sqlite3.OperationalError("database is locked")
+                    yield bar
+            return bulk_upsert(repo, stream(), chunk_size=50, on_commit=on_commit)
+
+        with patch.object(BarRepository, 'bulk_upsert', failing_upsert):
+            results = service.update_symbols(['NVDA', 'AAPL', 'MSFT'], days=50)
+
+        # First chunk (NVDA) committed; AAPL's chunk failed; MSFT never fetched
+        self.assertEqual(fake.calls, ['NVDA', 'AAPL'])
+        self.assertTrue(results['NVDA'].success)
+        self.assertFalse(results['AAPL'].success)
+        self.assertEqual(results['AAPL'].bars_stored, 0)
+        self.assertIn('database is locked', results['AAPL'].error)
+        self.assertFalse(results['MSFT'].success)
+        self.assertIn('Not fetched', results['MSFT'].error)
+
+        session = self.db.get_new_session()
+        avg = dict(session.query(Position.symbol, Position.avg_volume_50d))
+        self.assertEqual(avg['NVDA'], results['NVDA'].avg_volume_50d)
+        self.assertFalse(avg['AAPL'])
+        self.assertEqual(BarRepository(session).count('AAPL'), 0)
+        session.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
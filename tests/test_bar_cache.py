@@ -0,0 +1,224 @@
+"""
+CANSLIM Monitor - Bar Cache Tests
+==================================
+Tests for the memory-mapped columnar bar cache: cold sync, in-place tail
+appends and revisions, rebuilds on adjusted history, prepending older
+chunks, zero-copy DataFrames, and VolumeService.get_dataframe reading
+through the cache.
+
+Run: python -m pytest tests/test_bar_cache.py
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.data import bar_cache
+from canslim_monitor.data.bar_cache import BarArrays, BarCache, bar_timestamp_ms, init_bar_cache
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.data.repositories import BarRepository
+from canslim_monitor.gui.chart.indicator_engine import bars_to_dataframe
+from canslim_monitor.integrations.polygon_client import Bar
+from canslim_monitor.services.volume_service import VolumeService
+
+
+def make_bars(symbol, count, close=10.0, start=date(2024, 1, 1)):
+    return [
+        Bar(symbol=symbol, bar_date=start + timedelta(days=i), open=close, high=close + 1,
+            low=close - 1, close=close + i, volume=1000 + i)
+        for i in range(count)
+    ]
+
+
+class FakeFeed:
+    """Serves a mutable bar list to BarCache.sync and records each request."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.requests = []
+
+    def __call__(self, since_ms):
+        self.requests.append(since_ms)
+        if since_ms is None:
+            return list(self.bars)
+        return [b for b in self.bars if bar_timestamp_ms(b) >= since_ms]
+
+
+class BarCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = BarCache(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _generations(self, symbol='NVDA', timeframe='day'):
+        return self.cache._generations(self.cache._series_dir(symbol, timeframe))
+
+    def test_cold_sync_then_tail_append(self):
+        feed = FakeFeed(make_bars('NVDA', 10))
+        arrays = self.cache.sync('NVDA', 'day', feed)
+        self.assertEqual(len(arrays), 10)
+        self.assertIsInstance(arrays.close, np.memmap)
+        self.assertEqual(arrays.close.mode, 'c')
+
+        feed.bars = make_bars('NVDA', 12)
+        arrays = self.cache.sync('NVDA', 'day', feed)
+
+        # Second sync asked only for the overlap + new bars, appended in place
+        self.assertIsNotNone(feed.requests[1])
+        self.assertEqual(feed.requests[1], bar_timestamp_ms(feed.bars[7]))
+        self.assertEqual(len(arrays), 12)
+        self.assertEqual(arrays.close.tolist(), [10.0 + i for i in range(12)])
+        self.assertEqual(self._generations(), [1])
+
+    def test_revised_last_bar_overwritten_in_place(self):
+        feed = FakeFeed(make_bars('NVDA', 5))
+        self.cache.sync('NVDA', 'day', feed)
+
+        feed.bars[-1].close = 99.0
+        feed.bars[-1].volume = 5000
+        arrays = self.cache.sync('NVDA', 'day', feed)
+
+        self.assertEqual(len(arrays), 5)
+        self.assertEqual(float(arrays.close[-1]), 99.0)
+        self.assertEqual(int(arrays.volume[-1]), 5000)
+        self.assertEqual(self._generations(), [1])
+
+    def test_adjusted_history_rebuilds(self):
+        feed = FakeFeed(make_bars('NVDA', 10))
+        self.cache.sync('NVDA', 'day', feed)
+
+        # 2:1 split: every settled close halves
+        feed.bars = make_bars('NVDA', 11, close=5.0)
+        arrays = self.cache.sync('NVDA', 'day', feed)
+
+        self.assertEqual(feed.requests[-1], None)
+        self.assertEqual(arrays.close.tolist(), [5.0 + i for i in range(11)])
+        self.assertEqual(self._generations(), [2])
+
+    def test_unchanged_tail_writes_nothing(self):
+        feed = FakeFeed(make_bars('NVDA', 10))
+        self.cache.sync('NVDA', 'day', feed)
+        path = os.path.join(self.cache._current_generation('NVDA', 'day'), 'close.bin')
+        mtime = os.stat(path).st_mtime_ns
+
+        arrays = self.cache.sync('NVDA', 'day', feed)
+        self.assertEqual(len(arrays), 10)
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+
+    def test_extend_prepends_older_chunk(self):
+        bars = make_bars('NVDA', 20)
+        self.cache.sync('NVDA', 'day', FakeFeed(bars[10:]))
+
+        arrays = self.cache.extend('NVDA', 'day', bars[:12])
+
+        self.assertEqual(len(arrays), 20)
+        self.assertEqual(arrays.close.tolist(), [10.0 + i for i in range(20)])
+        self.assertTrue(np.all(np.diff(arrays.timestamp) > 0))
+        self.assertEqual(self._generations(), [2])
+
+    def test_torn_append_is_invisible(self):
+        self.cache.sync('NVDA', 'day', FakeFeed(make_bars('NVDA', 5)))
+        gen_dir = self.cache._current_generation('NVDA', 'day')
+        with open(os.path.join(gen_dir, 'timestamp.bin'), 'ab') as f:
+            f.write(b'\x00' * 8)
+
+        self.assertEqual(len(self.cache.load('NVDA', 'day')), 5)
+
+    def test_dataframes_wrap_cached_columns(self):
+        arrays = self.cache.sync('NVDA', 'day', FakeFeed(make_bars('NVDA', 10)))
+
+        df = arrays[-5:].to_dataframe()
+        self.assertEqual(list(df.columns), ['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        self.assertTrue(np.shares_memory(df['close'].to_numpy(), arrays.close))
+
+        df = bars_to_dataframe(arrays)
+        self.assertTrue(np.shares_memory(df['volume'].to_numpy(), arrays.volume))
+        self.assertEqual(df['timestamp'].tolist()[0], bar_timestamp_ms(make_bars('NVDA', 1)[0]))
+
+    def test_dataframe_edits_stay_private(self):
+        self.cache.sync('NVDA', 'day', FakeFeed(make_bars('NVDA', 10)))
+
+        df = self.cache.load('NVDA', 'day').to_dataframe()
+        df.loc[0, 'close'] = -1.0
+
+        self.assertEqual(float(self.cache.load('NVDA', 'day').close[0]), 10.0)
+
+    def test_from_bars_sorts_and_keeps_last_duplicate(self):
+        bars = make_bars('NVDA', 3)
+        dup = make_bars('NVDA', 1, close=50.0)
+        arrays = BarArrays.from_bars([bars[2], bars[0], bars[1]] + dup)
+        self.assertEqual(arrays.close.tolist(), [50.0, 11.0, 12.0])
+
+
+class TestVolumeServiceThroughCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(db_path=os.path.join(self.tmpdir.name, 'canslim.db'))
+        self.db.initialize(seed_config=False)
+        session = self.db.get_new_session()
+        BarRepository(session).bulk_upsert(make_bars('NVDA', 80))
+        session.close()
+        self.cache = init_bar_cache(os.path.join(self.tmpdir.name, 'bar_cache'))
+
+    def tearDown(self):
+        bar_cache._cache = None
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_get_dataframe_returns_most_recent_days(self):
+        service = VolumeService(self.db.get_new_session, None)
+        df = service.get_dataframe('nvda', days=60)
+
+        self.assertEqual(len(df), 60)
+        self.assertEqual(list(df.columns), ['date', 'open', 'high', 'low', 'close', 'volume'])
+        self.assertEqual(df['close'].iloc[-1], 89.0)
+        self.assertEqual(df['date'].iloc[0].date(), date(2024, 1, 21))
+
+        # New bars in SQLite are appended to the cached series on the next call
+        session = self.db.get_new_session()
+        BarRepository(session).bulk_upsert(make_bars('NVDA', 82))
+        session.close()
+        df = service.get_dataframe('NVDA', days=60)
+        self.assertEqual(df['close'].iloc[-1], 91.0)
+
+    def test_matches_uncached_path(self):
+        service = VolumeService(self.db.get_new_session, None)
+        cached = service.get_dataframe('NVDA', days=60)
+        bar_cache._cache = None
+        uncached = service.get_dataframe('NVDA', days=60)
+
+        self.assertEqual(cached['date'].dtype, uncached['date'].dtype)
+        self.assertEqual(cached['date'].tolist(), uncached['date'].tolist())
+        self.assertEqual(cached['close'].tolist(), uncached['close'].tolist())
+        self.assertEqual(cached['volume'].tolist(), uncached['volume'].tolist())
+
+    def test_backfilled_gap_rebuilds_cache(self):
+        # Cache a series with a hole, then backfill the hole in SQLite
+        bars = make_bars('AAPL', 80)
+        session = self.db.get_new_session()
+        BarRepository(session).bulk_upsert(bars[:20] + bars[30:])
+        session.close()
+        service = VolumeService(self.db.get_new_session, None)
+        self.assertEqual(len(service.get_dataframe('AAPL', days=200)), 70)
+
+        session = self.db.get_new_session()
+        BarRepository(session).bulk_upsert(bars[20:30])
+        session.close()
+        df = service.get_dataframe('AAPL', days=200)
+
+        self.assertEqual(len(df), 80)
+        self.assertEqual(df['close'].tolist(), [10.0 + i for i in range(80)])
+
+
+if __name__ == '__main__':
+    unittest.main()
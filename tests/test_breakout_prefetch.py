@@ -0,0 +1,175 @@
+"""
+CANSLIM Monitor - Breakout Prefetch Tests
+==========================================
+Tests for BreakoutThread's batched cycle: one quote call and one technicals
+call for the whole watchlist, per-symbol fallbacks on the worker pool, and
+evaluation against the prefetched snapshot.
+
+Run: python -m pytest tests/test_breakout_prefetch.py
+"""
+
+import sys
+import os
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.integrations.polygon_client import PolygonClient
+from canslim_monitor.providers.types import Quote
+from canslim_monitor.service.threads.breakout_thread import BreakoutThread
+
+
+class FakePosition:
+    def __init__(self, symbol, pivot=100.0, avg_volume_50d=1_000_000):
+        self.id = hash(symbol) & 0xFFFF
+        self.symbol = symbol
+        self.pivot = pivot
+        self.avg_volume_50d = avg_volume_50d
+        self.pivot_set_date = None
+        self.pivot_distance_pct = None
+        self.pivot_status = None
+
+
+def make_quote(symbol, last=102.0, volume=5_000_000, volume_available=True):
+    return Quote(
+        symbol=symbol, last=last, volume=volume, avg_volume=1_000_000,
+        high=last + 0.5, low=last - 2.0, volume_available=volume_available,
+    )
+
+
+class TestBreakoutPrefetch(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = Mock()
+        self.provider.is_connected.return_value = True
+        self.thread = BreakoutThread(
+            shutdown_event=threading.Event(),
+            config={'fetch_workers': 4},
+            realtime_provider=self.provider,
+        )
+        self.thread.technical_service = Mock()
+        self.thread.technical_service.get_multiple.side_effect = lambda symbols: {
+            s: {'ema_21': 98.0, 'ma_50': 95.0, 'ma_200': 80.0} for s in symbols
+        }
+        self.alerts = []
+        self.thread._create_breakout_alert = (
+            lambda pos, price_data, *args, **kwargs: self.alerts.append((pos.symbol, price_data)) or True
+        )
+
+    def run_cycle(self, positions):
+        self.thread._get_watchlist_positions = lambda: positions
+        self.thread._do_work()
+
+    def test_one_batched_call_per_source(self):
+        symbols = ['AAA', 'BBB', 'CCC']
+        self.provider.get_quotes.side_effect = lambda syms: {s: make_quote(s) for s in syms}
+        self.thread._get_price_data = Mock(side_effect=AssertionError("per-symbol quote"))
+        self.thread.technical_service.get_technical_data.side_effect = AssertionError("per-symbol MAs")
+
+        self.run_cycle([FakePosition(s) for s in symbols])
+
+        self.provider.get_quotes.assert_called_once_with(symbols)
+        self.thread.technical_service.get_multiple.assert_called_once_with(symbols)
+        self.assertEqual(sorted(s for s, _ in self.alerts), symbols)
+        self.assertEqual(self.alerts[0][1]['ma50'], 95.0)
+        self.assertEqual(self.thread.get_stats()['last_quote_fallbacks'], 0)
+
+    def test_missing_quotes_fetched_concurrently(self):
+        self.provider.get_quotes.return_value = {'AAA': make_quote('AAA')}
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(symbol):
+            barrier.wait()  # only passes if all three run at once
+            return make_quote(symbol).to_dict()
+
+        self.thread._get_price_data = fetch
+        self.run_cycle([FakePosition(s) for s in ['AAA', 'BBB', 'CCC', 'DDD']])
+
+        self.assertEqual(len(self.alerts), 4)
+        self.assertEqual(self.thread.get_stats()['last_quote_fallbacks'], 3)
+
+    def test_raw_ib_fallback_stays_serial(self):
+        self.thread.ibkr_client = object()  # raw connection: no get_quote/get_quotes
+        self.provider.get_quotes.return_value = {}
+        threads = []
+
+        def fetch(symbol):
+            threads.append(threading.current_thread())
+            return make_quote(symbol).to_dict()
+
+        self.thread._get_price_data = fetch
+        self.run_cycle([FakePosition(s) for s in ['AAA', 'BBB', 'CCC']])
+
+        self.assertEqual(threads, [threading.current_thread()] * 3)
+        self.assertEqual(len(self.alerts), 3)
+
+    def test_intraday_fallback_only_for_suspect_volume(self):
+        self.provider.get_quotes.return_value = {
+            'GOOD': make_quote('GOOD'),
+            'ZERO': make_quote('ZERO', volume=0, volume_available=False),
+        }
+        self.thread.volume_service = Mock()
+        self.thread.volume_service.polygon_client.get_intraday_volume.return_value = {
+            'cumulative_volume': 4_000_000, 'high': 103.0, 'low': 99.0, 'bars_count': 120,
+        }
+
+        self.run_cycle([FakePosition('GOOD'), FakePosition('ZERO')])
+
+        self.thread.volume_service.polygon_client.get_intraday_volume.assert_called_once_with('ZERO')
+        self.assertEqual(self.thread.get_stats()['last_intraday_fallbacks'], 1)
+
+    def test_watchlist_prices_persisted(self):
+        from canslim_monitor.data.database import DatabaseManager
+        from canslim_monitor.data.repositories import PositionRepository
+
+        db = DatabaseManager(in_memory=True)
+        db.initialize(seed_config=False)
+        self.addCleanup(db.close)
+        session = db.get_new_session()
+        repo = PositionRepository(session)
+        repo.create(symbol='AAA', pivot=100.0, pattern='Base', state=0)
+        repo.create(symbol='BBB', pivot=100.0, pattern='Base', state=0)
+        session.commit()
+        session.close()
+
+        self.thread.db_session_factory = db.get_new_session
+        self.provider.get_quotes.side_effect = lambda syms: {
+            s: make_quote(s, last=90.0) for s in syms if s == 'AAA'
+        }
+        self.thread._get_price_data = lambda symbol: None
+        self.run_cycle([FakePosition('AAA'), FakePosition('BBB')])
+
+        session = db.get_new_session()
+        repo = PositionRepository(session)
+        self.assertEqual(repo.get_by_symbol('AAA').last_price, 90.0)
+        self.assertIsNone(repo.get_by_symbol('BBB').last_price)
+        session.close()
+
+
+class TestSharedClientThrottle(unittest.TestCase):
+
+    def test_parallel_fetches_keep_rate_limit_delay(self):
+        # Fallback workers share one PolygonClient; its throttle must hold across threads
+        client = PolygonClient(api_key='THROTTLE', rate_limit_delay=0.05)
+        sent = []
+        response = MagicMock(status_code=200)
+        response.json.return_value = {'status': 'OK'}
+
+        def get(*args, **kwargs):
+            sent.append(time.time())
+            return response
+
+        thread = BreakoutThread(shutdown_event=threading.Event(), config={'fetch_workers': 8})
+        with patch('canslim_monitor.utils.http_pool.HttpPool.get', side_effect=get):
+            thread._fetch_each([f'S{i}' for i in range(8)], lambda s: client._make_request(f'/{s}'))
+
+        gaps = [b - a for a, b in zip(sorted(sent), sorted(sent)[1:])]
+        self.assertEqual(len(sent), 8)
+        self.assertGreaterEqual(min(gaps), 0.04)
+
+
+if __name__ == '__main__':
+    unittest.main()
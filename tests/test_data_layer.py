@@ -187,7 +187,38 @@ class TestPositionRepository(unittest.TestCase):
         
         uber = self.repo.get_by_symbol('UBER')
         self.assertEqual(uber.last_price, 75.0)
-    
+
+    def test_bulk_update_prices_single_statement(self):
+        """Test bulk price updates issue one UPDATE and compute P&L."""
+        from sqlalchemy import event
+
+        held = self.repo.create(symbol='NVDA', pivot=120.0, pattern='Base', state=1, avg_cost=100.0)
+        self.repo.create(symbol='AMD', pivot=150.0, pattern='Base', state=1)
+        self.repo.create(symbol='TSLA', pivot=250.0, pattern='Base')
+        self.session.commit()
+
+        statements = []
+        def count(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith('UPDATE'):
+                statements.append(executemany)
+        event.listen(self.db.engine, 'before_cursor_execute', count)
+        try:
+            updated = self.repo.bulk_update_prices(
+                {'NVDA': 110.0, 'AMD': 160.0, 'TSLA': 260.0}, min_state=1
+            )
+        finally:
+            event.remove(self.db.engine, 'before_cursor_execute', count)
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(statements, [True])
+
+        # Already-loaded instance sees the new values
+        self.assertEqual(held.last_price, 110.0)
+        self.assertAlmostEqual(held.current_pnl_pct, 10.0)
+        self.assertIsNotNone(held.last_price_time)
+        self.assertIsNone(self.repo.get_by_symbol('AMD').current_pnl_pct)
+        self.assertIsNone(self.repo.get_by_symbol('TSLA').last_price)
+
     def test_delete_position(self):
         """Test deleting a position."""
         position = self.repo.create(symbol='COIN', pivot=250.0, pattern='Base')
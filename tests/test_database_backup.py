@@ -0,0 +1,172 @@
+"""
+CANSLIM Monitor - Database Backup Tests
+========================================
+Tests for online backups of a live WAL database, deduplicated snapshots
+(create, restore, verify, rotate) and MaintenanceThread backup results.
+
+Run: python -m pytest tests/test_database_backup.py
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.data.backup import BackupError, SnapshotStore, integrity_check, online_backup
+from canslim_monitor.service.threads.maintenance_thread import MaintenanceThread
+
+
+def rows(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute('SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) FROM t').fetchone()
+    finally:
+        conn.close()
+
+
+class BackupTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.db_path = self.tmp / 'monitor.db'
+        # Live connection: WAL mode, autocheckpoint off so rows stay in -wal
+        self.live = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.live.execute('PRAGMA journal_mode=WAL')
+        self.live.execute('PRAGMA wal_autocheckpoint=0')
+        self.live.execute('CREATE TABLE t (id INTEGER PRIMARY KEY, payload BLOB)')
+        self.insert(2000)
+
+    def tearDown(self):
+        self.live.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def insert(self, n, size=400):
+        self.live.executemany('INSERT INTO t (payload) VALUES (?)', [(os.urandom(size),) for _ in range(n)])
+        self.live.commit()
+
+
+class TestOnlineBackup(BackupTestCase):
+
+    def test_backup_includes_uncheckpointed_wal_pages(self):
+        dest = self.tmp / 'backup.db'
+        result = online_backup(self.db_path, dest, step_pages=16)
+
+        self.assertEqual(rows(dest), rows(self.db_path))
+        self.assertEqual(integrity_check(dest), 'ok')
+        self.assertGreater(result.pages, 100)
+        self.assertEqual(result.bytes_written, dest.stat().st_size)
+        # Standalone file: not left in WAL mode
+        conn = sqlite3.connect(str(dest))
+        self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'delete')
+        conn.close()
+
+    def test_concurrent_writes_do_not_block_backup(self):
+        stop = threading.Event()
+        writes = []
+
+        def writer():
+            while not stop.is_set():
+                self.insert(5)
+                writes.append(1)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            online_backup(self.db_path, self.tmp / 'backup.db', step_pages=8, step_sleep=0.001)
+        finally:
+            stop.set()
+            thread.join()
+
+        self.assertEqual(integrity_check(self.tmp / 'backup.db'), 'ok')
+        self.assertGreater(len(writes), 0)
+        self.assertGreaterEqual(rows(self.tmp / 'backup.db')[0], 2000)
+
+    def test_missing_database(self):
+        with self.assertRaises(BackupError):
+            online_backup(self.tmp / 'nope.db', self.tmp / 'backup.db')
+        self.assertFalse((self.tmp / 'nope.db').exists())
+
+
+class TestSnapshotStore(BackupTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.store = SnapshotStore(self.tmp / 'snapshots', chunk_pages=4)
+
+    def test_second_snapshot_writes_only_changed_chunks(self):
+        first = self.store.create(self.db_path)
+        self.assertEqual(first.new_chunks, first.chunks)
+
+        self.live.execute('UPDATE t SET payload = zeroblob(400) WHERE id = 1')
+        self.live.commit()
+        second = self.store.create(self.db_path)
+
+        self.assertLess(second.new_chunks, second.chunks // 10)
+        self.assertLess(second.bytes_written, first.bytes_written // 10)
+
+        restored = self.store.restore(second.path, self.tmp / 'restored.db')
+        self.assertEqual(rows(restored), rows(self.db_path))
+        self.assertTrue(self.store.verify(first.path)['ok'])
+
+    def test_verify_detects_corrupt_chunk(self):
+        result = self.store.create(self.db_path)
+        chunk = next((self.tmp / 'snapshots' / 'chunks').glob('*/*'))
+        chunk.write_bytes(b'garbage')
+
+        check = self.store.verify(result.path)
+        self.assertFalse(check['ok'])
+        with self.assertRaises(BackupError):
+            self.store.restore(result.path, self.tmp / 'restored.db')
+        self.assertFalse((self.tmp / 'restored.db').exists())
+
+    def test_rotate_removes_unreferenced_chunks(self):
+        self.store.create(self.db_path)
+        self.live.execute('DELETE FROM t WHERE id > 1000')
+        self.live.commit()
+        self.live.execute('VACUUM')
+        latest = self.store.create(self.db_path)
+
+        deleted, removed = self.store.rotate(keep=1)
+        self.assertEqual(deleted, 1)
+        self.assertGreater(removed, 0)
+        self.assertEqual(self.store.snapshots(), [Path(latest.path)])
+        self.assertTrue(self.store.verify(latest.path)['ok'])
+
+
+class TestMaintenanceBackup(BackupTestCase):
+
+    def make_thread(self, mode):
+        return MaintenanceThread(
+            shutdown_event=threading.Event(),
+            config={
+                'database': {'path': str(self.db_path)},
+                'maintenance': {'backup_mode': mode, 'backup_count': 2},
+            },
+        )
+
+    def test_online_mode_reports_stats(self):
+        result = self.make_thread('online')._backup_database()
+        self.assertEqual(result['mode'], 'online')
+        self.assertGreater(result['pages_copied'], 0)
+        self.assertGreater(result['bytes_written'], 0)
+        self.assertIn('duration_s', result)
+        self.assertEqual(rows(result['backup_path']), rows(self.db_path))
+
+    def test_incremental_mode_reports_stats(self):
+        thread = self.make_thread('incremental')
+        first = thread._backup_database()
+        second = thread._backup_database()
+        self.assertEqual(second['mode'], 'incremental')
+        self.assertEqual(second['new_chunks'], 0)
+        self.assertLess(second['bytes_written'], first['bytes_written'])
+        self.assertTrue(second['backup_path'].endswith('.manifest.json'))
+
+
+if __name__ == '__main__':
+    unittest.main()
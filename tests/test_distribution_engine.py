@@ -0,0 +1,164 @@
+"""
+CANSLIM Monitor - Distribution Day Engine Tests
+================================================
+Replays a recorded 2-year SPY/QQQ bar fixture through
+DistributionDayTracker.get_combined_data() one session at a time (the way
+HistoricalSeeder and the regime thread drive it) and compares every day's
+result and the final distribution_days table against the output recorded
+from the query-per-bar tracker.
+
+Run: python -m pytest tests/test_distribution_engine.py
+"""
+
+import json
+import logging
+import sys
+import os
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from canslim_monitor.regime.historical_data import DailyBar
+from canslim_monitor.regime.distribution_tracker import DistributionDayTracker
+from canslim_monitor.regime.models_regime import Base, DistributionDay
+
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'regime_dday_2y.json')
+
+
+def load_bars(raw):
+    return [DailyBar(date.fromisoformat(d), o, h, l, c, v) for d, o, h, l, c, v in raw]
+
+
+def _plain(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
+
+
+def replay(spy_bars, qqq_bars, config, window, statements=None):
+    """
+    Run the tracker over every SPY session after the first *window* bars,
+    passing each day the trailing *window* bars of both series.
+
+    Returns (per-day results, final distribution_days rows), JSON-ready.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    if statements is not None:
+        event.listen(engine, 'before_cursor_execute',
+                     lambda *args: statements.append(args[2]))
+    session = sessionmaker(bind=engine)()
+    tracker = DistributionDayTracker.from_config({'distribution_days': config}, session)
+
+    days = []
+    q = 0
+    for i in range(window, len(spy_bars)):
+        current = spy_bars[i].date
+        while q < len(qqq_bars) and qqq_bars[q].date <= current:
+            q += 1
+        combined = tracker.get_combined_data(
+            spy_bars[i + 1 - window:i + 1],
+            qqq_bars[max(0, q - window):q],
+            current_date=current,
+        )
+        days.append(_plain([
+            current,
+            combined.spy_count, combined.qqq_count,
+            combined.spy_5day_delta, combined.qqq_5day_delta,
+            combined.trend.value,
+            combined.spy_dates, combined.qqq_dates,
+            combined.spy_expired_today, combined.qqq_expired_today,
+            combined.spy_new_d_days, combined.qqq_new_d_days,
+            combined.expiration_details,
+        ]))
+
+    table = _plain([
+        [r.symbol, r.date, r.close_price, r.volume, r.pct_change,
+         r.expired, r.expiry_reason, r.expiry_date]
+        for r in session.query(DistributionDay).order_by(
+            DistributionDay.symbol, DistributionDay.date)
+    ])
+    session.close()
+    return days, table
+
+
+class TestDistributionEngineParity(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(FIXTURE) as f:
+            cls.fixture = json.load(f)
+        cls.spy = load_bars(cls.fixture['bars']['SPY'])
+        cls.qqq = load_bars(cls.fixture['bars']['QQQ'])
+
+    def setUp(self):
+        logging.disable(logging.INFO)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def _check_run(self, name):
+        run = self.fixture['runs'][name]
+        days, table = replay(self.spy, self.qqq, run['config'], run['window'])
+
+        self.assertEqual(len(days), len(run['days']))
+        for got, expected in zip(days, run['days']):
+            self.assertEqual(got, expected, got[0])
+        self.assertEqual(table, run['table'])
+
+    def test_default_config(self):
+        self._check_run('default')
+
+    def test_stalling_wide_window(self):
+        self._check_run('stalling')
+
+
+class TestDistributionEngineQueries(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.INFO)
+        with open(FIXTURE) as f:
+            bars = json.load(f)['bars']
+        self.spy = load_bars(bars['SPY'])[:120]
+        self.qqq = load_bars(bars['QQQ'])[:120]
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_statements_per_update_are_constant(self):
+        statements = []
+        days, _ = replay(self.spy, self.qqq, {}, 35, statements)
+        flat = [' '.join(s.split()) for s in statements]
+        # One D-day load per symbol per day, however many candidates it scans
+        dday_selects = [s for s in flat if 'FROM distribution_days WHERE' in s]
+        self.assertEqual(len(dday_selects), 2 * len(days))
+        # Per symbol: D-days, override, prior count; plus the daily-count upsert
+        selects = [s for s in flat if s.startswith('SELECT') and 'WHERE' in s]
+        self.assertEqual(len(selects), 7 * len(days))
+
+    def test_override_applies_to_display_count_only(self):
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        tracker = DistributionDayTracker(db_session=session)
+
+        baseline = tracker.update_distribution_days('SPY', self.spy[:60])
+        tracker.add_override('SPY', 2, action='ADJUST', reason='parity')
+        adjusted = tracker.update_distribution_days('SPY', self.spy[:60])
+
+        self.assertEqual(adjusted.raw_count, baseline.raw_count)
+        self.assertEqual(adjusted.active_count, baseline.active_count + 2)
+        self.assertEqual(adjusted.active_dates, baseline.active_dates)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+"""
+CANSLIM Monitor - Historical Regime Seeder Tests
+=================================================
+Tests for HistoricalSeeder.seed_range(): indexed 35-bar windows,
+chunked write transactions and per-day savepoints.
+
+Run: python -m pytest tests/test_historical_seeder.py
+"""
+
+import logging
+import random
+import sys
+import os
+import unittest
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from canslim_monitor.regime.historical_data import DailyBar
+from canslim_monitor.regime.historical_seeder import HistoricalSeeder
+from canslim_monitor.regime.models_regime import Base, DistributionDay, MarketRegimeAlert
+from canslim_monitor.regime.ftd_tracker import Base as FTDBase, MarketStatus
+
+
+def synthetic_bars(start, end, seed, skip=()):
+    rng = random.Random(seed)
+    bars = []
+    price, volume = 400.0, 80_000_000
+    d = start
+    while d <= end:
+        if d.weekday() < 5 and d not in skip:
+            open_ = price
+            price *= 1 + rng.gauss(0.0004, 0.011)
+            volume = max(10_000_000, int(volume * (1 + rng.gauss(0, 0.15))))
+            bars.append(DailyBar(d, open_, max(open_, price) * 1.003,
+                                 min(open_, price) * 0.997, price, volume))
+        d += timedelta(days=1)
+    return bars
+
+
+class TestHistoricalSeeder(unittest.TestCase):
+
+    START = date(2024, 1, 2)
+    END = date(2024, 9, 30)
+
+    def setUp(self):
+        logging.disable(logging.INFO)
+        self.data = {
+            'SPY': synthetic_bars(self.START - timedelta(days=60), self.END, 1),
+            # QQQ misses a few SPY sessions, so windows must be located per series
+            'QQQ': synthetic_bars(self.START - timedelta(days=60), self.END, 2,
+                                  skip={date(2024, 3, 4), date(2024, 7, 1)}),
+        }
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def _seeder(self):
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        FTDBase.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        seeder = HistoricalSeeder(db_session=session, config={})
+        seeder._fetch_historical_data = lambda s, e: self.data
+        return seeder, session, engine
+
+    def test_indexed_windows_match_scan(self):
+        seeder, _, _ = self._seeder()
+        days = seeder._get_trading_days(self.data['SPY'], self.START, self.END)
+        for series in ('SPY', 'QQQ'):
+            bars = self.data[series]
+            ends = seeder._index_through_dates(bars, days)
+            for d, end in zip(days, ends):
+                self.assertEqual(
+                    bars[max(0, end - 35):end],
+                    seeder._get_bars_through_date(bars, d),
+                )
+
+    def _snapshot(self, session):
+        return (
+            [(r.symbol, r.date, r.expired) for r in
+             session.query(DistributionDay).order_by(DistributionDay.symbol, DistributionDay.date)],
+            [(r.date, r.composite_score, r.market_phase) for r in
+             session.query(MarketRegimeAlert).order_by(MarketRegimeAlert.date)],
+            [(r.date, r.phase, r.spy_d_count, r.qqq_d_count) for r in
+             session.query(MarketStatus).order_by(MarketStatus.date)],
+        )
+
+    def test_chunked_commits(self):
+        seeder, session, engine = self._seeder()
+        commits = []
+        event.listen(engine, 'commit', lambda conn: commits.append(1))
+
+        result = seeder.seed_range(self.START, self.END, verbose=False, chunk_size=50)
+
+        self.assertTrue(result.success, result.errors)
+        self.assertEqual(result.regime_alerts_created, result.days_processed)
+        # One commit per 50-day chunk, not several per day
+        self.assertGreater(len(commits), 0)
+        self.assertLessEqual(len(commits), result.days_processed // 50 + 2)
+        self.assertEqual(session.query(MarketRegimeAlert).count(), result.days_processed)
+
+    def test_day_savepoints_do_not_commit(self):
+        seeder, session, engine = self._seeder()
+        commits = []
+        event.listen(engine, 'commit', lambda conn: commits.append('COMMIT'))
+
+        def release_commits(conn, cursor, statement, *args):
+            # A RELEASE with no outer transaction open commits on its own
+            if statement.startswith('RELEASE') and not conn.connection.dbapi_connection.in_transaction:
+                commits.append(statement)
+
+        event.listen(engine, 'after_cursor_execute', release_commits)
+        result = seeder.seed_range(self.START, self.END, verbose=False, chunk_size=50)
+
+        self.assertTrue(result.success, result.errors)
+        self.assertEqual([c for c in commits if c.startswith('RELEASE')], [])
+        self.assertLessEqual(len(commits), result.days_processed // 50 + 2)
+
+    def test_chunk_size_does_not_change_results(self):
+        small, small_session, _ = self._seeder()
+        small.seed_range(self.START, self.END, verbose=False, chunk_size=7)
+        large, large_session, _ = self._seeder()
+        large.seed_range(self.START, self.END, verbose=False, chunk_size=10_000)
+
+        self.assertEqual(self._snapshot(small_session), self._snapshot(large_session))
+
+    def test_session_restored_after_seed(self):
+        seeder, session, _ = self._seeder()
+        seeder.seed_range(self.START, self.START + timedelta(days=10), verbose=False)
+        self.assertIs(seeder.db, session)
+
+    def test_components_do_not_keep_deferred_session(self):
+        seeder, session, _ = self._seeder()
+        seeder._get_components()
+        seeder.seed_range(self.START, self.START + timedelta(days=10), verbose=False)
+        for component in seeder._get_components()[:3]:
+            self.assertIs(component.db, session)
+
+    def test_failed_day_rolls_back_only_itself(self):
+        seeder, session, _ = self._seeder()
+        bad_day = date(2024, 5, 15)
+        save_status = seeder._save_market_status
+
+        def failing_save(current_date, *args):
+            save_status(current_date, *args)   # regime alert and status already flushed
+            if current_date == bad_day:
+                raise RuntimeError("disk full")
+
+        seeder._save_market_status = failing_save
+        result = seeder.seed_range(self.START, self.END, verbose=False, chunk_size=50)
+
+        self.assertEqual(len(result.errors), 1)
+        alerts = [r.date for r in session.query(MarketRegimeAlert)]
+        self.assertNotIn(bad_day, alerts)
+        self.assertIn(bad_day + timedelta(days=1), alerts)
+        self.assertEqual(len(alerts), result.days_processed)
+        self.assertEqual(result.regime_alerts_created, result.days_processed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+"""
+CANSLIM Monitor - HTTP Pool Tests
+==================================
+Tests for the shared keep-alive HttpPool: connection reuse across calls
+and threads, per-host stats, and the REST clients routed through it.
+
+A local HTTP/1.1 server counts accepted connections, so reuse is
+measured on the wire rather than inferred.
+
+Run: python -m pytest tests/test_http_pool.py
+"""
+
+import gzip
+import json
+import sys
+import os
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.integrations.discord_notifier import DiscordNotifier
+from canslim_monitor.integrations.polygon_client import PolygonClient
+from canslim_monitor.utils.http_pool import HttpPool, get_http_pool, init_http_pool, _percentile
+
+
+class KeepAliveServer:
+    """HTTP/1.1 server that records connections and requests."""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = []
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def _reply(self, status, body: bytes, gzipped=False):
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                if gzipped:
+                    body = gzip.compress(body)
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests.append(('GET', self.path, dict(self.headers)))
+                if self.path.startswith('/missing'):
+                    self._reply(404, b'{}')
+                    return
+                gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+                self._reply(200, json.dumps({'status': 'OK', 'path': self.path}).encode(), gzipped)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = self.rfile.read(length)
+                with server._lock:
+                    server.requests.append(('POST', self.path, json.loads(body)))
+                self.send_response(204)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.host = f"127.0.0.1:{self.httpd.server_address[1]}"
+        self.url = f"http://{self.host}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestHttpPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = HttpPool(pool_maxsize=4)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_sequential_requests_reuse_one_connection(self):
+        with KeepAliveServer() as server:
+            for i in range(20):
+                response = self.pool.get(f"{server.url}/v2/x/{i}", timeout=5)
+                self.assertEqual(response.json()['path'], f"/v2/x/{i}")
+            self.assertEqual(server.connections, 1)
+            # gzip negotiated and decoded transparently
+            self.assertIn('gzip', server.requests[0][2]['Accept-Encoding'])
+
+    def test_threads_share_bounded_pool(self):
+        with KeepAliveServer() as server:
+            def worker():
+                for _ in range(10):
+                    self.pool.get(f"{server.url}/t", timeout=5).raise_for_status()
+
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(len(server.requests), 40)
+            self.assertLessEqual(server.connections, 4)
+
+    def test_per_host_stats(self):
+        with KeepAliveServer() as server:
+            for _ in range(3):
+                self.pool.get(f"{server.url}/ok", timeout=5)
+            self.pool.get(f"{server.url}/missing", timeout=5)
+
+        # Nothing listens on a just-closed port
+        probe = socket.socket()
+        probe.bind(('127.0.0.1', 0))
+        down = f"127.0.0.1:{probe.getsockname()[1]}"
+        probe.close()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.pool.get(f"http://{down}/x", timeout=1)
+
+        stats = self.pool.get_stats()
+        self.assertEqual(stats[server.host]['requests'], 4)
+        self.assertEqual(stats[server.host]['errors'], 0)
+        self.assertEqual(stats[server.host]['status'], {200: 3, 404: 1})
+        self.assertGreater(stats[server.host]['p99_ms'], 0)
+        self.assertLessEqual(stats[server.host]['p50_ms'], stats[server.host]['p90_ms'])
+        self.assertEqual(stats[down]['errors'], 1)
+
+        self.pool.reset_stats()
+        self.assertEqual(self.pool.get_stats(), {})
+
+    def test_configure_replaces_pools(self):
+        with KeepAliveServer() as server:
+            self.pool.get(f"{server.url}/a", timeout=5)
+            self.pool.configure(pool_maxsize=2)
+            self.pool.get(f"{server.url}/b", timeout=5)
+            self.assertEqual(self.pool.pool_maxsize, 2)
+            self.assertEqual(server.connections, 2)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(_percentile(values, 50), 50)
+        self.assertEqual(_percentile(values, 99), 99)
+        self.assertEqual(_percentile([7], 90), 7)
+        self.assertEqual(_percentile([], 50), 0.0)
+
+
+class TestClientsUsePool(unittest.TestCase):
+
+    def test_polygon_and_discord_keep_alive(self):
+        pool = get_http_pool()
+        with KeepAliveServer() as server:
+            connections_before = server.connections
+            client = PolygonClient(api_key='test', base_url=server.url, rate_limit_delay=0)
+            for _ in range(5):
+                self.assertEqual(client._make_request('/v1/marketstatus/now')['status'], 'OK')
+
+            notifier = DiscordNotifier(default_webhook=f"{server.url}/webhook")
+            self.assertTrue(notifier.deliver({'content': 'hello'}).ok)
+
+            self.assertEqual(server.connections - connections_before, 1)
+            self.assertEqual(server.requests[-1], ('POST', '/webhook', {'content': 'hello'}))
+            self.assertGreaterEqual(pool.get_stats()[server.host]['requests'], 6)
+
+    def test_init_from_config(self):
+        pool = init_http_pool({'http': {'pool_maxsize': 16}})
+        self.assertIs(pool, get_http_pool())
+        self.assertEqual(pool.pool_maxsize, 16)
+        init_http_pool({})   # Missing section keeps the current sizes
+        self.assertEqual(pool.pool_maxsize, 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,258 @@
+"""
+CANSLIM Monitor - Batched IBKR Snapshot Tests
+==============================================
+Tests for ThreadSafeIBKRClient.get_quotes() batched mode and the
+persistent conId contract cache.
+
+Uses a fake IB object on a real asyncio loop (running in a background
+thread, like the production client) so the snapshot deadline logic is
+exercised without TWS / IB Gateway.
+
+Run: python -m pytest tests/test_ibkr_batch_quotes.py
+"""
+
+import asyncio
+import sys
+import os
+import threading
+import time
+import types
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.integrations.ibkr_client_threadsafe import ThreadSafeIBKRClient
+from canslim_monitor.integrations.ibkr_contract_cache import ContractCache
+
+
+NaN = float('nan')
+
+
+class FakeStock:
+    """Stand-in for ib_insync.Stock."""
+
+    def __init__(self, symbol, exchange='SMART', currency='USD'):
+        self.symbol = symbol
+        self.exchange = exchange
+        self.currency = currency
+        self.conId = 0
+
+
+class FakeTicker:
+    def __init__(self):
+        self.last = NaN
+        self.close = NaN
+        self.bid = NaN
+        self.ask = NaN
+        self.volume = NaN
+        self.avVolume = NaN
+        self.high = NaN
+        self.low = NaN
+        self.open = NaN
+
+
+class FakeIB:
+    """Minimal IB replacement: prices arrive after a per-symbol delay."""
+
+    def __init__(self, loop, prices, delays=None):
+        self.loop = loop
+        self.prices = prices
+        self.delays = delays or {}
+        self.qualify_calls = 0
+        self.qualified_symbols = []
+        self.requested = []
+        self.cancelled = []
+
+    def isConnected(self):
+        return True
+
+    async def qualifyContractsAsync(self, *contracts):
+        self.qualify_calls += 1
+        for c in contracts:
+            self.qualified_symbols.append(c.symbol)
+            if c.symbol in self.prices:
+                c.conId = 1000 + sorted(self.prices).index(c.symbol)
+                c.primaryExchange = 'NASDAQ'
+        return [c for c in contracts if c.conId]
+
+    def reqMktData(self, contract, genericTickList='', snapshot=True, regulatorySnapshot=False):
+        ticker = FakeTicker()
+        self.requested.append(contract.symbol)
+        delay = self.delays.get(contract.symbol, 0.05)
+        if delay is not None:
+            def deliver():
+                ticker.last = self.prices[contract.symbol]
+                ticker.volume = 1000.0
+            self.loop.call_later(delay, deliver)
+        return ticker
+
+    def cancelMktData(self, contract):
+        self.cancelled.append(contract.symbol)
+
+
+class TestBatchedQuotes(unittest.TestCase):
+    """ThreadSafeIBKRClient.get_quotes() batching and deadline behaviour."""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+        fake_module = types.ModuleType('ib_insync')
+        fake_module.Stock = FakeStock
+        self.module_patch = patch.dict(sys.modules, {'ib_insync': fake_module})
+        self.module_patch.start()
+
+    def tearDown(self):
+        self.module_patch.stop()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=2.0)
+        self.loop.close()
+
+    def _make_client(self, fake_ib, **kwargs):
+        client = ThreadSafeIBKRClient(**kwargs)
+        client._ib = fake_ib
+        client._loop = self.loop
+        client._connected.set()
+        return client
+
+    def test_batch_resolves_in_one_round_trip(self):
+        """N symbols cost one qualify call and well under N x 2 s."""
+        prices = {f'SYM{i}': 10.0 + i for i in range(20)}
+        fake = FakeIB(self.loop, prices)
+        client = self._make_client(fake, snapshot_timeout=2.0)
+
+        start = time.monotonic()
+        quotes = client.get_quotes(list(prices))
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(set(quotes), set(prices))
+        self.assertEqual(quotes['SYM3']['last'], 13.0)
+        self.assertTrue(quotes['SYM3']['volume_available'])
+        self.assertEqual(fake.qualify_calls, 1)
+        self.assertLess(elapsed, 1.0)
+
+    def test_deadline_bounds_slow_tickers(self):
+        """A ticker that never ticks is dropped once the deadline passes."""
+        prices = {'FAST': 50.0, 'SLOW': 60.0}
+        fake = FakeIB(self.loop, prices, delays={'SLOW': None})
+        client = self._make_client(fake, snapshot_timeout=0.3)
+
+        start = time.monotonic()
+        quotes = client.get_quotes(['FAST', 'SLOW'])
+        elapsed = time.monotonic() - start
+
+        self.assertIn('FAST', quotes)
+        self.assertNotIn('SLOW', quotes)
+        self.assertIn('SLOW', fake.cancelled)
+        self.assertLess(elapsed, 1.5)
+
+    def test_unqualified_symbols_skipped(self):
+        """Symbols that fail qualification never get a market data request."""
+        fake = FakeIB(self.loop, {'AAPL': 200.0})
+        client = self._make_client(fake)
+
+        quotes = client.get_quotes(['AAPL', 'BOGUS'])
+
+        self.assertEqual(list(quotes), ['AAPL'])
+        self.assertNotIn('BOGUS', fake.requested)
+
+    def test_batches_respect_batch_size(self):
+        """Large symbol lists are split into batch_size chunks."""
+        prices = {f'S{i}': 1.0 + i for i in range(7)}
+        fake = FakeIB(self.loop, prices)
+        client = self._make_client(fake, batch_size=3)
+
+        quotes = client.get_quotes(list(prices) + ['S0'])
+
+        self.assertEqual(len(quotes), 7)
+        self.assertEqual(fake.qualify_calls, 3)
+        self.assertEqual(len(fake.requested), 7)
+
+    def test_not_connected_returns_empty(self):
+        client = ThreadSafeIBKRClient()
+        self.assertEqual(client.get_quotes(['AAPL']), {})
+
+    def test_second_cycle_skips_qualification(self):
+        """Cached conIds are reused; only new symbols are qualified."""
+        fake = FakeIB(self.loop, {'AAPL': 200.0, 'MSFT': 400.0, 'NVDA': 900.0})
+        client = self._make_client(fake)
+
+        client.get_quotes(['AAPL', 'MSFT'])
+        fake.qualified_symbols.clear()
+        quotes = client.get_quotes(['AAPL', 'MSFT', 'NVDA'])
+
+        self.assertEqual(len(quotes), 3)
+        self.assertEqual(fake.qualified_symbols, ['NVDA'])
+        stats = client.get_status()['contract_cache']
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 3)
+
+    def test_cache_survives_restart(self):
+        """A persistent cache reloads qualified contracts in a new client."""
+        db = DatabaseManager(in_memory=True)
+        db.initialize(seed_config=False)
+
+        fake = FakeIB(self.loop, {'AAPL': 200.0})
+        client = self._make_client(
+            fake, contract_cache=ContractCache(db.get_new_session)
+        )
+        client.get_quotes(['AAPL'])
+
+        fake.qualified_symbols.clear()
+        restarted = self._make_client(
+            fake, contract_cache=ContractCache(db.get_new_session)
+        )
+        quotes = restarted.get_quotes(['AAPL'])
+
+        self.assertIn('AAPL', quotes)
+        self.assertEqual(fake.qualified_symbols, [])
+
+    def test_error_200_invalidates(self):
+        """TWS 'no security definition' drops the cached contract."""
+        db = DatabaseManager(in_memory=True)
+        db.initialize(seed_config=False)
+        fake = FakeIB(self.loop, {'AAPL': 200.0})
+        client = self._make_client(
+            fake, contract_cache=ContractCache(db.get_new_session)
+        )
+        client.get_quotes(['AAPL'])
+
+        client._on_ib_error(1, 200, 'No security definition', FakeStock('AAPL'))
+        client.contract_cache.flush()
+
+        self.assertIsNone(ContractCache(db.get_new_session).get('AAPL'))
+        fake.qualified_symbols.clear()
+        client.get_quotes(['AAPL'])
+        self.assertEqual(fake.qualified_symbols, ['AAPL'])
+
+    def test_lookups_never_open_a_session(self):
+        """Persisted contracts load up front, so get() on the IB loop stays in memory."""
+        db = DatabaseManager(in_memory=True)
+        db.initialize(seed_config=False)
+        stock = FakeStock('AAPL')
+        stock.conId = 265598
+        seed = ContractCache(db.get_new_session)
+        seed.put('AAPL', stock)
+        seed.flush()
+
+        sessions = []
+        cache = ContractCache(lambda: sessions.append(1) or db.get_new_session())
+        opened = len(sessions)
+        self.assertEqual(cache.get('AAPL')['con_id'], 265598)
+        self.assertIsNone(cache.get('MSFT'))
+        self.assertEqual(len(sessions), opened)
+
+    def test_ttl_expiry_counts_as_miss(self):
+        cache = ContractCache(ttl_hours=0)
+        stock = FakeStock('AAPL')
+        stock.conId = 265598
+        cache.put('AAPL', stock)
+        self.assertIsNone(cache.get('AAPL'))
+        self.assertEqual(cache.get_stats()['misses'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
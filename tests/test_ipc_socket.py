@@ -0,0 +1,272 @@
+"""
+CANSLIM Monitor - Socket IPC Tests
+===================================
+Tests for the cross-platform SocketServer/SocketClient transport:
+request/response over the IPCMessage protocol, concurrent clients, and
+push subscriptions for quotes, alerts and thread stats.
+
+Run: python -m pytest tests/test_ipc_socket.py
+"""
+
+import os
+import queue
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.providers.quote_book import QuoteBook
+from canslim_monitor.providers.types import Quote
+from canslim_monitor.service.ipc import SocketClient, SocketServer, create_pipe_client, create_pipe_server
+from canslim_monitor.service.ipc.socket_server import resolve_address
+from canslim_monitor.services.alert_service import AlertService, AlertContext, AlertSubtype, AlertType
+
+
+class Collector:
+    """Thread-safe push sink."""
+
+    def __init__(self):
+        self.messages = []
+        self._cond = threading.Condition()
+
+    def __call__(self, message):
+        with self._cond:
+            self.messages.append(message)
+            self._cond.notify_all()
+
+    def wait_for(self, predicate, timeout=3.0):
+        deadline = time.time() + timeout
+        with self._cond:
+            while True:
+                matches = [m for m in self.messages if predicate(m)]
+                if matches:
+                    return matches
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return []
+                self._cond.wait(remaining)
+
+
+class SocketIPCTestCase(unittest.TestCase):
+
+    address = None
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.address = self.address or os.path.join(self.tmp, 'ipc.sock')
+        self.shutdown = threading.Event()
+        self.book = QuoteBook()
+        self.stats = {'breakout': {'state': 'running', 'message_count': 0}}
+        self.server = SocketServer(
+            command_queue=queue.Queue(),
+            shutdown_event=self.shutdown,
+            command_handler=self.handle,
+            address=self.address,
+            quote_book=self.book,
+            stats_provider=lambda: {k: dict(v) for k, v in self.stats.items()},
+            push_interval=0.02,
+            stats_interval=0.05,
+        )
+        self.server.start()
+        self.assertTrue(self.server.wait_ready())
+        self.clients = []
+
+    def tearDown(self):
+        for client in self.clients:
+            client.disconnect()
+        self.shutdown.set()
+        self.server.join(timeout=2)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def handle(self, command):
+        if command['type'] == 'SLOW':
+            time.sleep(0.5)
+        if command['type'] == 'GET_STATUS':
+            return {'service_running': True, 'threads': self.stats}
+        return {'echo': command['data'], 'type': command['type']}
+
+    def connect(self, **kwargs):
+        client = SocketClient(address=self.server.address, **kwargs)
+        self.assertTrue(client.connect(timeout=2))
+        self.clients.append(client)
+        return client
+
+
+class TestRequestResponse(SocketIPCTestCase):
+
+    def test_status_and_commands(self):
+        client = self.connect()
+        self.assertTrue(client.get_status()['service_running'])
+        self.assertEqual(client.force_check('NVDA')['echo'], {'symbol': 'NVDA'})
+        self.assertTrue(client.ping())
+
+    def test_concurrent_clients_are_not_blocked_by_slow_command(self):
+        slow_client, fast_client = self.connect(), self.connect()
+
+        results = {}
+        thread = threading.Thread(target=lambda: results.update(slow=slow_client.send_command('SLOW')))
+        thread.start()
+        time.sleep(0.05)
+        start = time.time()
+        self.assertEqual(fast_client.send_command('FAST', {'n': 1})['echo'], {'n': 1})
+        self.assertLess(time.time() - start, 0.4)
+        self.assertEqual(self.server.client_count, 2)
+        thread.join()
+        self.assertEqual(results['slow']['type'], 'SLOW')
+
+    def test_invalid_json_gets_error_response(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(self.server.address)
+        sock.sendall(b'{not json\n')
+        sock.settimeout(2)
+        self.assertIn(b'"status": "error"', sock.recv(65536))
+        sock.close()
+
+    def test_malformed_subscribe_gets_error_response(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(self.server.address)
+        sock.settimeout(2)
+        reader = sock.makefile('rb')
+        for request in (
+            b'{"type": "SUBSCRIBE", "data": {"topics": ["quotes"], "symbols": 5}}',
+            b'{"type": "SUBSCRIBE", "data": {"symbols": [1, 2]}}',
+            b'{"type": "SUBSCRIBE", "data": {"topics": "quotes"}}',
+            b'{"type": "SUBSCRIBE", "data": ["quotes"]}',
+            b'{"type": "UNSUBSCRIBE", "data": {"topics": 7}}',
+        ):
+            sock.sendall(request + b'\n')
+            self.assertIn(b'"status": "error"', reader.readline())
+        reader.close()
+        sock.close()
+
+        self.assertTrue(self.server.is_alive())
+        client = self.connect()
+        self.assertEqual(client.subscribe(['alerts'])['subscribed'], ['alerts'])
+
+    def test_disconnect_is_detected(self):
+        lost = threading.Event()
+        client = self.connect(disconnect_callback=lost.set)
+        self.shutdown.set()
+        self.server.join(timeout=2)
+        deadline = time.time() + 2
+        while client.is_connected() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(client.is_connected())
+        self.assertTrue(lost.wait(1))
+        self.assertIsNone(client.get_status())
+        self.assertFalse(os.path.exists(self.address))
+
+
+class TestPushSubscriptions(SocketIPCTestCase):
+
+    def test_quote_snapshot_then_filtered_deltas(self):
+        self.book.update(Quote(symbol='NVDA', last=100.0))
+        pushes = Collector()
+        client = self.connect()
+        reply = client.subscribe(['quotes'], pushes, symbols=['nvda', 'AAPL'])
+        self.assertEqual(reply['subscribed'], ['quotes'])
+
+        snapshot = pushes.wait_for(lambda m: m.get('snapshot'))
+        self.assertEqual(snapshot[0]['data']['NVDA']['last'], 100.0)
+
+        self.book.update(Quote(symbol='AAPL', last=200.0))
+        self.book.update(Quote(symbol='MSFT', last=300.0))   # Not subscribed
+        delta = pushes.wait_for(lambda m: 'AAPL' in m['data'] and not m.get('snapshot'))
+        self.assertEqual(set(delta[0]['data']), {'AAPL'})
+        self.assertGreater(delta[0]['seq'], snapshot[0]['seq'])
+
+        client.unsubscribe(['quotes'])
+        count = len(pushes.messages)
+        self.book.update(Quote(symbol='AAPL', last=201.0))
+        time.sleep(0.1)
+        self.assertEqual(len(pushes.messages), count)
+
+    def test_changing_quote_symbols_sends_new_snapshot(self):
+        self.book.update(Quote(symbol='NVDA', last=100.0))
+        self.book.update(Quote(symbol='AAPL', last=200.0))
+        pushes = Collector()
+        client = self.connect()
+        client.subscribe(['quotes'], pushes, symbols=['NVDA'])
+        self.assertEqual(set(pushes.wait_for(lambda m: m.get('snapshot'))[0]['data']), {'NVDA'})
+
+        client.set_quote_symbols(['AAPL'])
+        snapshots = pushes.wait_for(lambda m: m.get('snapshot') and 'AAPL' in m['data'])
+        self.assertEqual(set(snapshots[0]['data']), {'AAPL'})
+
+    def test_thread_stats_pushes_only_changed_fields(self):
+        pushes = Collector()
+        client = self.connect()
+        client.subscribe(['thread_stats'], pushes)
+        self.assertTrue(pushes.wait_for(lambda m: m.get('snapshot')))
+
+        self.stats['breakout']['message_count'] = 5
+        delta = pushes.wait_for(lambda m: not m.get('snapshot'))
+        self.assertEqual(delta[0]['data'], {'breakout': {'message_count': 5}})
+
+    def test_alerts_published_to_subscribers_only(self):
+        subscribed, other = Collector(), Collector()
+        self.connect().subscribe(['alerts'], subscribed)
+        self.connect(notification_callback=other).subscribe(['quotes'])
+
+        alert_service = AlertService()
+        alert_service.add_listener(lambda a: self.server.publish('alerts', a.to_dict()))
+        alert_service.create_alert('NVDA', AlertType.BREAKOUT, AlertSubtype.APPROACHING,
+                                   AlertContext(current_price=101.5))
+
+        pushed = subscribed.wait_for(lambda m: m['topic'] == 'alerts')
+        self.assertEqual(pushed[0]['data']['symbol'], 'NVDA')
+        self.assertEqual(pushed[0]['data']['context']['current_price'], 101.5)
+        time.sleep(0.05)
+        self.assertFalse([m for m in other.messages if m.get('topic') == 'alerts'])
+
+
+class TestTcpTransport(SocketIPCTestCase):
+
+    address = 'tcp://127.0.0.1:0'
+
+    def test_request_over_tcp(self):
+        self.assertIsInstance(self.server.address, tuple)
+        self.assertTrue(self.connect().get_status()['service_running'])
+
+
+class TestFactories(unittest.TestCase):
+
+    def test_socket_transport_selected(self):
+        server = create_pipe_server(queue.Queue(), threading.Event(), transport='socket',
+                                    address='tcp://127.0.0.1:0')
+        self.assertIsInstance(server, SocketServer)
+        self.assertIsInstance(create_pipe_client(transport='socket'), SocketClient)
+
+    def test_resolve_address(self):
+        self.assertEqual(resolve_address('tcp://localhost:9000'), ('localhost', 9000))
+        self.assertEqual(resolve_address('/run/canslim.sock'), '/run/canslim.sock')
+
+    def test_stale_socket_file_is_replaced(self):
+        tmp = tempfile.mkdtemp()
+        path = os.path.join(tmp, 'ipc.sock')
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()   # File remains, nobody listening
+
+        shutdown = threading.Event()
+        server = SocketServer(queue.Queue(), shutdown, lambda c: {'ok': True}, address=path)
+        server.start()
+        try:
+            self.assertTrue(server.wait_ready())
+            client = SocketClient(address=path)
+            self.assertTrue(client.connect(timeout=2))
+            self.assertEqual(client.send_command('X'), {'ok': True})
+            client.disconnect()
+        finally:
+            shutdown.set()
+            server.join(timeout=2)
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
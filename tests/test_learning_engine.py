@@ -6,6 +6,7 @@ Tests for factor analysis, weight optimization, A/B testing, and orchestration.
 """
 
 import os
+import random
 import sys
 import unittest
 from datetime import datetime, date, timedelta
@@ -24,6 +25,7 @@ from canslim_monitor.data.repositories.learning_repo import (
 from canslim_monitor.core.learning.factor_analyzer import (
     FactorAnalyzer, FactorAnalysis, ANALYZABLE_FACTORS
 )
+from canslim_monitor.core.learning import weight_optimizer
 from canslim_monitor.core.learning.weight_optimizer import (
     WeightOptimizer, OptimizationResult, DEFAULT_WEIGHTS
 )
@@ -322,6 +324,72 @@ class TestWeightOptimizer(unittest.TestCase):
         self.assertEqual(metrics['precision'], 0)
 
 
+def make_outcomes(count, seed=3):
+    """Random OutcomeData with every scored factor, including gaps and odd values."""
+    rng = random.Random(seed)
+    stages = ['1', '2', '2b', '3(2)', '3c', '4', 'x', None]
+    ad = ['A+', 'A', 'B', 'C-', 'D', 'E', 'Z', None]
+    regimes = ['BULLISH', 'NEUTRAL', 'BEARISH', 'UNKNOWN', None]
+    outcomes = []
+    for i in range(count):
+        rs = rng.randint(0, 99)
+        outcomes.append(OutcomeData(
+            position_id=i, symbol=f'S{i}', entry_date=date(2024, 1, 1) + timedelta(days=i % 300),
+            exit_date=date(2024, 6, 1), holding_days=20, gross_pct=0.0,
+            outcome='SUCCESS' if rng.random() < 0.2 + rs / 200 else rng.choice(['STOPPED', 'FAILED']),
+            rs_rating=rs or None,
+            eps_rating=rng.choice([None, rng.randint(1, 99)]),
+            comp_rating=rng.randint(1, 99),
+            ad_rating=rng.choice(ad),
+            industry_rank=rng.choice([None, rng.randint(1, 197)]),
+            fund_count=rng.choice([None, 0, rng.randint(1, 6000)]),
+            funds_qtr_chg=rng.choice([None, 0, rng.randint(-700, 700)]),
+            base_stage=rng.choice(stages),
+            base_depth=rng.choice([None, rng.uniform(5, 60)]),
+            market_regime=rng.choice(regimes),
+        ))
+    return outcomes
+
+
+class TestWeightOptimizerVectorized(unittest.TestCase):
+    """The NumPy population scorer must agree with the per-outcome Python path."""
+
+    def setUp(self):
+        self.optimizer = WeightOptimizer(Mock())
+        self.outcomes = make_outcomes(600)
+
+    def test_population_matches_per_outcome_scoring(self):
+        rng = random.Random(5)
+        population = [DEFAULT_WEIGHTS, {'rs_rating': 40, 'comp_rating': 0, 'market_regime': -3}]
+        population += [
+            {k: rng.uniform(0, 30) for k in DEFAULT_WEIGHTS} for _ in range(20)
+        ]
+        encoded = self.optimizer._encode_outcomes(self.outcomes)
+        vectorized = self.optimizer._evaluate_population(population, encoded)
+
+        with patch.object(weight_optimizer, 'NUMPY_AVAILABLE', False):
+            expected = [self.optimizer._evaluate_weights(w, self.outcomes) for w in population]
+
+        for got, want in zip(vectorized, expected):
+            for key in want:
+                self.assertAlmostEqual(got[key], want[key], places=12)
+
+    def test_optimize_same_result_with_and_without_numpy(self):
+        self.optimizer._outcomes = self.outcomes
+        self.optimizer._train_set = self.outcomes[:480]
+        self.optimizer._test_set = self.outcomes[480:]
+
+        random.seed(11)
+        fast = self.optimizer.optimize(iterations=15, population_size=12)
+        with patch.object(weight_optimizer, 'NUMPY_AVAILABLE', False):
+            random.seed(11)
+            slow = self.optimizer.optimize(iterations=15, population_size=12)
+
+        self.assertEqual(fast.weights, slow.weights)
+        self.assertAlmostEqual(fast.f1_score, slow.f1_score, places=12)
+        self.assertAlmostEqual(fast.baseline_accuracy, slow.baseline_accuracy, places=12)
+
+
 class TestLearningRepository(unittest.TestCase):
     """Tests for LearningRepository."""
 
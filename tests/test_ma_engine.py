@@ -0,0 +1,98 @@
+"""
+CANSLIM Monitor - Bulk Moving-Average Engine Tests
+===================================================
+The vectorized engine must produce exactly what TechnicalDataService's
+per-symbol calculations produce, for full and short histories alike.
+
+Run: python -m pytest tests/test_ma_engine.py
+"""
+
+import random
+import sys
+import os
+import unittest
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.integrations.polygon_client import Bar
+from canslim_monitor.services.technical_data_service import TechnicalDataService
+from canslim_monitor.utils.ma_engine import BarMatrix, compute_indicators
+
+
+def make_bars(symbol, count, end, rng):
+    days = []
+    d = end
+    while len(days) < count:
+        if d.weekday() < 5 and rng.random() > 0.02:     # occasional missing day
+            days.append(d)
+        d -= timedelta(days=1)
+    days.reverse()
+    price = rng.uniform(10, 800)
+    bars = []
+    for d in days:
+        price = max(1.0, price * (1 + rng.gauss(0, 0.025)))
+        bars.append(Bar(symbol, d, price, price, price, round(price, 4),
+                        rng.randint(10_000, 9_000_000)))
+    return bars
+
+
+class FakePolygon:
+    def __init__(self, bars_by_symbol):
+        self.bars_by_symbol = bars_by_symbol
+
+    def get_daily_bars(self, symbol, days=50, end_date=None):
+        return self.bars_by_symbol[symbol][-days:]
+
+
+class TestBulkEngine(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        lengths = [250, 250, 249, 210, 199, 120, 60, 49, 30, 21, 20, 5, 0]
+        ends = [date(2025, 1, 3), date(2024, 12, 31), date(2025, 6, 13)]
+        self.bars = {}
+        for i, n in enumerate(lengths * 3):
+            self.bars[f'S{i:02d}'] = make_bars(f'S{i:02d}', n, ends[i % 3], rng)
+
+    def test_matches_per_symbol_path(self):
+        service = TechnicalDataService()
+        service._polygon_client = FakePolygon(self.bars)
+
+        bulk = service.compute_bulk(self.bars)
+        for symbol in self.bars:
+            expected = service._fetch_technical_data(symbol)
+            self.assertEqual(bulk[symbol].to_dict(), expected.to_dict(), symbol)
+            if len(self.bars[symbol]) >= 21:
+                self.assertEqual(bulk[symbol].as_of_date, expected.as_of_date)
+
+    def test_get_multiple_uses_bulk_and_cache(self):
+        service = TechnicalDataService()
+        service._polygon_client = FakePolygon(self.bars)
+        symbols = ['S00', 'S03', 's05']
+
+        first = service.get_multiple(symbols)
+        self.assertEqual(set(first), set(symbols))
+        self.assertEqual(first['s05'], service._fetch_technical_data('S05').to_dict())
+
+        service._polygon_client = None          # served from cache now
+        self.assertEqual(service.get_multiple(symbols), first)
+
+    def test_bad_series_does_not_blank_batch(self):
+        service = TechnicalDataService()
+        self.bars['S01'][-1].close = 'n/a'
+        service._polygon_client = FakePolygon(self.bars)
+
+        results = service.get_multiple(['S00', 'S01', 'S03'])
+
+        self.assertEqual(results['S00'], service._fetch_technical_data('S00').to_dict())
+        self.assertEqual(results['S03'], service._fetch_technical_data('S03').to_dict())
+        self.assertIsNone(results['S01']['ma_21'])
+
+    def test_empty_matrix(self):
+        values = compute_indicators(BarMatrix.from_bars({}))
+        self.assertEqual(len(values['ma_21']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,8 +5,10 @@ Tests for market hours and holiday detection.
 Tests both API-based and fallback calendar functionality.
 """
 
+import os
+import tempfile
 import unittest
-from datetime import date, datetime, time as dt_time
+from datetime import date, datetime, time as dt_time, timedelta
 from unittest.mock import patch, Mock
 import pytz
 
@@ -16,6 +18,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from canslim_monitor.utils.market_calendar import MarketCalendar, get_market_calendar, init_market_calendar
+from canslim_monitor.utils.shared_rate_limit import configure_shared_rate_limit, reset_shared_rate_limits
 
 
 class TestMarketCalendarFallback(unittest.TestCase):
@@ -232,66 +235,72 @@ class TestMarketCalendarFallback(unittest.TestCase):
 
 
 class TestMarketCalendarAPI(unittest.TestCase):
-    """Test market calendar with mocked API responses."""
+    """Test the API reconciler with mocked responses."""
     
     def setUp(self):
         """Set up test fixtures."""
         self.calendar = MarketCalendar(api_key='test_key')
         self.tz = pytz.timezone('America/New_York')
     
-    @patch('utils.market_calendar.requests.get')
-    def test_is_market_open_api(self, mock_get):
-        """Test market open check using API."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'market': 'open',
-            'exchanges': {
-                'nyse': 'open',
-                'nasdaq': 'open',
-                'otc': 'open'
-            },
-            'earlyHours': False,
-            'afterHours': False
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-        
-        # Clear cache to force API call
+    def _responses(self, mock_get, status, holidays):
+        """Route mocked GETs by endpoint."""
+        def get(url, params=None, timeout=None):
+            response = Mock()
+            response.raise_for_status.return_value = None
+            response.json.return_value = holidays if url.endswith('/upcoming') else status
+            return response
+        mock_get.side_effect = get
+    
+    @patch('canslim_monitor.utils.http_pool.HttpPool.get')
+    def test_lookups_never_call_api(self, mock_get):
+        """is_market_open and friends are served from the session table."""
         self.calendar.clear_cache()
         
-        result = self.calendar.is_market_open()
-        self.assertTrue(result)
-        
-        # Verify API was called
-        mock_get.assert_called()
-    
-    @patch('utils.market_calendar.requests.get')
-    def test_is_market_closed_api(self, mock_get):
-        """Test market closed check using API."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'market': 'closed',
-            'exchanges': {
-                'nyse': 'closed',
-                'nasdaq': 'closed',
-                'otc': 'closed'
-            },
-            'earlyHours': False,
-            'afterHours': False
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-        
-        self.calendar.clear_cache()
+        self.calendar.is_market_open()
+        self.calendar.is_trading_day()
+        self.calendar.next_trading_day()
+        self.calendar.seconds_until_open()
+        self.calendar.get_upcoming_holidays()
+        
+        mock_get.assert_not_called()
+    
+    @patch('canslim_monitor.utils.http_pool.HttpPool.get')
+    def test_reconcile_applies_api_closure(self, mock_get):
+        """An announced closure removes the session from the table."""
+        self._responses(mock_get, {'market': 'closed'}, [
+            {'date': '2030-03-06', 'name': 'National Day of Mourning',
+             'status': 'closed', 'exchange': 'NYSE'},
+        ])
+        d = date(2030, 3, 6)  # Wednesday
+        self.assertTrue(self.calendar.is_trading_day(d))
         
-        result = self.calendar.is_market_open()
-        self.assertFalse(result)
-    
-    @patch('utils.market_calendar.requests.get')
+        self.assertTrue(self.calendar.reconcile())
+        
+        self.assertFalse(self.calendar.is_trading_day(d))
+        self.assertTrue(self.calendar.is_holiday(d))
+        self.assertFalse(self.calendar.is_market_open(self.tz.localize(datetime(2030, 3, 6, 11, 0))))
+        self.assertEqual(self.calendar.next_trading_day(date(2030, 3, 5)), date(2030, 3, 7))
+    
+    @patch('canslim_monitor.utils.http_pool.HttpPool.get')
+    def test_reconcile_applies_api_early_close(self, mock_get):
+        """Early close times from the API (UTC ISO strings) are converted to ET."""
+        self._responses(mock_get, {'market': 'closed'}, [
+            {'date': '2030-03-07', 'name': 'Early Close', 'status': 'early-close',
+             'open': '2030-03-07T14:30:00.000Z', 'close': '2030-03-07T19:00:00.000Z',
+             'exchange': 'NASDAQ'},
+        ])
+        self.calendar.reconcile()
+        
+        self.assertTrue(self.calendar.is_early_close(date(2030, 3, 7)))
+        self.assertEqual(self.calendar.get_market_hours(date(2030, 3, 7)), (dt_time(9, 30), dt_time(14, 0)))
+        self.assertEqual(
+            self.calendar.seconds_until_close(self.tz.localize(datetime(2030, 3, 7, 13, 0))), 3600
+        )
+    
+    @patch('canslim_monitor.utils.http_pool.HttpPool.get')
     def test_get_market_status_api(self, mock_get):
-        """Test getting full market status from API."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        """Test full market status comes from the last reconcile."""
+        self._responses(mock_get, {
             'market': 'open',
             'exchanges': {
                 'nyse': 'open',
@@ -301,11 +310,10 @@ class TestMarketCalendarAPI(unittest.TestCase):
             'earlyHours': False,
             'afterHours': False,
             'serverTime': '2025-01-08T10:00:00-05:00'
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        }, [])
         
         self.calendar.clear_cache()
+        self.calendar.reconcile()
         
         status = self.calendar.get_market_status()
         
@@ -313,35 +321,31 @@ class TestMarketCalendarAPI(unittest.TestCase):
         self.assertEqual(status['nyse'], 'open')
         self.assertEqual(status['source'], 'api')
     
-    @patch('utils.market_calendar.requests.get')
+    @patch('canslim_monitor.utils.http_pool.HttpPool.get')
     def test_get_holidays_api(self, mock_get):
-        """Test getting holidays from API."""
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        """Test upcoming holidays include reconciled API entries."""
+        next_year = datetime.now(self.tz).year + 1
+        mlk = self.calendar._nth_weekday(next_year, 1, 0, 3)
+        self._responses(mock_get, {}, [
             {
-                'date': '2025-01-20',
+                'date': mlk.isoformat(),
                 'name': 'Martin Luther King Jr. Day',
                 'status': 'closed',
                 'exchange': 'NYSE'
             },
-            {
-                'date': '2025-02-17',
-                'name': 'Presidents Day',
-                'status': 'closed',
-                'exchange': 'NYSE'
-            }
-        ]
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        ])
         
         self.calendar.clear_cache()
+        self.calendar.reconcile()
         
         holidays = self.calendar.get_upcoming_holidays()
         
         self.assertGreaterEqual(len(holidays), 1)
-        self.assertEqual(holidays[0]['source'], 'api')
+        api = [h for h in holidays if h['date'] == mlk.isoformat()]
+        self.assertEqual(api[0]['source'], 'api')
+        self.assertEqual(api[0]['name'], 'Martin Luther King Jr. Day')
     
-    @patch('utils.market_calendar.requests.get')
+    @patch('canslim_monitor.utils.http_pool.HttpPool.get')
     def test_api_failure_fallback(self, mock_get):
         """Test fallback when API fails."""
         mock_get.side_effect = Exception("API Error")
@@ -349,31 +353,95 @@ class TestMarketCalendarAPI(unittest.TestCase):
         self.calendar.clear_cache()
         
         # Should not raise, should fall back
+        self.assertFalse(self.calendar.reconcile())
         status = self.calendar.get_market_status()
         
         self.assertEqual(status['source'], 'fallback')
-    
-    def test_cache_prevents_repeated_calls(self):
-        """Test that caching prevents repeated API calls."""
-        with patch('utils.market_calendar.requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {
-                'market': 'open',
-                'exchanges': {'nyse': 'open', 'nasdaq': 'open'}
-            }
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+        self.assertTrue(self.calendar.is_trading_day(date(2025, 1, 8)))
+    
+    def test_no_api_key_never_reconciles(self):
+        """Without an API key the reconciler is a no-op."""
+        calendar = MarketCalendar(api_key=None)
+        with patch('canslim_monitor.utils.http_pool.HttpPool.get') as mock_get:
+            self.assertFalse(calendar.reconcile())
+            calendar.start_reconciler()
+            mock_get.assert_not_called()
+    
+    def test_reconciler_thread(self):
+        """start_reconciler refreshes in the background until stopped."""
+        with patch('canslim_monitor.utils.http_pool.HttpPool.get') as mock_get:
+            self._responses(mock_get, {'market': 'open'}, [])
             
-            self.calendar.clear_cache()
+            self.calendar.start_reconciler(interval=3600)
+            self.calendar.stop_reconciler()
             
-            # First call should hit API
-            self.calendar.is_market_open()
-            
-            # Second call should use cache
-            self.calendar.is_market_open()
-            
-            # Should only have called API once
-            self.assertEqual(mock_get.call_count, 1)
+            # One status + one holidays fetch
+            self.assertEqual(mock_get.call_count, 2)
+    
+    @patch('canslim_monitor.utils.http_pool.HttpPool.get')
+    def test_reconcile_draws_from_shared_budget(self, mock_get):
+        """Reconcile calls take tokens from the key's shared budget and skip when it is busy."""
+        with tempfile.TemporaryDirectory() as tmp:
+            limiter = configure_shared_rate_limit('test_key', 600, path=os.path.join(tmp, 'rate.db'))
+            try:
+                self._responses(mock_get, {'market': 'open'}, [])
+                self.assertTrue(self.calendar.reconcile())
+                self.assertLess(limiter.get_state()['tokens'], 599)
+                
+                mock_get.reset_mock()
+                with patch.object(limiter, 'acquire', return_value=None):
+                    self.assertFalse(self.calendar.reconcile())
+                mock_get.assert_not_called()
+            finally:
+                reset_shared_rate_limits()
+
+
+class TestSessionTable(unittest.TestCase):
+    """Session table matches the rule-based calendar."""
+    
+    def setUp(self):
+        self.calendar = MarketCalendar(api_key=None)
+        self.tz = pytz.timezone('America/New_York')
+    
+    def test_matches_rules_across_years(self):
+        """Every day 2018-2030 agrees with the rule-based holiday check."""
+        d = date(2018, 1, 1)
+        while d <= date(2030, 12, 31):
+            expected = d.weekday() < 5 and not self.calendar._is_holiday_fallback(d)
+            self.assertEqual(self.calendar.is_trading_day(d), expected, d)
+            d += timedelta(days=1)
+    
+    def test_open_matches_rules_at_boundaries(self):
+        """Open/close instants agree with the rule-based check, DST days included."""
+        for d in (date(2025, 3, 10), date(2025, 11, 3), date(2025, 11, 28), date(2025, 1, 8)):
+            for hh, mm in ((9, 29), (9, 30), (12, 59), (13, 0), (13, 1), (16, 0), (16, 1)):
+                dt = self.tz.localize(datetime(d.year, d.month, d.day, hh, mm))
+                self.assertEqual(
+                    self.calendar.is_market_open(dt), self.calendar._is_market_open_fallback(dt), dt
+                )
+    
+    def test_seconds_until_open(self):
+        """Seconds until open skips weekends and holidays."""
+        # Wednesday Dec 24, 2025 2:00 PM ET (after early close) -> Friday Dec 26 9:30 AM
+        dt = self.tz.localize(datetime(2025, 12, 24, 14, 0))
+        self.assertEqual(self.calendar.seconds_until_open(dt), (43 * 60 + 30) * 60)
+        
+        dt = self.tz.localize(datetime(2025, 1, 8, 10, 0))
+        self.assertEqual(self.calendar.seconds_until_open(dt), 0)
+    
+    def test_seconds_until_close(self):
+        """Seconds until close honours early closes."""
+        dt = self.tz.localize(datetime(2025, 11, 28, 12, 0))
+        self.assertEqual(self.calendar.seconds_until_close(dt), 3600)
+        
+        dt = self.tz.localize(datetime(2025, 11, 28, 14, 0))
+        self.assertEqual(self.calendar.seconds_until_close(dt), 0)
+    
+    def test_table_extends_on_demand(self):
+        """Dates outside the initial span are handled by widening the table."""
+        self.assertTrue(self.calendar.is_holiday(date(2040, 12, 25)))
+        self.assertEqual(self.calendar.previous_trading_day(date(2001, 1, 2)), date(2000, 12, 29))
+        self.assertLessEqual(self.calendar._table.first_year, 2000)
 
 
 class TestGoodFridayCalculation(unittest.TestCase):
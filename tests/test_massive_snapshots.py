@@ -0,0 +1,163 @@
+"""
+CANSLIM Monitor - Polygon Multi-Ticker Snapshot Tests
+======================================================
+Tests for PolygonClient.get_snapshots() and the batched
+MassiveRealtimeProvider.get_quotes().
+
+A local HTTP server replays a recorded
+``/v2/snapshot/locale/us/markets/stocks/tickers`` response (filtered to
+the requested ``tickers=`` like the real endpoint) and counts requests,
+so the tests exercise the real ``requests`` code path without network.
+
+Run: python -m pytest tests/test_massive_snapshots.py
+"""
+
+import json
+import sys
+import os
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.integrations.polygon_client import PolygonClient
+from canslim_monitor.providers.massive import MassiveRealtimeProvider
+
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'polygon_snapshot_tickers.json')
+SNAPSHOT_PATH = '/v2/snapshot/locale/us/markets/stocks/tickers'
+
+
+class RecordedSnapshotServer:
+    """Serves the recorded snapshot fixture and logs every request."""
+
+    def __init__(self):
+        with open(FIXTURE) as f:
+            recorded = json.load(f)
+        self.tickers = {t['ticker']: t for t in recorded['tickers']}
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                server.requests.append((url.path, query))
+
+                if url.path == SNAPSHOT_PATH:
+                    wanted = query.get('tickers', [''])[0].split(',')
+                    found = [server.tickers[s] for s in wanted if s in server.tickers]
+                    body = {'status': 'OK', 'count': len(found), 'tickers': found}
+                elif url.path.startswith(SNAPSHOT_PATH + '/'):
+                    symbol = url.path.rsplit('/', 1)[-1]
+                    if symbol not in server.tickers:
+                        self.send_response(404)
+                        self.end_headers()
+                        return
+                    body = {'status': 'OK', 'ticker': server.tickers[symbol]}
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def snapshot_requests(self):
+        return [q for path, q in self.requests if path == SNAPSHOT_PATH]
+
+
+class TestPolygonSnapshots(unittest.TestCase):
+
+    def test_get_snapshots_parses_all_tickers(self):
+        with RecordedSnapshotServer() as server:
+            client = PolygonClient('test-key', base_url=server.url, rate_limit_delay=0)
+            snaps = client.get_snapshots(['aapl', 'MSFT', 'ZZZZ'])
+
+        self.assertEqual(set(snaps), {'AAPL', 'MSFT'})
+        self.assertEqual(snaps['AAPL']['last'], 230.56)
+        self.assertEqual(snaps['AAPL']['prev_close'], 228.67)
+        self.assertEqual(snaps['MSFT']['volume'], 17432988)
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(server.requests[0][1]['tickers'], ['AAPL,MSFT,ZZZZ'])
+
+    def test_single_and_batch_agree(self):
+        with RecordedSnapshotServer() as server:
+            client = PolygonClient('test-key', base_url=server.url, rate_limit_delay=0)
+            single = client.get_snapshot('NVDA')
+            batch = client.get_snapshots(['NVDA'])['NVDA']
+
+        self.assertEqual(single, batch)
+
+
+class TestBatchedRealtimeQuotes(unittest.TestCase):
+
+    def _provider(self, server, **kwargs):
+        provider = MassiveRealtimeProvider('test-key', base_url=server.url,
+                                           rate_limit_delay=0, **kwargs)
+        provider._client = PolygonClient('test-key', base_url=server.url, rate_limit_delay=0)
+        return provider
+
+    def test_one_call_per_chunk(self):
+        symbols = ['AAPL', 'MSFT', 'NVDA', 'SPY', 'ZZZZ']
+        with RecordedSnapshotServer() as server:
+            provider = self._provider(server, batch_size=2)
+            quotes = provider.get_quotes(symbols)
+
+        self.assertEqual(set(quotes), {'AAPL', 'MSFT', 'NVDA', 'SPY'})
+        self.assertEqual(len(server.snapshot_requests()), 3)   # ceil(5 / 2)
+        self.assertEqual(quotes['SPY'].last, 542.8)
+        self.assertEqual(quotes['SPY'].close, 541.64)
+        self.assertEqual(quotes['SPY'].timestamp.year, 2024)
+
+    def test_cache_filled_from_batch(self):
+        with RecordedSnapshotServer() as server:
+            provider = self._provider(server)
+            provider.get_quotes(['AAPL', 'MSFT'])
+            # Cached symbols are not re-requested; only NVDA goes out
+            quotes = provider.get_quotes(['AAPL', 'MSFT', 'NVDA'])
+            single = provider.get_quote('MSFT')
+
+        self.assertEqual(len(quotes), 3)
+        requests = server.snapshot_requests()
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[1]['tickers'], ['NVDA'])
+        self.assertIs(single, quotes['MSFT'])
+        self.assertEqual(len(server.requests), 2)
+
+    def test_duplicate_symbols_fetched_once(self):
+        with RecordedSnapshotServer() as server:
+            provider = self._provider(server)
+            quotes = provider.get_quotes(['AAPL', 'aapl'])
+
+        self.assertEqual(set(quotes), {'AAPL', 'aapl'})
+        self.assertEqual(server.snapshot_requests()[0]['tickers'], ['AAPL'])
+
+    def test_not_connected_returns_empty(self):
+        provider = MassiveRealtimeProvider('test-key')
+        self.assertEqual(provider.get_quotes(['AAPL']), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+"""
+CANSLIM Monitor - Monitor State Store Tests
+============================================
+Tests for MonitorStateStore write-behind persistence of trailing-stop
+high-water marks and checker cooldowns across PositionThread restarts.
+
+Run: python -m pytest tests/test_monitor_state.py
+"""
+
+import logging
+import sys
+import os
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import event
+
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.data.repositories import MonitorStateRepository
+from canslim_monitor.core.position_monitor import MonitorStateStore, PositionMonitor
+from canslim_monitor.core.position_monitor.checkers import StopChecker
+from canslim_monitor.services.alert_service import AlertSubtype
+from canslim_monitor.service.threads.position_thread import PositionThread
+
+
+class StateStoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.db = DatabaseManager(in_memory=True)
+        self.db.initialize(seed_config=False)
+        self.factory = self.db.get_new_session
+
+    def tearDown(self):
+        self.db.close()
+        logging.disable(logging.NOTSET)
+
+    def _rows(self):
+        """Stored state as {(scope, key): value}."""
+        session = self.factory()
+        try:
+            return {
+                (scope, key): value
+                for scope, values in MonitorStateRepository(session).load_all().items()
+                for key, value in values.items()
+            }
+        finally:
+            session.close()
+
+
+class TestMonitorStateStore(StateStoreTestCase):
+
+    def test_write_behind_and_reload(self):
+        store = MonitorStateStore(self.factory)
+        store.load()
+        prices = store.map('max_price')
+        prices['NVDA'] = 131.5
+        prices['AAPL'] = 190.0
+        prices['NVDA'] = 133.0
+
+        # Nothing written until flush
+        self.assertEqual(self._rows(), {})
+        self.assertEqual(store.pending_count(), 1)
+
+        self.assertEqual(store.flush(), 1)
+        self.assertEqual(self._rows(), {('max_price', 'NVDA'): 133.0, ('max_price', 'AAPL'): 190.0})
+        self.assertEqual(store.flush(), 0)
+
+        prices.pop('AAPL')
+        prices['MSFT'] = 420.0
+        store.flush()
+
+        restarted = MonitorStateStore(self.factory)
+        self.assertEqual(restarted.load(), 2)
+        self.assertEqual(dict(restarted.map('max_price')), {'NVDA': 133.0, 'MSFT': 420.0})
+        self.assertEqual(dict(restarted.map('max_gain')), {})
+
+    def test_datetime_values_round_trip(self):
+        store = MonitorStateStore(self.factory)
+        when = datetime(2026, 3, 2, 10, 15, 30)
+        store.map('cooldown.stop', datetime_values=True)['NVDA_HARD_STOP'] = when
+        store.flush()
+
+        restarted = MonitorStateStore(self.factory)
+        restarted.load()
+        self.assertEqual(restarted.map('cooldown.stop', datetime_values=True)['NVDA_HARD_STOP'], when)
+
+    def test_clear_deletes_scope(self):
+        store = MonitorStateStore(self.factory)
+        gains = store.map('max_gain')
+        gains['NVDA'] = 12.0
+        store.map('max_price')['NVDA'] = 100.0
+        store.flush()
+
+        gains.clear()
+        store.flush()
+        self.assertEqual(self._rows(), {('max_price', 'NVDA'): 100.0})
+
+    def test_one_statement_per_cycle(self):
+        store = MonitorStateStore(self.factory)
+        prices = store.map('max_price')
+        gains = store.map('max_gain')
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('INSERT'):
+                statements.append(executemany)
+
+        engine = self.db.engine
+        event.listen(engine, 'before_cursor_execute', count)
+        try:
+            for i in range(200):
+                prices[f'S{i}'] = float(i)
+                gains[f'S{i}'] = i / 2
+            self.assertEqual(store.flush(), 2)
+        finally:
+            event.remove(engine, 'before_cursor_execute', count)
+
+        self.assertEqual(statements, [True])
+        self.assertEqual(len(self._rows()), 400)
+        self.assertEqual(store.flush(), 0)
+
+    def test_failed_flush_keeps_changes(self):
+        store = MonitorStateStore(self.factory)
+        store.map('max_price')['NVDA'] = 100.0
+        store.db_session_factory = lambda: (_ for _ in ()).throw(RuntimeError("db locked"))
+
+        self.assertEqual(store.flush(), 0)
+        self.assertEqual(store.pending_count(), 1)
+
+        store.map('max_price')['NVDA'] = 101.0
+        store.db_session_factory = self.factory
+        store.flush()
+        self.assertEqual(self._rows(), {('max_price', 'NVDA'): 101.0})
+
+
+class TestCheckerCooldownState(StateStoreTestCase):
+
+    def test_cooldowns_survive_restart(self):
+        config = {'cooldowns': {'hard_stop': 60, 'stop_warning': 30}}
+
+        store = MonitorStateStore(self.factory)
+        checker = StopChecker(config)
+        checker.attach_state(store)
+        checker.set_cooldown('NVDA', AlertSubtype.HARD_STOP)
+        checker._cooldowns['AAPL_WARNING'] = datetime.now() - timedelta(minutes=45)
+        store.flush()
+
+        restarted = MonitorStateStore(self.factory)
+        restarted.load()
+        checker = StopChecker(config)
+        checker.attach_state(restarted)
+
+        self.assertTrue(checker.is_on_cooldown('NVDA', AlertSubtype.HARD_STOP))
+        # Expired while down: dropped on load
+        self.assertNotIn('AAPL_WARNING', checker._cooldowns)
+        restarted.flush()
+        self.assertEqual(list(self._rows()), [('cooldown.stop', 'NVDA_HARD_STOP')])
+
+    def test_monitor_clear_cooldowns_persists(self):
+        store = MonitorStateStore(self.factory)
+        monitor = PositionMonitor(config={})
+        monitor.attach_state_store(store)
+        monitor.checkers[0].set_cooldown('NVDA', AlertSubtype.HARD_STOP)
+        store.flush()
+
+        monitor.clear_cooldowns()
+        store.flush()
+        self.assertEqual(self._rows(), {})
+
+
+class TestPositionThreadState(StateStoreTestCase):
+
+    def _thread(self):
+        return PositionThread(
+            shutdown_event=threading.Event(),
+            db_session_factory=self.factory,
+            config={},
+        )
+
+    def test_high_water_marks_survive_restart(self):
+        thread = self._thread()
+        thread._build_price_entry('NVDA', {'last': 130.0})
+        thread._build_price_entry('NVDA', {'last': 135.0})
+        thread._build_price_entry('NVDA', {'last': 132.0})
+        thread._max_gains['NVDA'] = 18.5
+        thread.state_store.flush()
+
+        restarted = self._thread()
+        self.assertEqual(restarted._max_prices['NVDA'], 135.0)
+        self.assertEqual(restarted._max_gains['NVDA'], 18.5)
+        self.assertEqual(restarted._build_price_entry('NVDA', {'last': 133.0})['max_price'], 135.0)
+
+    def test_closed_positions_pruned(self):
+        thread = self._thread()
+        thread._max_prices['NVDA'] = 135.0
+        thread._max_prices['AAPL'] = 190.0
+        thread._max_gains['AAPL'] = 4.0
+        thread._prune_tracking(['NVDA'])
+        thread.state_store.flush()
+
+        self.assertEqual(self._rows(), {('max_price', 'NVDA'): 135.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
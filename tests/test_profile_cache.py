@@ -0,0 +1,128 @@
+"""
+CANSLIM Monitor - Technical Profile Cache Tests
+================================================
+Tests for TechnicalProfileCache keying on the last stored bar date,
+reprice_profile parity with a full rebuild, and scoring from a cached
+profile.
+
+Run: python -m pytest tests/test_profile_cache.py
+"""
+
+import sys
+import os
+import math
+import unittest
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.data.models import HistoricalBar
+from canslim_monitor.services.volume_service import VolumeService
+from canslim_monitor.services.technical_profile_cache import TechnicalProfileCache
+from canslim_monitor.utils.indicators import build_technical_profile, calculate_ma_position, reprice_profile
+from canslim_monitor.utils.scoring import CANSLIMScorer
+
+
+START = date(2026, 1, 2)
+
+
+def add_bars(session, symbol, count, start_index=0, base=100.0):
+    for i in range(start_index, start_index + count):
+        close = base + i * 0.3 + 2 * math.sin(i / 3)
+        session.add(HistoricalBar(
+            symbol=symbol, bar_date=START + timedelta(days=i),
+            open=close - 0.5, high=close + 1, low=close - 1, close=close,
+            volume=1_000_000 + (i % 7) * 50_000,
+        ))
+    session.commit()
+
+
+class TestTechnicalProfileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.db = DatabaseManager(in_memory=True)
+        self.db.initialize()
+        self.session = self.db.get_new_session()
+        add_bars(self.session, 'NVDA', 80)
+        add_bars(self.session, 'SPY', 80, base=500.0)
+        add_bars(self.session, 'THIN', 20)
+        self.volume_service = VolumeService(db_session_factory=self.db.get_new_session, polygon_client=None)
+        self.cache = TechnicalProfileCache(self.volume_service)
+
+    def tearDown(self):
+        self.session.close()
+        self.db.close()
+
+    def test_hits_until_new_bar_lands(self):
+        self.cache.sync(['NVDA'])
+        first = self.cache.get('NVDA', 7)
+        self.assertIsNotNone(first)
+        self.assertIs(self.cache.get('NVDA', 7), first)
+        self.assertEqual(self.cache.get_stats()['hits'], 1)
+
+        # New bar: next sync sees the new last date and the profile is rebuilt
+        add_bars(self.session, 'NVDA', 1, start_index=80)
+        self.cache.sync(['NVDA'])
+        second = self.cache.get('NVDA', 7)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.analysis_date, START + timedelta(days=80))
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+        self.assertAlmostEqual(stats['hit_rate'], 1 / 3, places=3)
+        self.assertGreater(stats['compute_ms'], 0)
+
+    def test_base_length_is_part_of_key(self):
+        self.cache.sync(['NVDA'])
+        self.cache.get('NVDA', 7)
+        self.cache.get('NVDA', 12)
+        self.assertEqual(self.cache.get_stats()['misses'], 2)
+
+    def test_insufficient_bars_cached_as_none(self):
+        self.assertIsNone(self.cache.get('THIN'))
+        self.assertIsNone(self.cache.get('THIN'))
+        self.assertEqual(self.cache.get_stats()['misses'], 1)
+
+    def test_warm(self):
+        built = self.cache.warm(['NVDA', 'THIN'], {'NVDA': 7})
+        self.assertEqual(built, 2)
+        self.cache.get('NVDA', 7)
+        self.assertEqual(self.cache.get_stats()['hits'], 1)
+
+    def test_reprice_matches_full_rebuild(self):
+        daily_df = self.volume_service.get_dataframe('NVDA')
+        index_df = self.volume_service.get_dataframe('SPY')
+        profile = build_technical_profile('NVDA', daily_df, index_df, base_length_weeks=7)
+
+        for price in (profile.ma_50 * 0.9, profile.ma_50, profile.ma_50 * 1.01, profile.ma_50 * 1.2):
+            repriced = reprice_profile(profile, price)
+            expected = calculate_ma_position(daily_df, price)
+            self.assertEqual(repriced.indicator_details['ma_position'], expected)
+            self.assertEqual(
+                repriced.dynamic_score,
+                profile.dynamic_score - profile.ma_position_score + expected.score,
+            )
+
+        # Original is left untouched
+        self.assertEqual(profile.current_price, daily_df['close'].iloc[-1])
+        self.assertEqual(profile.indicator_details['ma_position'], calculate_ma_position(daily_df))
+
+    def test_scoring_from_cached_profile_matches_dataframe_path(self):
+        scorer = CANSLIMScorer()
+        position_data = {'symbol': 'NVDA', 'pattern': 'Cup w/Handle', 'base_stage': '1',
+                         'base_depth': 20, 'base_length': 7, 'rs_rating': 92}
+        daily_df = self.volume_service.get_dataframe('NVDA')
+        index_df = self.volume_service.get_dataframe('SPY')
+
+        expected = scorer.calculate_score_with_dynamic(position_data, daily_df, index_df)
+        cached = scorer.calculate_score_with_dynamic(
+            position_data, None, profile=self.cache.get('NVDA', 7)
+        )
+        self.assertTrue(expected[2]['dynamic_components'])
+        self.assertEqual(cached[:2], expected[:2])
+        self.assertEqual(cached[2]['dynamic_components'], expected[2]['dynamic_components'])
+
+
+if __name__ == '__main__':
+    unittest.main()
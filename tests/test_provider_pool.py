@@ -0,0 +1,174 @@
+"""
+CANSLIM Monitor - Provider Pool Tests
+======================================
+Tests for the process-wide ProviderPool: one connect per process,
+a shared RateLimiter per credential, interval-bound health checks and
+invalidation.
+
+Fake providers count connect() calls, which for Massive are real
+test_connection() API calls.
+
+Run: python -m pytest tests/test_provider_pool.py
+"""
+
+import sys
+import os
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.data.repositories.provider_repo import ProviderRepository
+from canslim_monitor.providers.base import HistoricalProvider, RealtimeProvider
+from canslim_monitor.providers.pool import ProviderPool, close_provider_pool, get_provider_pool
+from canslim_monitor.providers.registry import ProviderRegistry
+from canslim_monitor.providers.types import ProviderStatus
+
+
+class FakeHistorical(HistoricalProvider):
+    connects = 0
+    connect_result = True
+
+    def __init__(self, api_key=None, throttle_profile=None, **settings):
+        super().__init__(name="fake_historical", throttle_profile=throttle_profile)
+        self.api_key = api_key
+        self._connected = False
+
+    def connect(self):
+        type(self).connects += 1
+        self._connected = type(self).connect_result
+        return self._connected
+
+    def disconnect(self):
+        self._connected = False
+
+    def is_connected(self):
+        return self._connected
+
+    def get_daily_bars(self, symbol, days=50, end_date=None):
+        return []
+
+    def get_intraday_volume(self, *args, **kwargs):
+        return None
+
+
+class FakeRealtime(RealtimeProvider):
+
+    def __init__(self, api_key=None, throttle_profile=None, **settings):
+        super().__init__(name="fake_realtime", throttle_profile=throttle_profile)
+
+    def connect(self):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def is_connected(self):
+        return True
+
+    def get_quote(self, symbol):
+        return None
+
+    def get_quotes(self, symbols):
+        return {}
+
+
+ProviderRegistry.register_historical("fakepool", FakeHistorical)
+ProviderRegistry.register_realtime("fakepool", FakeRealtime)
+
+
+class ProviderPoolTestCase(unittest.TestCase):
+
+    def setUp(self):
+        FakeHistorical.connects = 0
+        FakeHistorical.connect_result = True
+        self.db = DatabaseManager(in_memory=True)
+        self.db.initialize(seed_config=False)
+
+        session = self.db.get_new_session()
+        repo = ProviderRepository(session)
+        for name, domain in (("fake_hist", "historical"), ("fake_rt", "realtime")):
+            provider = repo.create_provider(name, domain, "fakepool", calls_per_minute=5)
+            repo.set_credential(provider.id, "api_key", "KEY1")
+        session.commit()
+        session.close()
+
+        self.pool = ProviderPool(self.db.get_new_session, health_check_interval=3600)
+
+    def tearDown(self):
+        self.pool.close()
+        self.db.close()
+
+    def test_acquire_connects_once_across_threads(self):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.pool.get_historical()))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(FakeHistorical.connects, 1)
+        self.assertEqual(len({id(p) for p in results}), 1)
+        self.assertEqual(self.pool.get_stats()["historical"]["acquires"], 8)
+
+    def test_same_credential_shares_rate_limiter(self):
+        historical = self.pool.get_historical()
+        realtime = self.pool.get_realtime()
+        self.assertIsNotNone(historical.rate_limiter)
+        self.assertIs(historical.rate_limiter, realtime.rate_limiter)
+
+    def test_health_check_only_on_interval(self):
+        provider = self.pool.get_historical()
+        provider._health.status = ProviderStatus.DOWN
+
+        # Within the interval: no reconnect
+        self.assertIs(self.pool.get_historical(), provider)
+        self.assertEqual(FakeHistorical.connects, 1)
+
+        # Interval elapsed: reconnected in place
+        self.pool.health_check_interval = 0
+        self.assertIs(self.pool.get_historical(), provider)
+        self.assertEqual(FakeHistorical.connects, 2)
+        self.assertEqual(self.pool.get_stats()["historical"]["reconnects"], 1)
+
+    def test_failed_connect_retried_after_interval(self):
+        FakeHistorical.connect_result = False
+        self.assertIsNone(self.pool.get_historical())
+        self.assertIsNone(self.pool.get_historical())
+        self.assertEqual(FakeHistorical.connects, 1)
+
+        FakeHistorical.connect_result = True
+        self.pool.health_check_interval = 0
+        self.assertIsNotNone(self.pool.get_historical())
+
+    def test_invalidate_rebuilds_but_keeps_limiter(self):
+        first = self.pool.get_historical()
+        limiter = first.rate_limiter
+        self.pool.invalidate("historical")
+        self.assertFalse(first.is_connected())
+
+        second = self.pool.get_historical()
+        self.assertIsNot(second, first)
+        self.assertIs(second.rate_limiter, limiter)
+        self.assertEqual(FakeHistorical.connects, 2)
+
+
+class TestSingleton(unittest.TestCase):
+
+    def test_get_provider_pool(self):
+        close_provider_pool()
+        self.assertIsNone(get_provider_pool())
+        db = DatabaseManager(in_memory=True)
+        pool = get_provider_pool(db.get_new_session)
+        self.assertIs(get_provider_pool(), pool)
+        close_provider_pool()
+        self.assertIsNone(get_provider_pool())
+        db.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,241 @@
+"""
+CANSLIM Monitor - Streaming Quote Book Tests
+=============================================
+Tests for the shared QuoteBook, the IBKR streaming subscription path and
+QuoteStreamThread's subscription reconciliation.
+
+A fake IB event source stands in for TWS: streamed tickers are pushed
+through ThreadSafeIBKRClient._on_pending_tickers exactly as
+ib_insync's pendingTickersEvent would.
+
+Run: python -m pytest tests/test_quote_stream.py
+"""
+
+import asyncio
+import sys
+import os
+import threading
+import time
+import types
+import unittest
+from threading import Event
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.integrations.ibkr_client_threadsafe import ThreadSafeIBKRClient
+from canslim_monitor.providers.ibkr import IBKRRealtimeProvider
+from canslim_monitor.providers.quote_book import QuoteBook
+from canslim_monitor.providers.types import Quote
+from canslim_monitor.service.threads.quote_stream_thread import QuoteStreamThread
+
+
+NaN = float('nan')
+
+
+class FakeStock:
+    def __init__(self, symbol, exchange='SMART', currency='USD'):
+        self.symbol = symbol
+        self.exchange = exchange
+        self.currency = currency
+        self.conId = 0
+
+
+class FakeTicker:
+    def __init__(self, contract):
+        self.contract = contract
+        self.last = NaN
+        self.close = NaN
+        self.bid = NaN
+        self.ask = NaN
+        self.volume = NaN
+        self.avVolume = NaN
+        self.high = NaN
+        self.low = NaN
+        self.open = NaN
+
+
+class FakeIBEventSource:
+    """Fake IB: hands out tickers and lets the test push ticks into them."""
+
+    def __init__(self, client):
+        self.client = client
+        self.tickers = {}
+        self.cancelled = []
+
+    def isConnected(self):
+        return True
+
+    async def qualifyContractsAsync(self, *contracts):
+        for i, c in enumerate(contracts, start=1):
+            c.conId = i
+        return list(contracts)
+
+    def reqMktData(self, contract, genericTickList='', snapshot=False, regulatorySnapshot=False):
+        ticker = FakeTicker(contract)
+        self.tickers[contract.symbol] = ticker
+        return ticker
+
+    def cancelMktData(self, contract):
+        self.cancelled.append(contract.symbol)
+
+    def tick(self, symbol, last, volume=1000.0):
+        """Emit a pendingTickersEvent for one ticker on the client's loop."""
+        ticker = self.tickers[symbol]
+        ticker.last = last
+        ticker.volume = volume
+        self.client._loop.call_soon_threadsafe(
+            self.client._on_pending_tickers, {ticker}
+        )
+
+
+class TestQuoteBook(unittest.TestCase):
+
+    def test_update_and_get(self):
+        book = QuoteBook()
+        seq = book.update(Quote(symbol='AAPL', last=200.0))
+        self.assertEqual(seq, 1)
+        self.assertEqual(book.get('aapl').last, 200.0)
+        self.assertIsNone(book.get('MSFT'))
+
+    def test_max_age(self):
+        book = QuoteBook()
+        book.update(Quote(symbol='AAPL', last=200.0))
+        self.assertIsNotNone(book.get('AAPL', max_age=60))
+        with patch('canslim_monitor.providers.quote_book.time.monotonic',
+                   return_value=time.monotonic() + 120):
+            self.assertIsNone(book.get('AAPL', max_age=60))
+            self.assertEqual(book.get_many(['AAPL'], max_age=60), {})
+
+    def test_changes_since(self):
+        book = QuoteBook()
+        book.update(Quote(symbol='AAPL', last=200.0))
+        seq = book.sequence
+        book.update(Quote(symbol='MSFT', last=400.0))
+        book.update(Quote(symbol='MSFT', last=401.0))
+
+        current, changed = book.changes_since(seq)
+        self.assertEqual(current, 3)
+        self.assertEqual(list(changed), ['MSFT'])
+        self.assertEqual(changed['MSFT'].last, 401.0)
+
+    def test_listener_and_remove(self):
+        book = QuoteBook()
+        seen = []
+        book.add_listener(lambda q, s: seen.append((q.symbol, s)))
+        book.update(Quote(symbol='AAPL', last=1.0))
+        book.remove(['AAPL'])
+        self.assertEqual(seen, [('AAPL', 1)])
+        self.assertNotIn('AAPL', book)
+
+
+class TestIBKRStreaming(unittest.TestCase):
+    """Streaming subscriptions on ThreadSafeIBKRClient via IBKRRealtimeProvider."""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+        fake_module = types.ModuleType('ib_insync')
+        fake_module.Stock = FakeStock
+        self.module_patch = patch.dict(sys.modules, {'ib_insync': fake_module})
+        self.module_patch.start()
+
+        self.client = ThreadSafeIBKRClient()
+        self.ib = FakeIBEventSource(self.client)
+        self.client._ib = self.ib
+        self.client._loop = self.loop
+        self.client._connected.set()
+
+        self.provider = IBKRRealtimeProvider(ibkr_client=self.client)
+        self.book = QuoteBook()
+
+    def tearDown(self):
+        self.module_patch.stop()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=2.0)
+        self.loop.close()
+
+    def _wait_for(self, predicate, timeout=1.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_ticks_flow_into_book(self):
+        self.assertTrue(self.provider.supports_streaming())
+        self.assertTrue(self.provider.subscribe(['AAPL', 'MSFT'], self.book.update))
+        self.assertEqual(sorted(self.provider.get_subscriptions()), ['AAPL', 'MSFT'])
+
+        self.ib.tick('AAPL', 201.5)
+        self.assertTrue(self._wait_for(lambda: 'AAPL' in self.book))
+
+        quote = self.book.get('AAPL')
+        self.assertEqual(quote.last, 201.5)
+        self.assertEqual(quote.volume, 1000)
+        self.assertNotIn('MSFT', self.book)
+
+    def test_unsubscribe_cancels_stream(self):
+        self.provider.subscribe(['AAPL', 'MSFT'], self.book.update)
+        self.provider.unsubscribe(['AAPL'])
+
+        self.assertEqual(self.provider.get_subscriptions(), ['MSFT'])
+        self.assertTrue(self._wait_for(lambda: 'AAPL' in self.ib.cancelled))
+
+    def test_subscribe_is_idempotent(self):
+        self.provider.subscribe(['AAPL'], self.book.update)
+        first = self.ib.tickers['AAPL']
+        self.provider.subscribe(['AAPL'], self.book.update)
+        self.assertIs(self.ib.tickers['AAPL'], first)
+
+
+class TestQuoteStreamThread(unittest.TestCase):
+    """Subscriptions follow the monitored symbol set."""
+
+    def setUp(self):
+        self.provider = MagicMock()
+        self.provider.is_connected.return_value = True
+        self.subscribed = set()
+        self.provider.get_subscriptions.side_effect = lambda: list(self.subscribed)
+        self.provider.subscribe.side_effect = (
+            lambda symbols, cb: self.subscribed.update(symbols) or True
+        )
+        self.provider.unsubscribe.side_effect = (
+            lambda symbols: self.subscribed.difference_update(symbols)
+        )
+        self.book = QuoteBook()
+        self.thread = QuoteStreamThread(
+            shutdown_event=Event(),
+            quote_book=self.book,
+            realtime_provider=self.provider,
+            config={'indices': ['SPY'], 'max_lines': 3},
+        )
+
+    def test_sync_adds_and_removes(self):
+        self.thread.sync(['AAPL', 'SPY'])
+        self.assertEqual(self.subscribed, {'AAPL', 'SPY'})
+
+        self.book.update(Quote(symbol='AAPL', last=1.0))
+        self.thread.sync(['NVDA', 'SPY'])
+
+        self.assertEqual(self.subscribed, {'NVDA', 'SPY'})
+        self.assertNotIn('AAPL', self.book)
+
+    def test_priority_and_cap(self):
+        self.thread.db_session_factory = MagicMock()
+        repo = MagicMock()
+        repo.get_in_position.return_value = [MagicMock(symbol='NVDA')]
+        repo.get_watching.return_value = [MagicMock(symbol='AAPL'), MagicMock(symbol='MSFT')]
+
+        with patch('canslim_monitor.data.repositories.PositionRepository', return_value=repo):
+            desired = self.thread._get_desired_symbols()
+
+        # Active first, then indices, then watchlist - capped at 3
+        self.assertEqual(desired, ['NVDA', 'SPY', 'AAPL'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,240 @@
+"""
+CANSLIM Monitor - Shared Rate Limit Tests
+==========================================
+Tests for the cross-process token bucket: one budget per API key across
+processes, priority pre-emption and aging, the shared 429 back-off, and
+PolygonClient drawing from it.
+
+Run: python -m pytest tests/test_shared_rate_limit.py
+"""
+
+import sys
+import os
+import multiprocessing
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.integrations.polygon_client import PolygonClient
+from canslim_monitor.utils import shared_rate_limit
+from canslim_monitor.utils.shared_rate_limit import (
+    RatePriority,
+    SharedRateLimiter,
+    configure_shared_rate_limit,
+    current_rate_priority,
+    get_shared_rate_limiter,
+    rate_priority,
+    reset_shared_rate_limits,
+)
+
+
+def _drain(path, count, start, results):
+    """Child process: acquire *count* tokens and report completion times."""
+    limiter = SharedRateLimiter('KEY', calls_per_minute=600, path=path)
+    start.wait(30)
+    for _ in range(count):
+        limiter.acquire()
+        results.put(time.time())
+    limiter.close()
+
+
+class SharedRateLimitTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'rate.db')
+
+    def tearDown(self):
+        reset_shared_rate_limits()
+        self.tmpdir.cleanup()
+
+    def _limiter(self, **kwargs):
+        params = dict(calls_per_minute=600)
+        params.update(kwargs)
+        limiter = SharedRateLimiter('KEY', path=self.path, **params)
+        self.addCleanup(limiter.close)
+        return limiter
+
+    def test_budget_shared_between_instances(self):
+        first = self._limiter(calls_per_minute=2)
+        second = self._limiter(calls_per_minute=2)
+        self.assertIsNotNone(first.acquire(timeout=0))
+        self.assertIsNotNone(first.acquire(timeout=0))
+        # Bucket holds 2 tokens, both drawn above; the other instance must wait
+        self.assertIsNone(second.acquire(timeout=0.2))
+        self.assertEqual(second.get_state()['waiting'], {})
+
+    def test_other_keys_have_their_own_bucket(self):
+        self._limiter(calls_per_minute=1).acquire()
+        other = SharedRateLimiter('OTHER', calls_per_minute=1, path=self.path)
+        self.addCleanup(other.close)
+        self.assertIsNotNone(other.acquire(timeout=0.1))
+
+    def test_processes_share_one_budget(self):
+        # 10 tokens/s from an empty bucket: 20 calls from 2 processes need ~2 s
+        limiter = self._limiter()
+        ctx = multiprocessing.get_context('spawn')
+        results, start = ctx.Queue(), ctx.Event()
+        procs = [ctx.Process(target=_drain, args=(self.path, 10, start, results)) for _ in range(2)]
+        for p in procs:
+            p.start()
+        time.sleep(1.0)   # Children open the bucket, then block on start
+        with limiter._transaction() as cur:
+            cur.execute("UPDATE buckets SET tokens = 0, updated_at = ?", (time.time(),))
+        start.set()
+
+        times = sorted(results.get(timeout=30) for _ in range(20))
+        for p in procs:
+            p.join(10)
+
+        # Per-process buckets would finish both halves in ~1 s
+        self.assertGreaterEqual(times[-1] - times[0], 1.5)
+
+    def test_high_priority_preempts_low(self):
+        limiter = self._limiter(calls_per_minute=60, burst_size=0)
+        order = []
+
+        # Empty the bucket
+        while limiter.acquire(timeout=0) is not None:
+            pass
+
+        def call(priority, label):
+            limiter.acquire(priority=priority)
+            order.append(label)
+
+        low = threading.Thread(target=call, args=(RatePriority.LOW, 'low'))
+        low.start()
+        time.sleep(0.1)
+        high = threading.Thread(target=call, args=(RatePriority.HIGH, 'high'))
+        high.start()
+        low.join(10)
+        high.join(10)
+
+        self.assertEqual(order, ['high', 'low'])
+
+    def test_low_waiter_ages_past_normal_stream(self):
+        # 10 tokens/s against 20 NORMAL arrivals/s: NORMAL is always queued
+        limiter = self._limiter(calls_per_minute=600, burst_size=0)
+        while limiter.acquire(timeout=0) is not None:
+            pass
+        done = {}
+        streaming = threading.Event()
+        streaming.set()
+
+        def low_call():
+            limiter.acquire(priority=RatePriority.LOW, timeout=10)
+            done['low'] = streaming.is_set()
+
+        def normal_call():
+            limiter.acquire(priority=RatePriority.NORMAL, timeout=10)
+
+        with patch.object(shared_rate_limit, 'PRIORITY_AGING_SECONDS', 0.3):
+            normals = []
+            low = threading.Thread(target=low_call)
+            low.start()
+            for _ in range(60):
+                t = threading.Thread(target=normal_call)
+                t.start()
+                normals.append(t)
+                time.sleep(0.05)
+            streaming.clear()
+            low.join(15)
+            for t in normals:
+                t.join(15)
+
+        # Served while NORMAL callers were still arriving, not after they stopped
+        self.assertTrue(done.get('low'))
+
+    def test_low_priority_wait_is_bounded(self):
+        limiter = self._limiter(calls_per_minute=1, burst_size=0)
+        limiter.acquire(timeout=0)
+        with patch.object(shared_rate_limit, 'LOW_PRIORITY_TIMEOUT', 0.2):
+            self.assertIsNone(limiter.acquire(priority=RatePriority.LOW))
+        self.assertEqual(limiter.get_state()['waiting'], {})
+
+    def test_429_backoff_is_shared(self):
+        first = self._limiter(calls_per_minute=6)
+        second = self._limiter(calls_per_minute=6)
+        first.report_429()
+        self.assertGreater(second.get_state()['backoff_remaining'], 0)
+        self.assertIsNone(second.acquire(timeout=0.2))
+
+        first.report_success()
+        with first._transaction() as cur:
+            cur.execute("UPDATE buckets SET backoff_until = 0, tokens = 5")
+        self.assertIsNotNone(second.acquire(timeout=0.2))
+
+    def test_thread_priority_context(self):
+        self.assertEqual(current_rate_priority(), RatePriority.NORMAL)
+        with rate_priority(RatePriority.HIGH):
+            self.assertEqual(current_rate_priority(), RatePriority.HIGH)
+            with rate_priority(RatePriority.LOW):
+                self.assertEqual(current_rate_priority(), RatePriority.LOW)
+            self.assertEqual(current_rate_priority(), RatePriority.HIGH)
+        self.assertEqual(current_rate_priority(), RatePriority.NORMAL)
+
+    def test_registry(self):
+        self.assertIsNone(get_shared_rate_limiter('KEY'))
+        self.assertIsNone(configure_shared_rate_limit('KEY', 0, path=self.path))
+        limiter = configure_shared_rate_limit('KEY', 5, path=self.path)
+        self.assertIs(get_shared_rate_limiter('KEY'), limiter)
+        self.assertIs(configure_shared_rate_limit('KEY', 10), limiter)
+        self.assertEqual(limiter.get_state()['calls_per_minute'], 10)
+
+
+class TestPolygonClientUsesBudget(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.limiter = configure_shared_rate_limit(
+            'POLYKEY', 600, path=os.path.join(self.tmpdir.name, 'rate.db')
+        )
+
+    def tearDown(self):
+        reset_shared_rate_limits()
+        self.tmpdir.cleanup()
+
+    def test_429_reports_instead_of_sleeping(self):
+        response = MagicMock(status_code=429)
+        client = PolygonClient(api_key='POLYKEY', rate_limit_delay=0)
+        with patch('canslim_monitor.utils.http_pool.HttpPool.get', return_value=response), \
+                patch('canslim_monitor.integrations.polygon_client.sleep') as sleep:
+            self.assertIsNone(client._make_request('/v1/marketstatus/now'))
+        sleep.assert_not_called()
+        self.assertGreater(self.limiter.get_state()['backoff_remaining'], 0)
+
+    def test_success_draws_token(self):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {'status': 'OK'}
+        client = PolygonClient(api_key='POLYKEY', rate_limit_delay=0)
+        with patch('canslim_monitor.utils.http_pool.HttpPool.get', return_value=response):
+            for _ in range(3):
+                self.assertEqual(client._make_request('/x')['status'], 'OK')
+        self.assertLess(self.limiter.get_state()['tokens'], 598)
+
+    def test_locked_budget_falls_back_to_local_delay(self):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {'status': 'OK'}
+        client = PolygonClient(api_key='POLYKEY', rate_limit_delay=0)
+        locked = sqlite3.OperationalError("database is locked")
+        with patch.object(self.limiter, 'acquire', side_effect=locked), \
+                patch.object(self.limiter, 'report_success') as report, \
+                patch('canslim_monitor.utils.http_pool.HttpPool.get', return_value=response):
+            self.assertEqual(client._make_request('/x')['status'], 'OK')
+        report.assert_not_called()
+
+    def test_budget_timeout_skips_request(self):
+        client = PolygonClient(api_key='POLYKEY', rate_limit_delay=0)
+        with patch.object(self.limiter, 'acquire', return_value=None), \
+                patch('canslim_monitor.utils.http_pool.HttpPool.get') as get:
+            self.assertIsNone(client._make_request('/x'))
+        get.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
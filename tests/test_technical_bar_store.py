@@ -0,0 +1,147 @@
+"""
+CANSLIM Monitor - Technical Data Bar Store Tests
+=================================================
+Tests for TechnicalDataService's local bar store: one backfill per
+symbol, then incremental top-ups of only the missing tail.
+
+Run: python -m pytest tests/test_technical_bar_store.py
+"""
+
+import sys
+import os
+import unittest
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.data.database import DatabaseManager
+from canslim_monitor.data.repositories import BarRepository
+from canslim_monitor.integrations.polygon_client import Bar
+from canslim_monitor.services.technical_data_service import TechnicalDataService
+
+
+def _weekdays(end: date, count: int):
+    """The last *count* weekdays up to and including *end*, oldest first."""
+    days = []
+    d = end
+    while len(days) < count:
+        if d.weekday() < 5:
+            days.append(d)
+        d -= timedelta(days=1)
+    return list(reversed(days))
+
+
+def close_for(d: date) -> float:
+    """Deterministic close per calendar date, so overlapping histories agree."""
+    return 100.0 + (d - date(2020, 1, 1)).days * 0.1
+
+
+class FakePolygon:
+    """Serves a synthetic price history and records every request."""
+
+    def __init__(self, end: date, history: int = 400):
+        self.dates = _weekdays(end, history)
+        self.calls = []
+        self.rate_limited = False
+
+    def get_daily_bars(self, symbol, days=50, end_date=None):
+        self.calls.append(days)
+        if self.rate_limited:
+            return []
+        return [
+            Bar(symbol=symbol, bar_date=d, open=close_for(d), high=close_for(d) + 1,
+                low=close_for(d) - 1, close=close_for(d), volume=1_000_000 + d.day)
+            for d in self.dates
+        ][-days:]
+
+
+class TestTechnicalBarStore(unittest.TestCase):
+
+    def setUp(self):
+        self.db = DatabaseManager(in_memory=True)
+        self.db.initialize(seed_config=False)
+        self.yesterday = date.today() - timedelta(days=1)
+
+    def _service(self, fake):
+        service = TechnicalDataService(db_session_factory=self.db.get_new_session)
+        service._polygon_client = fake
+        return service
+
+    def test_cold_start_backfills_once(self):
+        fake = FakePolygon(self.yesterday)
+        service = self._service(fake)
+
+        data = service.get_technical_data('NVDA')
+
+        self.assertEqual(fake.calls, [TechnicalDataService.BARS_NEEDED])
+        self.assertIsNotNone(data['ma_200'])
+        session = self.db.get_new_session()
+        self.assertEqual(BarRepository(session).count('NVDA'), TechnicalDataService.BARS_NEEDED)
+        session.close()
+
+    def test_restart_tops_up_missing_tail(self):
+        """A new service instance reuses the store and fetches only new bars."""
+        stale = FakePolygon(self.yesterday - timedelta(days=7))
+        self._service(stale).get_technical_data('NVDA')
+
+        fake = FakePolygon(self.yesterday)
+        data = self._service(fake).get_technical_data('NVDA')
+
+        self.assertEqual(len(fake.calls), 1)
+        self.assertLessEqual(fake.calls[0], 5)
+        session = self.db.get_new_session()
+        repo = BarRepository(session)
+        self.assertEqual(repo.get_last_bar_date('NVDA'), fake.dates[-1])
+        session.close()
+        self.assertEqual(data['last_close'], round(close_for(fake.dates[-1]), 2))
+
+    def test_up_to_date_store_makes_no_request(self):
+        fake = FakePolygon(self.yesterday)
+        self._service(fake).get_technical_data('NVDA')
+        fake.calls.clear()
+
+        # Last stored bar is the most recent weekday up to yesterday
+        self._service(fake).get_technical_data('NVDA')
+        self.assertEqual(fake.calls, [])
+
+    def test_matches_full_download(self):
+        """MAs from store + top-up equal MAs from a full 250-bar download."""
+        stale = FakePolygon(self.yesterday - timedelta(days=14))
+        self._service(stale).get_technical_data('AAPL')
+        fake = FakePolygon(self.yesterday)
+        incremental = self._service(fake).get_technical_data('AAPL')
+
+        direct = TechnicalDataService()
+        direct._polygon_client = FakePolygon(self.yesterday)
+        full = direct.get_technical_data('AAPL')
+
+        self.assertEqual(incremental, full)
+
+    def test_rate_limited_uses_stored_bars(self):
+        stale = FakePolygon(self.yesterday - timedelta(days=7))
+        self._service(stale).get_technical_data('NVDA')
+
+        fake = FakePolygon(self.yesterday)
+        fake.rate_limited = True
+        data = self._service(fake).get_technical_data('NVDA')
+
+        self.assertIsNotNone(data['ma_50'])
+        self.assertEqual(data['last_close'], round(close_for(stale.dates[-1]), 2))
+
+    def test_upsert_updates_existing_rows(self):
+        session = self.db.get_new_session()
+        repo = BarRepository(session)
+        d = date(2024, 6, 3)
+        repo.upsert_bars([Bar('MSFT', d, 1, 2, 0.5, 1.5, 100)])
+        repo.upsert_bars([Bar('MSFT', d, 1, 2, 0.5, 1.8, 200),
+                          Bar('MSFT', d + timedelta(days=1), 1, 2, 0.5, 1.9, 300)])
+        session.commit()
+
+        bars = repo.get_bars('MSFT')
+        self.assertEqual([b.close for b in bars], [1.8, 1.9])
+        self.assertEqual(repo.count('MSFT'), 2)
+        session.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
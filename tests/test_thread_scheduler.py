@@ -0,0 +1,142 @@
+"""
+CANSLIM Monitor - Thread Scheduler Tests
+=========================================
+Tests for FixedRateScheduler deadline bookkeeping and BaseThread's
+fixed-rate loop (missed ticks, lateness histogram, closed-market sleep).
+
+Run: python -m pytest tests/test_thread_scheduler.py
+"""
+
+import random
+import sys
+import os
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from canslim_monitor.service.threads.base_thread import BaseThread
+from canslim_monitor.service.threads.scheduler import FixedRateScheduler
+
+
+class TestFixedRateScheduler(unittest.TestCase):
+
+    def test_cadence_does_not_drift_with_cycle_time(self):
+        s = FixedRateScheduler(30)
+        s.start(now=0)
+        self.assertEqual(s.time_until_next(now=0), 0)
+
+        # Cycle takes 12s: next start is still t=30, not t=42
+        self.assertEqual(s.advance(now=12), 0)
+        self.assertEqual(s.time_until_next(now=12), 18)
+        self.assertEqual(s.next_deadline, 30)
+
+    def test_overrun_skips_deadlines(self):
+        s = FixedRateScheduler(10)
+        s.start(now=0)
+
+        # Cycle ran until t=35: deadlines 10, 20, 30 are skipped, next is 40
+        self.assertEqual(s.advance(now=35), 3)
+        self.assertEqual(s.next_deadline, 40)
+
+        # Ending exactly on a deadline runs it
+        self.assertEqual(s.advance(now=50), 0)
+        self.assertEqual(s.next_deadline, 50)
+
+    def test_lateness(self):
+        s = FixedRateScheduler(10)
+        s.start(now=100)
+        self.assertAlmostEqual(s.begin_tick(now=100.25), 0.25)
+        self.assertEqual(s.begin_tick(now=99), 0)
+
+    def test_jitter_phase(self):
+        s = FixedRateScheduler(30, jitter=3, rng=random.Random(7))
+        self.assertTrue(0 <= s.phase < 3)
+        s.start(now=0)
+        self.assertEqual(s.next_deadline, s.phase)
+
+        s.reanchor(600, now=50)
+        self.assertEqual(s.next_deadline, 650 + s.phase)
+
+        self.assertEqual(FixedRateScheduler(30).phase, 0)
+
+
+class FakeCalendar:
+    def __init__(self, open_in):
+        self.open_in = open_in
+
+    def seconds_until_open(self):
+        return self.open_in
+
+
+class CountingThread(BaseThread):
+
+    def __init__(self, shutdown_event, poll_interval, work_s=0.0, run=True, **kwargs):
+        super().__init__(name='test', shutdown_event=shutdown_event,
+                         poll_interval=poll_interval, jitter=0, **kwargs)
+        self.work_s = work_s
+        self.run_allowed = run
+        self.starts = []
+
+    def _should_run(self):
+        return self.run_allowed
+
+    def _do_work(self):
+        self.starts.append(time.monotonic())
+        time.sleep(self.work_s)
+
+
+class TestBaseThreadSchedule(unittest.TestCase):
+
+    def _run_for(self, thread, seconds):
+        thread.start()
+        time.sleep(seconds)
+        thread.shutdown_event.set()
+        thread.join(timeout=2)
+
+    def test_fixed_rate(self):
+        thread = CountingThread(threading.Event(), poll_interval=0.05, work_s=0.03)
+        self._run_for(thread, 0.42)
+
+        gaps = [b - a for a, b in zip(thread.starts, thread.starts[1:])]
+        self.assertGreaterEqual(len(gaps), 5)
+        # Fixed-delay would give ~0.08s gaps
+        self.assertLess(sum(gaps) / len(gaps), 0.065)
+
+        stats = thread.get_stats()
+        self.assertEqual(stats['missed_ticks'], 0)
+        self.assertEqual(sum(stats['lateness_hist'].values()), len(thread.starts))
+
+    def test_overrun_counted_not_queued(self):
+        thread = CountingThread(threading.Event(), poll_interval=0.05, work_s=0.12)
+        self._run_for(thread, 0.5)
+
+        gaps = [b - a for a, b in zip(thread.starts, thread.starts[1:])]
+        # Skipped ticks are not run back to back
+        self.assertTrue(all(g >= 0.12 for g in gaps))
+
+        stats = thread.get_stats()
+        self.assertGreaterEqual(stats['missed_ticks'], 2)
+        self.assertGreaterEqual(stats['missed_hist']['2'], 1)
+
+    def test_market_hours_only_sleeps_until_open(self):
+        thread = CountingThread(threading.Event(), poll_interval=0.02, run=False, market_hours_only=True)
+        thread._market_calendar = FakeCalendar(open_in=600)
+        self._run_for(thread, 0.2)
+
+        stats = thread.get_stats()
+        self.assertEqual(stats['state'], 'stopped')
+        # One closed check, then asleep until the open
+        self.assertEqual(sum(stats['lateness_hist'].values()), 1)
+
+    def test_other_threads_keep_polling_when_idle(self):
+        thread = CountingThread(threading.Event(), poll_interval=0.02, run=False)
+        thread._market_calendar = FakeCalendar(open_in=600)
+        self._run_for(thread, 0.2)
+
+        self.assertGreater(sum(thread.get_stats()['lateness_hist'].values()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
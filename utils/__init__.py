@@ -21,6 +21,15 @@ from canslim_monitor.utils.logging import (
     get_gui_logger,
     LoggingManager
 )
+from canslim_monitor.utils.http_pool import HttpPool, get_http_pool, init_http_pool
+from canslim_monitor.utils.shared_rate_limit import (
+    SharedRateLimiter,
+    RatePriority,
+    rate_priority,
+    set_default_rate_priority,
+    configure_shared_rate_limit,
+    get_shared_rate_limiter,
+)
 from canslim_monitor.utils.market_calendar import MarketCalendar, get_market_calendar, init_market_calendar
 from canslim_monitor.utils.config import (
     load_config,
@@ -68,6 +77,17 @@ __all__ = [
     'get_database_logger',
     'get_gui_logger',
     'LoggingManager',
+    # HTTP Pool
+    'HttpPool',
+    'get_http_pool',
+    'init_http_pool',
+    # Shared rate budget
+    'SharedRateLimiter',
+    'RatePriority',
+    'rate_priority',
+    'set_default_rate_priority',
+    'configure_shared_rate_limit',
+    'get_shared_rate_limiter',
     # Market Calendar
     'MarketCalendar',
     'get_market_calendar',
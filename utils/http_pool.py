@@ -0,0 +1,218 @@
+"""
+CANSLIM Monitor - Pooled HTTP Sessions
+Shared keep-alive HTTP layer for every outbound REST client.
+
+Polygon/Massive, the market calendar, CNN Fear & Greed, Yahoo VIX and
+the Discord webhooks all used module-level requests.get/post, which
+opens a new TCP+TLS connection per call.  HttpPool keeps per-host
+connection pools alive across calls and threads:
+
+- One requests.Session per thread (cookies/headers are not shared), all
+  mounted on the same HTTPAdapter so urllib3's per-host pools are shared
+- gzip/deflate negotiated by requests (Accept-Encoding) and decoded
+  transparently
+- Per-host request counts, errors and latency percentiles (get_stats)
+
+Responses and exceptions are plain requests objects, so callers keep
+their existing status handling and ``except requests.exceptions...``
+clauses.
+
+Usage:
+    from canslim_monitor.utils.http_pool import get_http_pool
+
+    response = get_http_pool().get(url, params=params, timeout=10)
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_POOL_CONNECTIONS = 10   # Hosts with a cached pool
+DEFAULT_POOL_MAXSIZE = 10       # Keep-alive connections kept per host
+LATENCY_WINDOW = 1000           # Latency samples kept per host
+
+
+def _percentile(sorted_values, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100.0 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(rank, len(sorted_values) - 1))]
+
+
+class _HostStats:
+    """Request counters for one host (guarded by HttpPool._stats_lock)."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.status: Dict[int, int] = {}
+        self.latencies = deque(maxlen=LATENCY_WINDOW)   # seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'status': dict(self.status),
+            'p50_ms': round(_percentile(latencies, 50) * 1000, 1),
+            'p90_ms': round(_percentile(latencies, 90) * 1000, 1),
+            'p99_ms': round(_percentile(latencies, 99) * 1000, 1),
+            'max_ms': round(latencies[-1] * 1000, 1) if latencies else 0.0,
+        }
+
+
+class HttpPool:
+    """
+    Thread-safe pooled HTTP client with per-host stats.
+
+    Use the process-wide instance from get_http_pool() so every client
+    shares the same keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            pool_connections: Number of hosts whose pools are cached
+            pool_maxsize: Keep-alive connections kept per host (the most
+                concurrent requests to one host that reuse connections)
+            logger: Logger instance
+        """
+        self.logger = logger or logging.getLogger('canslim.http')
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, _HostStats] = {}
+        self._adapter: Optional[HTTPAdapter] = None
+        self._generation = 0
+        self.configure(pool_connections, pool_maxsize)
+
+    def configure(self, pool_connections: int = None, pool_maxsize: int = None):
+        """
+        Resize the connection pools.
+
+        Threads pick up the new adapter on their next request; connections
+        in the old pools are closed.
+        """
+        self.pool_connections = pool_connections or getattr(self, 'pool_connections', DEFAULT_POOL_CONNECTIONS)
+        self.pool_maxsize = pool_maxsize or getattr(self, 'pool_maxsize', DEFAULT_POOL_MAXSIZE)
+
+        old = self._adapter
+        self._adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        self._generation += 1
+        if old is not None:
+            old.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """This thread's Session, mounted on the shared adapter."""
+        local = self._local
+        if getattr(local, 'generation', None) != self._generation:
+            session = getattr(local, 'session', None) or requests.Session()
+            session.mount('https://', self._adapter)
+            session.mount('http://', self._adapter)
+            local.session = session
+            local.generation = self._generation
+        return local.session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request over the shared pools.
+
+        Same arguments and exceptions as requests.request(); pass an
+        explicit timeout as with requests.
+        """
+        host = urlsplit(url).netloc
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception:
+            self._record(host, time.perf_counter() - start, None)
+            raise
+        self._record(host, time.perf_counter() - start, response.status_code)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def _record(self, host: str, elapsed: float, status: Optional[int]):
+        with self._stats_lock:
+            stats = self._stats.get(host)
+            if stats is None:
+                stats = self._stats[host] = _HostStats()
+            stats.requests += 1
+            stats.latencies.append(elapsed)
+            if status is None:
+                stats.errors += 1
+            else:
+                stats.status[status] = stats.status.get(status, 0) + 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host {requests, errors, status, p50_ms, p90_ms, p99_ms, max_ms}."""
+        with self._stats_lock:
+            return {host: stats.to_dict() for host, stats in self._stats.items()}
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats.clear()
+
+    def close(self):
+        """Close pooled connections (the pool stays usable)."""
+        self.configure()
+
+
+# Singleton instance
+_pool: Optional[HttpPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HttpPool:
+    """
+    Get the process-wide HTTP pool.
+
+    Returns:
+        HttpPool instance
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = HttpPool()
+    return _pool
+
+
+def init_http_pool(config: Dict[str, Any] = None) -> HttpPool:
+    """
+    Configure the process-wide HTTP pool from the ``http`` config section.
+
+    Args:
+        config: Full application config
+
+    Returns:
+        HttpPool instance
+    """
+    http_config = (config or {}).get('http', {}) or {}
+    pool = get_http_pool()
+    pool.configure(
+        pool_connections=http_config.get('pool_connections'),
+        pool_maxsize=http_config.get('pool_maxsize'),
+    )
+    return pool
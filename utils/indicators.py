@@ -22,7 +22,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, date, timedelta
 from typing import Tuple, Optional, Dict, List
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
 @dataclass
@@ -48,6 +48,7 @@ class TechnicalProfile:
     # Raw indicator values
     up_down_ratio: float = None
     ma_50: float = None
+    ma_50_slope_pct: float = None
     ma_200: float = None
     ma_10w: float = None
     current_price: float = None
@@ -222,21 +223,26 @@ def calculate_ma_position(
             details={"error": "Need at least 50 days of data"}
         )
     
-    df = daily_df.copy()
-    
-    # Calculate 50-day MA
-    df['ma_50'] = calculate_sma(df['close'], 50)
+    ma_50, ma_slope = calculate_ma_50_trend(daily_df)
     
     # Get current values
     if current_price is None:
-        current_price = df['close'].iloc[-1]
-    
-    ma_50 = df['ma_50'].iloc[-1]
-    ma_50_prev = df['ma_50'].iloc[-6] if len(df) > 55 else ma_50  # 5 days ago
+        current_price = daily_df['close'].iloc[-1]
     
-    # Calculate MA slope (positive = trending up)
+    return score_ma_position(current_price, ma_50, ma_slope)
+
+
+def calculate_ma_50_trend(daily_df: pd.DataFrame) -> Tuple[float, float]:
+    """50-day MA and its 5-day slope in percent (positive = trending up)."""
+    ma_series = calculate_sma(daily_df['close'], 50)
+    ma_50 = ma_series.iloc[-1]
+    ma_50_prev = ma_series.iloc[-6] if len(daily_df) > 55 else ma_50  # 5 days ago
     ma_slope = (ma_50 - ma_50_prev) / ma_50_prev * 100 if ma_50_prev > 0 else 0
-    
+    return ma_50, ma_slope
+
+
+def score_ma_position(current_price: float, ma_50: float, ma_slope: float) -> IndicatorResult:
+    """Score price vs the 50-day MA (see calculate_ma_position)."""
     # Calculate percent from MA
     pct_from_ma = (current_price - ma_50) / ma_50 * 100 if ma_50 > 0 else 0
     
@@ -639,7 +645,7 @@ def build_technical_profile(
     
     # Calculate 50-day MA
     if len(daily_df) >= 50:
-        profile.ma_50 = calculate_sma(daily_df['close'], 50).iloc[-1]
+        profile.ma_50, profile.ma_50_slope_pct = calculate_ma_50_trend(daily_df)
     
     # Calculate 200-day MA
     if len(daily_df) >= 200:
@@ -692,3 +698,20 @@ def build_technical_profile(
     )
     
     return profile
+
+
+def reprice_profile(profile: TechnicalProfile, current_price: float) -> TechnicalProfile:
+    """
+    Copy of *profile* with the price-dependent factor (50-day MA position)
+    re-scored at *current_price*. Everything else depends only on daily bars.
+    """
+    if not current_price or current_price <= 0 or profile.ma_50 is None:
+        return profile
+    
+    ma_result = score_ma_position(current_price, profile.ma_50, profile.ma_50_slope_pct or 0)
+    repriced = replace(profile, indicator_details=dict(profile.indicator_details))
+    repriced.current_price = current_price
+    repriced.indicator_details['ma_position'] = ma_result
+    repriced.dynamic_score += ma_result.score - profile.ma_position_score
+    repriced.ma_position_score = ma_result.score
+    return repriced
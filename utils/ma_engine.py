@@ -0,0 +1,196 @@
+"""
+CANSLIM Monitor - Bulk Moving-Average Engine
+=============================================
+Computes TechnicalDataService's indicators for many symbols at once.
+
+Bars for every symbol are packed into right-aligned 2-D arrays
+(symbols x bars, most recent bar in the last column, NaN padding on the
+left for short histories) and each indicator is one vectorized pass:
+
+- SMA 21/50/200 and 50-day average volume: window sums over the last
+  N columns
+- EMA 21: the recurrence runs over the time axis once, updating every
+  symbol per step (seeded per symbol with its first-21-bar SMA)
+- 10-week MA: calendar-week boundaries found once for the whole matrix
+
+Results match TechnicalDataService's per-symbol ``_calculate_*`` methods.
+
+Usage:
+    matrix = BarMatrix.from_bars({'NVDA': bars, 'AAPL': bars2})
+    values = compute_indicators(matrix)
+    values['ma_50'][matrix.index['NVDA']]
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+DEPTH = 250         # Bars per symbol (enough for the 200-day MA)
+EMA_PERIOD = 21
+WEEKS = 10
+
+_close = attrgetter('close')
+_volume = attrgetter('volume')
+_bar_date = attrgetter('bar_date')
+
+
+@dataclass
+class BarMatrix:
+    """Right-aligned close/volume/week-key arrays for a set of symbols."""
+    symbols: List[str]
+    index: Dict[str, int]
+    closes: np.ndarray          # float64 (S, T), NaN-padded on the left
+    volumes: np.ndarray         # float64 (S, T), NaN-padded on the left
+    week_keys: np.ndarray       # int64 (S, T), -1 where padded
+    lengths: np.ndarray         # int64 (S,), bars actually present
+    last_dates: List[Optional[date]]
+
+    @classmethod
+    def from_bars(cls, bars_by_symbol: Dict[str, Sequence], depth: int = DEPTH) -> 'BarMatrix':
+        """
+        Pack bar lists (oldest first, objects with bar_date/close/volume)
+        into a matrix, keeping the most recent *depth* bars per symbol.
+        """
+        symbols = list(bars_by_symbol)
+        s = len(symbols)
+        closes = np.full((s, depth), np.nan)
+        volumes = np.full((s, depth), np.nan)
+        week_keys = np.full((s, depth), -1, dtype=np.int64)
+        lengths = np.zeros(s, dtype=np.int64)
+        last_dates: List[Optional[date]] = []
+        # Most symbols share the same trading dates, so week keys are
+        # computed once per distinct date sequence
+        keys_by_dates: Dict[tuple, np.ndarray] = {}
+
+        for row, symbol in enumerate(symbols):
+            bars = list(bars_by_symbol[symbol])[-depth:]
+            n = len(bars)
+            lengths[row] = n
+            last_dates.append(bars[-1].bar_date if bars else None)
+            if not n:
+                continue
+            closes[row, depth - n:] = np.fromiter(map(_close, bars), float, n)
+            volumes[row, depth - n:] = np.fromiter(map(_volume, bars), float, n)
+
+            dates = tuple(map(_bar_date, bars))
+            keys = keys_by_dates.get(dates)
+            if keys is None:
+                # Same (year, ISO week) key as TechnicalDataService._calculate_weekly_ma
+                keys = np.array([d.year * 100 + d.isocalendar()[1] for d in dates])
+                keys_by_dates[dates] = keys
+            week_keys[row, depth - n:] = keys
+
+        return cls(
+            symbols=symbols,
+            index={sym: i for i, sym in enumerate(symbols)},
+            closes=closes,
+            volumes=volumes,
+            week_keys=week_keys,
+            lengths=lengths,
+            last_dates=last_dates,
+        )
+
+
+def compute_indicators(matrix: BarMatrix) -> Dict[str, np.ndarray]:
+    """
+    Compute all indicators for every row of *matrix*.
+
+    Returns:
+        Dict of float arrays (S,) keyed ma_21, ma_50, ma_200, ema_21,
+        ma_10_week, avg_volume_50d, last_close. NaN where a symbol has
+        too little history (the per-symbol methods return None there).
+    """
+    closes = matrix.closes
+    lengths = matrix.lengths
+    depth = closes.shape[1]
+
+    result = {
+        'ma_21': _sma(closes, lengths, 21),
+        'ma_50': _sma(closes, lengths, 50),
+        'ma_200': _sma(closes, lengths, 200),
+        'ema_21': _ema(closes, lengths, EMA_PERIOD),
+        'ma_10_week': _weekly_ma(closes, matrix.week_keys, lengths, WEEKS),
+        'avg_volume_50d': _avg_volume(matrix.volumes, lengths, 50),
+        'last_close': np.where(lengths > 0, closes[:, depth - 1], np.nan),
+    }
+    return result
+
+
+def _sma(closes: np.ndarray, lengths: np.ndarray, period: int) -> np.ndarray:
+    """Latest SMA per row; NaN where fewer than *period* bars."""
+    if period > closes.shape[1]:
+        return np.full(closes.shape[0], np.nan)
+    sums = closes[:, -period:].sum(axis=1)
+    return np.where(lengths >= period, sums / period, np.nan)
+
+
+def _ema(closes: np.ndarray, lengths: np.ndarray, period: int) -> np.ndarray:
+    """
+    Latest EMA per row, seeded with the SMA of each row's first *period*
+    bars; one pass over the time axis updates all rows together.
+    """
+    s, depth = closes.shape
+    out = np.full(s, np.nan)
+    valid = lengths >= period
+    if not valid.any():
+        return out
+
+    start = depth - lengths                     # first real column per row
+    seed_col = start + period - 1
+    window = np.clip(start[:, None] + np.arange(period), 0, depth - 1)
+    seed = np.take_along_axis(closes, window, axis=1).sum(axis=1) / period
+
+    multiplier = 2 / (period + 1)
+    ema = np.full(s, np.nan)
+    first = int(seed_col[valid].min())
+    for t in range(first, depth):
+        seeded_now = valid & (seed_col == t)
+        running = valid & (seed_col < t)
+        ema = np.where(seeded_now, seed, ema)
+        ema = np.where(
+            running,
+            closes[:, t] * multiplier + ema * (1 - multiplier),
+            ema,
+        )
+    out[valid] = ema[valid]
+    return out
+
+
+def _weekly_ma(
+    closes: np.ndarray,
+    week_keys: np.ndarray,
+    lengths: np.ndarray,
+    weeks: int,
+) -> np.ndarray:
+    """
+    SMA of the last *weeks* weekly closes (last daily close of each
+    calendar week); NaN with fewer than weeks*5 daily bars or *weeks* weeks.
+    """
+    s, depth = closes.shape
+    # A column closes its week when the next column starts a different week
+    week_end = np.empty((s, depth), dtype=bool)
+    week_end[:, :-1] = week_keys[:, :-1] != week_keys[:, 1:]
+    week_end[:, -1] = True
+    week_end &= week_keys >= 0
+
+    # Rank week ends from the right: 1 = current week, 2 = prior week, ...
+    rank = np.cumsum(week_end[:, ::-1], axis=1)[:, ::-1]
+    take = week_end & (rank <= weeks)
+    sums = np.where(take, closes, 0.0).sum(axis=1)
+    n_weeks = week_end.sum(axis=1)
+
+    ok = (lengths >= weeks * 5) & (n_weeks >= weeks)
+    return np.where(ok, sums / weeks, np.nan)
+
+
+def _avg_volume(volumes: np.ndarray, lengths: np.ndarray, days: int) -> np.ndarray:
+    """Average of the last *days* volumes (all bars if fewer); NaN if none."""
+    days = min(days, volumes.shape[1])
+    n = np.minimum(lengths, days)
+    sums = np.nansum(volumes[:, -days:], axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(n > 0, sums / n, np.nan)
@@ -2,50 +2,143 @@
 CANSLIM Monitor - Market Calendar (Polygon/Massive API)
 Phase 2: Service Architecture
 
-Uses Polygon.io (now Massive.com) API for market status and holidays:
-- /v1/marketstatus/now - Real-time market status
-- /v1/marketstatus/upcoming - Upcoming market holidays
+All lookups (is_market_open, is_trading_day, next_trading_day,
+seconds_until_open, ...) are served from a precomputed SessionTable of
+regular open/close instants, built from the rule-based holiday and early
+close calendar below. They never touch the network and cost O(log n).
 
-Falls back to hardcoded calendar when API is unavailable.
+The Polygon.io (now Massive.com) API is only used by the optional
+reconciler (reconcile() / start_reconciler()), which refreshes the table
+with announced closures and early closes:
+- /v1/marketstatus/upcoming - Upcoming market holidays
+- /v1/marketstatus/now - Real-time market status (get_market_status)
 """
 
 import logging
-import requests
+import sqlite3
+import threading
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime, time as dt_time, timedelta
 from typing import Optional, Set, Tuple, List, Dict, Any
 from threading import Lock
 import pytz
 
+from canslim_monitor.utils.http_pool import get_http_pool
+from canslim_monitor.utils.shared_rate_limit import get_shared_rate_limiter
+
+
+class SessionTable:
+    """
+    Sorted regular sessions for a span of years.
+
+    Immutable once built; MarketCalendar swaps in a new table to extend
+    its range or apply reconciled API data.
+    """
+
+    def __init__(
+        self,
+        first_year: int,
+        last_year: int,
+        sessions: List[Tuple[date, datetime, datetime]],
+        exceptions: Dict[date, Dict[str, Any]],
+    ):
+        """
+        Args:
+            first_year, last_year: Inclusive year range covered
+            sessions: (date, open, close) per trading day, tz-aware, sorted
+            exceptions: Holidays and early closes by date (for listings)
+        """
+        self.first_year = first_year
+        self.last_year = last_year
+        self.exceptions = exceptions
+
+        self._dates = [d for d, _, _ in sessions]
+        self._ordinals = [d.toordinal() for d in self._dates]
+        self._hours = [(o, c) for _, o, c in sessions]
+        self._opens = [o.timestamp() for _, o, _ in sessions]
+        self._closes = [c.timestamp() for _, _, c in sessions]
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def covers(self, d: date) -> bool:
+        return self.first_year <= d.year <= self.last_year
+
+    def _index(self, d: date) -> Optional[int]:
+        i = bisect_left(self._ordinals, d.toordinal())
+        if i < len(self._ordinals) and self._ordinals[i] == d.toordinal():
+            return i
+        return None
+
+    def is_session(self, d: date) -> bool:
+        return self._index(d) is not None
+
+    def hours(self, d: date) -> Optional[Tuple[datetime, datetime]]:
+        """(open, close) for a trading day, None if closed."""
+        i = self._index(d)
+        return self._hours[i] if i is not None else None
+
+    def is_open_at(self, ts: float) -> bool:
+        """True if the POSIX timestamp falls inside a session (close inclusive)."""
+        i = bisect_right(self._opens, ts) - 1
+        return i >= 0 and ts <= self._closes[i]
+
+    def session_at(self, ts: float) -> Optional[int]:
+        i = bisect_right(self._opens, ts) - 1
+        return i if i >= 0 and ts <= self._closes[i] else None
+
+    def close_at(self, i: int) -> float:
+        return self._closes[i]
+
+    def next_open(self, ts: float) -> Optional[float]:
+        """First session open strictly after ts, None past the table."""
+        i = bisect_right(self._opens, ts)
+        return self._opens[i] if i < len(self._opens) else None
+
+    def next_session(self, d: date) -> Optional[date]:
+        i = bisect_right(self._ordinals, d.toordinal())
+        return self._dates[i] if i < len(self._dates) else None
+
+    def previous_session(self, d: date) -> Optional[date]:
+        i = bisect_left(self._ordinals, d.toordinal()) - 1
+        return self._dates[i] if i >= 0 else None
+
 
 class MarketCalendar:
     """
-    US stock market calendar using Polygon/Massive API.
-    
+    US stock market calendar.
+
     Features:
-    - Real-time market status from API
-    - Upcoming holidays from API
-    - Caching to minimize API calls
-    - Fallback to hardcoded calendar when API unavailable
+    - Precomputed session table: every lookup is a pure bisect
+    - Rule-based holidays / early closes (no API key needed)
+    - Optional background reconciler pulls announced holidays and early
+      closes from the API and rebuilds the table off the caller's path
     """
-    
+
     # API Configuration
     BASE_URL = "https://api.polygon.io"
     STATUS_ENDPOINT = "/v1/marketstatus/now"
     HOLIDAYS_ENDPOINT = "/v1/marketstatus/upcoming"
-    
-    # Regular market hours (ET) - used for fallback
+
+    # Regular market hours (ET)
     REGULAR_OPEN = dt_time(9, 30)
     REGULAR_CLOSE = dt_time(16, 0)
     EARLY_CLOSE = dt_time(13, 0)
-    
+
     # Extended hours
     PREMARKET_OPEN = dt_time(4, 0)
     AFTERHOURS_CLOSE = dt_time(20, 0)
-    
-    # Cache settings
-    STATUS_CACHE_SECONDS = 60  # Cache status for 1 minute
-    HOLIDAYS_CACHE_SECONDS = 3600  # Cache holidays for 1 hour
-    
+
+    # Session table span around the current year (extended on demand)
+    TABLE_YEARS_BACK = 1
+    TABLE_YEARS_AHEAD = 1
+
+    # Reconciler settings
+    STATUS_CACHE_SECONDS = 60  # API status younger than this is reported by get_market_status
+    RECONCILE_INTERVAL = 3600  # Refresh holidays from the API hourly
+    BUDGET_TIMEOUT = 30        # Skip a reconcile call rather than wait longer for the shared budget
+    STOCK_EXCHANGES = (None, 'NYSE', 'NASDAQ', 'XNYS', 'XNAS')
+
     def __init__(
         self,
         api_key: str = None,
@@ -54,183 +147,118 @@ class MarketCalendar:
     ):
         """
         Initialize market calendar.
-        
+
         Args:
-            api_key: Polygon.io/Massive API key
+            api_key: Polygon.io/Massive API key (reconciler only)
             timezone: Market timezone (default: US Eastern)
             logger: Logger instance
         """
         self.api_key = api_key
         self.timezone = pytz.timezone(timezone)
         self.logger = logger or logging.getLogger('canslim.market_calendar')
-        
-        # Cache
+
+        # Reconciled API data
         self._status_cache: Optional[Dict] = None
         self._status_cache_time: Optional[datetime] = None
-        self._holidays_cache: Optional[List[Dict]] = None
-        self._holidays_cache_time: Optional[datetime] = None
+        self._api_exceptions: Dict[date, Dict[str, Any]] = {}
         self._lock = Lock()
-        
+
         # Fallback holiday cache (computed)
         self._fallback_holidays: Dict[int, Set[date]] = {}
         self._fallback_early_close: Dict[int, Set[date]] = {}
-    
+
+        this_year = datetime.now(self.timezone).year
+        self._table = self._build_table(
+            this_year - self.TABLE_YEARS_BACK, this_year + self.TABLE_YEARS_AHEAD
+        )
+
+        self._reconciler: Optional[threading.Thread] = None
+        self._reconciler_stop = threading.Event()
+
     # ==================== PUBLIC API ====================
-    
+
     def is_market_open(self, dt: datetime = None) -> bool:
         """
-        Check if market is currently open using API.
-        
+        Check if the market is open for regular trading.
+
         Args:
-            dt: Datetime to check (default: now). Note: API only returns current status.
-            
+            dt: Datetime to check (default: now)
+
         Returns:
             True if market is open for regular trading
         """
-        # If checking a specific time that's not now, use fallback
-        if dt is not None:
-            if dt.tzinfo is None:
-                dt = self.timezone.localize(dt)
-            else:
-                dt = dt.astimezone(self.timezone)
-            
-            now = datetime.now(self.timezone)
-            # If checking more than 5 minutes from now, use fallback
-            if abs((dt - now).total_seconds()) > 300:
-                return self._is_market_open_fallback(dt)
-        
-        # Use API for current status
-        status = self._get_market_status()
-        
-        if status:
-            # Check exchanges status
-            exchanges = status.get('exchanges', {})
-            nyse_status = exchanges.get('nyse', '')
-            nasdaq_status = exchanges.get('nasdaq', '')
-            
-            # Market is open if either major exchange is open
-            return nyse_status == 'open' or nasdaq_status == 'open'
-        
-        # Fallback to computed calendar
-        return self._is_market_open_fallback(dt)
-    
+        dt = self._localize(dt)
+        return self._table_for(dt.date()).is_open_at(dt.timestamp())
+
     def is_trading_day(self, d: date = None) -> bool:
         """
         Check if a date is a trading day.
-        
+
         Args:
             d: Date to check (default: today)
-            
+
         Returns:
             True if market is open on this date
         """
         if d is None:
             d = datetime.now(self.timezone).date()
-        
-        # Weekend check
-        if d.weekday() >= 5:
-            return False
-        
-        # Holiday check
-        if self.is_holiday(d):
-            return False
-        
-        return True
-    
+        return self._table_for(d).is_session(d)
+
     def is_holiday(self, d: date) -> bool:
         """
         Check if a date is a market holiday.
-        
+
         Args:
             d: Date to check
-            
+
         Returns:
             True if market is closed for holiday
         """
-        holidays = self._get_holidays()
-        
-        if holidays:
-            for holiday in holidays:
-                holiday_date = self._parse_date(holiday.get('date'))
-                if holiday_date == d:
-                    status = holiday.get('status', '')
-                    return status == 'closed'
-        
-        # Fallback to computed calendar
-        return self._is_holiday_fallback(d)
-    
+        return d.weekday() < 5 and not self._table_for(d).is_session(d)
+
     def is_early_close(self, d: date) -> bool:
         """
         Check if a date is an early close day.
-        
+
         Args:
             d: Date to check
-            
+
         Returns:
             True if market closes early (typically 1:00 PM ET)
         """
-        holidays = self._get_holidays()
-        
-        if holidays:
-            for holiday in holidays:
-                holiday_date = self._parse_date(holiday.get('date'))
-                if holiday_date == d:
-                    status = holiday.get('status', '')
-                    close_time = holiday.get('close')
-                    # Early close if status is 'early-close' or close time is before 16:00
-                    if status == 'early-close':
-                        return True
-                    if close_time and self._parse_time(close_time) < self.REGULAR_CLOSE:
-                        return True
-        
-        # Fallback to computed calendar
-        return self._is_early_close_fallback(d)
-    
+        hours = self._table_for(d).hours(d)
+        return hours is not None and hours[1].time() < self.REGULAR_CLOSE
+
     def get_market_hours(self, d: date = None) -> Tuple[Optional[dt_time], Optional[dt_time]]:
         """
         Get market hours for a specific date.
-        
+
         Args:
             d: Date to check (default: today)
-            
+
         Returns:
             Tuple of (open_time, close_time) or (None, None) if closed
         """
         if d is None:
             d = datetime.now(self.timezone).date()
-        
-        if not self.is_trading_day(d):
+
+        hours = self._table_for(d).hours(d)
+        if hours is None:
             return (None, None)
-        
-        # Check holidays for special hours
-        holidays = self._get_holidays()
-        
-        if holidays:
-            for holiday in holidays:
-                holiday_date = self._parse_date(holiday.get('date'))
-                if holiday_date == d:
-                    open_time = holiday.get('open')
-                    close_time = holiday.get('close')
-                    
-                    if open_time and close_time:
-                        return (
-                            self._parse_time(open_time),
-                            self._parse_time(close_time)
-                        )
-        
-        # Regular hours or early close
-        close_time = self.EARLY_CLOSE if self.is_early_close(d) else self.REGULAR_CLOSE
-        return (self.REGULAR_OPEN, close_time)
-    
+        return (hours[0].time(), hours[1].time())
+
     def get_market_status(self) -> Dict[str, Any]:
         """
         Get comprehensive current market status.
-        
+
+        Reports the reconciler's last API status while it is fresh,
+        otherwise the session table's answer.
+
         Returns:
             Dict with market status details
         """
-        status = self._get_market_status()
-        
+        status = self._fresh_status()
+
         if status:
             return {
                 'market': status.get('market', 'unknown'),
@@ -242,214 +270,287 @@ class MarketCalendar:
                 'server_time': status.get('serverTime'),
                 'source': 'api'
             }
-        
-        # Fallback response
-        is_open = self._is_market_open_fallback()
+
+        is_open = self.is_market_open()
         return {
             'market': 'open' if is_open else 'closed',
             'nyse': 'open' if is_open else 'closed',
             'nasdaq': 'open' if is_open else 'closed',
             'source': 'fallback'
         }
-    
+
     def get_upcoming_holidays(self) -> List[Dict[str, Any]]:
         """
-        Get list of upcoming market holidays.
-        
+        Get list of upcoming market holidays and early closes.
+
         Returns:
             List of holiday dicts with date, name, status, open/close times
+            and source ('api' once reconciled, else 'fallback')
         """
-        holidays = self._get_holidays()
-        
-        if holidays:
-            result = []
-            for h in holidays:
-                # Only include stock market holidays
-                if h.get('exchange') in (None, 'NYSE', 'NASDAQ', 'XNYS', 'XNAS'):
-                    result.append({
-                        'date': h.get('date'),
-                        'name': h.get('name'),
-                        'status': h.get('status'),
-                        'open': h.get('open'),
-                        'close': h.get('close'),
-                        'source': 'api'
-                    })
-            return result
-        
-        # Fallback - return next 30 days of holidays
-        return self._get_fallback_upcoming_holidays()
-    
+        today = datetime.now(self.timezone).date()
+        self._table_for(today.replace(year=today.year + 1, month=1, day=1))
+        exceptions = self._table.exceptions
+        return [
+            dict(exceptions[d], date=d.isoformat())
+            for d in sorted(exceptions) if d >= today
+        ][:20]
+
     def next_trading_day(self, d: date = None) -> date:
         """
         Get the next trading day.
-        
+
         Args:
             d: Starting date (default: today)
-            
+
         Returns:
             Next date when market is open
         """
         if d is None:
             d = datetime.now(self.timezone).date()
-        
-        next_day = d + timedelta(days=1)
-        
-        for _ in range(10):
-            if self.is_trading_day(next_day):
-                return next_day
-            next_day += timedelta(days=1)
-        
-        return next_day
-    
+
+        nxt = self._table_for(d).next_session(d)
+        if nxt is None:
+            nxt = self._table_for(date(d.year + 1, 12, 31)).next_session(d)
+        return nxt
+
     def previous_trading_day(self, d: date = None) -> date:
         """
         Get the previous trading day.
-        
+
         Args:
             d: Starting date (default: today)
-            
+
         Returns:
             Previous date when market was open
         """
         if d is None:
             d = datetime.now(self.timezone).date()
-        
-        prev_day = d - timedelta(days=1)
-        
-        for _ in range(10):
-            if self.is_trading_day(prev_day):
-                return prev_day
-            prev_day -= timedelta(days=1)
-        
-        return prev_day
-    
+
+        prev = self._table_for(d).previous_session(d)
+        if prev is None:
+            prev = self._table_for(date(d.year - 1, 1, 1)).previous_session(d)
+        return prev
+
     def seconds_until_open(self, dt: datetime = None) -> int:
         """Get seconds until market opens (0 if already open)."""
-        if dt is None:
-            dt = datetime.now(self.timezone)
-        elif dt.tzinfo is None:
-            dt = self.timezone.localize(dt)
-        else:
-            dt = dt.astimezone(self.timezone)
-        
-        if self.is_market_open():
+        dt = self._localize(dt)
+        ts = dt.timestamp()
+        table = self._table_for(dt.date())
+
+        if table.is_open_at(ts):
             return 0
-        
-        # Find next trading day
-        check_date = dt.date()
-        current_time = dt.time()
-        
-        if self.is_trading_day(check_date) and current_time < self.REGULAR_OPEN:
-            open_dt = self.timezone.localize(
-                datetime.combine(check_date, self.REGULAR_OPEN)
-            )
-        else:
-            next_day = self.next_trading_day(check_date)
-            open_dt = self.timezone.localize(
-                datetime.combine(next_day, self.REGULAR_OPEN)
-            )
-        
-        delta = open_dt - dt
-        return max(0, int(delta.total_seconds()))
-    
+
+        next_open = table.next_open(ts)
+        if next_open is None:
+            next_open = self._table_for(date(dt.year + 1, 12, 31)).next_open(ts)
+        return max(0, int(next_open - ts))
+
     def seconds_until_close(self, dt: datetime = None) -> int:
         """Get seconds until market closes (0 if already closed)."""
-        if dt is None:
-            dt = datetime.now(self.timezone)
-        elif dt.tzinfo is None:
-            dt = self.timezone.localize(dt)
-        else:
-            dt = dt.astimezone(self.timezone)
-        
-        if not self.is_market_open():
-            return 0
-        
-        open_time, close_time = self.get_market_hours(dt.date())
-        if close_time is None:
+        dt = self._localize(dt)
+        ts = dt.timestamp()
+        table = self._table_for(dt.date())
+
+        i = table.session_at(ts)
+        if i is None:
             return 0
-        
-        close_dt = self.timezone.localize(
-            datetime.combine(dt.date(), close_time)
-        )
-        
-        delta = close_dt - dt
-        return max(0, int(delta.total_seconds()))
-    
-    # ==================== API METHODS ====================
-    
-    def _get_market_status(self) -> Optional[Dict]:
+        return max(0, int(table.close_at(i) - ts))
+
+    # ==================== SESSION TABLE ====================
+
+    def _localize(self, dt: Optional[datetime]) -> datetime:
+        if dt is None:
+            return datetime.now(self.timezone)
+        if dt.tzinfo is None:
+            return self.timezone.localize(dt)
+        return dt.astimezone(self.timezone)
+
+    def _table_for(self, d: date) -> SessionTable:
+        """Current table, rebuilt to a wider span if d falls outside it."""
+        table = self._table
+        if table.covers(d):
+            return table
+        with self._lock:
+            table = self._table
+            if not table.covers(d):
+                table = self._build_table(
+                    min(table.first_year, d.year), max(table.last_year, d.year),
+                    self._api_exceptions
+                )
+                self._table = table
+        return table
+
+    def _build_table(
+        self,
+        first_year: int,
+        last_year: int,
+        api_exceptions: Dict[date, Dict[str, Any]] = None,
+    ) -> SessionTable:
         """
-        Fetch current market status from API with caching.
-        
+        Lay out every regular session in [first_year, last_year] from the
+        holiday/early-close rules, with reconciled API entries taking
+        precedence on their dates.
+        """
+        api_exceptions = api_exceptions or {}
+        sessions = []
+        exceptions: Dict[date, Dict[str, Any]] = {}
+
+        d = date(first_year, 1, 1)
+        end = date(last_year, 12, 31)
+        one_day = timedelta(days=1)
+        while d <= end:
+            if d.weekday() < 5:
+                api = api_exceptions.get(d)
+                open_time, close_time = self.REGULAR_OPEN, self.REGULAR_CLOSE
+
+                if api is not None:
+                    exceptions[d] = api
+                    if api.get('status') == 'closed':
+                        d += one_day
+                        continue
+                    open_time = self._parse_session_time(d, api.get('open')) or open_time
+                    close_time = self._parse_session_time(d, api.get('close')) or (
+                        self.EARLY_CLOSE if api.get('status') == 'early-close' else close_time
+                    )
+                elif self._is_holiday_fallback(d):
+                    exceptions[d] = {'name': 'Market Holiday', 'status': 'closed', 'source': 'fallback'}
+                    d += one_day
+                    continue
+                elif self._is_early_close_fallback(d):
+                    close_time = self.EARLY_CLOSE
+                    exceptions[d] = {
+                        'name': 'Early Close', 'status': 'early-close',
+                        'open': '09:30', 'close': '13:00', 'source': 'fallback'
+                    }
+
+                # One UTC offset per day: DST switches at 2 AM, outside any session
+                tz = self.timezone.localize(datetime.combine(d, dt_time(12))).tzinfo
+                sessions.append((
+                    d,
+                    datetime.combine(d, open_time, tzinfo=tz),
+                    datetime.combine(d, close_time, tzinfo=tz),
+                ))
+            d += one_day
+
+        return SessionTable(first_year, last_year, sessions, exceptions)
+
+    def _parse_session_time(self, d: date, value: Optional[str]) -> Optional[dt_time]:
+        """Market-local time from an API 'HH:MM' or ISO-8601 (usually UTC) string."""
+        if not value:
+            return None
+        if 'T' in value:
+            try:
+                parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                return self._parse_time(value)
+            if parsed.tzinfo is not None:
+                return parsed.astimezone(self.timezone).time()
+            return parsed.time()
+        return self._parse_time(value)
+
+    # ==================== RECONCILER ====================
+
+    def reconcile(self) -> bool:
+        """
+        Pull upcoming holidays and current status from the API and rebuild
+        the session table with them. Network I/O happens outside the lock;
+        readers keep using the old table until the swap.
+
         Returns:
-            Market status dict or None if unavailable
+            True if the API answered and the table was refreshed
         """
         if not self.api_key:
-            return None
-        
+            return False
+
+        status = self._fetch(self.STATUS_ENDPOINT)
+        if status is not None:
+            with self._lock:
+                self._status_cache = status
+                self._status_cache_time = datetime.now()
+
+        holidays = self._fetch(self.HOLIDAYS_ENDPOINT)
+        if holidays is None:
+            return False
+
+        api_exceptions: Dict[date, Dict[str, Any]] = {}
+        for h in holidays:
+            d = self._parse_date(h.get('date'))
+            if d is None or h.get('exchange') not in self.STOCK_EXCHANGES:
+                continue
+            api_exceptions[d] = {
+                'name': h.get('name'),
+                'status': h.get('status'),
+                'open': h.get('open'),
+                'close': h.get('close'),
+                'source': 'api',
+            }
+
+        current = self._table
+        table = self._build_table(current.first_year, current.last_year, api_exceptions)
+        with self._lock:
+            self._api_exceptions = api_exceptions
+            self._table = table
+
+        self.logger.debug(f"Market calendar reconciled ({len(api_exceptions)} API entries)")
+        return True
+
+    def start_reconciler(self, interval: float = None):
+        """Run reconcile() now and then every interval seconds on a daemon thread."""
+        if not self.api_key or (self._reconciler and self._reconciler.is_alive()):
+            return
+        interval = interval or self.RECONCILE_INTERVAL
+        self._reconciler_stop.clear()
+
+        def loop():
+            while True:
+                try:
+                    self.reconcile()
+                except Exception as e:
+                    self.logger.warning(f"Market calendar reconcile failed: {e}")
+                if self._reconciler_stop.wait(interval):
+                    return
+
+        self._reconciler = threading.Thread(target=loop, name='calendar_reconciler', daemon=True)
+        self._reconciler.start()
+
+    def stop_reconciler(self):
+        """Stop the background reconciler, if running."""
+        self._reconciler_stop.set()
+        if self._reconciler:
+            self._reconciler.join(timeout=5)
+            self._reconciler = None
+
+    def _fresh_status(self) -> Optional[Dict]:
         with self._lock:
-            # Check cache
             if self._status_cache and self._status_cache_time:
                 elapsed = (datetime.now() - self._status_cache_time).total_seconds()
                 if elapsed < self.STATUS_CACHE_SECONDS:
                     return self._status_cache
-            
-            # Fetch from API
-            try:
-                url = f"{self.BASE_URL}{self.STATUS_ENDPOINT}"
-                params = {'apiKey': self.api_key}
-                
-                response = requests.get(url, params=params, timeout=5)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                self._status_cache = data
-                self._status_cache_time = datetime.now()
-                
-                return data
-                
-            except Exception as e:
-                self.logger.warning(f"Failed to fetch market status: {e}")
-                return self._status_cache  # Return stale cache if available
-    
-    def _get_holidays(self) -> Optional[List[Dict]]:
-        """
-        Fetch upcoming holidays from API with caching.
-        
-        Returns:
-            List of holiday dicts or None if unavailable
-        """
-        if not self.api_key:
+        return None
+
+    def _fetch(self, endpoint: str) -> Optional[Any]:
+        """GET an API endpoint within the key's shared rate budget; None on any failure."""
+        limiter = get_shared_rate_limiter(self.api_key)
+        try:
+            if limiter is not None and limiter.acquire(timeout=self.BUDGET_TIMEOUT) is None:
+                self.logger.debug(f"Shared rate budget busy, skipping {endpoint}")
+                return None
+        except sqlite3.Error as e:
+            self.logger.debug(f"Shared rate limit unavailable: {e}")
+            limiter = None
+        try:
+            response = get_http_pool().get(
+                f"{self.BASE_URL}{endpoint}", params={'apiKey': self.api_key}, timeout=5
+            )
+            if response.status_code == 429 and limiter is not None:
+                limiter.report_429()
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            self.logger.warning(f"Failed to fetch {endpoint}: {e}")
             return None
-        
-        with self._lock:
-            # Check cache
-            if self._holidays_cache and self._holidays_cache_time:
-                elapsed = (datetime.now() - self._holidays_cache_time).total_seconds()
-                if elapsed < self.HOLIDAYS_CACHE_SECONDS:
-                    return self._holidays_cache
-            
-            # Fetch from API
-            try:
-                url = f"{self.BASE_URL}{self.HOLIDAYS_ENDPOINT}"
-                params = {'apiKey': self.api_key}
-                
-                response = requests.get(url, params=params, timeout=5)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                self._holidays_cache = data
-                self._holidays_cache_time = datetime.now()
-                
-                return data
-                
-            except Exception as e:
-                self.logger.warning(f"Failed to fetch market holidays: {e}")
-                return self._holidays_cache  # Return stale cache if available
-    
-    # ==================== FALLBACK METHODS ====================
+
+    # ==================== RULE-BASED CALENDAR ====================
     
     def _is_market_open_fallback(self, dt: datetime = None) -> bool:
         """Fallback market hours check using hardcoded calendar."""
@@ -559,37 +660,6 @@ class MarketCalendar:
         self._fallback_early_close[year] = early_close
         return early_close
     
-    def _get_fallback_upcoming_holidays(self) -> List[Dict]:
-        """Get hardcoded upcoming holidays."""
-        today = datetime.now(self.timezone).date()
-        result = []
-        
-        for year in [today.year, today.year + 1]:
-            holidays = self._get_fallback_holidays(year)
-            early_close = self._get_fallback_early_close(year)
-            
-            for h in sorted(holidays):
-                if h >= today:
-                    result.append({
-                        'date': h.isoformat(),
-                        'name': 'Market Holiday',
-                        'status': 'closed',
-                        'source': 'fallback'
-                    })
-            
-            for e in sorted(early_close):
-                if e >= today and e not in holidays:
-                    result.append({
-                        'date': e.isoformat(),
-                        'name': 'Early Close',
-                        'status': 'early-close',
-                        'open': '09:30',
-                        'close': '13:00',
-                        'source': 'fallback'
-                    })
-        
-        return sorted(result, key=lambda x: x['date'])[:20]
-    
     # ==================== HELPER METHODS ====================
     
     def _observe_holiday(self, d: date) -> date:
@@ -662,12 +732,13 @@ class MarketCalendar:
             return None
     
     def clear_cache(self):
-        """Clear all cached data."""
+        """Drop reconciled API data and rebuild the table from the rules."""
         with self._lock:
             self._status_cache = None
             self._status_cache_time = None
-            self._holidays_cache = None
-            self._holidays_cache_time = None
+            self._api_exceptions = {}
+            table = self._table
+            self._table = self._build_table(table.first_year, table.last_year)
 
 
 # Singleton instance
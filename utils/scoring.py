@@ -5,9 +5,12 @@ Loads scoring rules from scoring_config.yaml for consistency with CLI validator.
 
 import os
 import json
-from typing import Dict, Any, Tuple, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Tuple, Optional, List
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    from .indicators import TechnicalProfile
+
 try:
     import yaml
     HAS_YAML = True
@@ -363,12 +366,20 @@ class CANSLIMScorer:
         
         return total_score, grade, details
     
+    @staticmethod
+    def base_length_weeks(base_length: Any) -> int:
+        """Base length in weeks for the technical profile (default 12)."""
+        if isinstance(base_length, str):
+            return int(''.join(filter(str.isdigit, base_length)) or 12)
+        return base_length
+
     def calculate_score_with_dynamic(
         self, 
         position_data: Dict[str, Any], 
         daily_df: 'pd.DataFrame',
         index_df: 'pd.DataFrame' = None,
-        market_regime: str = 'BULLISH'
+        market_regime: str = 'BULLISH',
+        profile: Optional['TechnicalProfile'] = None
     ) -> Tuple[int, str, Dict]:
         """
         Calculate entry score including dynamic factors from technical analysis.
@@ -378,6 +389,8 @@ class CANSLIMScorer:
             daily_df: DataFrame with columns: date, open, high, low, close, volume
             index_df: Optional SPY data for RS calculations
             market_regime: Current market regime
+            profile: Prebuilt TechnicalProfile (e.g. from TechnicalProfileCache);
+                     daily_df and index_df are not used when given
             
         Returns:
             Tuple of (total_score, grade, details_dict)
@@ -385,25 +398,21 @@ class CANSLIMScorer:
         # First calculate static score
         static_score, static_grade, details = self.calculate_score(position_data, market_regime)
         
-        if daily_df is None or len(daily_df) < 50:
+        if profile is None and (daily_df is None or len(daily_df) < 50):
             # Not enough data for dynamic analysis
             return static_score, static_grade, details
         
         try:
-            from .indicators import build_technical_profile
-            
-            # Get base length from position data (default 12 weeks)
-            base_length = position_data.get('base_length', 12)
-            if isinstance(base_length, str):
-                base_length = int(''.join(filter(str.isdigit, base_length)) or 12)
-            
-            # Build technical profile
-            profile = build_technical_profile(
-                symbol=position_data.get('symbol', 'UNKNOWN'),
-                daily_df=daily_df,
-                index_df=index_df,
-                base_length_weeks=base_length
-            )
+            if profile is None:
+                from .indicators import build_technical_profile
+                
+                # Build technical profile
+                profile = build_technical_profile(
+                    symbol=position_data.get('symbol', 'UNKNOWN'),
+                    daily_df=daily_df,
+                    index_df=index_df,
+                    base_length_weeks=self.base_length_weeks(position_data.get('base_length', 12))
+                )
             
             # Extract dynamic scores
             dynamic_components = []
@@ -0,0 +1,417 @@
+"""
+CANSLIM Monitor - Cross-Process Rate Budget
+Token bucket shared by every process that holds the same API key.
+
+The GUI (price worker, chart and sentiment dialogs) and the service
+(technical data, volume, breakout fallback, regime) each kept their own
+RateLimiter / rate_limit_delay for one Polygon/Massive key, so together
+they overshot the tier limit and PolygonClient slept 60 s on every 429.
+
+SharedRateLimiter keeps the bucket in a small SQLite file instead:
+
+- Every acquire is one ``BEGIN IMMEDIATE`` transaction (refill, check,
+  consume), so processes and threads draw from the same tokens atomically
+- A 429 sets a shared back-off window that every holder of the key obeys
+- Waiting callers register their priority; a token is only handed to a
+  caller when no more urgent waiter is queued, so position monitoring
+  pre-empts GUI chart fetches
+- Priority ages: every ``PRIORITY_AGING_SECONDS`` spent waiting counts as
+  one level more urgent, so a steady stream of service calls cannot
+  starve the GUI, and LOW callers give up after ``LOW_PRIORITY_TIMEOUT``
+- The key is stored as a hash; the file holds no credentials
+
+Priority is per thread (``rate_priority`` context manager) with a
+process-wide default (``set_default_rate_priority``).
+
+Usage:
+    from canslim_monitor.utils.shared_rate_limit import (
+        RatePriority, configure_shared_rate_limit, get_shared_rate_limiter, rate_priority,
+    )
+
+    configure_shared_rate_limit(api_key, calls_per_minute=5)
+
+    with rate_priority(RatePriority.HIGH):
+        limiter = get_shared_rate_limiter(api_key)
+        limiter.acquire()
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Any, Dict, Optional
+
+
+DEFAULT_STATE_FILE = 'canslim_rate_limits.db'
+WAITER_TTL = 5.0            # Seconds a queued waiter stays visible without a refresh
+MAX_POLL_INTERVAL = 1.0     # Longest single sleep while waiting
+MAX_BACKOFF_SECONDS = 60.0  # Cap for the shared 429 back-off
+PRIORITY_AGING_SECONDS = 15.0  # Waiting this long promotes a waiter by one priority level
+LOW_PRIORITY_TIMEOUT = 30.0    # Default acquire timeout for LOW callers (GUI threads)
+
+
+class RatePriority(IntEnum):
+    """Call priority; lower values are served first."""
+    HIGH = 0      # Position monitoring
+    NORMAL = 1    # Other service work (technicals, volume, breakout, regime)
+    LOW = 2       # GUI charts and lookups
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    key TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    capacity REAL NOT NULL,
+    refill_rate REAL NOT NULL,
+    min_delay REAL NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    last_call REAL NOT NULL DEFAULT 0,
+    backoff_until REAL NOT NULL DEFAULT 0,
+    backoff REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS waiters (
+    key TEXT NOT NULL,
+    waiter TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    since REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (key, waiter)
+);
+"""
+
+
+def default_state_path() -> str:
+    """Bucket file shared by all processes of this user (``CANSLIM_RATE_LIMIT_DB`` overrides)."""
+    return os.environ.get('CANSLIM_RATE_LIMIT_DB') or os.path.join(
+        tempfile.gettempdir(), DEFAULT_STATE_FILE
+    )
+
+
+def _key_hash(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:32]
+
+
+# ----------------------------------------------------------------------
+# Per-thread priority
+# ----------------------------------------------------------------------
+
+_default_priority = RatePriority.NORMAL
+_thread_priority = threading.local()
+
+
+def set_default_rate_priority(priority: RatePriority):
+    """Set the priority used by threads without a ``rate_priority`` block."""
+    global _default_priority
+    _default_priority = RatePriority(priority)
+
+
+def current_rate_priority() -> RatePriority:
+    """Priority of the calling thread."""
+    priority = getattr(_thread_priority, 'value', None)
+    return _default_priority if priority is None else priority
+
+
+@contextmanager
+def rate_priority(priority: RatePriority):
+    """Run the enclosed API calls at *priority* (nests, restores on exit)."""
+    previous = getattr(_thread_priority, 'value', None)
+    _thread_priority.value = RatePriority(priority)
+    try:
+        yield
+    finally:
+        _thread_priority.value = previous
+
+
+class SharedRateLimiter:
+    """Token bucket for one API key, persisted in a SQLite file."""
+
+    def __init__(
+        self,
+        api_key: str,
+        calls_per_minute: int,
+        burst_size: int = 0,
+        min_delay_seconds: float = 0.0,
+        path: str = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            api_key: Credential the budget belongs to (stored hashed)
+            calls_per_minute: Sustained rate for the key
+            burst_size: Extra tokens above one minute's worth
+            min_delay_seconds: Minimum gap between any two calls on the key
+            path: Bucket file (default: ``default_state_path()``)
+            logger: Logger instance
+        """
+        self.path = path or default_state_path()
+        self.logger = logger or logging.getLogger('canslim.rate_limit')
+        self._key = _key_hash(api_key)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self.configure(calls_per_minute, burst_size, min_delay_seconds)
+
+    def configure(self, calls_per_minute: int, burst_size: int = 0, min_delay_seconds: float = 0.0):
+        """Create the bucket or update its limits (the latest caller wins)."""
+        self.calls_per_minute = calls_per_minute
+        capacity = float(calls_per_minute + (burst_size or 0))
+        refill_rate = calls_per_minute / 60.0
+        with self._transaction() as cur:
+            cur.execute(
+                "INSERT INTO buckets (key, tokens, capacity, refill_rate, min_delay, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET capacity = excluded.capacity, "
+                "refill_rate = excluded.refill_rate, min_delay = excluded.min_delay, "
+                "tokens = MIN(tokens, excluded.capacity)",
+                (self._key, capacity, capacity, refill_rate, min_delay_seconds or 0.0, time.time()),
+            )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def acquire(self, priority: RatePriority = None, timeout: float = None) -> Optional[float]:
+        """Block until a call on this key is permitted.
+
+        Args:
+            priority: Call priority (default: the calling thread's priority)
+            timeout: Give up after this many seconds (default: wait forever,
+                or ``LOW_PRIORITY_TIMEOUT`` for LOW callers)
+
+        Returns:
+            Seconds spent waiting, or None if *timeout* elapsed first
+        """
+        priority = RatePriority(priority if priority is not None else current_rate_priority())
+        if timeout is None and priority == RatePriority.LOW:
+            timeout = LOW_PRIORITY_TIMEOUT
+        waiter = f"{os.getpid()}:{threading.get_ident()}:{uuid.uuid4().hex[:8]}"
+        since = time.time()
+        start = time.monotonic()
+        consumed = False
+        try:
+            while True:
+                wait = self._try_consume(waiter, priority, since)
+                if wait <= 0:
+                    consumed = True
+                    return time.monotonic() - start
+                if timeout is not None:
+                    remaining = timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        return None
+                    wait = min(wait, remaining)
+                time.sleep(min(wait, MAX_POLL_INTERVAL))
+        finally:
+            if not consumed:
+                self._remove_waiter(waiter)
+
+    def report_429(self):
+        """Start (or double) the shared back-off; every process waits it out."""
+        initial = 60.0 / self.calls_per_minute if self.calls_per_minute else 1.0
+        with self._transaction() as cur:
+            row = cur.execute(
+                "SELECT backoff FROM buckets WHERE key = ?", (self._key,)
+            ).fetchone()
+            backoff = min(max(row[0] * 2, initial) if row else initial, MAX_BACKOFF_SECONDS)
+            cur.execute(
+                "UPDATE buckets SET backoff = ?, backoff_until = ?, tokens = 0 WHERE key = ?",
+                (backoff, time.time() + backoff, self._key),
+            )
+        self.logger.warning(f"Rate limit 429: all clients on this key back off {backoff:.1f}s")
+
+    def report_success(self):
+        """Reset the back-off after a successful call."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT backoff FROM buckets WHERE key = ?", (self._key,)
+            ).fetchone()
+        if not row or not row[0]:
+            return   # Common case: no write transaction
+        with self._transaction() as cur:
+            cur.execute(
+                "UPDATE buckets SET backoff = 0 WHERE key = ? AND backoff > 0", (self._key,)
+            )
+
+    def get_state(self) -> Dict[str, Any]:
+        """Current bucket and queue for status displays."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tokens, capacity, refill_rate, updated_at, backoff_until "
+                "FROM buckets WHERE key = ?", (self._key,)
+            ).fetchone()
+            waiting = dict(self._conn.execute(
+                "SELECT priority, COUNT(*) FROM waiters WHERE key = ? AND expires_at > ? "
+                "GROUP BY priority", (self._key, now)
+            ).fetchall())
+        tokens, capacity, refill_rate, updated_at, backoff_until = row
+        return {
+            'tokens': round(min(capacity, tokens + (now - updated_at) * refill_rate), 2),
+            'capacity': capacity,
+            'calls_per_minute': round(refill_rate * 60, 2),
+            'backoff_remaining': round(max(0.0, backoff_until - now), 1),
+            'waiting': {RatePriority(p).name: n for p, n in waiting.items()},
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _transaction(self):
+        """Serialized write transaction (threads via lock, processes via SQLite)."""
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute('BEGIN IMMEDIATE')
+            try:
+                yield cur
+            except BaseException:
+                cur.execute('ROLLBACK')
+                raise
+            cur.execute('COMMIT')
+
+    def _migrate(self):
+        """Add columns introduced after the bucket file was created."""
+        with self._lock:
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(waiters)")}
+            if 'since' in columns:
+                return
+            try:
+                self._conn.execute("ALTER TABLE waiters ADD COLUMN since REAL NOT NULL DEFAULT 0")
+            except sqlite3.OperationalError:
+                pass   # Another process added it first
+
+    def _try_consume(self, waiter: str, priority: RatePriority, since: float) -> float:
+        """Take a token if allowed, else queue *waiter* and return seconds to wait.
+
+        Waiters are ranked by ``since + priority * PRIORITY_AGING_SECONDS``:
+        a LOW caller that has waited two aging periods ranks with a HIGH
+        caller that just arrived.
+        """
+        with self._transaction() as cur:
+            now = time.time()
+            cur.execute("DELETE FROM waiters WHERE expires_at <= ?", (now,))
+            tokens, capacity, refill_rate, min_delay, updated_at, last_call, backoff_until = cur.execute(
+                "SELECT tokens, capacity, refill_rate, min_delay, updated_at, last_call, backoff_until "
+                "FROM buckets WHERE key = ?", (self._key,)
+            ).fetchone()
+
+            tokens = min(capacity, tokens + max(0.0, now - updated_at) * refill_rate)
+            rank = since + int(priority) * PRIORITY_AGING_SECONDS
+            ahead = cur.execute(
+                "SELECT COUNT(*) FROM waiters WHERE key = ? AND waiter != ? "
+                "AND since + priority * ? < ?",
+                (self._key, waiter, PRIORITY_AGING_SECONDS, rank),
+            ).fetchone()[0]
+
+            if now < backoff_until:
+                wait = backoff_until - now
+            elif min_delay > 0 and now - last_call < min_delay:
+                wait = min_delay - (now - last_call)
+            elif tokens < 1.0:
+                wait = (1.0 - tokens) / refill_rate if refill_rate > 0 else MAX_POLL_INTERVAL
+            elif ahead:
+                wait = MAX_POLL_INTERVAL / 4   # Let the more urgent waiter take it
+            else:
+                cur.execute(
+                    "UPDATE buckets SET tokens = ?, updated_at = ?, last_call = ? WHERE key = ?",
+                    (tokens - 1.0, now, now, self._key),
+                )
+                cur.execute(
+                    "DELETE FROM waiters WHERE key = ? AND waiter = ?", (self._key, waiter)
+                )
+                return 0.0
+
+            cur.execute(
+                "UPDATE buckets SET tokens = ?, updated_at = ? WHERE key = ?",
+                (tokens, now, self._key),
+            )
+            cur.execute(
+                "INSERT OR REPLACE INTO waiters (key, waiter, priority, expires_at, since) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self._key, waiter, int(priority), now + WAITER_TTL, since),
+            )
+            return wait
+
+    def _remove_waiter(self, waiter: str):
+        try:
+            with self._transaction() as cur:
+                cur.execute(
+                    "DELETE FROM waiters WHERE key = ? AND waiter = ?", (self._key, waiter)
+                )
+        except sqlite3.Error as e:
+            self.logger.debug(f"Could not remove rate-limit waiter: {e}")
+
+
+# ----------------------------------------------------------------------
+# Process-wide registry (one limiter per key)
+# ----------------------------------------------------------------------
+
+_limiters: Dict[str, SharedRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def configure_shared_rate_limit(
+    api_key: str,
+    calls_per_minute: int,
+    burst_size: int = 0,
+    min_delay_seconds: float = 0.0,
+    path: str = None
+) -> Optional[SharedRateLimiter]:
+    """
+    Enable (or re-tune) the shared budget for *api_key* in this process.
+
+    Called with the provider's tier throttle when it is created, so every
+    process reading the same provider_config uses the same limits.
+
+    Returns:
+        SharedRateLimiter, or None if the key or rate is missing or the
+        bucket file cannot be opened
+    """
+    if not api_key or not calls_per_minute:
+        return None
+    key = _key_hash(api_key)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        try:
+            if limiter is None or (path and limiter.path != path):
+                limiter = SharedRateLimiter(
+                    api_key, calls_per_minute, burst_size, min_delay_seconds, path=path
+                )
+                _limiters[key] = limiter
+            else:
+                limiter.configure(calls_per_minute, burst_size, min_delay_seconds)
+        except sqlite3.Error as e:
+            logging.getLogger('canslim.rate_limit').warning(
+                f"Shared rate limit unavailable, using per-process limits: {e}"
+            )
+            return None
+        return limiter
+
+
+def get_shared_rate_limiter(api_key: str) -> Optional[SharedRateLimiter]:
+    """Shared limiter for *api_key*, or None if none was configured."""
+    if not api_key or not _limiters:
+        return None
+    return _limiters.get(_key_hash(api_key))
+
+
+def reset_shared_rate_limits():
+    """Forget all configured limiters (tests / shutdown)."""
+    with _limiters_lock:
+        for limiter in _limiters.values():
+            limiter.close()
+        _limiters.clear()